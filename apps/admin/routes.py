@@ -1,12 +1,19 @@
-"""Admin routes for system health monitoring."""
+"""Admin routes for system health monitoring and on-demand profiling."""
 
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
 
 from auth import require_admin
+from packages.core.profiler import (
+    PROFILER_BLOCK_THRESHOLD_MS,
+    PROFILER_INTERVAL_MS,
+    PROFILER_MAX_SECONDS,
+    ProfilerBusyError,
+    profile,
+)
 from packages.seo_health_report.metrics import metrics
 
 router = APIRouter()
@@ -54,3 +61,27 @@ async def admin_health(request: Request, user=Depends(require_admin)):
 async def admin_health_metrics_json(user=Depends(require_admin)):
     """Return metrics as JSON for AJAX refresh."""
     return JSONResponse(_get_metrics_data())
+
+
+@router.post("/profile")
+async def admin_profile(
+    seconds: float = Query(10, gt=0, le=PROFILER_MAX_SECONDS),
+    interval_ms: float = Query(PROFILER_INTERVAL_MS, ge=1, le=1000),
+    block_ms: float = Query(PROFILER_BLOCK_THRESHOLD_MS, ge=1),
+    format: str = Query("json", pattern="^(json|collapsed)$"),
+    user=Depends(require_admin),
+):
+    """
+    Profile this API process for `seconds` and return what it was doing.
+
+    format=collapsed returns only the collapsed stacks, ready for a
+    flamegraph tool; json adds per-coroutine loop time and the callbacks
+    that blocked the event loop for more than `block_ms`.
+    """
+    try:
+        report = await profile(seconds, interval_ms / 1000, block_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    if format == "collapsed":
+        return PlainTextResponse(report.collapsed())
+    return JSONResponse(report.to_dict())
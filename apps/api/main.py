@@ -7,15 +7,19 @@ Production-ready API with database persistence, authentication, and payments.
 
 import logging
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent.parent  # repo root
 
 # Import configuration and validate at startup
 from packages.config import get_settings, validate_startup
+from packages.seo_health_report.seo_logging import start_queue_logging
 
 # Configure logging early
 logging.basicConfig(level=logging.INFO)
+# Format and write log output on a background thread, off the event loop
+start_queue_logging()
 logger = logging.getLogger(__name__)
 
 # Validate configuration at startup
@@ -47,6 +51,7 @@ from apps.api.openapi import (
     get_custom_openapi_function,
 )
 from database import get_db, init_db
+from packages.seo_health_report.scripts import memory_cache
 from rate_limiter import get_rate_limit_status
 
 # Import dashboard router
@@ -124,11 +129,23 @@ except ImportError:
 # Initialize database on startup
 init_db()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Reclaim expired response cache entries even when nothing reads them
+    memory_cache.start_sweeper()
+    try:
+        yield
+    finally:
+        memory_cache.stop_sweeper()
+
+
 app = FastAPI(
     title="SEO Health Report API",
     description="Run comprehensive SEO audits with AI visibility analysis",
     version="2.0.0",
     openapi_tags=TAGS_METADATA,
+    lifespan=lifespan,
 )
 
 # Set custom OpenAPI schema
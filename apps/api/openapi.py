@@ -264,6 +264,46 @@ AUDIT_STATUS_EXAMPLE = {
     "completed_at": "2024-01-15T10:32:45Z",
 }
 
+AUDIT_BATCH_REQUEST_EXAMPLE = {
+    "audits": [
+        "https://example.com",
+        {"url": "https://example.org", "company_name": "Example Org"},
+    ],
+    "csv": "url,company_name\nhttps://example.net,Example Net\n",
+    "tier": "low",
+}
+
+AUDIT_BATCH_RESPONSE_EXAMPLE = {
+    "batch_id": "batch_0a1b2c3d4e5f",
+    "submitted": 3,
+    "queued": 2,
+    "duplicates": 1,
+    "invalid": 0,
+    "items": [
+        {
+            "url": "https://example.com",
+            "status": "duplicate",
+            "audit_id": "audit_abc123def456",
+            "canonical_url": "https://example.com/",
+            "error": None,
+        },
+    ],
+    "progress_url": "/audits/batch/batch_0a1b2c3d4e5f",
+}
+
+AUDIT_BATCH_PROGRESS_EXAMPLE = {
+    "batch_id": "batch_0a1b2c3d4e5f",
+    "status": "running",
+    "tier": "low",
+    "submitted": 3,
+    "queued": 2,
+    "duplicates": 1,
+    "invalid": 0,
+    "audits": {"total": 2, "completed": 1, "running": 1},
+    "progress": 0.5,
+    "created_at": "2024-01-15T10:30:00Z",
+}
+
 AUDIT_FULL_EXAMPLE = {
     **AUDIT_STATUS_EXAMPLE,
     "result": {
@@ -0,0 +1,80 @@
+"""
+Fast JSON encoding and conditional (ETag) responses for read endpoints.
+
+Polling clients re-request the same audit many times. Bodies are serialized
+once to bytes (with orjson when installed), tagged with a strong ETag over
+those bytes, and a matching ``If-None-Match`` gets an empty 304.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Clients may keep a copy but must revalidate it with the ETag on each use
+CACHE_CONTROL = "private, no-cache"
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to compact JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def make_etag(*parts: bytes) -> str:
+    """Build a strong ETag from the bytes that determine a response body."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part)
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header matches ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+def _headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers=_headers(etag))
+
+
+def json_response(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """Return pre-serialized JSON, or 304 if the client already has it."""
+    etag = etag or make_etag(body)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return Response(content=body, media_type="application/json", headers=_headers(etag))
+
+
+def streaming_json_response(chunks: Iterable[bytes], etag: str) -> StreamingResponse:
+    """Stream a JSON body assembled from byte chunks."""
+    return StreamingResponse(chunks, media_type="application/json", headers=_headers(etag))
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    """Format one server-sent event with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
@@ -1,33 +1,67 @@
 """Audit management routes."""
 
+import asyncio
 import json
 import logging
 import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, field_validator
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from apps.api.openapi import (
+    AUDIT_BATCH_PROGRESS_EXAMPLE,
+    AUDIT_BATCH_REQUEST_EXAMPLE,
+    AUDIT_BATCH_RESPONSE_EXAMPLE,
     AUDIT_FULL_EXAMPLE,
     AUDIT_REQUEST_EXAMPLE,
     AUDIT_RESPONSE_EXAMPLE,
     AUDIT_STATUS_EXAMPLE,
     ERROR_RESPONSES,
 )
+from apps.api.responses import (
+    dumps,
+    etag_matches,
+    json_response,
+    make_etag,
+    not_modified,
+    sse_event,
+    streaming_json_response,
+)
 from auth import require_auth
-from database import Audit, User, get_db
+from database import Audit, SessionLocal, User, get_db
+from packages.core.scheduling import job_priority
+from packages.database.listing import encode_cursor, keyset_page
+from packages.seo_health_report.batches import (
+    BatchService,
+    BatchTarget,
+    BatchTooLargeError,
+    parse_csv_targets,
+)
 from packages.seo_health_report.metrics import metrics
-from packages.seo_health_report.progress import get_audit_progress
-from packages.seo_health_report.scripts.calculate_scores import calculate_composite_score
-from packages.seo_health_report.scripts.idempotency import compute_idempotency_key
-from packages.seo_health_report.scripts.orchestrate import run_full_audit
+from packages.seo_health_report.progress import (
+    LiveProgress,
+    get_audit_progress,
+    get_progress_broker,
+)
+from packages.seo_health_report.quotas.service import QuotaExceededError
+from packages.seo_health_report.scripts import memory_cache
+from packages.seo_health_report.scripts.idempotency import (
+    compute_coalesce_key,
+    compute_idempotency_key,
+)
+from packages.storage.results import (
+    download_result_blob,
+    iter_decompressed,
+    store_audit_result,
+)
 from rate_limiter import check_rate_limit
 
 if TYPE_CHECKING:
@@ -46,6 +80,9 @@ except ImportError:
 
 router = APIRouter(tags=["audits"])
 
+# Idle interval after which the progress stream sends an SSE comment keepalive
+PROGRESS_STREAM_HEARTBEAT_SECONDS = float(os.getenv("PROGRESS_STREAM_HEARTBEAT_SECONDS", "15"))
+
 # Project root for report storage
 project_root = Path(__file__).parent.parent
 
@@ -114,6 +151,40 @@ class AuditResponse(BaseModel):
         json_schema_extra = {"example": AUDIT_RESPONSE_EXAMPLE}
 
 
+class BatchAuditTarget(BaseModel):
+    """One URL in a batch, with the company name for its report."""
+
+    url: str
+    company_name: Optional[str] = None
+
+
+class AuditBatchRequest(BaseModel):
+    """Request model for submitting many audits at once."""
+
+    audits: list[Union[str, BatchAuditTarget]] = []
+    csv: Optional[str] = None  # "url[,company_name]" rows, header optional
+    keywords: list[str] = []
+    competitors: list[str] = []
+    tier: str = "low"
+
+    @field_validator("tier")
+    @classmethod
+    def validate_tier(cls, v):
+        return AuditRequest.validate_tier(v)
+
+    def targets(self) -> list[BatchTarget]:
+        targets = [
+            BatchTarget(item) if isinstance(item, str) else BatchTarget(**item.model_dump())
+            for item in self.audits
+        ]
+        if self.csv:
+            targets.extend(parse_csv_targets(self.csv))
+        return targets
+
+    class Config:
+        json_schema_extra = {"example": AUDIT_BATCH_REQUEST_EXAMPLE}
+
+
 # --- Helper Functions ---
 
 
@@ -125,7 +196,9 @@ async def fire_audit_webhook(
     audit_data: dict,
 ) -> None:
     """
-    Fire a webhook event for audit completion/failure.
+    Queue a webhook event for audit completion/failure.
+
+    Deliveries go through the outbox and are sent by the worker's dispatcher.
 
     Args:
         db: Database session
@@ -164,10 +237,8 @@ async def fire_audit_webhook(
 
         if delivery_ids:
             logger.info(
-                f"Fired {event.value} webhook for audit {audit_id}: {len(delivery_ids)} deliveries"
+                f"Queued {event.value} webhook for audit {audit_id}: {len(delivery_ids)} deliveries"
             )
-
-        await service.close()
     except Exception as e:
         logger.error(f"Failed to fire webhook for audit {audit_id}: {e}")
 
@@ -192,18 +263,23 @@ def enqueue_audit_job(
     if existing:
         return existing[0]
 
+    payload = {"url": url, "job_type": job_type, **options}
     db.execute(
         text("""
             INSERT INTO audit_jobs
-            (job_id, tenant_id, audit_id, status, idempotency_key, payload_json, queued_at)
-            VALUES (:job_id, :tenant_id, :audit_id, 'queued', :idempotency_key, :payload, CURRENT_TIMESTAMP)
+            (job_id, tenant_id, audit_id, status, idempotency_key, payload_json, priority,
+             coalesce_key, queued_at)
+            VALUES (:job_id, :tenant_id, :audit_id, 'queued', :idempotency_key, :payload,
+                    :priority, :coalesce_key, CURRENT_TIMESTAMP)
         """),
         {
             "job_id": job_id,
             "tenant_id": tenant_id or "default",
             "audit_id": audit_id,
             "idempotency_key": idempotency_key,
-            "payload": json.dumps({"url": url, "job_type": job_type, **options}),
+            "payload": json.dumps(payload),
+            "priority": job_priority(options.get("tier")),
+            "coalesce_key": compute_coalesce_key(payload),
         },
     )
     db.commit()
@@ -222,6 +298,9 @@ async def run_audit_task(
     """Background task to run the audit. LEGACY: kept for tests, prefer job queue."""
     import time
 
+    from packages.seo_health_report.scripts.calculate_scores import calculate_composite_score
+    from packages.seo_health_report.scripts.orchestrate import run_full_audit
+
     start_time = time.perf_counter()
 
     metrics.inc_gauge("active_audits")
@@ -254,7 +333,7 @@ async def run_audit_task(
             audit.status = "completed"
             audit.overall_score = result["overall_score"]
             audit.grade = result["grade"]
-            audit.result = result
+            audit.result, audit.result_key = store_audit_result(audit_id, result, tenant_id)
             audit.report_path = str(report_path)
             audit.completed_at = datetime.now(timezone.utc)
             db.commit()
@@ -308,6 +387,21 @@ async def run_audit_task(
         db.close()
 
 
+def _audit_summary(audit: Audit) -> dict:
+    """Status and score fields shared by the audit read endpoints."""
+    return {
+        "audit_id": audit.id,
+        "status": audit.status,
+        "url": audit.url,
+        "company_name": audit.company_name,
+        "tier": audit.tier,
+        "overall_score": audit.overall_score,
+        "grade": audit.grade,
+        "created_at": audit.created_at.isoformat() if audit.created_at else None,
+        "completed_at": audit.completed_at.isoformat() if audit.completed_at else None,
+    }
+
+
 # --- Routes ---
 
 
@@ -373,6 +467,104 @@ async def start_audit(
     )
 
 
+@router.post(
+    "/audits/batch",
+    summary="Start SEO audits in bulk",
+    description=(
+        "Queue audits for many URLs (a list and/or CSV text) in one request. URLs are "
+        "canonicalized and deduplicated against the batch and recent audits; the quota is "
+        "admitted for the whole batch at once."
+    ),
+    responses={
+        200: {
+            "description": "Batch queued",
+            "content": {"application/json": {"example": AUDIT_BATCH_RESPONSE_EXAMPLE}},
+        },
+        400: ERROR_RESPONSES[400],
+        409: {"description": "A concurrent submission queued some of these URLs; retry"},
+        413: {"description": "Too many URLs in one batch"},
+        422: ERROR_RESPONSES[422],
+        429: ERROR_RESPONSES[429],
+    },
+)
+async def start_audit_batch(
+    request: AuditBatchRequest,
+    http_request: Request,
+    user: User = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    """Admit and queue a batch of audits for the worker."""
+    check_rate_limit(http_request)
+
+    targets = request.targets()
+    if not targets:
+        raise HTTPException(status_code=400, detail="No URLs submitted")
+
+    try:
+        submission = BatchService(db).submit(
+            targets,
+            user_id=user.id,
+            tenant_id=getattr(user, "tenant_id", None),
+            tier=request.tier,
+            keywords=request.keywords,
+            competitors=request.competitors,
+        )
+    except BatchTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except QuotaExceededError as e:
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "message": str(e),
+                "quota_type": e.quota_type,
+                "limit": e.limit,
+                "used": e.used,
+            },
+        )
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409, detail="Some URLs were queued by a concurrent request; retry"
+        )
+
+    logger.info(
+        f"Batch {submission.batch_id}: {submission.count('queued')} queued, "
+        f"{submission.count('duplicate')} duplicates, {submission.count('invalid')} invalid"
+    )
+    return {
+        **submission.to_dict(),
+        "progress_url": f"/audits/batch/{submission.batch_id}",
+    }
+
+
+@router.get(
+    "/audits/batch/{batch_id}",
+    summary="Get batch progress",
+    description="Aggregate status of the audits a batch queued.",
+    responses={
+        200: {
+            "description": "Batch progress",
+            "content": {"application/json": {"example": AUDIT_BATCH_PROGRESS_EXAMPLE}},
+        },
+        404: ERROR_RESPONSES[404],
+    },
+)
+async def get_audit_batch(
+    batch_id: str,
+    user: User = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    """Get aggregate progress of an audit batch."""
+    service = BatchService(db)
+    batch = service.get_batch(batch_id)
+    tenant_id = getattr(user, "tenant_id", None)
+    if batch is None or not (
+        batch.user_id == user.id or (tenant_id and batch.tenant_id == tenant_id)
+    ):
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return service.progress(batch)
+
+
 @router.get(
     "/audit/{audit_id}",
     summary="Get audit status",
@@ -385,23 +577,22 @@ async def start_audit(
         404: ERROR_RESPONSES[404],
     },
 )
-async def get_audit(audit_id: str, db: Session = Depends(get_db)):
+async def get_audit(audit_id: str, request: Request, db: Session = Depends(get_db)):
     """Get audit status and results."""
-    audit = db.query(Audit).filter(Audit.id == audit_id).first()
-    if not audit:
-        raise HTTPException(status_code=404, detail="Audit not found")
+    cache_key = f"audit_json:status:{audit_id}"
+    cached = memory_cache.get(cache_key)
+    if cached is None:
+        audit = db.query(Audit).filter(Audit.id == audit_id).first()
+        if not audit:
+            raise HTTPException(status_code=404, detail="Audit not found")
 
-    return {
-        "audit_id": audit.id,
-        "status": audit.status,
-        "url": audit.url,
-        "company_name": audit.company_name,
-        "tier": audit.tier,
-        "overall_score": audit.overall_score,
-        "grade": audit.grade,
-        "created_at": audit.created_at.isoformat() if audit.created_at else None,
-        "completed_at": audit.completed_at.isoformat() if audit.completed_at else None,
-    }
+        body = dumps(_audit_summary(audit))
+        cached = (body, make_etag(body))
+        if audit.status == "completed":
+            memory_cache.set(cache_key, cached, memory_cache.AUDIT_RESULT_TTL)
+
+    body, etag = cached
+    return json_response(request, body, etag)
 
 
 @router.get(
@@ -416,35 +607,58 @@ async def get_audit(audit_id: str, db: Session = Depends(get_db)):
         404: ERROR_RESPONSES[404],
     },
 )
-async def get_full_audit(audit_id: str, db: Session = Depends(get_db)):
+async def get_full_audit(audit_id: str, request: Request, db: Session = Depends(get_db)):
     """Get full audit data including result and report URLs."""
-    audit = db.query(Audit).filter(Audit.id == audit_id).first()
-    if not audit:
-        raise HTTPException(status_code=404, detail="Audit not found")
+    cache_key = f"audit_json:full:{audit_id}"
+    cached = memory_cache.get(cache_key)
+    if cached is None:
+        audit = db.query(Audit).filter(Audit.id == audit_id).first()
+        if not audit:
+            raise HTTPException(status_code=404, detail="Audit not found")
+
+        response = _audit_summary(audit)
+
+        # Add report URLs
+        if hasattr(audit, "report_html_path") and audit.report_html_path:
+            response["report_html_url"] = f"/audits/{audit_id}/report/html"
+        if hasattr(audit, "report_pdf_path") and audit.report_pdf_path:
+            response["report_pdf_url"] = f"/audits/{audit_id}/report/pdf"
+
+        # Offloaded results are streamed from storage after the summary fields;
+        # inline results are serialized with the rest of the body
+        result_key = getattr(audit, "result_key", None)
+        if audit.status == "completed" and isinstance(result_key, str) and result_key:
+            body = dumps(response)
+            cached = (body, make_etag(body, result_key.encode()), result_key)
+        else:
+            if audit.status == "completed" and audit.result:
+                response["result"] = audit.result
+            body = dumps(response)
+            cached = (body, make_etag(body), None)
+
+        if audit.status == "completed":
+            memory_cache.set(cache_key, cached, memory_cache.AUDIT_RESULT_TTL)
+
+    body, etag, result_key = cached
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if result_key is None:
+        return json_response(request, body, etag)
 
-    response = {
-        "audit_id": audit.id,
-        "status": audit.status,
-        "url": audit.url,
-        "company_name": audit.company_name,
-        "tier": audit.tier,
-        "overall_score": audit.overall_score,
-        "grade": audit.grade,
-        "created_at": audit.created_at.isoformat() if audit.created_at else None,
-        "completed_at": audit.completed_at.isoformat() if audit.completed_at else None,
-    }
+    try:
+        blob = await asyncio.to_thread(download_result_blob, result_key)
+    except FileNotFoundError:
+        logger.warning(f"Result blob missing for audit {audit_id}: {result_key}")
+        return json_response(request, body)
 
-    # Add result if completed
-    if audit.status == "completed" and audit.result:
-        response["result"] = audit.result
+    return streaming_json_response(_stream_with_result(body, blob), etag)
 
-    # Add report URLs
-    if hasattr(audit, "report_html_path") and audit.report_html_path:
-        response["report_html_url"] = f"/audits/{audit_id}/report/html"
-    if hasattr(audit, "report_pdf_path") and audit.report_pdf_path:
-        response["report_pdf_url"] = f"/audits/{audit_id}/report/pdf"
 
-    return response
+def _stream_with_result(summary_body: bytes, blob: bytes):
+    """Yield the summary object with the stored result spliced in as ``result``."""
+    yield summary_body[:-1] + b',"result":'
+    yield from iter_decompressed(blob)
+    yield b"}"
 
 
 @router.get(
@@ -478,30 +692,42 @@ async def get_full_audit(audit_id: str, db: Session = Depends(get_db)):
         },
     },
 )
-async def get_audit_events(audit_id: str, db: Session = Depends(get_db)):
+async def get_audit_events(audit_id: str, request: Request, db: Session = Depends(get_db)):
     """Get progress events for an audit."""
-    events = db.execute(
-        text("""
-            SELECT event_type, message, progress_pct, created_at
-            FROM audit_progress_events
-            WHERE audit_id = :audit_id
-            ORDER BY created_at
-        """),
-        {"audit_id": audit_id},
-    ).fetchall()
-
-    return {
-        "audit_id": audit_id,
-        "events": [
+    cache_key = f"audit_json:events:{audit_id}"
+    cached = memory_cache.get(cache_key)
+    if cached is None:
+        events = db.execute(
+            text("""
+                SELECT event_type, message, progress_pct, created_at
+                FROM audit_progress_events
+                WHERE audit_id = :audit_id
+                ORDER BY created_at
+            """),
+            {"audit_id": audit_id},
+        ).fetchall()
+
+        body = dumps(
             {
-                "event_type": e[0],
-                "message": e[1],
-                "progress_pct": e[2],
-                "timestamp": e[3].isoformat() if e[3] else None,
+                "audit_id": audit_id,
+                "events": [
+                    {
+                        "event_type": e[0],
+                        "message": e[1],
+                        "progress_pct": e[2],
+                        "timestamp": e[3].isoformat() if e[3] else None,
+                    }
+                    for e in events
+                ],
             }
-            for e in events
-        ],
-    }
+        )
+        cached = (body, make_etag(body))
+        # No further events are written once an audit has completed
+        if any(e[0] == "completed" for e in events):
+            memory_cache.set(cache_key, cached, memory_cache.AUDIT_RESULT_TTL)
+
+    body, etag = cached
+    return json_response(request, body, etag)
 
 
 @router.get(
@@ -561,6 +787,73 @@ async def get_audit_progress_endpoint(audit_id: str, db: Session = Depends(get_d
     return progress.to_dict()
 
 
+@router.get(
+    "/audit/{audit_id}/progress/stream",
+    summary="Stream audit progress",
+    description=(
+        "Server-sent event stream of audit progress. Sends a `snapshot` event with the "
+        "current progress and event history, then a `progress` event for each new "
+        "event until the audit completes or fails."
+    ),
+    responses={
+        200: {"description": "text/event-stream of progress events"},
+        404: ERROR_RESPONSES[404],
+    },
+)
+async def stream_audit_progress(audit_id: str, request: Request, db: Session = Depends(get_db)):
+    """Push progress updates instead of having clients poll."""
+    # Subscribe before reading so no event lands between the read and the stream
+    subscription = await get_progress_broker().subscribe(audit_id)
+    live = LiveProgress.load(db, audit_id)
+    if live is None:
+        subscription.close()
+        raise HTTPException(status_code=404, detail="Audit not found")
+
+    return StreamingResponse(
+        _progress_event_stream(request, subscription, live),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _reload_live_progress(audit_id: str) -> Optional[LiveProgress]:
+    db = SessionLocal()
+    try:
+        return LiveProgress.load(db, audit_id)
+    finally:
+        db.close()
+
+
+async def _progress_event_stream(request: Request, subscription, live: LiveProgress):
+    """Yield the snapshot, then one SSE message per pushed progress event."""
+    metrics.inc_gauge("progress_stream_subscribers")
+    try:
+        yield sse_event(
+            "snapshot", {"progress": live.progress().to_dict(), "events": live.event_dicts()}
+        )
+        while not live.finished:
+            event = await subscription.get(timeout=PROGRESS_STREAM_HEARTBEAT_SECONDS)
+            if await request.is_disconnected():
+                break
+            if event is None:
+                # Pushes can be lost (e.g. while the listener reconnects), so
+                # check that the audit hasn't finished without us hearing
+                current = await asyncio.to_thread(_reload_live_progress, live.audit_id)
+                if current is not None and current.finished:
+                    yield sse_event(
+                        "snapshot",
+                        {"progress": current.progress().to_dict(), "events": current.event_dicts()},
+                    )
+                    break
+                yield b": keepalive\n\n"
+                continue
+            progress = live.apply(event)
+            yield sse_event("progress", {"progress": progress.to_dict(), "event": event})
+    finally:
+        subscription.close()
+        metrics.dec_gauge("progress_stream_subscribers")
+
+
 @router.get(
     "/audits/{audit_id}/report/{format}",
     summary="Download audit report",
@@ -639,35 +932,53 @@ async def get_audit_pdf(audit_id: str, db: Session = Depends(get_db)):
     },
 )
 async def list_audits(
+    request: Request,
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     user: User = Depends(require_auth),
     db: Session = Depends(get_db),
 ):
-    """List audits for the authenticated user with pagination."""
+    """
+    List audits for the authenticated user, newest first.
+
+    Pass the returned ``next_cursor`` as ``cursor`` to fetch the next page;
+    ``skip`` still works but costs more the deeper it goes.
+    """
     limit = min(limit, 100)
-    audits = (
-        db.query(Audit)
-        .filter(Audit.user_id == user.id)
-        .order_by(Audit.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = db.query(Audit).filter(Audit.user_id == user.id)
+    if skip and not cursor:
+        audits = (
+            query.order_by(Audit.created_at.desc(), Audit.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        next_cursor = encode_cursor(audits[-1]) if len(audits) == limit else None
+    else:
+        try:
+            page = keyset_page(query, cursor=cursor, per_page=limit)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        audits, next_cursor = page.items, page.next_cursor
+    body = dumps(
+        {
+            "audits": [
+                {
+                    "audit_id": a.id,
+                    "status": a.status,
+                    "url": a.url,
+                    "company_name": a.company_name,
+                    "overall_score": a.overall_score,
+                    "grade": a.grade,
+                    "tier": a.tier,
+                    "created_at": a.created_at.isoformat() if a.created_at else None,
+                }
+                for a in audits
+            ],
+            "skip": skip,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        }
     )
-    return {
-        "audits": [
-            {
-                "audit_id": a.id,
-                "status": a.status,
-                "url": a.url,
-                "company_name": a.company_name,
-                "overall_score": a.overall_score,
-                "grade": a.grade,
-                "tier": a.tier,
-                "created_at": a.created_at.isoformat() if a.created_at else None,
-            }
-            for a in audits
-        ],
-        "skip": skip,
-        "limit": limit,
-    }
+    return json_response(request, body)
@@ -198,5 +198,3 @@ async def test_webhook(
     except ValueError as e:
         logger.warning("Webhook test event failed: %s", e)
         raise HTTPException(status_code=404, detail="Webhook not found")
-    finally:
-        await service.close()
@@ -21,7 +21,7 @@ from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
-from sqlalchemy import or_, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from apps.dashboard.auth import (
@@ -36,8 +36,20 @@ from apps.dashboard.auth import (
 )
 from auth import authenticate_user, hash_password, verify_password
 from database import Audit, Tenant, User, get_db
-from packages.seo_health_report.quotas.service import QuotaExceededError, QuotaService
-from packages.seo_health_report.scripts.idempotency import compute_idempotency_key
+from packages.core.scheduling import job_priority
+from packages.database.listing import apply_search, count_audits, keyset_page
+from packages.seo_health_report.quotas.service import (
+    QUOTA_STATUS_CACHE_TTL,
+    QuotaExceededError,
+    QuotaService,
+    quota_cache_key,
+)
+from packages.seo_health_report.scripts import memory_cache
+from packages.seo_health_report.scripts.idempotency import (
+    compute_coalesce_key,
+    compute_idempotency_key,
+)
+from packages.storage.results import load_audit_result
 
 logger = logging.getLogger(__name__)
 
@@ -77,12 +89,17 @@ def get_tenant_name(db: Session, tenant_id: Optional[str]) -> Optional[str]:
 
 
 def get_quota_for_user(db: Session, tenant_id: Optional[str]) -> Optional[dict]:
-    """Get quota status for template context."""
+    """Get quota status for template context, cached briefly per tenant."""
     if not tenant_id:
         return None
+    cache_key = quota_cache_key(tenant_id)
+    quota = memory_cache.get(cache_key)
+    if quota is not None:
+        return quota
+
     quota_service = QuotaService(db)
     status = quota_service.check_quota(tenant_id)
-    return {
+    quota = {
         "monthly_audits_used": status.monthly_audits_used,
         "monthly_audits_limit": status.monthly_audits_limit,
         "monthly_audits_remaining": status.monthly_audits_remaining,
@@ -91,6 +108,8 @@ def get_quota_for_user(db: Session, tenant_id: Optional[str]) -> Optional[dict]:
         "can_start_audit": status.can_start_audit,
         "reset_date": status.reset_date,
     }
+    memory_cache.set(cache_key, quota, QUOTA_STATUS_CACHE_TTL)
+    return quota
 
 
 @router.get("/", response_class=RedirectResponse)
@@ -153,21 +172,20 @@ async def audit_list(
     user: dict = Depends(require_dashboard_auth),
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None),
+    before: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
 ):
-    """Display list of all audits with filtering and pagination."""
+    """Display list of all audits with filtering and cursor pagination."""
     per_page = 20
 
     query = db.query(Audit)
 
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(Audit.url.ilike(search_term), Audit.company_name.ilike(search_term))
-        )
+        query = apply_search(query, db, search)
 
     if status:
         if status == "pending":
@@ -190,14 +208,21 @@ async def audit_list(
         except ValueError:
             pass
 
-    total = query.count()
+    filtered = any((search, status, date_from, date_to))
+    total = count_audits(
+        query, f"audit_count:{search}|{status}|{date_from}|{date_to}", filtered=filtered
+    )
     total_pages = ceil(total / per_page) if total > 0 else 1
 
-    page = min(page, total_pages)
-
-    audits = (
-        query.order_by(Audit.created_at.desc()).offset((page - 1) * per_page).limit(per_page).all()
-    )
+    try:
+        result_page = keyset_page(query, cursor=cursor, before=before, per_page=per_page)
+    except ValueError:
+        # Stale or hand-edited cursor: start over from the newest audits
+        result_page = keyset_page(query, per_page=per_page)
+        page = 1
+    if not cursor and not before:
+        page = 1
+    audits = result_page.items
 
     tenant_name = get_tenant_name(db, user.get("tenant_id"))
     quota = get_quota_for_user(db, user.get("tenant_id"))
@@ -214,6 +239,8 @@ async def audit_list(
         "per_page": per_page,
         "total": total,
         "total_pages": total_pages,
+        "next_cursor": result_page.next_cursor,
+        "prev_cursor": result_page.prev_cursor,
     }
 
     return templates.TemplateResponse(
@@ -281,18 +308,23 @@ def enqueue_audit_job(
     if existing:
         return existing[0]
 
+    payload = {"url": url, "job_type": job_type, **options}
     db.execute(
         text("""
             INSERT INTO audit_jobs
-            (job_id, tenant_id, audit_id, status, idempotency_key, payload_json, queued_at)
-            VALUES (:job_id, :tenant_id, :audit_id, 'queued', :idempotency_key, :payload, CURRENT_TIMESTAMP)
+            (job_id, tenant_id, audit_id, status, idempotency_key, payload_json, priority,
+             coalesce_key, queued_at)
+            VALUES (:job_id, :tenant_id, :audit_id, 'queued', :idempotency_key, :payload,
+                    :priority, :coalesce_key, CURRENT_TIMESTAMP)
         """),
         {
             "job_id": job_id,
             "tenant_id": tenant_id or "default",
             "audit_id": audit_id,
             "idempotency_key": idempotency_key,
-            "payload": json.dumps({"url": url, "job_type": job_type, **options}),
+            "payload": json.dumps(payload),
+            "priority": job_priority(options.get("tier")),
+            "coalesce_key": compute_coalesce_key(payload),
         },
     )
     db.commit()
@@ -351,8 +383,8 @@ async def audit_create(
 
     if tenant_id:
         try:
-            quota_service = QuotaService(db)
-            quota_service.enforce_quota(tenant_id)
+            # Reserves the monthly unit and a concurrent slot in one UPDATE
+            QuotaService(db).admit_audit(tenant_id)
         except QuotaExceededError as e:
             return templates.TemplateResponse(
                 request,
@@ -421,20 +453,21 @@ async def audit_create(
         if result_audit_id != audit_id:
             db.delete(audit)
             db.commit()
+            if tenant_id:
+                QuotaService(db).release_audit(tenant_id, refund=True)
             logger.info(f"Returning existing audit {result_audit_id} for duplicate request")
             return RedirectResponse(url=f"/dashboard/audits/{result_audit_id}", status_code=302)
 
-        if tenant_id:
-            quota_service = QuotaService(db)
-            quota_service.increment_usage(tenant_id)
-
         logger.info(f"Created audit {audit_id} for {normalized_url} by user {user_id}")
 
     except Exception as e:
         logger.error(f"Failed to enqueue audit job: {e}")
+        db.rollback()
         audit.status = "failed"
         audit.result = {"error": f"Failed to queue audit: {str(e)}"}
         db.commit()
+        if tenant_id:
+            QuotaService(db).release_audit(tenant_id, refund=True)
 
         return templates.TemplateResponse(
             request,
@@ -476,12 +509,16 @@ async def audit_detail(
         )
     tenant_name = get_tenant_name(db, user.get("tenant_id"))
     quota = get_quota_for_user(db, user.get("tenant_id"))
+    audit_result = (
+        load_audit_result(audit) if audit.status in ("completed", "partial") else None
+    )
     return templates.TemplateResponse(
         request,
         "audit_detail.html",
         {
             "request": request,
             "audit": audit,
+            "audit_result": audit_result,
             "user": user,
             "tenant_name": tenant_name,
             "quota": quota,
@@ -0,0 +1 @@
+"""Headless-browser rendering service shared by workers."""
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Rendering service entrypoint.
+
+Holds one warm BrowserPool for the life of the process and renders pages for
+workers over HTTP, so an audit no longer pays for a Chromium launch. Workers
+reach it through RENDER_SERVICE_URL (see providers/render_client.py).
+"""
+
+import logging
+import os
+import sys
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Optional
+
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from fastapi import FastAPI
+from pydantic import BaseModel, Field
+
+from packages.seo_health_report.providers.browser_crawler import BrowserPool
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RENDER_MAX_URLS_PER_REQUEST = int(os.getenv("RENDER_MAX_URLS_PER_REQUEST", "20"))
+
+
+class RenderRequest(BaseModel):
+    urls: list[str] = Field(..., min_length=1, max_length=RENDER_MAX_URLS_PER_REQUEST)
+    timeout_ms: int = Field(30000, ge=1000, le=120000)
+
+
+def create_app(pool: Optional[BrowserPool] = None) -> FastAPI:
+    """Build the service around `pool` (a new BrowserPool by default)."""
+    pool = pool or BrowserPool()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await pool.start()
+        logger.info(f"Browser pool ready with {pool.size} warm contexts")
+        try:
+            yield
+        finally:
+            await pool.stop()
+
+    app = FastAPI(title="SEO Health Report Renderer", lifespan=lifespan)
+
+    @app.post("/render")
+    async def render(request: RenderRequest) -> dict[str, Any]:
+        pages = await pool.crawl_many(request.urls, timeout_ms=request.timeout_ms)
+        return {"pages": [asdict(page) for page in pages]}
+
+    @app.get("/health")
+    async def health() -> dict[str, Any]:
+        return {"status": "ok", "pool": pool.stats()}
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(create_app(), host="0.0.0.0", port=int(os.getenv("RENDER_SERVICE_PORT", "8100")))
@@ -5,6 +5,8 @@ Job executor module for claiming and processing audit jobs.
 import asyncio
 import json
 import logging
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
@@ -13,12 +15,30 @@ import httpx
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from apps.worker.handlers.full_audit import handle_full_audit_with_lease_renewal
+from apps.worker.handlers.full_audit import (
+    finalize_audit,
+    handle_full_audit,
+    lease_renewal,
+    write_progress_event,
+)
 from database import SessionLocal
+from packages.core.scheduling import (
+    JOB_FAIR_SHARE_DEFAULT_WEIGHT,
+    JOB_PRIORITY_AGING_MAX,
+    JOB_PRIORITY_AGING_SECONDS,
+    JOB_QUEUE_METRICS_INTERVAL,
+    QUEUE_DEPTH_GAUGE,
+    QUEUE_WAIT_HISTOGRAM,
+    job_lane,
+)
+from packages.schemas.models import ProgressStage
+from packages.seo_health_report.scripts.idempotency import compute_coalesce_key
 from packages.seo_health_report.scripts.safe_fetch import SSRFError
 
 logger = logging.getLogger(__name__)
 
+COALESCED_COUNTER = "audit_jobs_coalesced_total"
+
 
 class TransientError(Exception):
     """Retry-able errors: timeouts, 429, 503, network issues."""
@@ -50,6 +70,7 @@ class AuditJob:
     idempotency_key: str
     payload: dict[str, Any]
     last_error: Optional[str]
+    priority: int = 0
 
     @classmethod
     def from_row(cls, row) -> "AuditJob":
@@ -72,6 +93,7 @@ class AuditJob:
             idempotency_key=row.idempotency_key,
             payload=payload,
             last_error=row.last_error,
+            priority=row.priority,
         )
 
 
@@ -97,9 +119,109 @@ def _redact_error(error_message: str) -> str:
         return result
 
 
+# Fair-share claim (see packages/core/scheduling.py): eligible jobs are due
+# queued jobs and jobs whose lease expired, from tenants under their
+# concurrency cap, that aren't waiting on an identical running job (see
+# complete_followers); ordered by the tenant's share of its allowance in
+# use, then priority aged by at most one lane, then queue order.
+CLAIM_JOB_SQL = text("""
+    UPDATE audit_jobs
+    SET
+        status = 'running',
+        started_at = COALESCE(started_at, CURRENT_TIMESTAMP),
+        locked_until = datetime('now', '+' || :lease_seconds || ' seconds'),
+        locked_by = :worker_id,
+        attempt = attempt + 1
+    WHERE job_id = (
+        SELECT j.job_id
+        FROM audit_jobs j
+        LEFT JOIN (
+            SELECT tenant_id, COUNT(*) AS running
+            FROM audit_jobs
+            WHERE status = 'running' AND locked_until >= CURRENT_TIMESTAMP
+            GROUP BY tenant_id
+        ) r ON r.tenant_id = j.tenant_id
+        LEFT JOIN tenant_quotas q ON q.tenant_id = j.tenant_id
+        WHERE (
+                (j.status = 'queued' AND j.queued_at <= CURRENT_TIMESTAMP)
+                OR (j.status = 'running' AND j.locked_until < CURRENT_TIMESTAMP)
+            )
+            AND (
+                q.max_concurrent_audits IS NULL
+                OR q.max_concurrent_audits <= 0
+                OR COALESCE(r.running, 0) < q.max_concurrent_audits
+            )
+            AND NOT EXISTS (
+                SELECT 1 FROM audit_jobs l
+                WHERE l.coalesce_key = j.coalesce_key
+                  AND l.job_id != j.job_id
+                  AND l.status = 'running'
+                  AND l.locked_until >= CURRENT_TIMESTAMP
+            )
+        ORDER BY
+            COALESCE(r.running, 0) * 1.0 / (
+                CASE WHEN q.max_concurrent_audits > 0
+                    THEN q.max_concurrent_audits ELSE :default_weight END
+            ),
+            j.priority + MIN(
+                CAST(
+                    (julianday('now') - julianday(j.queued_at)) * 86400 / :aging_seconds
+                    AS INTEGER
+                ),
+                :aging_max
+            ) DESC,
+            j.queued_at
+        LIMIT 1
+    )
+    RETURNING *, (julianday('now') - julianday(queued_at)) * 86400.0 AS wait_seconds
+""")
+
+QUEUE_DEPTH_SQL = text("""
+    SELECT tenant_id, COUNT(*) FROM audit_jobs WHERE status = 'queued' GROUP BY tenant_id
+""")
+
+_queue_metrics_lock = threading.Lock()
+_queue_metrics_refreshed = 0.0
+_queue_depth_tenants: set[str] = set()
+
+
+def _record_claim(job: AuditJob, wait_seconds: Optional[float]) -> None:
+    """Export how long the claimed job waited in the queue."""
+    if wait_seconds is None:
+        return
+    from packages.seo_health_report.metrics import metrics
+
+    metrics.observe_histogram(
+        QUEUE_WAIT_HISTOGRAM,
+        max(wait_seconds, 0.0),
+        labels={"tenant_id": job.tenant_id or "default", "lane": job_lane(job.priority)},
+    )
+
+
+def _refresh_queue_depth(db: Session) -> None:
+    """Export queued jobs per tenant, at most every JOB_QUEUE_METRICS_INTERVAL."""
+    global _queue_metrics_refreshed
+    with _queue_metrics_lock:
+        if time.monotonic() - _queue_metrics_refreshed < JOB_QUEUE_METRICS_INTERVAL:
+            return
+        _queue_metrics_refreshed = time.monotonic()
+
+    from packages.seo_health_report.metrics import metrics
+
+    depths = {tenant_id or "default": count for tenant_id, count in db.execute(QUEUE_DEPTH_SQL)}
+    with _queue_metrics_lock:
+        # Tenants whose queue drained report 0 rather than their last depth
+        for tenant_id in _queue_depth_tenants - depths.keys():
+            metrics.set_gauge(QUEUE_DEPTH_GAUGE, 0, labels={"tenant_id": tenant_id})
+        for tenant_id, count in depths.items():
+            metrics.set_gauge(QUEUE_DEPTH_GAUGE, count, labels={"tenant_id": tenant_id})
+        _queue_depth_tenants.clear()
+        _queue_depth_tenants.update(depths)
+
+
 def claim_job(worker_id: str, lease_seconds: int = 300) -> Optional[AuditJob]:
     """
-    Atomically claim a job using UPDATE with optimistic locking (SQLite compatible).
+    Atomically claim the next job by fair-share order (SQLite compatible).
 
     Args:
         worker_id: Unique identifier for this worker instance.
@@ -110,32 +232,30 @@ def claim_job(worker_id: str, lease_seconds: int = 300) -> Optional[AuditJob]:
     """
     db: Session = SessionLocal()
     try:
-        query = text("""
-            UPDATE audit_jobs
-            SET
-                status = 'running',
-                started_at = COALESCE(started_at, CURRENT_TIMESTAMP),
-                locked_until = datetime('now', '+' || :lease_seconds || ' seconds'),
-                locked_by = :worker_id,
-                attempt = attempt + 1
-            WHERE job_id = (
-                SELECT job_id FROM audit_jobs
-                WHERE status = 'queued'
-                   OR (status = 'running' AND locked_until < CURRENT_TIMESTAMP)
-                ORDER BY queued_at
-                LIMIT 1
-            )
-            RETURNING *
-        """)
-
-        result = db.execute(query, {"worker_id": worker_id, "lease_seconds": lease_seconds})
+        result = db.execute(
+            CLAIM_JOB_SQL,
+            {
+                "worker_id": worker_id,
+                "lease_seconds": lease_seconds,
+                "aging_seconds": JOB_PRIORITY_AGING_SECONDS,
+                "aging_max": JOB_PRIORITY_AGING_MAX,
+                "default_weight": JOB_FAIR_SHARE_DEFAULT_WEIGHT,
+            },
+        )
         row = result.fetchone()
         db.commit()
 
+        try:
+            _refresh_queue_depth(db)
+        except Exception as e:
+            logger.debug(f"Could not refresh queue depth: {e}")
+
         if row is None:
             return None
 
-        return AuditJob.from_row(row)
+        job = AuditJob.from_row(row)
+        _record_claim(job, row.wait_seconds)
+        return job
     except Exception as e:
         db.rollback()
         logger.error(f"Error claiming job: {e}")
@@ -150,6 +270,23 @@ async def claim_job_async(worker_id: str, lease_seconds: int = 300) -> Optional[
     return await loop.run_in_executor(None, claim_job, worker_id, lease_seconds)
 
 
+# Frees the concurrent-audit slot the tenant took at admission. It runs in the
+# same transaction as the job's terminal status change, so it happens once.
+RELEASE_QUOTA_SLOT_SQL = text("""
+    UPDATE tenant_quotas
+    SET concurrent_audits = concurrent_audits - 1
+    WHERE tenant_id = :tenant_id AND concurrent_audits > 0
+""")
+
+
+def _finish_job(db: Session, query: Any, params: dict) -> Any:
+    """Apply a terminal job update and release the tenant's quota slot."""
+    row = db.execute(query, params).fetchone()
+    if row is not None and row.tenant_id:
+        db.execute(RELEASE_QUOTA_SLOT_SQL, {"tenant_id": row.tenant_id})
+    return row
+
+
 def mark_job_done(job_id: str) -> None:
     """
     Mark a job as successfully completed.
@@ -166,9 +303,10 @@ def mark_job_done(job_id: str) -> None:
                 finished_at = CURRENT_TIMESTAMP,
                 locked_until = NULL,
                 locked_by = NULL
-            WHERE job_id = :job_id
+            WHERE job_id = :job_id AND status IN ('queued', 'running')
+            RETURNING tenant_id
         """)
-        db.execute(query, {"job_id": job_id})
+        _finish_job(db, query, {"job_id": job_id})
         db.commit()
         logger.info(f"Job {job_id} marked as done")
     except Exception as e:
@@ -204,9 +342,10 @@ def mark_job_failed(job_id: str, error_message: str) -> None:
                 locked_until = NULL,
                 locked_by = NULL,
                 last_error = :error_message
-            WHERE job_id = :job_id
+            WHERE job_id = :job_id AND status IN ('queued', 'running')
+            RETURNING tenant_id
         """)
-        db.execute(query, {"job_id": job_id, "error_message": redacted_error})
+        _finish_job(db, query, {"job_id": job_id, "error_message": redacted_error})
         db.commit()
         logger.warning(f"Job {job_id} marked as failed: {redacted_error}")
     except Exception as e:
@@ -321,6 +460,89 @@ async def renew_lease_async(job_id: str, worker_id: str, lease_seconds: int = 30
     return await loop.run_in_executor(None, renew_lease, job_id, worker_id, lease_seconds)
 
 
+# Jobs with the leader's coalesce key that waited for it (the claim query
+# doesn't hand them out while it runs)
+FOLLOWERS_SQL = text("""
+    SELECT job_id, tenant_id, audit_id, payload_json FROM audit_jobs
+    WHERE coalesce_key = :coalesce_key AND status = 'queued' AND job_id != :job_id
+""")
+
+FOLLOWER_DONE_SQL = text("""
+    UPDATE audit_jobs
+    SET
+        status = 'done',
+        finished_at = CURRENT_TIMESTAMP,
+        leader_job_id = :leader_job_id
+    WHERE job_id = :job_id AND status = 'queued'
+    RETURNING tenant_id
+""")
+
+
+async def complete_followers(db: Session, job: AuditJob, raw_result: dict[str, Any]) -> int:
+    """
+    Give a finished audit's result to the identical jobs that waited on it.
+
+    Each follower gets its own reports, audit row and webhooks built from the
+    shared raw result, so nothing is crawled or sent to an LLM twice. A
+    follower that can't be completed stays queued and runs on its own.
+    Never raises.
+
+    Returns:
+        Number of followers completed.
+    """
+    coalesce_key = compute_coalesce_key(job.payload)
+    if coalesce_key is None:
+        return 0
+    try:
+        rows = db.execute(
+            FOLLOWERS_SQL, {"coalesce_key": coalesce_key, "job_id": job.job_id}
+        ).fetchall()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Could not look up jobs waiting on {job.job_id}: {e}")
+        return 0
+
+    from packages.seo_health_report.metrics import metrics
+
+    completed = 0
+    for row in rows:
+        try:
+            payload = row.payload_json
+            if isinstance(payload, str):
+                payload = json.loads(payload)
+            payload.setdefault("tenant_id", row.tenant_id)
+            finished = _finish_job(
+                db, FOLLOWER_DONE_SQL, {"job_id": row.job_id, "leader_job_id": job.job_id}
+            )
+            if finished is None:
+                db.rollback()
+                continue
+            # Commits the job's status with its audit row and webhooks
+            await finalize_audit(db, row.audit_id, payload, raw_result)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Could not complete job {row.job_id} from {job.job_id}: {e}")
+            continue
+        completed += 1
+        metrics.inc_counter(COALESCED_COUNTER)
+        try:
+            await write_progress_event(
+                db,
+                row.audit_id,
+                row.job_id,
+                ProgressStage.COMPLETED,
+                100,
+                "Audit completed with the result of an identical audit that was in progress",
+            )
+        except Exception as e:
+            db.rollback()
+            logger.debug(f"Could not record completion of job {row.job_id}: {e}")
+
+    if completed:
+        logger.info(f"Job {job.job_id} completed {completed} identical queued jobs")
+    return completed
+
+
 async def execute_job(job: AuditJob) -> None:
     """
     Execute an audit job by dispatching to the appropriate handler.
@@ -359,16 +581,21 @@ async def _execute_audit(job: AuditJob, worker_id: str = None, lease_seconds: in
             f"Missing required payload fields: url={url}, company_name={company_name}"
         )
 
+    worker_id = worker_id or job.locked_by or "unknown"
     db: Session = SessionLocal()
     try:
-        await handle_full_audit_with_lease_renewal(
-            audit_id=job.audit_id,
-            job_id=job.job_id,
-            payload=job.payload,
-            db=db,
-            worker_id=worker_id or job.locked_by or "unknown",
-            lease_seconds=lease_seconds,
-        )
+        # Followers are completed under the leader's lease: while it holds the
+        # lease they can't be claimed, and the leader can't be reclaimed
+        async with lease_renewal(job.job_id, worker_id, lease_seconds):
+            result = await handle_full_audit(
+                audit_id=job.audit_id,
+                job_id=job.job_id,
+                payload=job.payload,
+                db=db,
+                worker_id=worker_id,
+                lease_seconds=lease_seconds,
+            )
+            await complete_followers(db, job, result["raw"])
     except SSRFError as e:
         raise PermanentError(f"SSRF blocked: {e}")
     except httpx.TimeoutException as e:
@@ -2,7 +2,7 @@
 Full Audit Handler - Runs complete SEO audit via job queue.
 
 Executes technical, content, and AI visibility audits,
-calculates scores, generates reports, and delivers webhooks.
+calculates scores, generates reports, and stages webhooks in the outbox.
 """
 
 import asyncio
@@ -10,13 +10,18 @@ import json
 import logging
 import os
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
+from urllib.parse import urlparse
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from packages.core.cost_tracker import flush_cost_events, get_cost_ledger
+from packages.core.tracing import Stage, span, start_trace, traced
 from packages.schemas.models import (
     AuditResult,
     AuditStatus,
@@ -24,22 +29,24 @@ from packages.schemas.models import (
     ProgressStage,
     calculate_grade,
 )
+from packages.seo_health_report.progress import progress_event_dict, publish_progress_event
 from packages.seo_health_report.scripts.calculate_scores import calculate_composite_score
 from packages.seo_health_report.scripts.generate_report import generate_pdf_report
 from packages.seo_health_report.scripts.orchestrate import run_full_audit
 from packages.seo_health_report.scripts.rate_limiter import RateLimiter
 from packages.seo_health_report.scripts.redaction import redact_sensitive
-from packages.seo_health_report.scripts.webhook import (
-    build_audit_webhook_payload,
-    deliver_webhook,
-)
-from packages.seo_health_report.tier_config import get_tier_info, load_tier_config
+from packages.seo_health_report.scripts.webhook import build_audit_webhook_payload
+from packages.seo_health_report.tier_config import activate_tier, get_tier_info, reset_tier
+from packages.seo_health_report.webhooks.outbox import enqueue_audit_webhooks
+from packages.seo_health_report.webhooks.service import WebhookEvent
+from packages.storage.results import store_audit_result
 
 logger = logging.getLogger(__name__)
 
 LEASE_SECONDS = int(os.getenv("WORKER_LEASE_SECONDS", "300"))
 
 
+@traced(Stage.DB_WRITE)
 async def write_progress_event(
     db: Session,
     audit_id: str,
@@ -48,8 +55,10 @@ async def write_progress_event(
     progress_pct: int,
     message: str,
 ) -> None:
-    """Write progress event to database."""
+    """Write progress event to database and publish it to live subscribers."""
     event_id = str(uuid.uuid4())
+    event_type = stage.value if hasattr(stage, "value") else str(stage)
+    message = redact_sensitive(message)
     db.execute(
         text(
             """
@@ -62,12 +71,19 @@ async def write_progress_event(
             "event_id": event_id,
             "audit_id": audit_id,
             "job_id": job_id,
-            "event_type": stage.value if hasattr(stage, "value") else str(stage),
-            "message": redact_sensitive(message),
+            "event_type": event_type,
+            "message": message,
             "progress_pct": progress_pct,
         },
     )
+    publish_progress_event(
+        db,
+        audit_id,
+        progress_event_dict(event_type, message, progress_pct, datetime.now(timezone.utc)),
+    )
     db.commit()
+    # Phase boundary: write this audit's cost events buffered during the phase
+    flush_cost_events(db, audit_id)
 
 
 async def handle_full_audit(
@@ -100,220 +116,265 @@ async def handle_full_audit(
     callback_url = payload.get("callback_url")
     tenant_id = payload.get("tenant_id", "default")
 
-    # Load tier-specific configuration (models, settings)
-    load_tier_config(tier)
-    tier_info = get_tier_info()
-    logger.info(f"Audit tier: {tier_info.get('display_name', tier)} ({tier})")
-
     rate_limiter = RateLimiter.for_tier(tier)
 
-    await write_progress_event(
-        db,
-        audit_id,
-        job_id,
-        ProgressStage.INITIALIZING,
-        0,
-        f"Starting audit for {url}",
-    )
-
-    try:
+    with start_trace(
+        audit_id=audit_id, job_id=job_id, tenant_id=tenant_id, tier=tier, site=urlparse(url).netloc
+    ) as trace:
         await write_progress_event(
             db,
             audit_id,
             job_id,
-            ProgressStage.TECHNICAL_AUDIT,
-            10,
-            "Running technical SEO audit",
+            ProgressStage.INITIALIZING,
+            0,
+            f"Starting audit for {url}",
         )
 
-        await write_progress_event(
-            db,
-            audit_id,
-            job_id,
-            ProgressStage.CONTENT_AUDIT,
-            30,
-            "Running content authority audit",
-        )
+        # Bind tier-specific configuration (models, settings) to this job's context
+        # rather than os.environ, so audits on different tiers don't interfere
+        tier_token = activate_tier(tier)
+        tier_info = get_tier_info()
+        logger.info(f"Audit tier: {tier_info.get('display_name', tier)} ({tier})")
 
-        await write_progress_event(
-            db,
-            audit_id,
-            job_id,
-            ProgressStage.AI_VISIBILITY_AUDIT,
-            50,
-            "Running AI visibility audit",
-        )
+        try:
+            await write_progress_event(
+                db,
+                audit_id,
+                job_id,
+                ProgressStage.TECHNICAL_AUDIT,
+                10,
+                "Running technical SEO audit",
+            )
 
-        raw_result = await run_full_audit(
-            target_url=url,
-            company_name=company_name,
-            primary_keywords=keywords,
-            competitor_urls=competitors,
-            rate_limiter=rate_limiter,
-        )
+            await write_progress_event(
+                db,
+                audit_id,
+                job_id,
+                ProgressStage.CONTENT_AUDIT,
+                30,
+                "Running content authority audit",
+            )
 
-        scores = calculate_composite_score(raw_result)
-        overall_score = scores.get("overall_score", 0)
-        grade = calculate_grade(overall_score)
-        component_scores = scores.get("component_scores", {})
+            await write_progress_event(
+                db,
+                audit_id,
+                job_id,
+                ProgressStage.AI_VISIBILITY_AUDIT,
+                50,
+                "Running AI visibility audit",
+            )
 
-        technical_score = None
-        content_score = None
-        ai_visibility_score = None
+            raw_result = await run_full_audit(
+                target_url=url,
+                company_name=company_name,
+                primary_keywords=keywords,
+                competitor_urls=competitors,
+                rate_limiter=rate_limiter,
+                tier=tier,
+            )
 
-        if "technical" in component_scores:
-            technical_score = int(component_scores["technical"].get("score", 0))
-        if "content" in component_scores:
-            content_score = int(component_scores["content"].get("score", 0))
-        if "ai_visibility" in component_scores:
-            ai_visibility_score = int(component_scores["ai_visibility"].get("score", 0))
+            await write_progress_event(
+                db,
+                audit_id,
+                job_id,
+                ProgressStage.GENERATING_REPORT,
+                80,
+                "Generating audit report",
+            )
 
-        await write_progress_event(
-            db,
-            audit_id,
-            job_id,
-            ProgressStage.GENERATING_REPORT,
-            80,
-            "Generating audit report",
-        )
+            result_json = await finalize_audit(db, audit_id, payload, raw_result, trace)
+            summary = result_json["summary"]
 
-        audit_tier = AuditTier.BASIC
-        if tier in [t.value for t in AuditTier]:
-            audit_tier = AuditTier(tier)
+            await write_progress_event(
+                db,
+                audit_id,
+                job_id,
+                ProgressStage.COMPLETED,
+                100,
+                f"Audit completed with score {summary['overall_score']} ({summary['grade']})",
+            )
 
-        audit_result = AuditResult(
-            audit_id=audit_id,
-            url=url,
-            company_name=company_name,
-            tier=audit_tier,
-            status=AuditStatus.COMPLETED,
-            overall_score=overall_score,
-            grade=grade,
-            technical_score=technical_score,
-            content_score=content_score,
-            ai_visibility_score=ai_visibility_score,
-            completed_at=datetime.now(timezone.utc).isoformat(),
-        )
+            return result_json
+
+        except Exception as e:
+            error_msg = redact_sensitive(str(e))
+            await write_progress_event(
+                db,
+                audit_id,
+                job_id,
+                ProgressStage.FAILED,
+                0,
+                f"Audit failed: {error_msg}",
+            )
 
+            db.execute(
+                text("UPDATE audits SET status = :status WHERE id = :id"),
+                {"status": "failed", "id": audit_id},
+            )
+            webhook_payload = build_audit_webhook_payload(
+                audit_id=audit_id, status="failed", error_message=error_msg
+            )
+            enqueue_audit_webhooks(
+                db,
+                audit_id=audit_id,
+                tenant_id=tenant_id,
+                event_type=WebhookEvent.AUDIT_FAILED.value,
+                payload=webhook_payload,
+                callback_url=callback_url,
+            )
+            db.commit()
+
+            raise
+
+        finally:
+            # The audit's running cost totals aren't needed once it has finished
+            get_cost_ledger().finish_audit(db, audit_id)
+            reset_tier(tier_token)
+
+
+async def finalize_audit(
+    db: Session,
+    audit_id: str,
+    payload: dict[str, Any],
+    raw_result: dict[str, Any],
+    trace: Optional[Any] = None,
+) -> dict[str, Any]:
+    """
+    Score a finished audit, render its reports and publish the result.
+
+    The audit row update and its webhook outbox rows commit together. Also
+    used to give coalesced jobs (which waited on an identical audit) their
+    own reports, audit row and webhooks from the shared raw result.
+
+    Returns:
+        Result dict with raw and summary data
+    """
+    url = payload.get("url", "")
+    company_name = payload.get("company_name", "")
+    tier = payload.get("tier", "low")
+    callback_url = payload.get("callback_url")
+    tenant_id = payload.get("tenant_id", "default")
+
+    scores = calculate_composite_score(raw_result)
+    overall_score = scores.get("overall_score", 0)
+    grade = calculate_grade(overall_score)
+    component_scores = scores.get("component_scores", {})
+
+    technical_score = None
+    content_score = None
+    ai_visibility_score = None
+
+    if "technical" in component_scores:
+        technical_score = int(component_scores["technical"].get("score", 0))
+    if "content" in component_scores:
+        content_score = int(component_scores["content"].get("score", 0))
+    if "ai_visibility" in component_scores:
+        ai_visibility_score = int(component_scores["ai_visibility"].get("score", 0))
+
+    audit_tier = AuditTier.BASIC
+    if tier in [t.value for t in AuditTier]:
+        audit_tier = AuditTier(tier)
+
+    audit_result = AuditResult(
+        audit_id=audit_id,
+        url=url,
+        company_name=company_name,
+        tier=audit_tier,
+        status=AuditStatus.COMPLETED,
+        overall_score=overall_score,
+        grade=grade,
+        technical_score=technical_score,
+        content_score=content_score,
+        ai_visibility_score=ai_visibility_score,
+        completed_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+    with span("generate_html_report_simple", Stage.RENDER):
         html_path = await generate_html_report_simple(audit_result, raw_result, tenant_id)
-        audit_result.report_path = html_path
+    audit_result.report_path = html_path
 
-        # Try PDF generation (graceful fallback if unavailable)
+    # Try PDF generation (graceful fallback if unavailable)
+    with span("generate_pdf_report", Stage.RENDER):
         pdf_path = await generate_pdf_report(audit_result, raw_result, tenant_id, html_path)
-        if pdf_path:
-            audit_result.report_pdf_path = pdf_path
-            logger.info(f"PDF report generated: {pdf_path}")
-
-        result_json = {"raw": raw_result, "summary": audit_result.to_dict()}
-
-        grade_value = grade.value if hasattr(grade, "value") else str(grade)
-
-        db.execute(
-            text(
-                """
-                UPDATE audits SET
-                    status = 'completed',
-                    overall_score = :score,
-                    grade = :grade,
-                    result = :result,
-                    report_html_path = :html_path,
-                    report_pdf_path = :pdf_path,
-                    completed_at = CURRENT_TIMESTAMP
-                WHERE id = :audit_id
-            """
-            ),
-            {
-                "audit_id": audit_id,
-                "score": overall_score,
-                "grade": grade_value,
-                "result": json.dumps(result_json),
-                "html_path": html_path,
-                "pdf_path": pdf_path,
-            },
-        )
-        db.commit()
+    if pdf_path:
+        audit_result.report_pdf_path = pdf_path
+        logger.info(f"PDF report generated: {pdf_path}")
 
-        await write_progress_event(
-            db,
-            audit_id,
-            job_id,
-            ProgressStage.COMPLETED,
-            100,
-            f"Audit completed with score {overall_score} ({grade_value})",
-        )
+    result_json = {"raw": raw_result, "summary": audit_result.to_dict()}
+    if trace is not None:
+        # Spans up to here; the writes below are only in the histogram
+        result_json["trace"] = trace.to_dict()
 
-        if callback_url:
-            webhook_payload = build_audit_webhook_payload(
-                audit_id=audit_id,
-                status="completed",
-                overall_score=overall_score,
-                grade=grade_value,
-                report_url=html_path,
-            )
-            webhook_secret = get_webhook_secret(tenant_id)
-            webhook_result = await deliver_webhook(callback_url, webhook_payload, webhook_secret)
-
-            if webhook_result.success:
-                db.execute(
-                    text(
-                        "UPDATE audits SET callback_delivered_at = CURRENT_TIMESTAMP WHERE id = :id"
-                    ),
-                    {"id": audit_id},
-                )
-                db.commit()
-
-        return result_json
-
-    except Exception as e:
-        error_msg = redact_sensitive(str(e))
-        await write_progress_event(
-            db,
-            audit_id,
-            job_id,
-            ProgressStage.FAILED,
-            0,
-            f"Audit failed: {error_msg}",
-        )
+    grade_value = grade.value if hasattr(grade, "value") else str(grade)
 
-        db.execute(
-            text("UPDATE audits SET status = :status WHERE id = :id"),
-            {"status": "failed", "id": audit_id},
+    # Large results go to storage; the row keeps a pointer plus summary columns
+    with span("store_audit_result", Stage.DB_WRITE):
+        inline_result, result_key = await asyncio.to_thread(
+            store_audit_result, audit_id, result_json, tenant_id
         )
-        db.commit()
 
-        if callback_url:
-            webhook_payload = build_audit_webhook_payload(
-                audit_id=audit_id, status="failed", error_message=error_msg
-            )
-            await deliver_webhook(callback_url, webhook_payload, get_webhook_secret(tenant_id))
+    # Result and webhook outbox rows commit together; the dispatcher delivers
+    db.execute(
+        text(
+            """
+            UPDATE audits SET
+                status = 'completed',
+                overall_score = :score,
+                grade = :grade,
+                result = :result,
+                result_key = :result_key,
+                report_html_path = :html_path,
+                report_pdf_path = :pdf_path,
+                completed_at = CURRENT_TIMESTAMP
+            WHERE id = :audit_id
+        """
+        ),
+        {
+            "audit_id": audit_id,
+            "score": overall_score,
+            "grade": grade_value,
+            "result": json.dumps(inline_result) if inline_result is not None else None,
+            "result_key": result_key,
+            "html_path": html_path,
+            "pdf_path": pdf_path,
+        },
+    )
+    webhook_payload = build_audit_webhook_payload(
+        audit_id=audit_id,
+        status="completed",
+        overall_score=overall_score,
+        grade=grade_value,
+        report_url=html_path,
+    )
+    enqueue_audit_webhooks(
+        db,
+        audit_id=audit_id,
+        tenant_id=tenant_id,
+        event_type=WebhookEvent.AUDIT_COMPLETED.value,
+        payload=webhook_payload,
+        callback_url=callback_url,
+    )
+    db.commit()
 
-        raise
+    return result_json
 
 
-async def handle_full_audit_with_lease_renewal(
-    audit_id: str,
+@asynccontextmanager
+async def lease_renewal(
     job_id: str,
-    payload: dict[str, Any],
-    db: Session,
     worker_id: str,
     lease_seconds: int = LEASE_SECONDS,
-) -> dict[str, Any]:
+) -> AsyncIterator[None]:
     """
-    Wrapper for handle_full_audit with automatic lease renewal.
+    Keep renewing a job's lease for as long as the block runs.
 
-    Starts a background task that renews the job lease every LEASE_SECONDS/2
-    to prevent the job from being reclaimed during long-running audits.
+    A background task renews the lease every LEASE_SECONDS/2 so the job is
+    not reclaimed by another worker while it is still being worked on.
 
     Args:
-        audit_id: Audit record ID
         job_id: Job record ID
-        payload: Job payload with url, company_name, tier, etc.
-        db: Database session
-        worker_id: Worker ID for lease renewal
+        worker_id: Worker ID holding the lease
         lease_seconds: Lease duration in seconds
-
-    Returns:
-        Result dict with raw and summary data
     """
     from apps.worker.executor import renew_lease_async
 
@@ -330,6 +391,38 @@ async def handle_full_audit_with_lease_renewal(
 
     renewal_task = asyncio.create_task(lease_renewal_task())
     try:
+        yield
+    finally:
+        renewal_task.cancel()
+        try:
+            await renewal_task
+        except asyncio.CancelledError:
+            pass
+
+
+async def handle_full_audit_with_lease_renewal(
+    audit_id: str,
+    job_id: str,
+    payload: dict[str, Any],
+    db: Session,
+    worker_id: str,
+    lease_seconds: int = LEASE_SECONDS,
+) -> dict[str, Any]:
+    """
+    Wrapper for handle_full_audit with automatic lease renewal.
+
+    Args:
+        audit_id: Audit record ID
+        job_id: Job record ID
+        payload: Job payload with url, company_name, tier, etc.
+        db: Database session
+        worker_id: Worker ID for lease renewal
+        lease_seconds: Lease duration in seconds
+
+    Returns:
+        Result dict with raw and summary data
+    """
+    async with lease_renewal(job_id, worker_id, lease_seconds):
         return await handle_full_audit(
             audit_id=audit_id,
             job_id=job_id,
@@ -338,12 +431,6 @@ async def handle_full_audit_with_lease_renewal(
             worker_id=worker_id,
             lease_seconds=lease_seconds,
         )
-    finally:
-        renewal_task.cancel()
-        try:
-            await renewal_task
-        except asyncio.CancelledError:
-            pass
 
 
 async def generate_html_report_simple(
@@ -420,8 +507,3 @@ async def generate_html_report_simple(
         f.write(html)
 
     return str(report_path)
-
-
-def get_webhook_secret(tenant_id: str) -> str:
-    """Get webhook signing secret for tenant."""
-    return os.getenv("WEBHOOK_SECRET", f"webhook-secret-{tenant_id}")
@@ -17,6 +17,7 @@ from typing import Optional
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from packages.seo_health_report.progress import progress_event_dict, publish_progress_event
 from packages.seo_health_report.scripts.redaction import redact_sensitive
 from packages.seo_health_report.scripts.safe_fetch import safe_fetch
 
@@ -86,8 +87,9 @@ async def write_progress_event(
     message: str,
     progress_pct: int,
 ) -> None:
-    """Write a progress event to the database."""
+    """Write a progress event to the database and publish it to live subscribers."""
     event_id = str(uuid.uuid4())
+    message = redact_sensitive(message)
 
     db_session.execute(
         text(
@@ -102,8 +104,13 @@ async def write_progress_event(
             "audit_id": audit_id,
             "job_id": job_id,
             "event_type": event_type,
-            "message": redact_sensitive(message),
+            "message": message,
             "progress_pct": progress_pct,
         },
     )
+    publish_progress_event(
+        db_session,
+        audit_id,
+        progress_event_dict(event_type, message, progress_pct, datetime.now(timezone.utc)),
+    )
     db_session.commit()
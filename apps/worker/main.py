@@ -9,6 +9,7 @@ import logging
 import os
 import signal
 import sys
+import time
 import uuid
 from pathlib import Path
 from typing import Optional
@@ -28,18 +29,29 @@ from apps.worker.executor import (
     mark_job_failed_async,
     mark_job_queued_async,
 )
+from packages.core.analysis_pool import get_analysis_pool
+from packages.core.cost_tracker import get_cost_ledger
+from packages.core.profiler import profile
+from packages.seo_health_report.seo_logging import start_queue_logging
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[logging.StreamHandler(sys.stdout)],
 )
+# Format and write log output on a background thread, off the event loop
+start_queue_logging()
 logger = logging.getLogger(__name__)
 
 POLL_INTERVAL = int(os.getenv("WORKER_POLL_INTERVAL", "5"))
 LEASE_SECONDS = int(os.getenv("WORKER_LEASE_SECONDS", "300"))
 WORKER_ID = os.getenv("WORKER_ID", f"worker-{uuid.uuid4().hex[:8]}")
 WORKER_HEARTBEAT_FILE = os.getenv("WORKER_HEARTBEAT_FILE", "/tmp/worker_heartbeat")
+WEBHOOK_DISPATCHER_ENABLED = os.getenv("WEBHOOK_DISPATCHER_ENABLED", "true").lower() == "true"
+# Creating this file (optionally containing a duration) profiles the worker
+WORKER_PROFILE_TRIGGER_FILE = os.getenv("WORKER_PROFILE_TRIGGER_FILE", "/tmp/worker_profile")
+WORKER_PROFILE_SECONDS = float(os.getenv("WORKER_PROFILE_SECONDS", "30"))
+WORKER_PROFILE_DIR = os.getenv("WORKER_PROFILE_DIR", "/tmp/worker_profiles")
 
 shutdown_requested = False
 
@@ -77,6 +89,49 @@ def handle_shutdown(signum, frame):
     shutdown_requested = True
 
 
+def _read_profile_trigger() -> Optional[float]:
+    """Consume the profile trigger file; returns the seconds requested, if present."""
+    path = Path(WORKER_PROFILE_TRIGGER_FILE)
+    try:
+        content = path.read_text().strip()
+    except FileNotFoundError:
+        return None
+    path.unlink(missing_ok=True)
+    try:
+        return float(content) if content else WORKER_PROFILE_SECONDS
+    except ValueError:
+        logger.warning(f"Ignoring invalid profile duration {content!r}")
+        return WORKER_PROFILE_SECONDS
+
+
+async def watch_profile_triggers(requested: asyncio.Event) -> None:
+    """
+    Profile the worker on SIGUSR2 or when the trigger file appears.
+
+    Writes collapsed stacks and the event-loop blocking report to
+    WORKER_PROFILE_DIR.
+    """
+    while not shutdown_requested:
+        try:
+            try:
+                await asyncio.wait_for(requested.wait(), timeout=1)
+                seconds = WORKER_PROFILE_SECONDS
+            except asyncio.TimeoutError:
+                seconds = _read_profile_trigger()
+                if seconds is None:
+                    continue
+            requested.clear()
+
+            logger.info(f"Profiling worker for {seconds}s")
+            report = await profile(seconds)
+            paths = report.write(Path(WORKER_PROFILE_DIR), f"{WORKER_ID}-{int(time.time())}")
+            logger.info(
+                f"Profile written to {paths[0]} ({len(report.blocking)} callbacks blocked the loop)"
+            )
+        except Exception as e:
+            logger.exception(f"Error in profile watcher: {e}")
+
+
 async def worker_loop(worker_id: str) -> None:
     """
     Main worker loop that polls for and executes jobs.
@@ -146,11 +201,36 @@ async def main() -> None:
     signal.signal(signal.SIGTERM, handle_shutdown)
     signal.signal(signal.SIGINT, handle_shutdown)
 
+    profile_requested = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGUSR2, profile_requested.set)
+    profiler_task = asyncio.create_task(watch_profile_triggers(profile_requested))
+
+    cost_ledger = get_cost_ledger()
+    cost_ledger.start_flusher()
+
+    # Start analysis processes up front rather than inside the first audit
+    analysis_pool = get_analysis_pool()
+    analysis_pool.start()
+
+    dispatcher_stop = asyncio.Event()
+    dispatcher_task = None
+    if WEBHOOK_DISPATCHER_ENABLED:
+        from packages.seo_health_report.webhooks.dispatcher import WebhookDispatcher
+
+        dispatcher_task = asyncio.create_task(WebhookDispatcher().run_forever(dispatcher_stop))
+
     try:
         await worker_loop(WORKER_ID)
     except Exception as e:
         logger.exception(f"Fatal error in worker: {e}")
         sys.exit(1)
+    finally:
+        if dispatcher_task is not None:
+            dispatcher_stop.set()
+            await dispatcher_task
+        profiler_task.cancel()
+        cost_ledger.stop_flusher()
+        analysis_pool.shutdown()
 
     logger.info(f"Worker {WORKER_ID} shut down gracefully")
 
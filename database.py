@@ -7,6 +7,7 @@ from packages.database import (  # noqa: F401
     Base,
     Competitor,
     CostEvent,
+    CostRollup,
     Payment,
     SessionLocal,
     Tenant,
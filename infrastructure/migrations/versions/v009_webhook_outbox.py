@@ -0,0 +1,49 @@
+"""Turn webhook_deliveries into a transactional outbox
+
+Revision ID: 009_webhook_outbox
+Revises: 008_tenant_quotas
+Create Date: 2026-10-18
+
+Per-audit callback deliveries have no webhook subscription row, so webhook_id
+becomes nullable and the callback URL is stored in target_url.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "009_webhook_outbox"
+down_revision: Union[str, None] = "008_tenant_quotas"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("webhook_deliveries") as batch_op:
+        batch_op.alter_column("webhook_id", existing_type=sa.String(36), nullable=True)
+        batch_op.add_column(sa.Column("target_url", sa.String(500), nullable=True))
+        batch_op.add_column(sa.Column("audit_id", sa.String(36), nullable=True))
+        batch_op.add_column(sa.Column("tenant_id", sa.String(36), nullable=True))
+
+    op.create_index("ix_webhook_deliveries_audit_id", "webhook_deliveries", ["audit_id"])
+    op.create_index("ix_webhook_deliveries_tenant_id", "webhook_deliveries", ["tenant_id"])
+    op.create_index(
+        "ix_webhook_deliveries_status_next_retry",
+        "webhook_deliveries",
+        ["status", "next_retry_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_webhook_deliveries_status_next_retry", table_name="webhook_deliveries")
+    op.drop_index("ix_webhook_deliveries_tenant_id", table_name="webhook_deliveries")
+    op.drop_index("ix_webhook_deliveries_audit_id", table_name="webhook_deliveries")
+
+    op.execute("DELETE FROM webhook_deliveries WHERE webhook_id IS NULL")
+    with op.batch_alter_table("webhook_deliveries") as batch_op:
+        batch_op.drop_column("tenant_id")
+        batch_op.drop_column("audit_id")
+        batch_op.drop_column("target_url")
+        batch_op.alter_column("webhook_id", existing_type=sa.String(36), nullable=False)
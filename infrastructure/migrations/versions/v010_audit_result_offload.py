@@ -0,0 +1,26 @@
+"""Pointer column for audit results offloaded to storage
+
+Revision ID: 010_audit_result_offload
+Revises: 009_webhook_outbox
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "010_audit_result_offload"
+down_revision: Union[str, None] = "009_webhook_outbox"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("audits", sa.Column("result_key", sa.String(500), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("audits", "result_key")
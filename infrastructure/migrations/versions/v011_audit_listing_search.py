@@ -0,0 +1,69 @@
+"""Keyset pagination indexes and URL/company search for audits
+
+Revision ID: 011_audit_listing_search
+Revises: 010_audit_result_offload
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+revision: str = "011_audit_listing_search"
+down_revision: Union[str, None] = "010_audit_result_offload"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AUDITS_FTS_SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS audits_fts USING fts5("
+    "audit_id UNINDEXED, url, company_name, tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS audits_fts_insert AFTER INSERT ON audits BEGIN "
+    "INSERT INTO audits_fts (audit_id, url, company_name) "
+    "VALUES (new.id, new.url, new.company_name); END",
+    "CREATE TRIGGER IF NOT EXISTS audits_fts_update AFTER UPDATE OF url, company_name ON audits "
+    "BEGIN UPDATE audits_fts SET url = new.url, company_name = new.company_name "
+    "WHERE audit_id = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS audits_fts_delete AFTER DELETE ON audits BEGIN "
+    "DELETE FROM audits_fts WHERE audit_id = old.id; END",
+)
+
+
+def upgrade() -> None:
+    op.create_index("ix_audits_created_at_id", "audits", ["created_at", "id"])
+    op.create_index("ix_audits_user_created_at_id", "audits", ["user_id", "created_at", "id"])
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        # Trigram GIN indexes serve ILIKE '%term%' without a sequential scan
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_audits_url_trgm "
+            "ON audits USING gin (url gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_audits_company_name_trgm "
+            "ON audits USING gin (company_name gin_trgm_ops)"
+        )
+    elif dialect == "sqlite":
+        for statement in AUDITS_FTS_SQLITE_DDL:
+            op.execute(statement)
+        op.execute(
+            "INSERT INTO audits_fts (audit_id, url, company_name) "
+            "SELECT id, url, company_name FROM audits"
+        )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_audits_company_name_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_audits_url_trgm")
+    elif dialect == "sqlite":
+        for trigger in ("audits_fts_insert", "audits_fts_update", "audits_fts_delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS audits_fts")
+
+    op.drop_index("ix_audits_user_created_at_id", table_name="audits")
+    op.drop_index("ix_audits_created_at_id", table_name="audits")
@@ -0,0 +1,39 @@
+"""Concurrent audit counter on tenant quotas
+
+Revision ID: 012_quota_concurrent_counter
+Revises: 011_audit_listing_search
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "012_quota_concurrent_counter"
+down_revision: Union[str, None] = "011_audit_listing_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tenant_quotas",
+        sa.Column("concurrent_audits", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # Seed from jobs that are still in flight
+    op.execute(
+        """
+        UPDATE tenant_quotas SET concurrent_audits = (
+            SELECT COUNT(*) FROM audit_jobs
+            WHERE audit_jobs.tenant_id = tenant_quotas.tenant_id
+              AND audit_jobs.status IN ('queued', 'running')
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tenant_quotas", "concurrent_audits")
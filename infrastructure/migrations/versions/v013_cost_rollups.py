@@ -0,0 +1,61 @@
+"""Per-tenant daily cost rollups
+
+Revision ID: 013_cost_rollups
+Revises: 012_quota_concurrent_counter
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "013_cost_rollups"
+down_revision: Union[str, None] = "012_quota_concurrent_counter"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cost_rollups",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("tenant_id", sa.String(36), nullable=False, server_default=""),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cost_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ux_cost_rollups_tenant_day", "cost_rollups", ["tenant_id", "day"], unique=True
+    )
+
+    # Seed from the existing ledger
+    conn = op.get_bind()
+    day_expr = "date(created_at)" if conn.dialect.name == "sqlite" else "CAST(created_at AS DATE)"
+    uuid_expr = (
+        "lower(hex(randomblob(16)))" if conn.dialect.name == "sqlite" else "gen_random_uuid()::text"
+    )
+    op.execute(
+        f"""
+        INSERT INTO cost_rollups
+            (id, tenant_id, day, event_count, total_tokens, cost_usd, updated_at)
+        SELECT {uuid_expr}, tenant_id, day, event_count, total_tokens, cost_usd, CURRENT_TIMESTAMP
+        FROM (
+            SELECT COALESCE(tenant_id, '') AS tenant_id, {day_expr} AS day,
+                   COUNT(*) AS event_count,
+                   COALESCE(SUM(total_tokens), 0) AS total_tokens,
+                   COALESCE(SUM(cost_usd), 0) AS cost_usd
+            FROM cost_events
+            GROUP BY COALESCE(tenant_id, ''), {day_expr}
+        ) AS daily
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_cost_rollups_tenant_day", table_name="cost_rollups")
+    op.drop_table("cost_rollups")
@@ -0,0 +1,46 @@
+"""Audit batches for bulk submission
+
+Revision ID: 014_audit_batches
+Revises: 013_cost_rollups
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "014_audit_batches"
+down_revision: Union[str, None] = "013_cost_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_batches",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("tenant_id", sa.String(36), sa.ForeignKey("tenants.id"), nullable=True),
+        sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("tier", sa.String(50), nullable=True),
+        sa.Column("submitted_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("queued_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("duplicate_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("invalid_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_audit_batches_tenant_id", "audit_batches", ["tenant_id"])
+    op.create_index("ix_audit_batches_user_id", "audit_batches", ["user_id"])
+
+    op.add_column("audits", sa.Column("batch_id", sa.String(36), nullable=True))
+    op.create_index("ix_audits_batch_id", "audits", ["batch_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audits_batch_id", table_name="audits")
+    op.drop_column("audits", "batch_id")
+    op.drop_index("ix_audit_batches_user_id", table_name="audit_batches")
+    op.drop_index("ix_audit_batches_tenant_id", table_name="audit_batches")
+    op.drop_table("audit_batches")
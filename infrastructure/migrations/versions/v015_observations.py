@@ -0,0 +1,39 @@
+"""Tenant-neutral observation store
+
+Revision ID: 015_observations
+Revises: 014_audit_batches
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "015_observations"
+down_revision: Union[str, None] = "014_audit_batches"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "observations",
+        sa.Column("key", sa.String(64), primary_key=True),
+        sa.Column("kind", sa.String(50), nullable=False),
+        sa.Column("subject", sa.String(2048), nullable=False),
+        sa.Column("analyzer_version", sa.String(20), nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("observed_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_observations_kind", "observations", ["kind"])
+    op.create_index("ix_observations_expires_at", "observations", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_observations_expires_at", table_name="observations")
+    op.drop_index("ix_observations_kind", table_name="observations")
+    op.drop_table("observations")
@@ -0,0 +1,32 @@
+"""Job priority for fair-share claiming
+
+Revision ID: 016_job_priority
+Revises: 015_observations
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "016_job_priority"
+down_revision: Union[str, None] = "015_observations"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "audit_jobs",
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # Per-tenant running counts for the concurrency caps
+    op.create_index("idx_jobs_tenant_status", "audit_jobs", ["tenant_id", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_jobs_tenant_status", table_name="audit_jobs")
+    op.drop_column("audit_jobs", "priority")
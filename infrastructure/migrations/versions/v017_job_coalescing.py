@@ -0,0 +1,30 @@
+"""Coalescing of identical in-flight audit jobs
+
+Revision ID: 017_job_coalescing
+Revises: 016_job_priority
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "017_job_coalescing"
+down_revision: Union[str, None] = "016_job_priority"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("audit_jobs", sa.Column("coalesce_key", sa.String(64), nullable=True))
+    op.add_column("audit_jobs", sa.Column("leader_job_id", sa.String(36), nullable=True))
+    op.create_index("idx_jobs_coalesce_status", "audit_jobs", ["coalesce_key", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_jobs_coalesce_status", table_name="audit_jobs")
+    op.drop_column("audit_jobs", "leader_job_id")
+    op.drop_column("audit_jobs", "coalesce_key")
@@ -8,6 +8,8 @@ import re
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from packages.core.tracing import Stage, traced
+
 # Import from sibling module
 from .query_ai_systems import AIResponse
 
@@ -34,6 +36,7 @@ class SentimentResult:
     key_phrases: list[str]
 
 
+@traced(Stage.ANALYZE)
 def analyze_brand_presence(
     responses: dict[str, list[AIResponse]], brand_name: str, competitors: Optional[list[str]] = None
 ) -> dict[str, Any]:
@@ -130,6 +133,7 @@ def analyze_brand_presence(
     }
 
 
+@traced(Stage.ANALYZE)
 def check_accuracy(
     responses: dict[str, list[AIResponse]], ground_truth: dict[str, Any], brand_name: str
 ) -> dict[str, Any]:
@@ -276,6 +280,7 @@ def check_accuracy(
     }
 
 
+@traced(Stage.ANALYZE)
 def analyze_sentiment(responses: dict[str, list[AIResponse]], brand_name: str) -> dict[str, Any]:
     """
     Analyze sentiment of AI responses about the brand.
@@ -5,10 +5,13 @@ Check if brand exists in knowledge graphs: Google KG, Wikipedia, Wikidata, Crunc
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any, Optional
 from urllib.parse import quote
 
+from packages.core.observations import ObservationKind, observed
+from packages.core.tracing import Stage, traced
+
 
 @dataclass
 class KnowledgeSource:
@@ -21,6 +24,18 @@ class KnowledgeSource:
     error: Optional[str] = None
 
 
+def _shared_lookup(source: str):
+    """Share a source's brand lookups across audits; failed lookups aren't kept."""
+    return observed(
+        ObservationKind.KNOWLEDGE_GRAPH,
+        name=source,
+        keep=lambda result: result.error is None,
+        encode=asdict,
+        decode=lambda stored: KnowledgeSource(**stored),
+    )
+
+
+@_shared_lookup("google_kg")
 def check_google_knowledge_graph(brand_name: str, api_key: Optional[str] = None) -> KnowledgeSource:
     """
     Check Google Knowledge Graph for brand presence.
@@ -101,6 +116,7 @@ def check_google_knowledge_graph(brand_name: str, api_key: Optional[str] = None)
         return KnowledgeSource(source="google_kg", found=False, error=str(e))
 
 
+@_shared_lookup("wikipedia")
 def check_wikipedia(brand_name: str) -> KnowledgeSource:
     """
     Check Wikipedia for brand presence.
@@ -190,6 +206,7 @@ def check_wikipedia(brand_name: str) -> KnowledgeSource:
         return KnowledgeSource(source="wikipedia", found=False, error=str(e))
 
 
+@_shared_lookup("wikidata")
 def check_wikidata(brand_name: str) -> KnowledgeSource:
     """
     Check Wikidata for brand presence.
@@ -414,6 +431,7 @@ def check_linkedin(brand_name: str, linkedin_url: Optional[str] = None) -> Knowl
         return KnowledgeSource(source="linkedin", found=False, error=str(e))
 
 
+@traced(Stage.ANALYZE)
 def check_all_sources(brand_name: str, target_url: Optional[str] = None) -> dict[str, Any]:
     """
     Check all knowledge graph sources for brand presence.
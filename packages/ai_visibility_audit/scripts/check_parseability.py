@@ -15,6 +15,9 @@ from typing import Any, Optional
 # Add parent directory to path for logger import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from packages.core.observations import ObservationKind, observed
+from packages.core.parsed_page import parse_page
+from packages.core.tracing import Stage, traced
 from seo_health_report.scripts.logger import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +34,8 @@ class ParseabilityIssue:
     recommendation: str = ""
 
 
+@observed(ObservationKind.PAGE)
+@traced(Stage.FETCH)
 def fetch_page(url: str, timeout: int = 30) -> Optional[str]:
     """
     Fetch a web page's HTML content.
@@ -72,22 +77,11 @@ def check_semantic_html(html: str) -> dict[str, Any]:
     issues: list[ParseabilityIssue] = []
     findings = []
     score = 15  # Start with max, deduct for issues
+    page = parse_page(html)
 
     # Check for semantic elements
-    semantic_elements = {
-        "<header": "header",
-        "<nav": "nav",
-        "<main": "main",
-        "<article": "article",
-        "<section": "section",
-        "<aside": "aside",
-        "<footer": "footer",
-    }
-
-    found_semantic = []
-    for tag, name in semantic_elements.items():
-        if tag in html.lower():
-            found_semantic.append(name)
+    semantic_elements = ["header", "nav", "main", "article", "section", "aside", "footer"]
+    found_semantic = [name for name in semantic_elements if page.count(name)]
 
     if len(found_semantic) >= 5:
         findings.append(f"Good: Uses semantic elements: {', '.join(found_semantic)}")
@@ -109,9 +103,9 @@ def check_semantic_html(html: str) -> dict[str, Any]:
         score -= 5
 
     # Check heading hierarchy
-    h1_count = len(re.findall(r"<h1[^>]*>", html, re.IGNORECASE))
-    h2_count = len(re.findall(r"<h2[^>]*>", html, re.IGNORECASE))
-    h3_count = len(re.findall(r"<h3[^>]*>", html, re.IGNORECASE))
+    h1_count = page.count("h1")
+    h2_count = page.count("h2")
+    h3_count = page.count("h3")
 
     if h1_count == 1:
         findings.append("Good: Single H1 tag (proper hierarchy)")
@@ -147,7 +141,7 @@ def check_semantic_html(html: str) -> dict[str, Any]:
         score -= 2
 
     # Check for excessive div nesting (makes parsing harder)
-    div_count = html.lower().count("<div")
+    div_count = page.count("div")
     semantic_count = len(found_semantic)
 
     if div_count > 0 and semantic_count > 0:
@@ -195,10 +189,10 @@ def check_structured_data(html: str) -> dict[str, Any]:
     findings = []
     structured_data = []
     score_bonus = 0
+    page = parse_page(html)
 
     # Check for JSON-LD
-    json_ld_pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-    json_ld_matches = re.findall(json_ld_pattern, html, re.DOTALL | re.IGNORECASE)
+    json_ld_matches = page.json_ld
 
     if json_ld_matches:
         findings.append(f"Found {len(json_ld_matches)} JSON-LD block(s)")
@@ -221,20 +215,19 @@ def check_structured_data(html: str) -> dict[str, Any]:
                 findings.append("  - JSON-LD: Parse error (invalid JSON)")
 
     # Check for microdata
-    itemscope_count = len(re.findall(r"itemscope", html, re.IGNORECASE))
+    itemscope_count = page.itemscope_count
     if itemscope_count > 0:
         findings.append(f"Found {itemscope_count} microdata itemscope attribute(s)")
         score_bonus += 2
 
         # Try to extract itemtype
-        itemtype_matches = re.findall(r'itemtype=["\']([^"\']+)["\']', html, re.IGNORECASE)
-        for itemtype in itemtype_matches[:5]:  # Limit to 5
+        for itemtype in page.microdata_types[:5]:  # Limit to 5
             structured_data.append({"format": "Microdata", "type": itemtype})
             findings.append(f"  - Microdata: {itemtype}")
 
     # Check for RDFa
-    vocab_count = len(re.findall(r"vocab=", html, re.IGNORECASE))
-    typeof_count = len(re.findall(r"typeof=", html, re.IGNORECASE))
+    vocab_count = page.rdfa_vocab_count
+    typeof_count = len(page.rdfa_types)
 
     if vocab_count > 0 or typeof_count > 0:
         findings.append(f"Found RDFa markup (vocab: {vocab_count}, typeof: {typeof_count})")
@@ -285,22 +278,13 @@ def check_content_extraction(html: str) -> dict[str, Any]:
     findings = []
     issues = []
     score = 0
+    page = parse_page(html)
 
     # Check meta description
-    meta_desc = re.search(
-        r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)["\']',
-        html,
-        re.IGNORECASE,
-    )
-    if not meta_desc:
-        meta_desc = re.search(
-            r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']description["\']',
-            html,
-            re.IGNORECASE,
-        )
+    meta_desc = page.meta("description")
 
     if meta_desc:
-        desc_length = len(meta_desc.group(1))
+        desc_length = len(meta_desc)
         if 120 <= desc_length <= 160:
             findings.append(f"Good: Meta description present ({desc_length} chars)")
             score += 2
@@ -314,9 +298,9 @@ def check_content_extraction(html: str) -> dict[str, Any]:
         issues.append("Add meta description for AI snippet extraction")
 
     # Check title tag
-    title_match = re.search(r"<title>([^<]+)</title>", html, re.IGNORECASE)
-    if title_match:
-        title_length = len(title_match.group(1))
+    title = page.title
+    if title:
+        title_length = len(title)
         if 30 <= title_length <= 60:
             findings.append(f"Good: Title tag present ({title_length} chars)")
             score += 2
@@ -330,16 +314,8 @@ def check_content_extraction(html: str) -> dict[str, Any]:
         issues.append("Add title tag")
 
     # Check for readable content (text to HTML ratio)
-    # Remove scripts and styles
-    clean_html = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    clean_html = re.sub(r"<style[^>]*>.*?</style>", "", clean_html, flags=re.DOTALL | re.IGNORECASE)
-
-    # Extract text
-    text = re.sub(r"<[^>]+>", " ", clean_html)
-    text = re.sub(r"\s+", " ", text).strip()
-
-    text_length = len(text)
-    html_length = len(html)
+    text_length = len(page.text)
+    html_length = page.html_length
 
     if html_length > 0:
         text_ratio = text_length / html_length
@@ -356,8 +332,8 @@ def check_content_extraction(html: str) -> dict[str, Any]:
             issues.append("Increase visible text content, reduce markup bloat")
 
     # Check for images with alt text
-    img_tags = re.findall(r"<img[^>]+>", html, re.IGNORECASE)
-    imgs_with_alt = len([img for img in img_tags if "alt=" in img.lower()])
+    img_tags = page.images
+    imgs_with_alt = len([img for img in img_tags if img.alt is not None])
 
     if img_tags:
         alt_ratio = imgs_with_alt / len(img_tags)
@@ -375,7 +351,7 @@ def check_content_extraction(html: str) -> dict[str, Any]:
         "issues": issues,
         "details": {
             "has_meta_description": meta_desc is not None,
-            "has_title": title_match is not None,
+            "has_title": bool(title),
             "text_length": text_length,
             "text_ratio": text_length / html_length if html_length > 0 else 0,
             "image_count": len(img_tags),
@@ -415,10 +391,7 @@ def check_javascript_dependency(html: str) -> dict[str, Any]:
         findings.append(f"Detected JS framework(s): {', '.join(detected_frameworks)}")
 
         # Check if there's actual content or just JS shell
-        # Remove script tags and check remaining content
-        clean_html = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<[^>]+>", " ", clean_html)
-        text = re.sub(r"\s+", " ", text).strip()
+        text = parse_page(html).text
 
         if len(text) < 500:
             findings.append("WARNING: Very little server-rendered content - may be JS-dependent")
@@ -433,12 +406,10 @@ def check_javascript_dependency(html: str) -> dict[str, Any]:
         findings.append("No SPA framework detected - content likely server-rendered")
 
     # Check for noscript content
-    noscript_match = re.search(
-        r"<noscript[^>]*>(.*?)</noscript>", html, flags=re.DOTALL | re.IGNORECASE
-    )
-    if noscript_match:
-        noscript_content = noscript_match.group(1)
-        if len(noscript_content) > 100:
+    noscript_texts = parse_page(html).noscript_texts
+    noscript_match = noscript_texts[0] if noscript_texts else None
+    if noscript_match is not None:
+        if len(noscript_match) > 100:
             findings.append("Good: Has meaningful noscript fallback content")
         else:
             findings.append("Has noscript tag but minimal content")
@@ -455,6 +426,7 @@ def check_javascript_dependency(html: str) -> dict[str, Any]:
     }
 
 
+@traced(Stage.ANALYZE)
 def analyze_site_structure(url: str) -> dict[str, Any]:
     """
     Main function to analyze a website's LLM parseability.
@@ -6,6 +6,7 @@ to assess brand visibility.
 """
 
 import asyncio
+import contextvars
 import os
 import sys
 import time
@@ -16,6 +17,8 @@ from typing import Any, Optional
 # Add parent directory to path for config import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from packages.core.tracing import Stage, traced
+
 try:
     from seo_health_report.config import get_config
 except ImportError:
@@ -31,6 +34,15 @@ except ImportError:
             return MockConfig()
 
 
+# Per-audit tier settings (models), falling back to the process environment
+try:
+    from packages.seo_health_report.tier_config import tier_setting
+except ImportError:
+
+    def tier_setting(name, default=None):
+        return os.environ.get(name, default)
+
+
 # Cache imports with fallback
 try:
     from seo_health_report.scripts.cache import TTL_AI_RESPONSE, cached
@@ -81,6 +93,15 @@ GROK_MODEL_FAST = os.environ.get("XAI_MODEL_FAST", "grok-4-1-fast")
 GROK_MODEL_QUALITY = os.environ.get("XAI_MODEL_QUALITY", "grok-4-1")
 GROK_MODEL = os.environ.get("XAI_MODEL", GROK_MODEL_FAST)
 
+# API endpoints (overridable to point at a proxy or a local stub). Claude's
+# SDK reads ANTHROPIC_BASE_URL itself.
+OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")
+GEMINI_BASE_URL = os.environ.get(
+    "GEMINI_BASE_URL", "https://generativelanguage.googleapis.com/v1beta"
+)
+PERPLEXITY_BASE_URL = os.environ.get("PERPLEXITY_BASE_URL", "https://api.perplexity.ai")
+XAI_BASE_URL = os.environ.get("XAI_BASE_URL", "https://api.x.ai/v1")
+
 
 class QueryCategory(Enum):
     """Categories of test queries for comprehensive coverage."""
@@ -243,7 +264,10 @@ def generate_test_queries(
     return queries
 
 
-@cached("ai_responses", TTL_AI_RESPONSE)
+@cached(
+    "ai_responses", TTL_AI_RESPONSE, vary=lambda: tier_setting("ANTHROPIC_MODEL", ANTHROPIC_MODEL)
+)
+@traced(Stage.LLM)
 async def query_claude(query: str, brand_name: str, api_key: Optional[str] = None) -> AIResponse:
     """
     Query Claude (Anthropic) API.
@@ -279,12 +303,15 @@ async def query_claude(query: str, brand_name: str, api_key: Optional[str] = Non
 
         start_time = time.time()
 
-        # Run blocking API call in thread pool
+        # Run blocking API call in thread pool, carrying the audit's tier context
         loop = asyncio.get_event_loop()
+        context = contextvars.copy_context()
+        model = tier_setting("ANTHROPIC_MODEL", ANTHROPIC_MODEL)
         message = await loop.run_in_executor(
             None,
-            lambda: client.messages.create(
-                model=os.environ.get("ANTHROPIC_MODEL", ANTHROPIC_MODEL),
+            lambda: context.run(
+                client.messages.create,
+                model=model,
                 max_tokens=1024,
                 messages=[{"role": "user", "content": query}],
             ),
@@ -352,7 +379,10 @@ async def query_claude(query: str, brand_name: str, api_key: Optional[str] = Non
         )
 
 
-@cached("ai_responses", TTL_AI_RESPONSE)
+@cached(
+    "ai_responses", TTL_AI_RESPONSE, vary=lambda: tier_setting("OPENAI_MODEL", OPENAI_MODEL)
+)
+@traced(Stage.LLM)
 async def query_openai(query: str, brand_name: str, api_key: Optional[str] = None) -> AIResponse:
     """
     Query OpenAI (ChatGPT) API.
@@ -392,14 +422,14 @@ async def query_openai(query: str, brand_name: str, api_key: Optional[str] = Non
         }
 
         data = {
-            "model": os.environ.get("OPENAI_MODEL", OPENAI_MODEL),
+            "model": tier_setting("OPENAI_MODEL", OPENAI_MODEL),
             "messages": [{"role": "user", "content": query}],
             "max_tokens": 1024,
         }
 
         async with httpx.AsyncClient(timeout=60) as client:
             response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
+                f"{OPENAI_BASE_URL}/chat/completions",
                 headers=headers,
                 json=data,
             )
@@ -468,7 +498,10 @@ async def query_openai(query: str, brand_name: str, api_key: Optional[str] = Non
         )
 
 
-@cached("ai_responses", TTL_AI_RESPONSE)
+@cached(
+    "ai_responses", TTL_AI_RESPONSE, vary=lambda: tier_setting("XAI_MODEL", GROK_MODEL)
+)
+@traced(Stage.LLM)
 async def query_xai(query: str, brand_name: str, api_key: Optional[str] = None) -> AIResponse:
     """
     Query xAI (Grok) API.
@@ -512,14 +545,14 @@ async def query_xai(query: str, brand_name: str, api_key: Optional[str] = None)
 
         # xAI uses OpenAI-compatible API format
         data = {
-            "model": os.environ.get("XAI_MODEL", GROK_MODEL),
+            "model": tier_setting("XAI_MODEL", GROK_MODEL),
             "messages": [{"role": "user", "content": query}],
             "max_tokens": 1024,
         }
 
         async with httpx.AsyncClient(timeout=60) as client:
             response = await client.post(
-                "https://api.x.ai/v1/chat/completions",
+                f"{XAI_BASE_URL}/chat/completions",
                 headers=headers,
                 json=data,
             )
@@ -588,7 +621,12 @@ async def query_xai(query: str, brand_name: str, api_key: Optional[str] = None)
         )
 
 
-@cached("ai_responses", TTL_AI_RESPONSE)
+@cached(
+    "ai_responses",
+    TTL_AI_RESPONSE,
+    vary=lambda: tier_setting("PERPLEXITY_MODEL", PERPLEXITY_MODEL),
+)
+@traced(Stage.LLM)
 async def query_perplexity(
     query: str, brand_name: str, api_key: Optional[str] = None
 ) -> AIResponse:
@@ -630,14 +668,14 @@ async def query_perplexity(
         }
 
         data = {
-            "model": os.environ.get("PERPLEXITY_MODEL", PERPLEXITY_MODEL),
+            "model": tier_setting("PERPLEXITY_MODEL", PERPLEXITY_MODEL),
             "messages": [{"role": "user", "content": query}],
             "max_tokens": 1024,
         }
 
         async with httpx.AsyncClient(timeout=60) as client:
             response = await client.post(
-                "https://api.perplexity.ai/chat/completions",
+                f"{PERPLEXITY_BASE_URL}/chat/completions",
                 headers=headers,
                 json=data,
             )
@@ -706,7 +744,10 @@ async def query_perplexity(
         )
 
 
-@cached("ai_responses", TTL_AI_RESPONSE)
+@cached(
+    "ai_responses", TTL_AI_RESPONSE, vary=lambda: tier_setting("GOOGLE_MODEL", GEMINI_MODEL)
+)
+@traced(Stage.LLM)
 async def query_gemini(query: str, brand_name: str, api_key: Optional[str] = None) -> AIResponse:
     """
     Query Google Gemini API.
@@ -741,8 +782,8 @@ async def query_gemini(query: str, brand_name: str, api_key: Optional[str] = Non
         start_time = time.time()
 
         # Gemini REST API format
-        model = os.environ.get("GOOGLE_MODEL", GEMINI_MODEL)
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
+        model = tier_setting("GOOGLE_MODEL", GEMINI_MODEL)
+        url = f"{GEMINI_BASE_URL}/models/{model}:generateContent?key={api_key}"
 
         data = {
             "contents": [{"parts": [{"text": query}]}],
@@ -8,6 +8,9 @@ import re
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from packages.core.parsed_page import parse_page
+from packages.core.tracing import Stage, traced
+
 from .check_parseability import fetch_page
 
 
@@ -59,7 +62,7 @@ def check_original_research(html: str, url: str) -> list[CitableContent]:
         (r"\$\d+(?:[,\d]+)?(?:\.\d+)?\s*(?:billion|million|thousand|B|M|K)", "financial"),
     ]
 
-    html_lower = html.lower()
+    html_lower = parse_page(html).text_lower
 
     for pattern, content_type in research_patterns:
         matches = re.findall(pattern, html_lower)
@@ -116,18 +119,21 @@ def check_comprehensive_guides(html: str, url: str) -> list[CitableContent]:
     """
     citable = []
 
-    # Check title patterns
+    page = parse_page(html)
+
+    # Check title patterns (page title and headings, one per line)
     guide_title_patterns = [
         r"(?:complete|ultimate|definitive|comprehensive)\s+guide",
         r"everything\s+(?:you\s+need\s+to\s+know|about)",
-        r"(?:\d+|how\s+to)[^<]*(?:guide|tutorial|tips)",
+        r"(?:\d+|how\s+to)[^\n]*(?:guide|tutorial|tips)",
         r"(?:beginner|advanced|expert)[\'s]*\s+guide",
     ]
 
-    html_lower = html.lower()
+    titles = [page.title or ""] + [heading.text for heading in page.headings]
+    titles_lower = "\n".join(titles).lower()
 
     for pattern in guide_title_patterns:
-        if re.search(pattern, html_lower):
+        if re.search(pattern, titles_lower):
             citable.append(
                 CitableContent(
                     content_type="guide",
@@ -140,13 +146,8 @@ def check_comprehensive_guides(html: str, url: str) -> list[CitableContent]:
             break
 
     # Check content depth (heading count, word count)
-    h2_count = len(re.findall(r"<h2[^>]*>", html, re.IGNORECASE))
-    len(re.findall(r"<h3[^>]*>", html, re.IGNORECASE))
-
-    # Rough word count
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text)
-    word_count = len(text.split())
+    h2_count = page.count("h2")
+    word_count = page.word_count
 
     if word_count > 3000 and h2_count >= 5:
         citable.append(
@@ -175,21 +176,31 @@ def check_tools_and_resources(html: str, url: str) -> list[CitableContent]:
     """
     citable = []
 
-    # Check for interactive elements
-    tool_patterns = [
+    page = parse_page(html)
+    tool_words = r"calculator|tool|checker|analyzer|generator"
+    titles_lower = " ".join([page.title or ""] + [h.text for h in page.headings]).lower()
+    script_sources = " ".join(script.get("src", "") for script in page.scripts).lower()
+
+    # Check for interactive elements: form controls on a page titled as a tool,
+    # tool wording in the text, charts and downloadable templates
+    tool_checks = [
         (
-            r"<(?:form|input|select|button)[^>]*(?:calculator|tool|checker|analyzer|generator)",
+            page.count("form", "input", "select") > 0 and re.search(tool_words, titles_lower),
             "tool",
         ),
-        (r"(?:free|online)\s+(?:tool|calculator|checker|analyzer|generator)", "tool"),
-        (r"<canvas|<svg[^>]*chart|chart\.js|d3\.js", "visualization"),
-        (r"(?:template|worksheet|checklist)\s+(?:download|pdf|free)", "template"),
+        (re.search(rf"(?:free|online)\s+(?:{tool_words})", page.text_lower), "tool"),
+        (
+            page.count("canvas") > 0 or re.search(r"chart\.js|d3(?:\.min)?\.js", script_sources),
+            "visualization",
+        ),
+        (
+            re.search(r"(?:template|worksheet|checklist)\s+(?:download|pdf|free)", page.text_lower),
+            "template",
+        ),
     ]
 
-    html_lower = html.lower()
-
-    for pattern, content_type in tool_patterns:
-        if re.search(pattern, html_lower):
+    for found, content_type in tool_checks:
+        if found:
             citable.append(
                 CitableContent(
                     content_type=content_type,
@@ -217,7 +228,8 @@ def check_expert_content(html: str, url: str) -> list[CitableContent]:
     """
     citable = []
 
-    html_lower = html.lower()
+    page = parse_page(html)
+    html_lower = page.text_lower
 
     # Author credentials patterns
     credential_patterns = [
@@ -244,10 +256,9 @@ def check_expert_content(html: str, url: str) -> list[CitableContent]:
     citation_patterns = [
         r"(?:according\s+to|cited\s+by|referenced\s+in|source:|sources:)",
         r"\[\d+\]",  # Academic-style citations
-        r"<(?:cite|blockquote)[^>]*>",
     ]
 
-    citation_count = 0
+    citation_count = page.count("cite", "blockquote")
     for pattern in citation_patterns:
         citation_count += len(re.findall(pattern, html_lower))
 
@@ -278,7 +289,7 @@ def check_unique_perspectives(html: str, url: str) -> list[CitableContent]:
     """
     citable = []
 
-    html_lower = html.lower()
+    html_lower = parse_page(html).text_lower
 
     # Case study patterns
     case_study_patterns = [
@@ -324,6 +335,7 @@ def check_unique_perspectives(html: str, url: str) -> list[CitableContent]:
     return citable
 
 
+@traced(Stage.ANALYZE)
 def analyze_content_citability(url: str) -> dict[str, Any]:
     """
     Analyze website content for citation likelihood.
@@ -0,0 +1,217 @@
+"""
+Process pool for CPU-bound page analysis.
+
+Page analyzers (text extraction, readability, keyword extraction, schema
+validation) are pure-Python CPU work. Run on the event-loop thread they keep
+a worker process on one core however many pages it has fetched. Each worker
+process owns one AnalysisPool, a ProcessPoolExecutor that analyzes pages on
+the other cores while fetching carries on.
+
+Tasks are module-level functions called with picklable arguments (URLs and
+HTML strings) and returning plain data. They are submitted in batches so a
+page's HTML crosses the process boundary once and the per-task IPC cost is
+shared. The number of submitted tasks not yet finished is exported as the
+`analysis_pool_queue_depth` gauge.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_POOL_ENABLED = os.getenv("ANALYSIS_POOL_ENABLED", "true").lower() == "true"
+# Analysis processes per worker (defaults to one per core)
+ANALYSIS_POOL_WORKERS = int(os.getenv("ANALYSIS_POOL_WORKERS", str(os.cpu_count() or 1)))
+# Tasks sent to a process together
+ANALYSIS_BATCH_SIZE = int(os.getenv("ANALYSIS_BATCH_SIZE", "4"))
+# "spawn" avoids forking a process that already runs threads
+ANALYSIS_POOL_START_METHOD = os.getenv("ANALYSIS_POOL_START_METHOD", "spawn")
+
+QUEUE_DEPTH_GAUGE = "analysis_pool_queue_depth"
+
+
+def _run_batch(func: Callable[..., Any], batch: list[tuple]) -> list[Any]:
+    """Runs in a pool process: apply `func` to each argument tuple."""
+    return [func(*args) for args in batch]
+
+
+class AnalysisPool:
+    """
+    A per-process pool of analysis processes.
+
+    The executor starts on first use (or with start()); when the pool is
+    disabled, or a process dies, tasks run inline in the calling thread.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = ANALYSIS_POOL_WORKERS,
+        batch_size: int = ANALYSIS_BATCH_SIZE,
+        enabled: bool = ANALYSIS_POOL_ENABLED,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.batch_size = max(1, batch_size)
+        self.enabled = enabled
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Tasks submitted and not yet finished."""
+        return self._queue_depth
+
+    def start(self) -> None:
+        """Start the pool processes now rather than on the first submit."""
+        if self.enabled:
+            self._get_executor()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context(ANALYSIS_POOL_START_METHOD)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=context
+                )
+                logger.info(f"Analysis pool started with {self.max_workers} processes")
+            return self._executor
+
+    def _track(self, delta: int) -> None:
+        with self._lock:
+            self._queue_depth += delta
+            depth = self._queue_depth
+        try:
+            from packages.seo_health_report.metrics import metrics
+
+            metrics.set_gauge(QUEUE_DEPTH_GAUGE, depth)
+        except ImportError:
+            pass
+
+    def submit_batch(self, func: Callable[..., Any], batch: list[tuple]) -> Future:
+        """
+        Submit one batch of calls to `func`.
+
+        Returns:
+            Future resolving to the list of results, in batch order
+        """
+        if not self.enabled:
+            future: Future = Future()
+            try:
+                future.set_result(_run_batch(func, batch))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        self._track(len(batch))
+        try:
+            future = self._get_executor().submit(_run_batch, func, batch)
+        except BrokenProcessPool:
+            self._track(-len(batch))
+            self._reset()
+            return self.submit_batch(func, batch)
+        except RuntimeError:
+            # Shut down while submitting
+            self._track(-len(batch))
+            raise
+        future.add_done_callback(lambda _: self._track(-len(batch)))
+        return future
+
+    def _reset(self) -> None:
+        """Drop a broken executor; the next submit starts a fresh one."""
+        logger.warning("Analysis pool broken, restarting")
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _result(self, func: Callable[..., Any], batch: list[tuple], future: Future) -> list[Any]:
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            # A process died (e.g. OOM-killed); redo the batch here
+            self._reset()
+            return _run_batch(func, batch)
+
+    def map(self, func: Callable[..., Any], items: Iterable[tuple]) -> list[Any]:
+        """
+        Apply `func` to each argument tuple in `items` across the pool.
+
+        `items` may be a generator: each batch is submitted as soon as it
+        fills, so the pool works while the caller is still producing input.
+
+        Returns:
+            Results in the order of `items`
+        """
+        submitted: list[tuple[list[tuple], Future]] = []
+        batch: list[tuple] = []
+        for args in items:
+            batch.append(args)
+            if len(batch) >= self.batch_size:
+                submitted.append((batch, self.submit_batch(func, batch)))
+                batch = []
+        if batch:
+            submitted.append((batch, self.submit_batch(func, batch)))
+
+        results: list[Any] = []
+        for batch, future in submitted:
+            results.extend(self._result(func, batch, future))
+        return results
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a single call to `func` in the pool and wait for it."""
+        return self.map(func, [args])[0]
+
+    async def map_async(self, func: Callable[..., Any], items: Sequence[tuple]) -> list[Any]:
+        """map() for coroutines: waits without blocking the event loop."""
+        batches = [
+            list(items[start : start + self.batch_size])
+            for start in range(0, len(items), self.batch_size)
+        ]
+        futures = [asyncio.wrap_future(self.submit_batch(func, batch)) for batch in batches]
+        results: list[Any] = []
+        for batch, future in zip(batches, futures):
+            try:
+                results.extend(await future)
+            except BrokenProcessPool:
+                self._reset()
+                results.extend(await asyncio.to_thread(_run_batch, func, batch))
+        return results
+
+    async def run_async(self, func: Callable[..., Any], *args: Any) -> Any:
+        return (await self.map_async(func, [args]))[0]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "running": self._executor is not None,
+            "max_workers": self.max_workers,
+            "batch_size": self.batch_size,
+            "queue_depth": self._queue_depth,
+        }
+
+
+_pool: Optional[AnalysisPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_analysis_pool() -> AnalysisPool:
+    """Get the process-wide analysis pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = AnalysisPool()
+    return _pool
@@ -3,15 +3,43 @@ Cost Tracking Service
 
 Centralized cost event recording for all AI/API calls during audits.
 Implements append-only ledger pattern for accurate cost tracking per report.
+
+Events are not committed one by one. While this process has unwritten
+events for an audit, the ledger keeps that audit's running totals in memory,
+and they answer ceiling checks and summaries without a query. Any other
+audit is read from the table, so totals recorded by other processes are
+never served stale. The ledger buffers the event rows and writes them in batches. A batch is written
+by the background flusher (on a timer, or woken early when the buffer
+fills) and at an audit's phase boundaries (flush_cost_events, for that
+audit's events only). Each batch also updates the per-tenant daily rollups
+in cost_rollups.
+
+Batches are written in a short-lived session of their own, never in the
+caller's, so a flush can't commit or roll back the caller's work.
 """
 
+import logging
 import os
+import threading
 import uuid
-from datetime import datetime, timezone
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
 from typing import Any, Optional
 
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
+logger = logging.getLogger(__name__)
+
+# Buffered events are written once this many are pending
+COST_EVENT_FLUSH_SIZE = int(os.getenv("COST_EVENT_FLUSH_SIZE", "100"))
+# Background flush interval in seconds
+COST_EVENT_FLUSH_INTERVAL = float(os.getenv("COST_EVENT_FLUSH_INTERVAL", "5"))
+
+# Expected cost per tier, before the ceiling buffer multiplier
+TIER_EXPECTED_COSTS = {"low": 0.023, "medium": 0.051, "high": 0.158}
+
 # Model pricing (USD per 1M tokens unless otherwise noted)
 MODEL_PRICING = {
     # OpenAI
@@ -76,6 +104,286 @@ def calculate_cost(
     return round(cost, 8)
 
 
+@dataclass
+class AuditCostTotals:
+    """Running cost totals for one audit."""
+
+    total_cost_usd: float = 0.0
+    event_count: int = 0
+    by_provider: dict[str, dict[str, float]] = field(default_factory=dict)
+    by_phase: dict[str, float] = field(default_factory=dict)
+
+    def add(
+        self,
+        provider: str,
+        phase: Optional[str],
+        cost_usd: float,
+        total_tokens: int,
+        count: int = 1,
+    ) -> None:
+        self.total_cost_usd += cost_usd
+        self.event_count += count
+        entry = self.by_provider.setdefault(provider, {"cost_usd": 0.0, "total_tokens": 0})
+        entry["cost_usd"] += cost_usd
+        entry["total_tokens"] += total_tokens
+        phase_key = phase or "unknown"
+        self.by_phase[phase_key] = self.by_phase.get(phase_key, 0.0) + cost_usd
+
+    def summary(self, audit_id: str) -> dict[str, Any]:
+        return {
+            "audit_id": audit_id,
+            "total_cost_usd": round(self.total_cost_usd, 6),
+            "event_count": self.event_count,
+            "by_provider": {k: dict(v) for k, v in self.by_provider.items()},
+            "by_phase": dict(self.by_phase),
+        }
+
+
+def _load_totals(db: Session, audit_id: str) -> AuditCostTotals:
+    """Aggregate an audit's already-written events in one grouped query."""
+    from database import CostEvent
+
+    totals = AuditCostTotals()
+    rows = (
+        db.query(
+            CostEvent.provider,
+            CostEvent.phase,
+            func.sum(CostEvent.cost_usd),
+            func.sum(CostEvent.total_tokens),
+            func.count(CostEvent.id),
+        )
+        .filter(CostEvent.audit_id == audit_id)
+        .group_by(CostEvent.provider, CostEvent.phase)
+        .all()
+    )
+    for provider, phase, cost, tokens, count in rows:
+        totals.add(provider, phase, cost or 0.0, tokens or 0, count)
+    return totals
+
+
+def _upsert_rollups(db: Session, rows: list[dict[str, Any]]) -> None:
+    """Add a batch of events to the per-tenant daily rollups."""
+    from database import CostRollup
+
+    grouped: dict[tuple[str, date], list] = {}
+    for row in rows:
+        key = (row["tenant_id"] or "", row["created_at"].date())
+        bucket = grouped.setdefault(key, [0, 0, 0.0])
+        bucket[0] += 1
+        bucket[1] += row["total_tokens"] or 0
+        bucket[2] += row["cost_usd"]
+
+    dialect = db.get_bind().dialect.name
+    now = datetime.now(timezone.utc)
+    for (tenant_id, day), (count, tokens, cost) in grouped.items():
+        values = {
+            "id": str(uuid.uuid4()),
+            "tenant_id": tenant_id,
+            "day": day,
+            "event_count": count,
+            "total_tokens": tokens,
+            "cost_usd": cost,
+            "updated_at": now,
+        }
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+            stmt = dialect_insert(CostRollup).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[CostRollup.tenant_id, CostRollup.day],
+                set_={
+                    "event_count": CostRollup.event_count + stmt.excluded.event_count,
+                    "total_tokens": CostRollup.total_tokens + stmt.excluded.total_tokens,
+                    "cost_usd": CostRollup.cost_usd + stmt.excluded.cost_usd,
+                    "updated_at": now,
+                },
+            )
+            db.execute(stmt)
+            continue
+
+        updated = (
+            db.query(CostRollup)
+            .filter(CostRollup.tenant_id == tenant_id, CostRollup.day == day)
+            .update(
+                {
+                    CostRollup.event_count: CostRollup.event_count + count,
+                    CostRollup.total_tokens: CostRollup.total_tokens + tokens,
+                    CostRollup.cost_usd: CostRollup.cost_usd + cost,
+                    CostRollup.updated_at: now,
+                },
+                synchronize_session=False,
+            )
+        )
+        if not updated:
+            db.execute(insert(CostRollup).values(**values))
+
+
+class CostLedger:
+    """In-memory cost accumulator with a batched write-behind event buffer."""
+
+    def __init__(self, flush_size: int = COST_EVENT_FLUSH_SIZE):
+        self.flush_size = flush_size
+        # Running totals, only for audits with events still in the buffer
+        self._totals: dict[str, AuditCostTotals] = {}
+        self._pending: list[dict[str, Any]] = []
+        self._pending_by_audit: Counter = Counter()
+        self._drops = 0
+        self._lock = threading.RLock()
+        self._flusher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    def totals(self, db: Session, audit_id: str) -> AuditCostTotals:
+        """
+        Totals for an audit.
+
+        From memory while this process has unwritten events for it (the
+        table plus the buffer), otherwise from the table.
+        """
+        with self._lock:
+            totals = self._totals.get(audit_id)
+            if totals is not None:
+                return totals
+        return _load_totals(db, audit_id)
+
+    def record(self, db: Session, row: dict[str, Any]) -> None:
+        """Account for an event immediately and buffer its row for writing."""
+        audit_id = row["audit_id"]
+        loaded, loaded_at = None, None
+        while True:
+            with self._lock:
+                totals = self._totals.get(audit_id)
+                # A load is stale if a flush wrote and dropped totals while it ran
+                if totals is None and loaded is not None and loaded_at == self._drops:
+                    totals = self._totals[audit_id] = loaded
+                if totals is not None:
+                    totals.add(
+                        row["provider"], row["phase"], row["cost_usd"], row["total_tokens"] or 0
+                    )
+                    self._pending.append(row)
+                    self._pending_by_audit[audit_id] += 1
+                    should_flush = len(self._pending) >= self.flush_size
+                    break
+                loaded_at = self._drops
+            loaded = _load_totals(db, audit_id)
+        if not should_flush:
+            return
+        if self._flusher is not None and self._flusher.is_alive():
+            self._wake.set()
+        else:
+            # No background flusher in this process; still never the caller's session
+            self.flush(db)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, db: Optional[Session] = None, audit_id: Optional[str] = None) -> int:
+        """
+        Write buffered events and their rollups in one transaction.
+
+        Only ``audit_id``'s events when given, otherwise all of them. The
+        write uses a dedicated session on ``db``'s database (the default
+        database without it); ``db`` itself is never written to, committed
+        or rolled back. On failure the events are put back for the next
+        flush and 0 is returned. This never raises.
+        """
+        with self._lock:
+            if audit_id is None:
+                rows, self._pending = self._pending, []
+            else:
+                rows = [row for row in self._pending if row["audit_id"] == audit_id]
+                if rows:
+                    self._pending = [row for row in self._pending if row["audit_id"] != audit_id]
+            if not rows:
+                return 0
+
+        from database import CostEvent, SessionLocal
+
+        session = Session(bind=db.get_bind()) if db is not None else SessionLocal()
+        try:
+            session.execute(insert(CostEvent), rows)
+            _upsert_rollups(session, rows)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            with self._lock:
+                self._pending[:0] = rows
+            logger.warning(f"Failed to write {len(rows)} cost events, will retry: {e}")
+            return 0
+        finally:
+            session.close()
+
+        with self._lock:
+            for row in rows:
+                self._pending_by_audit[row["audit_id"]] -= 1
+            self._pending_by_audit += Counter()  # drop zero counts
+            # Written totals are read back from the table from now on
+            for written in {row["audit_id"] for row in rows}:
+                if not self._pending_by_audit[written]:
+                    self._totals.pop(written, None)
+                    self._drops += 1
+        return len(rows)
+
+    def finish_audit(self, db: Optional[Session], audit_id: str) -> None:
+        """Write an audit's pending events, which also drops its running totals."""
+        self.flush(db, audit_id)
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.flush()
+
+    def start_flusher(self, interval: float = COST_EVENT_FLUSH_INTERVAL) -> None:
+        """Start the background flush timer (idempotent)."""
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._stop.clear()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, args=(interval,), name="cost-ledger-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def stop_flusher(self, timeout: float = 5.0) -> None:
+        """Stop the flush timer and write whatever is still buffered."""
+        self._stop.set()
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout)
+            self._flusher = None
+        self.flush()
+
+
+_ledger: Optional[CostLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_cost_ledger() -> CostLedger:
+    """Get the process-wide cost ledger."""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = CostLedger()
+    return _ledger
+
+
+def flush_cost_events(db: Optional[Session] = None, audit_id: Optional[str] = None) -> int:
+    """
+    Write buffered cost events now (call at audit phase boundaries).
+
+    Pass ``audit_id`` to write only that audit's events. ``db`` only picks
+    the database; its transaction is left alone.
+    """
+    return get_cost_ledger().flush(db, audit_id)
+
+
 def record_cost_event(
     db: Session,
     audit_id: str,
@@ -94,6 +402,9 @@ def record_cost_event(
     """
     Record a cost event for an audit.
 
+    The event counts toward the audit's totals immediately; the row itself
+    is buffered and written by the next flush, so this doesn't commit.
+
     Args:
         db: SQLAlchemy session
         audit_id: The audit this cost belongs to
@@ -112,10 +423,10 @@ def record_cost_event(
     Returns:
         The created event ID
     """
-    from database import CostEvent
+    # Tier bound to this audit's context, else the process environment
+    from packages.seo_health_report.tier_config import tier_setting
 
-    # Get current tier from environment
-    tier = os.environ.get("REPORT_TIER", "medium")
+    tier = tier_setting("REPORT_TIER", "medium")
 
     # Calculate cost if not provided
     if cost_usd is None and model:
@@ -130,31 +441,31 @@ def record_cost_event(
     pricing = MODEL_PRICING.get(model, {}) if model else {}
 
     event_id = str(uuid.uuid4())
-    event = CostEvent(
-        id=event_id,
-        audit_id=audit_id,
-        tenant_id=tenant_id,
-        user_id=user_id,
-        tier=tier,
-        phase=phase,
-        provider=provider,
-        model=model,
-        operation=operation,
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
-        total_tokens=total_tokens or ((prompt_tokens or 0) + (completion_tokens or 0)),
-        input_unit_cost_usd_per_1m=pricing.get("input"),
-        output_unit_cost_usd_per_1m=pricing.get("output"),
-        flat_cost_usd=pricing.get("flat"),
-        cost_usd=cost_usd or 0.0,
-        currency="USD",
-        metadata_json=metadata,
-        created_at=datetime.now(timezone.utc),
+    get_cost_ledger().record(
+        db,
+        {
+            "id": event_id,
+            "audit_id": audit_id,
+            "tenant_id": tenant_id,
+            "user_id": user_id,
+            "tier": tier,
+            "phase": phase,
+            "provider": provider,
+            "model": model,
+            "operation": operation,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": total_tokens or ((prompt_tokens or 0) + (completion_tokens or 0)),
+            "input_unit_cost_usd_per_1m": pricing.get("input"),
+            "output_unit_cost_usd_per_1m": pricing.get("output"),
+            "flat_cost_usd": pricing.get("flat"),
+            "cost_usd": cost_usd or 0.0,
+            "currency": "USD",
+            "metadata_json": metadata,
+            "created_at": datetime.now(timezone.utc),
+        },
     )
 
-    db.add(event)
-    db.commit()
-
     return event_id
 
 
@@ -165,52 +476,7 @@ def get_audit_cost_summary(db: Session, audit_id: str) -> dict[str, Any]:
     Returns:
         Dictionary with total cost, breakdown by provider/model/phase
     """
-    from sqlalchemy import func
-
-    from database import CostEvent
-
-    # Total cost
-    total = (
-        db.query(func.sum(CostEvent.cost_usd)).filter(CostEvent.audit_id == audit_id).scalar()
-        or 0.0
-    )
-
-    # By provider
-    by_provider = {}
-    provider_results = (
-        db.query(CostEvent.provider, func.sum(CostEvent.cost_usd), func.sum(CostEvent.total_tokens))
-        .filter(CostEvent.audit_id == audit_id)
-        .group_by(CostEvent.provider)
-        .all()
-    )
-
-    for provider, cost, tokens in provider_results:
-        by_provider[provider] = {"cost_usd": cost or 0.0, "total_tokens": tokens or 0}
-
-    # By phase
-    by_phase = {}
-    phase_results = (
-        db.query(CostEvent.phase, func.sum(CostEvent.cost_usd))
-        .filter(CostEvent.audit_id == audit_id)
-        .group_by(CostEvent.phase)
-        .all()
-    )
-
-    for phase, cost in phase_results:
-        by_phase[phase or "unknown"] = cost or 0.0
-
-    # Count of events
-    event_count = (
-        db.query(func.count(CostEvent.id)).filter(CostEvent.audit_id == audit_id).scalar() or 0
-    )
-
-    return {
-        "audit_id": audit_id,
-        "total_cost_usd": round(total, 6),
-        "event_count": event_count,
-        "by_provider": by_provider,
-        "by_phase": by_phase,
-    }
+    return get_cost_ledger().totals(db, audit_id).summary(audit_id)
 
 
 def check_cost_ceiling(
@@ -228,22 +494,39 @@ def check_cost_ceiling(
     Returns:
         Tuple of (exceeded: bool, current_cost: float, ceiling: float)
     """
-    # Expected costs per tier (with buffer)
-    TIER_CEILINGS = {
-        "low": 0.023 * buffer_multiplier,
-        "medium": 0.051 * buffer_multiplier,
-        "high": 0.158 * buffer_multiplier,
-    }
+    expected = TIER_EXPECTED_COSTS.get(tier)
+    ceiling = expected * buffer_multiplier if expected is not None else 0.10
 
-    ceiling = TIER_CEILINGS.get(tier, 0.10)
+    current = get_cost_ledger().totals(db, audit_id).total_cost_usd
 
-    from sqlalchemy import func
+    return (current > ceiling, current, ceiling)
 
-    from database import CostEvent
 
-    current = (
-        db.query(func.sum(CostEvent.cost_usd)).filter(CostEvent.audit_id == audit_id).scalar()
-        or 0.0
-    )
+def get_tenant_daily_costs(
+    db: Session,
+    tenant_id: Optional[str],
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> list[dict[str, Any]]:
+    """
+    Daily cost totals for a tenant from the rollup table (admin views).
 
-    return (current > ceiling, current, ceiling)
+    Events still in the write buffer are not included.
+    """
+    from database import CostRollup
+
+    query = db.query(CostRollup).filter(CostRollup.tenant_id == (tenant_id or ""))
+    if start:
+        query = query.filter(CostRollup.day >= start)
+    if end:
+        query = query.filter(CostRollup.day <= end)
+
+    return [
+        {
+            "day": row.day.isoformat(),
+            "event_count": row.event_count,
+            "total_tokens": row.total_tokens,
+            "cost_usd": round(row.cost_usd, 6),
+        }
+        for row in query.order_by(CostRollup.day).all()
+    ]
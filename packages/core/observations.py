@@ -0,0 +1,276 @@
+"""
+Tenant-neutral observation store.
+
+Many tenants audit the same popular domains (competitors especially), and
+most of what an audit fetches about a site is the same whoever asks:
+robots.txt, sitemaps, PageSpeed results, page HTML, knowledge-graph
+lookups and structured data. Those observations are stored once, keyed by
+kind, analyzer version and canonical subject, and reused by any audit while
+they are fresh. Tenant-specific work (keywords, branding, AI prompts) is
+never stored here and is always recomputed.
+
+Freshness is per kind (OBSERVATION_TTL_<KIND> seconds). Bumping a kind's
+entry in ANALYZER_VERSIONS retires everything stored under the old version.
+The store is best effort: a database error is logged and the fetch simply
+runs.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+OBSERVATION_STORE_ENABLED = os.getenv("OBSERVATION_STORE_ENABLED", "true").lower() == "true"
+# Expired rows are deleted at most this often (seconds), from the write path
+OBSERVATION_PURGE_INTERVAL = int(os.getenv("OBSERVATION_PURGE_INTERVAL", "3600"))
+
+LOOKUPS_COUNTER = "observation_store_lookups_total"
+
+
+class ObservationKind(str, Enum):
+    """What an observation records."""
+
+    ROBOTS = "robots"
+    SITEMAP = "sitemap"
+    PAGESPEED = "pagespeed"
+    PAGE = "page"
+    KNOWLEDGE_GRAPH = "knowledge_graph"
+    STRUCTURED_DATA = "structured_data"
+
+
+_DEFAULT_TTLS = {
+    ObservationKind.ROBOTS: 86400,
+    ObservationKind.SITEMAP: 86400,
+    ObservationKind.PAGESPEED: 43200,
+    ObservationKind.PAGE: 3600,
+    ObservationKind.KNOWLEDGE_GRAPH: 604800,
+    ObservationKind.STRUCTURED_DATA: 86400,
+}
+
+# Seconds an observation of each kind stays fresh
+OBSERVATION_TTLS = {
+    kind: int(os.getenv(f"OBSERVATION_TTL_{kind.name}", str(ttl)))
+    for kind, ttl in _DEFAULT_TTLS.items()
+}
+
+# Bump when the code producing a kind changes what it records
+ANALYZER_VERSIONS = {kind: "1" for kind in ObservationKind}
+
+_purge_lock = threading.Lock()
+_last_purge = 0.0
+
+
+def _canonical_subject(kind: ObservationKind, subject: str) -> str:
+    if kind is ObservationKind.KNOWLEDGE_GRAPH:
+        return " ".join(subject.split()).lower()
+
+    from packages.seo_health_report.scripts.idempotency import canonicalize_url
+
+    return canonicalize_url(subject.strip())
+
+
+def observation_key(kind: ObservationKind, subject: str, qualifiers: tuple = ()) -> str:
+    """
+    Storage key for an observation.
+
+    `qualifiers` are whatever else changes the observation besides the
+    subject (the PSI strategy, the knowledge source, ...).
+    """
+    parts = [
+        kind.value,
+        ANALYZER_VERSIONS[kind],
+        _canonical_subject(kind, subject),
+        *(str(q) for q in qualifiers),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+def _record_lookup(kind: ObservationKind, result: str) -> None:
+    from packages.seo_health_report.metrics import metrics
+
+    metrics.inc_counter(LOOKUPS_COUNTER, labels={"kind": kind.value, "result": result})
+
+
+def get_observation(kind: ObservationKind, subject: str, qualifiers: tuple = ()) -> Any:
+    """The fresh stored observation, or None."""
+    if not OBSERVATION_STORE_ENABLED:
+        return None
+
+    from database import Observation, SessionLocal
+
+    session = SessionLocal()
+    try:
+        row = session.get(Observation, observation_key(kind, subject, qualifiers))
+        value = None
+        if row is not None and _aware(row.expires_at) > datetime.now(timezone.utc):
+            value = json.loads(zlib.decompress(row.payload))
+    except Exception as e:
+        logger.debug(f"Observation lookup failed for {kind.value} {subject}: {e}")
+        value = None
+    finally:
+        session.close()
+
+    _record_lookup(kind, "miss" if value is None else "hit")
+    return value
+
+
+def put_observation(
+    kind: ObservationKind, subject: str, value: Any, qualifiers: tuple = ()
+) -> None:
+    """Store an observation for OBSERVATION_TTLS[kind] seconds. Never raises."""
+    if not OBSERVATION_STORE_ENABLED:
+        return
+
+    from database import Observation, SessionLocal
+
+    now = datetime.now(timezone.utc)
+    session = SessionLocal()
+    try:
+        session.merge(
+            Observation(
+                key=observation_key(kind, subject, qualifiers),
+                kind=kind.value,
+                subject=_canonical_subject(kind, subject)[:2048],
+                analyzer_version=ANALYZER_VERSIONS[kind],
+                payload=zlib.compress(json.dumps(value, default=str).encode()),
+                observed_at=now,
+                expires_at=now + timedelta(seconds=OBSERVATION_TTLS[kind]),
+            )
+        )
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        logger.debug(f"Observation write failed for {kind.value} {subject}: {e}")
+        return
+    finally:
+        session.close()
+
+    _maybe_purge()
+
+
+def purge_expired_observations() -> int:
+    """Delete expired observations. Returns the number of rows removed."""
+    from database import Observation, SessionLocal
+
+    session = SessionLocal()
+    try:
+        removed = (
+            session.query(Observation)
+            .filter(Observation.expires_at <= datetime.now(timezone.utc))
+            .delete(synchronize_session=False)
+        )
+        session.commit()
+        return removed
+    except Exception as e:
+        session.rollback()
+        logger.warning(f"Failed to purge expired observations: {e}")
+        return 0
+    finally:
+        session.close()
+
+
+def _maybe_purge() -> None:
+    global _last_purge
+    with _purge_lock:
+        if time.monotonic() - _last_purge < OBSERVATION_PURGE_INTERVAL:
+            return
+        _last_purge = time.monotonic()
+    removed = purge_expired_observations()
+    if removed:
+        logger.info(f"Purged {removed} expired observations")
+
+
+def _aware(moment: datetime) -> datetime:
+    # SQLite hands datetimes back naive
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def _has_value(result: Any) -> bool:
+    return result is not None
+
+
+def observed(
+    kind: ObservationKind,
+    name: str = "",
+    params: tuple[str, ...] = (),
+    keep: Callable[[Any], bool] = _has_value,
+    encode: Optional[Callable[[Any], Any]] = None,
+    decode: Optional[Callable[[Any], Any]] = None,
+):
+    """
+    Serve the decorated fetcher from the observation store while fresh.
+
+    The first argument is the subject (a URL, or a brand name for
+    knowledge-graph lookups). `params` names the other arguments that change
+    the result; anything else (API keys, timeouts) is left out of the key.
+    Fetchers of the same kind and `name` share observations, so the
+    duplicate page fetchers across the audit modules fetch a page once.
+    Results failing `keep` are returned but not stored; `encode` and
+    `decode` convert results that aren't plain JSON.
+
+    Works on sync and async functions; async callers reach the database
+    from a worker thread.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def key_parts(args, kwargs) -> tuple[str, tuple]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            values = list(bound.arguments.values())
+            qualifiers = (name, *(bound.arguments.get(p) for p in params))
+            return values[0], qualifiers
+
+        def stored(value):
+            return decode(value) if decode else value
+
+        def to_store(result):
+            return encode(result) if encode else result
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not OBSERVATION_STORE_ENABLED:
+                    return await func(*args, **kwargs)
+                subject, qualifiers = key_parts(args, kwargs)
+                value = await asyncio.to_thread(get_observation, kind, subject, qualifiers)
+                if value is not None:
+                    return stored(value)
+                result = await func(*args, **kwargs)
+                if keep(result):
+                    await asyncio.to_thread(
+                        put_observation, kind, subject, to_store(result), qualifiers
+                    )
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not OBSERVATION_STORE_ENABLED:
+                return func(*args, **kwargs)
+            subject, qualifiers = key_parts(args, kwargs)
+            value = get_observation(kind, subject, qualifiers)
+            if value is not None:
+                return stored(value)
+            result = func(*args, **kwargs)
+            if keep(result):
+                put_observation(kind, subject, to_store(result), qualifiers)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,325 @@
+"""
+Single-pass HTML document model.
+
+An HTML page is parsed once, by lxml's C parser feeding a streaming target
+(no tree is built), into a compact ParsedPage holding everything the
+analyzers look at: head metadata, links and anchors, headings, images,
+scripts, JSON-LD blocks, structured-data attributes, tag counts and the
+visible text. Analyzers keep taking the raw HTML string and call
+parse_page(), which caches the last few pages so every analyzer looking at
+the same page shares one parse.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Optional
+
+from lxml import etree
+
+from packages.core.text_stats import TextStats, text_stats
+
+# Pages kept parsed; an audit analyzes one page with several analyzers at a time
+PARSED_PAGE_CACHE_SIZE = 32
+
+# Elements whose text is never rendered
+HIDDEN_TAGS = frozenset({"script", "style", "noscript", "template"})
+HEADING_TAGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+# Containers whose anchors count as site navigation
+NAVIGATION_TAGS = frozenset({"nav", "header"})
+# Attributes that mark an element as naming the page's author
+AUTHOR_ATTRIBUTES = ("class", "itemprop", "rel")
+
+_WORD = re.compile(r"\S+")
+_CSS_URL = re.compile(r"""url\(\s*["']?([^"')\s]+)["']?\s*\)""", re.IGNORECASE)
+
+
+def _clean(text: str) -> str:
+    return " ".join(text.split())
+
+
+@dataclass
+class Anchor:
+    """An <a href> element."""
+
+    href: str
+    text: str
+    rel: str = ""
+    in_navigation: bool = False
+
+
+@dataclass
+class Heading:
+    level: int
+    text: str
+
+
+@dataclass
+class Image:
+    src: str
+    alt: Optional[str]  # None when the alt attribute is missing
+
+
+@dataclass
+class ParsedPage:
+    """Everything analyzers need from one HTML page, read in a single pass."""
+
+    html_length: int = 0
+    title: Optional[str] = None
+    lang: Optional[str] = None
+    metas: list[dict[str, str]] = field(default_factory=list)
+    links: list[dict[str, str]] = field(default_factory=list)
+    anchors: list[Anchor] = field(default_factory=list)
+    headings: list[Heading] = field(default_factory=list)
+    images: list[Image] = field(default_factory=list)
+    iframes: list[str] = field(default_factory=list)
+    scripts: list[dict[str, str]] = field(default_factory=list)
+    json_ld: list[str] = field(default_factory=list)
+    # Microdata itemtype of each itemscope element that declares one
+    microdata_types: list[str] = field(default_factory=list)
+    itemscope_count: int = 0
+    rdfa_types: list[str] = field(default_factory=list)
+    rdfa_vocab_count: int = 0
+    # Text of elements marked up as the author (class/itemprop/rel "author")
+    author_texts: list[str] = field(default_factory=list)
+    noscript_texts: list[str] = field(default_factory=list)
+    # datetime attribute of each <time> element
+    datetimes: list[str] = field(default_factory=list)
+    # (kind, url) for src attributes, <link href> and CSS url() references
+    resources: list[tuple[str, str]] = field(default_factory=list)
+    tag_counts: Counter = field(default_factory=Counter)
+    text: str = ""
+
+    def meta(self, name: str, attribute: str = "name") -> Optional[str]:
+        """Content of the first <meta> whose `attribute` (name/property) is `name`."""
+        values = self.meta_all(name, attribute)
+        return values[0] if values else None
+
+    def meta_all(self, name: str, attribute: str = "name") -> list[str]:
+        name = name.lower()
+        return [
+            meta["content"]
+            for meta in self.metas
+            if meta.get(attribute, "").strip().lower() == name and meta.get("content")
+        ]
+
+    def link_href(self, rel: str) -> Optional[str]:
+        """href of the first <link> with `rel` among its rel values."""
+        rel = rel.lower()
+        for link in self.links:
+            if rel in link.get("rel", "").lower().split() and link.get("href"):
+                return link["href"]
+        return None
+
+    @property
+    def canonical(self) -> Optional[str]:
+        return self.link_href("canonical")
+
+    def count(self, *tags: str) -> int:
+        """Number of elements with any of the given tag names."""
+        return sum(self.tag_counts[tag] for tag in tags)
+
+    def headings_at(self, level: int) -> list[str]:
+        return [heading.text for heading in self.headings if heading.level == level]
+
+    @cached_property
+    def word_offsets(self) -> list[int]:
+        """Character offset in `text` of each word."""
+        return [match.start() for match in _WORD.finditer(self.text)]
+
+    @property
+    def words(self) -> list[str]:
+        return self.text_stats.words
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @property
+    def text_lower(self) -> str:
+        return self.text_stats.text_lower
+
+    @property
+    def text_stats(self) -> TextStats:
+        """Word, sentence and readability statistics of the visible text."""
+        return text_stats(self.text)
+
+
+class _Capture:
+    """Collects the text inside one open element."""
+
+    __slots__ = ("depth", "kind", "attrs", "parts", "hidden")
+
+    def __init__(self, depth: int, kind: str, attrs: dict[str, str], hidden: bool = False):
+        self.depth = depth
+        self.kind = kind
+        self.attrs = attrs
+        self.parts: list[str] = []
+        # Whether text inside hidden elements belongs to the capture
+        self.hidden = hidden
+
+
+class _PageBuilder:
+    """lxml parser target that fills a ParsedPage from start/end/data events."""
+
+    def __init__(self, page: ParsedPage):
+        self.page = page
+        self._depth = 0
+        self._hidden_depth = 0
+        self._navigation_depth = 0
+        self._open: list[str] = []
+        self._captures: list[_Capture] = []
+        self._text: list[str] = []
+
+    def start(self, tag, attrib) -> None:
+        if not isinstance(tag, str):
+            return
+        tag = tag.lower()
+        page = self.page
+        attrs = dict(attrib)
+        self._depth += 1
+        self._open.append(tag)
+        page.tag_counts[tag] += 1
+        self._separate()
+
+        if tag in HIDDEN_TAGS:
+            self._hidden_depth += 1
+        if tag in NAVIGATION_TAGS:
+            self._navigation_depth += 1
+
+        if tag == "html" and attrs.get("lang"):
+            page.lang = attrs["lang"].strip()
+        elif tag == "meta":
+            page.metas.append(attrs)
+        elif tag == "link":
+            page.links.append(attrs)
+            if attrs.get("href"):
+                page.resources.append(("href", attrs["href"].strip()))
+        elif tag == "a" and attrs.get("href") is not None:
+            self._capture(tag, attrs)
+        elif tag in HEADING_TAGS or tag == "noscript" or tag == "style":
+            self._capture(tag, attrs, hidden=tag in HIDDEN_TAGS)
+        elif tag == "title" and page.title is None:
+            self._capture(tag, attrs)
+        elif tag == "img":
+            page.images.append(Image(src=attrs.get("src", ""), alt=attrs.get("alt")))
+        elif tag == "iframe":
+            page.iframes.append(attrs.get("src", ""))
+        elif tag == "time" and attrs.get("datetime"):
+            page.datetimes.append(attrs["datetime"].strip())
+        elif tag == "script":
+            page.scripts.append(attrs)
+            if attrs.get("type", "").strip().lower() == "application/ld+json":
+                self._capture(tag, attrs, hidden=True)
+
+        if "src" in attrs and attrs["src"]:
+            page.resources.append(("src", attrs["src"].strip()))
+        if "style" in attrs:
+            for url in _CSS_URL.findall(attrs["style"]):
+                page.resources.append(("url()", url))
+        if "itemscope" in attrs:
+            page.itemscope_count += 1
+            if attrs.get("itemtype"):
+                page.microdata_types.append(attrs["itemtype"].strip())
+        if "typeof" in attrs:
+            page.rdfa_types.append(attrs["typeof"].strip())
+        if "vocab" in attrs:
+            page.rdfa_vocab_count += 1
+        if tag not in HIDDEN_TAGS and any(
+            "author" in attrs.get(name, "").lower() for name in AUTHOR_ATTRIBUTES
+        ):
+            self._capture("author", attrs)
+
+    def end(self, tag) -> None:
+        if not isinstance(tag, str) or not self._open:
+            return
+        tag = self._open.pop()
+        self._separate()
+        while self._captures and self._captures[-1].depth == self._depth:
+            self._finish(self._captures.pop())
+        if tag in HIDDEN_TAGS:
+            self._hidden_depth -= 1
+        if tag in NAVIGATION_TAGS:
+            self._navigation_depth -= 1
+        self._depth -= 1
+
+    def data(self, data: str) -> None:
+        if not self._hidden_depth:
+            self._text.append(data)
+        for capture in self._captures:
+            if capture.hidden or not self._hidden_depth:
+                capture.parts.append(data)
+
+    def close(self) -> ParsedPage:
+        while self._captures:
+            self._finish(self._captures.pop())
+        self.page.text = _clean("".join(self._text))
+        return self.page
+
+    def _separate(self) -> None:
+        # Element boundaries separate words, as a tag does in rendered text
+        self._text.append(" ")
+        for capture in self._captures:
+            capture.parts.append(" ")
+
+    def _capture(self, kind: str, attrs: dict[str, str], hidden: bool = False) -> None:
+        self._captures.append(_Capture(self._depth, kind, attrs, hidden))
+
+    def _finish(self, capture: _Capture) -> None:
+        page = self.page
+        raw = "".join(capture.parts)
+        kind = capture.kind
+        if kind == "a":
+            page.anchors.append(
+                Anchor(
+                    href=capture.attrs["href"].strip(),
+                    text=_clean(raw),
+                    rel=capture.attrs.get("rel", "").lower(),
+                    in_navigation=self._navigation_depth > 0,
+                )
+            )
+        elif kind in HEADING_TAGS:
+            page.headings.append(Heading(level=HEADING_TAGS[kind], text=_clean(raw)))
+        elif kind == "title":
+            page.title = raw.strip()
+        elif kind == "script":
+            page.json_ld.append(raw.strip())
+        elif kind == "style":
+            page.resources.extend(("url()", url) for url in _CSS_URL.findall(raw))
+        elif kind == "noscript":
+            page.noscript_texts.append(raw.strip())
+        elif kind == "author":
+            text = _clean(raw)
+            if text:
+                page.author_texts.append(text)
+
+
+def _parse(html: str) -> ParsedPage:
+    page = ParsedPage(html_length=len(html))
+    builder = _PageBuilder(page)
+    if not html or not html.strip():
+        return builder.close()
+    parser = etree.HTMLParser(target=builder, remove_comments=True, no_network=True, huge_tree=True)
+    try:
+        parser.feed(html)
+        return parser.close()
+    except etree.LxmlError:
+        # Keep whatever was read before the parser gave up
+        return builder.close()
+
+
+@lru_cache(maxsize=PARSED_PAGE_CACHE_SIZE)
+def parse_page(html: str) -> ParsedPage:
+    """
+    Parse an HTML page into a ParsedPage, reusing the result for the same HTML.
+
+    The returned page is shared between callers and must not be modified.
+
+    Args:
+        html: HTML content
+
+    Returns:
+        ParsedPage for the content
+    """
+    return _parse(html or "")
@@ -0,0 +1,309 @@
+"""
+On-demand sampling profiler and event-loop blocking monitor.
+
+profile(seconds) runs two collectors for a fixed window and returns a
+ProfileReport:
+
+- StackSampler: a daemon thread that samples every thread's Python stack
+  at a fixed interval. Samples are counted as collapsed stacks
+  ("thread;outer (file:line);inner (file:line) count"), the input format of
+  flamegraph.pl, speedscope and inferno.
+- BlockingMonitor: times every callback the event loop runs. Time is summed
+  per coroutine, and any callback that holds the loop longer than the
+  threshold is flagged together with the stack it was blocked in, which
+  pinpoints sync I/O (e.g. a `requests` call) hidden inside async code.
+
+Both are cheap enough to switch on in production for a few seconds; the
+API exposes profile() at POST /admin/profile and the worker runs it on
+SIGUSR2 or when its trigger file appears.
+"""
+
+import asyncio
+import asyncio.events
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+# Milliseconds between stack samples
+PROFILER_INTERVAL_MS = float(os.getenv("PROFILER_INTERVAL_MS", "10"))
+# Loop callbacks running longer than this are flagged as blocking
+PROFILER_BLOCK_THRESHOLD_MS = float(os.getenv("PROFILER_BLOCK_THRESHOLD_MS", "100"))
+# Longest profile a trigger may request
+PROFILER_MAX_SECONDS = int(os.getenv("PROFILER_MAX_SECONDS", "120"))
+# Flagged callbacks kept per profile (the slowest are kept)
+PROFILER_MAX_BLOCKING_EVENTS = int(os.getenv("PROFILER_MAX_BLOCKING_EVENTS", "100"))
+
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2]) + os.sep
+
+# The profiler's own threads are left out of the samples
+_SAMPLER_THREAD = "stack-sampler"
+_WATCHDOG_THREAD = "loop-blocking-watchdog"
+
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_PROJECT_ROOT):
+        filename = filename[len(_PROJECT_ROOT) :]
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{frame.f_lineno})"
+
+
+def collapse_stack(frame) -> list[str]:
+    """Labels of `frame` and its callers, outermost first."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+class StackSampler:
+    """Samples the stacks of all threads from a background thread."""
+
+    def __init__(self, interval: float = PROFILER_INTERVAL_MS / 1000):
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=_SAMPLER_THREAD, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def sample(self) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            name = names.get(thread_id, str(thread_id))
+            if name in (_SAMPLER_THREAD, _WATCHDOG_THREAD):
+                continue
+            stack = [name, *collapse_stack(frame)]
+            self.stacks[";".join(stack)] += 1
+        self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+@dataclass
+class BlockingEvent:
+    """One loop callback that ran longer than the threshold."""
+
+    callback: str
+    duration: float  # Seconds
+    stack: Optional[list[str]] = None  # Where it was blocked, if caught in time
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "callback": self.callback,
+            "duration_ms": round(self.duration * 1000, 1),
+            "stack": self.stack,
+        }
+
+
+@dataclass
+class CallbackTime:
+    """Loop time used by one coroutine (or plain callback)."""
+
+    steps: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    blocking_steps: int = 0
+
+
+def _callback_name(handle: asyncio.Handle) -> str:
+    callback = handle._callback
+    task = getattr(callback, "__self__", None)
+    if isinstance(task, asyncio.Task):
+        coro = task.get_coro()
+        return getattr(coro, "__qualname__", task.get_name())
+    return getattr(callback, "__qualname__", type(callback).__name__)
+
+
+class BlockingMonitor:
+    """
+    Times the callbacks an event loop runs.
+
+    Wraps asyncio's Handle._run while active, so only loops using the
+    stdlib Handle are covered (uvloop is not). A watchdog thread grabs the
+    loop thread's stack once a callback passes the threshold, while it is
+    still blocking.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold: float):
+        self.loop = loop
+        self.threshold = threshold
+        self.callbacks: dict[str, CallbackTime] = {}
+        self.events: list[BlockingEvent] = []
+        self._loop_thread = threading.get_ident()
+        self._running: Optional[tuple[asyncio.Handle, float]] = None
+        self._caught: Optional[tuple[tuple[asyncio.Handle, float], list[str]]] = None
+        self._original_run = None
+        self._stop = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start monitoring; call from the loop's thread."""
+        self._loop_thread = threading.get_ident()
+        original_run = self._original_run = asyncio.events.Handle._run
+        monitor = self
+
+        def _run(handle):
+            if handle._loop is not monitor.loop:
+                return original_run(handle)
+            running = monitor._running = (handle, time.perf_counter())
+            try:
+                return original_run(handle)
+            finally:
+                monitor._running = None
+                monitor._record(handle, running)
+
+        asyncio.events.Handle._run = _run
+        self._watchdog = threading.Thread(target=self._watch, name=_WATCHDOG_THREAD, daemon=True)
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        if self._original_run is not None:
+            asyncio.events.Handle._run = self._original_run
+            self._original_run = None
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+
+    def _record(self, handle: asyncio.Handle, running: tuple[asyncio.Handle, float]) -> None:
+        duration = time.perf_counter() - running[1]
+        name = _callback_name(handle)
+        usage = self.callbacks.setdefault(name, CallbackTime())
+        usage.steps += 1
+        usage.total += duration
+        usage.max = max(usage.max, duration)
+        if duration < self.threshold:
+            return
+        usage.blocking_steps += 1
+        caught = self._caught
+        stack = caught[1] if caught is not None and caught[0] is running else None
+        self.events.append(BlockingEvent(name, duration, stack))
+        if len(self.events) > PROFILER_MAX_BLOCKING_EVENTS:
+            self.events.sort(key=lambda event: event.duration, reverse=True)
+            del self.events[PROFILER_MAX_BLOCKING_EVENTS:]
+
+    def _watch(self) -> None:
+        poll = max(self.threshold / 4, 0.001)
+        while not self._stop.wait(poll):
+            running = self._running
+            if running is None or (self._caught is not None and self._caught[0] is running):
+                continue
+            if time.perf_counter() - running[1] < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is not None and self._running is running:
+                self._caught = (running, collapse_stack(frame))
+
+
+@dataclass
+class ProfileReport:
+    """What a profile window saw."""
+
+    duration: float
+    interval: float
+    block_threshold: float
+    samples: int = 0
+    stacks: Counter = field(default_factory=Counter)
+    callbacks: dict[str, CallbackTime] = field(default_factory=dict)
+    blocking: list[BlockingEvent] = field(default_factory=list)
+
+    def collapsed(self) -> str:
+        """Samples as collapsed stacks, one "frame;frame;frame count" per line."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+    def to_dict(self) -> dict[str, Any]:
+        by_time = sorted(self.callbacks.items(), key=lambda item: item[1].total, reverse=True)
+        return {
+            "duration_seconds": round(self.duration, 3),
+            "interval_ms": self.interval * 1000,
+            "block_threshold_ms": self.block_threshold * 1000,
+            "samples": self.samples,
+            "loop_time": [
+                {
+                    "callback": name,
+                    "steps": usage.steps,
+                    "total_ms": round(usage.total * 1000, 1),
+                    "max_ms": round(usage.max * 1000, 1),
+                    "blocking_steps": usage.blocking_steps,
+                }
+                for name, usage in by_time
+            ],
+            "blocking": [
+                event.to_dict()
+                for event in sorted(self.blocking, key=lambda event: event.duration, reverse=True)
+            ],
+            "collapsed": self.collapsed(),
+        }
+
+    def write(self, directory: Path, name: str) -> list[Path]:
+        """Write `<name>.collapsed` and `<name>.json` into `directory`."""
+        directory.mkdir(parents=True, exist_ok=True)
+        collapsed_path = directory / f"{name}.collapsed"
+        json_path = directory / f"{name}.json"
+        collapsed_path.write_text(self.collapsed())
+        json_path.write_text(json.dumps(self.to_dict(), indent=2))
+        return [collapsed_path, json_path]
+
+
+async def profile(
+    seconds: float,
+    interval: float = PROFILER_INTERVAL_MS / 1000,
+    block_threshold: float = PROFILER_BLOCK_THRESHOLD_MS / 1000,
+) -> ProfileReport:
+    """
+    Profile this process for `seconds` while the running loop carries on.
+
+    Raises:
+        ProfilerBusyError: If a profile is already running in this process
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+    try:
+        seconds = min(seconds, PROFILER_MAX_SECONDS)
+        sampler = StackSampler(interval)
+        monitor = BlockingMonitor(asyncio.get_running_loop(), block_threshold)
+        started = time.perf_counter()
+        sampler.start()
+        monitor.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            monitor.stop()
+            sampler.stop()
+        return ProfileReport(
+            duration=time.perf_counter() - started,
+            interval=interval,
+            block_threshold=block_threshold,
+            samples=sampler.samples,
+            stacks=sampler.stacks,
+            callbacks=monitor.callbacks,
+            blocking=monitor.events,
+        )
+    finally:
+        _profile_lock.release()
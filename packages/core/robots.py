@@ -0,0 +1,280 @@
+"""
+Compiled robots.txt policies.
+
+A robots.txt file is parsed once per host into a RobotsPolicy that answers
+"may agent Y fetch URL X" for every crawler in an audit. Rules follow RFC
+9309: the longest matching pattern wins, Allow wins a tie, `*` matches any
+run of characters and a trailing `$` anchors the end of the path.
+
+Plain-prefix rules (nearly all of them in practice) are compiled into a
+character trie, so a lookup walks the path once; `$`-anchored literals are
+a dict lookup, and the few wildcard rules are precompiled regexes that are
+only tried when they could beat the best prefix match.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+from urllib.parse import quote, unquote, urlparse
+
+from packages.core.observations import ObservationKind, observed
+from packages.core.tracing import Stage, traced
+
+logger = logging.getLogger(__name__)
+
+# Agent the audit's own crawlers identify as (product token of their User-Agent)
+CRAWLER_USER_AGENT = "SEO-Health-Report-Bot/1.0"
+
+# Compiled policies live as long as the fetched robots.txt in the HTTP cache
+ROBOTS_CACHE_TTL = int(os.getenv("SEO_HEALTH_CACHE_TTL_HTTP", "3600"))
+ROBOTS_CACHE_MAX_HOSTS = int(os.getenv("ROBOTS_CACHE_MAX_HOSTS", "1000"))
+# An unreachable robots.txt (5xx, timeout) allows everything only this long
+ROBOTS_UNREACHABLE_TTL = int(os.getenv("ROBOTS_UNREACHABLE_TTL", "60"))
+ROBOTS_MAX_BYTES = 500 * 1024  # RFC 9309 lets crawlers ignore anything beyond 500 KiB
+
+_RULE_END = ""  # trie key marking "a rule ends here"
+_SAFE_PATH_CHARS = "/?&=*$:@!,;+~'()"
+
+
+def _normalize(path: str) -> str:
+    """Percent-encode consistently so encoded and raw forms compare equal."""
+    return quote(unquote(path), safe=_SAFE_PATH_CHARS)
+
+
+def _agent_token(user_agent: str) -> str:
+    return user_agent.split("/", 1)[0].strip().lower()
+
+
+@dataclass
+class _Group:
+    """Compiled rules for one set of user agents."""
+
+    trie: dict = field(default_factory=dict)
+    exact: dict[str, bool] = field(default_factory=dict)
+    # (pattern length, allow, regex), longest first
+    wildcards: list[tuple[int, bool, re.Pattern]] = field(default_factory=list)
+    crawl_delay: Optional[float] = None
+
+    def add(self, pattern: str, allow: bool) -> None:
+        pattern = _normalize(pattern)
+        if "*" in pattern.rstrip("$") or pattern.count("$") > 1:
+            regex = re.escape(pattern).replace(r"\*", ".*")
+            if regex.endswith(r"\$"):
+                regex = regex[:-2] + "$"
+            self.wildcards.append((len(pattern), allow, re.compile(regex)))
+            self.wildcards.sort(key=lambda item: (-item[0], not item[1]))
+        elif pattern.endswith("$"):
+            path = pattern[:-1]
+            self.exact[path] = self.exact.get(path, False) or allow
+        else:
+            node = self.trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[_RULE_END] = node.get(_RULE_END, False) or allow
+
+    def allows(self, path: str) -> bool:
+        best_length, best_allow = -1, True
+
+        # Walk the trie along the path; the deepest rule passed is the longest
+        node = self.trie
+        if _RULE_END in node:
+            best_length, best_allow = 0, node[_RULE_END]
+        for depth, char in enumerate(path, 1):
+            node = node.get(char)
+            if node is None:
+                break
+            if _RULE_END in node:
+                best_length, best_allow = depth, node[_RULE_END]
+
+        if path in self.exact:
+            length = len(path) + 1
+            if length > best_length or (length == best_length and self.exact[path]):
+                best_length, best_allow = length, self.exact[path]
+
+        for length, allow, regex in self.wildcards:
+            if length < best_length or (length == best_length and not allow):
+                break
+            if regex.match(path):
+                best_length, best_allow = length, allow
+                break
+
+        return best_allow
+
+
+@dataclass
+class RobotsPolicy:
+    """A parsed robots.txt, queried with is_allowed() and crawl_delay()."""
+
+    groups: dict[str, _Group] = field(default_factory=dict)
+    sitemaps: list[str] = field(default_factory=list)
+    # Rules as written, for reporting: {"user_agent", "type", "path"}
+    rules: list[dict[str, str]] = field(default_factory=list)
+    crawl_delays: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, content: Optional[str]) -> "RobotsPolicy":
+        """Compile robots.txt content; empty or missing content allows everything."""
+        policy = cls()
+        if not content:
+            return policy
+
+        agents: list[str] = []
+        in_rules = False
+        for line in content[:ROBOTS_MAX_BYTES].splitlines():
+            line = line.split("#", 1)[0].strip()
+            if ":" not in line:
+                continue
+            directive, value = line.split(":", 1)
+            directive = directive.strip().lower()
+            value = value.strip()
+
+            if directive == "user-agent":
+                # A user-agent line after rules starts a new group
+                if in_rules:
+                    agents, in_rules = [], False
+                agents.append(value.lower() or "*")
+            elif directive in ("allow", "disallow"):
+                in_rules = True
+                for agent in agents or ["*"]:
+                    policy.rules.append({"user_agent": agent, "type": directive, "path": value})
+                    # An empty Disallow means "allow everything" and adds no rule
+                    if value:
+                        policy._group(agent).add(value, allow=directive == "allow")
+            elif directive == "crawl-delay":
+                in_rules = True
+                try:
+                    delay = float(value)
+                except ValueError:
+                    continue
+                for agent in agents or ["*"]:
+                    policy._group(agent).crawl_delay = delay
+                    policy.crawl_delays[agent] = delay
+            elif directive == "sitemap":
+                policy.sitemaps.append(value)
+
+        return policy
+
+    def _group(self, agent: str) -> _Group:
+        if agent not in self.groups:
+            self.groups[agent] = _Group()
+        return self.groups[agent]
+
+    def _group_for(self, user_agent: str) -> Optional[_Group]:
+        token = _agent_token(user_agent)
+        if token in self.groups:
+            return self.groups[token]
+        # Otherwise the most specific group whose name prefixes the token
+        matches = [name for name in self.groups if name != "*" and token.startswith(name)]
+        if matches:
+            return self.groups[max(matches, key=len)]
+        return self.groups.get("*")
+
+    def is_allowed(self, url: str, user_agent: str = CRAWLER_USER_AGENT) -> bool:
+        """Whether `user_agent` may fetch `url` (a full URL or a path)."""
+        parsed = urlparse(url)
+        path = parsed.path or "/"
+        if path == "/robots.txt":
+            return True
+        group = self._group_for(user_agent)
+        if group is None:
+            return True
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+        return group.allows(_normalize(path))
+
+    def crawl_delay(self, user_agent: str = CRAWLER_USER_AGENT) -> Optional[float]:
+        """Crawl-delay in seconds for `user_agent`, if its group sets one."""
+        group = self._group_for(user_agent)
+        return group.crawl_delay if group else None
+
+
+# Allows every URL; used when robots.txt is missing or unreachable
+ALLOW_ALL = RobotsPolicy()
+
+_policies: dict[str, tuple[float, RobotsPolicy]] = {}
+_policies_lock = threading.Lock()
+
+
+def _host_key(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def robots_url_for(url: str) -> str:
+    """The robots.txt URL governing `url`."""
+    return f"{_host_key(url)}/robots.txt"
+
+
+def store_robots_policy(url: str, policy: RobotsPolicy, ttl: int = ROBOTS_CACHE_TTL) -> None:
+    """Cache a compiled policy for the host of `url`."""
+    with _policies_lock:
+        if len(_policies) >= ROBOTS_CACHE_MAX_HOSTS:
+            _policies.pop(min(_policies, key=lambda key: _policies[key][0]))
+        _policies[_host_key(url)] = (time.monotonic() + ttl, policy)
+
+
+def clear_robots_cache() -> None:
+    with _policies_lock:
+        _policies.clear()
+
+
+@observed(ObservationKind.ROBOTS)
+@traced(Stage.FETCH, name="robots.fetch_robots")
+def fetch_robots_txt(robots_url: str) -> Optional[str]:
+    """
+    robots.txt text, shared with other audits of the host while fresh.
+
+    "" when the file is missing (4xx), which allows everything; None when
+    the host couldn't answer (5xx, network error), which isn't stored.
+    """
+    try:
+        import requests
+
+        headers = {"User-Agent": CRAWLER_USER_AGENT}
+        response = requests.get(robots_url, headers=headers, timeout=10)
+        if response.status_code >= 500:
+            logger.debug(f"robots.txt unavailable ({response.status_code}): {robots_url}")
+            return None
+        if response.status_code >= 400:
+            return ""
+        return response.text
+    except Exception as e:
+        logger.debug(f"Could not fetch {robots_url}: {e}")
+        return None
+
+
+def get_robots_policy(
+    url: str, fetch: Optional[Callable[[str], Optional[str]]] = None
+) -> RobotsPolicy:
+    """
+    Get the compiled robots.txt policy for the host of `url`.
+
+    The policy is built once per host and reused until ROBOTS_CACHE_TTL
+    expires. A missing or unreachable robots.txt allows everything, but an
+    unreachable one is fetched again after ROBOTS_UNREACHABLE_TTL.
+
+    Args:
+        url: Any URL on the host
+        fetch: Returns robots.txt text, "" if missing or None if unreachable
+            (defaults to fetch_robots_txt)
+
+    Returns:
+        RobotsPolicy for the host
+    """
+    key = _host_key(url)
+    with _policies_lock:
+        cached = _policies.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    content = (fetch or fetch_robots_txt)(robots_url_for(url))
+    if content is None:
+        store_robots_policy(url, ALLOW_ALL, ROBOTS_UNREACHABLE_TTL)
+        return ALLOW_ALL
+    policy = RobotsPolicy.parse(content) if content else ALLOW_ALL
+    store_robots_policy(url, policy)
+    return policy
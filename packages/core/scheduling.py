@@ -0,0 +1,57 @@
+"""
+Fair-share scheduling for the audit job queue.
+
+Workers don't take the oldest queued job. They pick in this order:
+
+1. Fair share. The tenant using the smallest share of its concurrency
+   allowance goes first. That is its running jobs divided by
+   TenantQuota.max_concurrent_audits. A tenant with a flood of queued jobs
+   is already running some of them, so another tenant's next job is
+   claimed ahead of the flood however long the flood has waited.
+2. Lane priority. Among tenants with an equal share, interactive jobs (a
+   person submitted one audit and is waiting) outrank bulk jobs (batch
+   submissions), and high-tier (enterprise) jobs outrank the others in
+   their lane. A job gains one priority level for every
+   JOB_PRIORITY_AGING_SECONDS it has waited, up to JOB_PRIORITY_AGING_MAX
+   levels: a bulk job can catch up with the interactive lane but never
+   overtake it.
+3. Queue order, oldest first.
+
+A tenant already running max_concurrent_audits jobs is skipped until one
+finishes.
+"""
+
+import os
+from typing import Optional
+
+# Waiting this long (seconds) lifts a job one priority level
+JOB_PRIORITY_AGING_SECONDS = int(os.getenv("JOB_PRIORITY_AGING_SECONDS", "600"))
+# Fair-share weight of tenants without a quota row (and the "default" tenant)
+JOB_FAIR_SHARE_DEFAULT_WEIGHT = int(os.getenv("JOB_FAIR_SHARE_DEFAULT_WEIGHT", "2"))
+# How often (seconds) a worker refreshes the per-tenant queue depth gauge
+JOB_QUEUE_METRICS_INTERVAL = int(os.getenv("JOB_QUEUE_METRICS_INTERVAL", "15"))
+
+PRIORITY_BULK = 0
+PRIORITY_INTERACTIVE = 2
+# Added on top of the lane for the top tier
+HIGH_TIER_BOOST = 1
+# Most levels a job gains by waiting: one lane
+JOB_PRIORITY_AGING_MAX = PRIORITY_INTERACTIVE - PRIORITY_BULK
+
+HIGH_TIERS = {"high", "enterprise", "premium"}
+
+QUEUE_WAIT_HISTOGRAM = "job_queue_wait_seconds"
+QUEUE_DEPTH_GAUGE = "job_queue_depth"
+
+
+def job_priority(tier: Optional[str], interactive: bool = True) -> int:
+    """Queue priority for a new job; higher is claimed first."""
+    priority = PRIORITY_INTERACTIVE if interactive else PRIORITY_BULK
+    if tier and tier.lower() in HIGH_TIERS:
+        priority += HIGH_TIER_BOOST
+    return priority
+
+
+def job_lane(priority: int) -> str:
+    """Lane label for metrics."""
+    return "interactive" if priority >= PRIORITY_INTERACTIVE else "bulk"
@@ -0,0 +1,112 @@
+"""
+Text statistics for content analysis.
+
+A page's text is tokenized once into a TextStats that every content check
+reads: word and sentence counts, syllables, n-gram counts and the Flesch
+readability scores. Syllables are counted once per distinct token (and
+memoized across pages), then weighted by how often the token occurs, so
+the cost grows with the vocabulary rather than with the length of the page.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Any
+
+# Distinct tokens whose syllable counts are remembered
+SYLLABLE_CACHE_SIZE = 100_000
+# Texts whose statistics are kept (analyzers of one page share them)
+TEXT_STATS_CACHE_SIZE = 32
+
+_VOWEL_GROUP = re.compile(r"[aeiouy]+")
+# A sentence: a run between ., ! and ? holding something other than whitespace
+_SENTENCE = re.compile(r"[^.!?\s][^.!?]*")
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def count_syllables(token: str) -> int:
+    """
+    Rough syllable count: vowel groups, less a silent final e, at least one.
+    """
+    word = token.lower()
+    count = len(_VOWEL_GROUP.findall(word))
+    if word.endswith("e") and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+@dataclass
+class TextStats:
+    """Counts over one tokenization of a text."""
+
+    text: str
+    words: list[str]
+    sentence_count: int
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @cached_property
+    def token_counts(self) -> Counter:
+        """Occurrences of each distinct token, as written."""
+        return Counter(self.words)
+
+    @cached_property
+    def syllable_count(self) -> int:
+        return sum(count_syllables(token) * n for token, n in self.token_counts.items())
+
+    @cached_property
+    def text_lower(self) -> str:
+        return self.text.lower()
+
+    def ngram_counts(self, n: int) -> Counter:
+        """Occurrences of each run of `n` consecutive lowercase words."""
+        words = self.text_lower.split()
+        if n == 1:
+            return Counter(words)
+        return Counter(" ".join(gram) for gram in zip(*(words[i:] for i in range(n))))
+
+    def readability(self) -> dict[str, Any]:
+        """Flesch Reading Ease and Flesch-Kincaid Grade, with their inputs."""
+        word_count = self.word_count
+        if word_count == 0:
+            return {
+                "flesch_reading_ease": 0,
+                "flesch_kincaid_grade": 0,
+                "avg_sentence_length": 0,
+                "avg_syllables_per_word": 0,
+            }
+
+        avg_sentence_length = word_count / self.sentence_count
+        avg_syllables_per_word = self.syllable_count / word_count
+
+        flesch_reading_ease = (
+            206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
+        )
+        flesch_reading_ease = max(0, min(100, flesch_reading_ease))
+
+        flesch_kincaid_grade = (
+            (0.39 * avg_sentence_length) + (11.8 * avg_syllables_per_word) - 15.59
+        )
+        flesch_kincaid_grade = max(0, flesch_kincaid_grade)
+
+        return {
+            "flesch_reading_ease": round(flesch_reading_ease, 1),
+            "flesch_kincaid_grade": round(flesch_kincaid_grade, 1),
+            "avg_sentence_length": round(avg_sentence_length, 1),
+            "avg_syllables_per_word": round(avg_syllables_per_word, 2),
+        }
+
+
+@lru_cache(maxsize=TEXT_STATS_CACHE_SIZE)
+def text_stats(text: str) -> TextStats:
+    """
+    Tokenize `text` once, reusing the result for the same text.
+
+    The returned stats are shared between callers and must not be modified.
+    """
+    text = text or ""
+    sentence_count = max(len(_SENTENCE.findall(text)), 1)
+    return TextStats(text=text, words=text.split(), sentence_count=sentence_count)
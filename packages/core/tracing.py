@@ -0,0 +1,292 @@
+"""
+Lightweight tracing for the audit pipeline.
+
+A span times one unit of work (a fetch, an analyzer, an LLM call, scoring,
+a report render, a database write) and is labeled with the pipeline stage it
+belongs to:
+
+    with span("generate_pdf_report", Stage.RENDER):
+        ...
+
+    @traced(Stage.FETCH)
+    def fetch_page(url): ...
+
+Every span's duration is observed in the `audit_stage_duration_seconds`
+histogram labeled by stage, so no collector is needed to see where time
+goes. Inside start_trace(audit_id=..., job_id=...) spans are also collected
+into a Trace (ids, parent links, attributes, status) that the worker stores
+with the audit result. When opentelemetry is installed each span is mirrored
+as an OpenTelemetry span carrying the trace's attributes, so a configured
+exporter sees the same tree.
+
+The current trace and span live in context variables: they follow asyncio
+tasks and asyncio.to_thread, and in_current_context() carries them into
+executor threads.
+"""
+
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Iterator, Optional, Union
+
+try:
+    from opentelemetry import trace as otel_trace
+
+    OTEL_AVAILABLE = True
+except ImportError:
+    otel_trace = None
+    OTEL_AVAILABLE = False
+
+# Whether audits record a per-audit trace (durations are always measured)
+AUDIT_TRACE_ENABLED = os.getenv("AUDIT_TRACE_ENABLED", "true").lower() == "true"
+# Spans kept per trace; later spans are counted but dropped
+AUDIT_TRACE_MAX_SPANS = int(os.getenv("AUDIT_TRACE_MAX_SPANS", "500"))
+
+STAGE_HISTOGRAM = "audit_stage_duration_seconds"
+
+
+class Stage(str, Enum):
+    """Pipeline stage a span belongs to (the histogram's `stage` label)."""
+
+    AUDIT = "audit"
+    FETCH = "fetch"
+    ANALYZE = "analyze"
+    LLM = "llm"
+    SCORING = "scoring"
+    RENDER = "render"
+    DB_WRITE = "db_write"
+
+
+@dataclass
+class Span:
+    """One timed unit of work."""
+
+    name: str
+    stage: str
+    span_id: str
+    trace_id: Optional[str] = None
+    parent_id: Optional[str] = None
+    start_time: float = 0.0  # Unix time
+    duration: float = 0.0  # Seconds
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        start_ns = int(self.start_time * 1e9)
+        return {
+            "name": self.name,
+            "stage": self.stage,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "start_time_unix_nano": start_ns,
+            "end_time_unix_nano": start_ns + int(self.duration * 1e9),
+            "duration_ms": round(self.duration * 1000, 1),
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class Trace:
+    """The spans recorded for one audit."""
+
+    def __init__(
+        self, attributes: Optional[dict[str, Any]] = None, max_spans: int = AUDIT_TRACE_MAX_SPANS
+    ):
+        self.trace_id = uuid.uuid4().hex
+        self.attributes = attributes or {}
+        self.max_spans = max_spans
+        self.spans: list[Span] = []
+        self.dropped_spans = 0
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            if len(self.spans) < self.max_spans:
+                self.spans.append(span)
+            else:
+                self.dropped_spans += 1
+
+    def stage_totals(self) -> dict[str, float]:
+        """Seconds per stage, counting only spans not nested in the same stage."""
+        with self._lock:
+            spans = list(self.spans)
+        stages = {span.span_id: span.stage for span in spans}
+        totals: dict[str, float] = {}
+        for span in spans:
+            if stages.get(span.parent_id) != span.stage:
+                totals[span.stage] = totals.get(span.stage, 0.0) + span.duration
+        return totals
+
+    def slowest(self, count: int = 10) -> list[Span]:
+        with self._lock:
+            return sorted(self.spans, key=lambda span: span.duration, reverse=True)[:count]
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start_time)
+        return {
+            "trace_id": self.trace_id,
+            "attributes": self.attributes,
+            "stage_totals_ms": {
+                stage: round(seconds * 1000, 1) for stage, seconds in self.stage_totals().items()
+            },
+            "spans": [span.to_dict() for span in spans],
+            "dropped_spans": self.dropped_spans,
+        }
+
+
+_current_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar(
+    "current_trace", default=None
+)
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+def current_trace() -> Optional[Trace]:
+    """The trace being recorded in this context, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def start_trace(**attributes: Any) -> Iterator[Optional[Trace]]:
+    """
+    Record the spans started in this context into a new Trace.
+
+    Args:
+        **attributes: Identify the work, e.g. audit_id and job_id
+
+    Yields:
+        The Trace, or None when AUDIT_TRACE_ENABLED is off
+    """
+    if not AUDIT_TRACE_ENABLED:
+        yield None
+        return
+    trace = Trace(
+        {key: value for key, value in attributes.items() if value is not None},
+        max_spans=AUDIT_TRACE_MAX_SPANS,
+    )
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def _stage_name(stage: Union[Stage, str]) -> str:
+    return stage.value if isinstance(stage, Stage) else str(stage)
+
+
+def _otel_span(name: str, stage: str, attributes: dict[str, Any], trace: Optional[Trace]):
+    if not OTEL_AVAILABLE:
+        return nullcontext()
+    otel_attributes = {**(trace.attributes if trace else {}), **attributes, "stage": stage}
+    otel_attributes = {
+        key: value
+        for key, value in otel_attributes.items()
+        if isinstance(value, (str, bool, int, float))
+    }
+    return otel_trace.get_tracer(__name__).start_as_current_span(name, attributes=otel_attributes)
+
+
+def _observe(span: Span) -> None:
+    try:
+        from packages.seo_health_report.metrics import metrics
+
+        metrics.observe_histogram(STAGE_HISTOGRAM, span.duration, labels={"stage": span.stage})
+    except ImportError:
+        pass
+
+
+@contextmanager
+def span(
+    name: str, stage: Union[Stage, str] = Stage.ANALYZE, **attributes: Any
+) -> Iterator[Span]:
+    """
+    Time the enclosed block as a span of `stage`.
+
+    Args:
+        name: What the work is (e.g. "crawl_site.fetch_page")
+        stage: Pipeline stage, the histogram label
+        **attributes: Extra detail recorded on the span (e.g. url)
+
+    Yields:
+        The Span, to add attributes while it runs
+    """
+    trace = _current_trace.get()
+    parent = _current_span.get()
+    record = Span(
+        name=name,
+        stage=_stage_name(stage),
+        span_id=uuid.uuid4().hex[:16],
+        trace_id=trace.trace_id if trace else None,
+        parent_id=parent.span_id if parent else None,
+        start_time=time.time(),
+        attributes=attributes,
+    )
+    token = _current_span.set(record)
+    started = time.perf_counter()
+    try:
+        with _otel_span(name, record.stage, attributes, trace):
+            yield record
+    except BaseException as e:
+        record.status = "error"
+        record.error = type(e).__name__
+        raise
+    finally:
+        record.duration = time.perf_counter() - started
+        _current_span.reset(token)
+        _observe(record)
+        if trace is not None:
+            trace.add(record)
+
+
+def traced(stage: Union[Stage, str], name: Optional[str] = None) -> Callable:
+    """
+    Decorator running each call of a function (sync or async) in a span.
+
+    The span is named "<module>.<function>" unless `name` is given.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, stage):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            with span(span_name, stage):
+                return func(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
+
+
+def in_current_context(func: Callable) -> Callable:
+    """
+    Bind `func` to a copy of the current context, for executor threads.
+
+    Call once per submitted task: a context can't run in two threads at once.
+    """
+    return functools.partial(contextvars.copy_context().run, func)
@@ -3,23 +3,29 @@ Database models and initialization for SEO Health Report System.
 Uses SQLAlchemy with SQLite (dev) or PostgreSQL (prod).
 """
 
+import logging
 import os
 from datetime import datetime, timezone
 
 from sqlalchemy import (
     JSON,
     Boolean,
+    CheckConstraint,
     Column,
+    Date,
     DateTime,
     Float,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     create_engine,
+    event,
+    func,
 )
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy.orm import declarative_base, deferred, relationship, sessionmaker
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./seo_health.db")
 
@@ -87,10 +93,14 @@ class Audit(Base):
     )  # pending, running, completed, failed
     overall_score = Column(Integer, nullable=True)
     grade = Column(String(5), nullable=True)
-    result = Column(JSON, nullable=True)
+    # Large results are offloaded to storage (see packages.storage.results) and
+    # only result_key is kept; deferred so status/score loads skip the JSON.
+    result = deferred(Column(JSON, nullable=True))
+    result_key = Column(String(500), nullable=True)
     report_path = Column(String(500), nullable=True)
     trade_type = Column(String(50), nullable=True)
     service_areas = Column(JSON, nullable=True)
+    batch_id = Column(String(36), nullable=True, index=True)  # audit_batches.id
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
     completed_at = Column(DateTime, nullable=True)
 
@@ -98,6 +108,54 @@ class Audit(Base):
     tenant = relationship("Tenant", back_populates="audits")
 
 
+# Keyset pagination walks (created_at, id); per-user listings add the user prefix
+Index("ix_audits_created_at_id", Audit.created_at, Audit.id)
+Index("ix_audits_user_created_at_id", Audit.user_id, Audit.created_at, Audit.id)
+
+# SQLite full-text search over url/company_name, kept in sync by triggers.
+# PostgreSQL uses pg_trgm GIN indexes instead (migration 011).
+AUDITS_FTS_SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS audits_fts USING fts5("
+    "audit_id UNINDEXED, url, company_name, tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS audits_fts_insert AFTER INSERT ON audits BEGIN "
+    "INSERT INTO audits_fts (audit_id, url, company_name) "
+    "VALUES (new.id, new.url, new.company_name); END",
+    "CREATE TRIGGER IF NOT EXISTS audits_fts_update AFTER UPDATE OF url, company_name ON audits "
+    "BEGIN UPDATE audits_fts SET url = new.url, company_name = new.company_name "
+    "WHERE audit_id = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS audits_fts_delete AFTER DELETE ON audits BEGIN "
+    "DELETE FROM audits_fts WHERE audit_id = old.id; END",
+)
+
+
+@event.listens_for(Audit.__table__, "after_create")
+def _create_audits_fts(target, connection, **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    try:
+        for statement in AUDITS_FTS_SQLITE_DDL:
+            connection.exec_driver_sql(statement)
+    except Exception as e:
+        # FTS5 trigram needs SQLite 3.34+; search falls back to LIKE without it
+        logging.getLogger(__name__).warning(f"audits_fts not created: {e}")
+
+
+class AuditBatch(Base):
+    """URLs submitted together through POST /audits/batch."""
+
+    __tablename__ = "audit_batches"
+
+    id = Column(String(36), primary_key=True)
+    tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=True, index=True)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=True, index=True)
+    tier = Column(String(50), nullable=True)
+    submitted_count = Column(Integer, nullable=False, default=0)  # URLs received
+    queued_count = Column(Integer, nullable=False, default=0)  # New audits created
+    duplicate_count = Column(Integer, nullable=False, default=0)  # Matched an existing audit
+    invalid_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
 class Payment(Base):
     __tablename__ = "payments"
 
@@ -176,6 +234,8 @@ class TenantQuota(Base):
 
     # Concurrent limits
     max_concurrent_audits = Column(Integer, default=2)  # basic=2, pro=5, enterprise=20
+    # Admitted audits whose jobs haven't finished; maintained by admission and the worker
+    concurrent_audits = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Per-audit limits
     max_pages_per_audit = Column(Integer, default=50)  # basic=50, pro=200, enterprise=1000
@@ -221,12 +281,17 @@ class WebhookDelivery(Base):
     __tablename__ = "webhook_deliveries"
 
     id = Column(String(36), primary_key=True)
+    # NULL for per-audit callback deliveries, which carry target_url instead
     webhook_id = Column(
-        String(36), ForeignKey("webhooks.id", ondelete="CASCADE"), nullable=False, index=True
+        String(36), ForeignKey("webhooks.id", ondelete="CASCADE"), nullable=True, index=True
     )
+    target_url = Column(String(500), nullable=True)
+    audit_id = Column(String(36), nullable=True, index=True)
+    tenant_id = Column(String(36), nullable=True, index=True)
     event_type = Column(String(50), nullable=False)
     payload = Column(JSON, nullable=False)
-    status = Column(String(20), default="pending", index=True)  # pending, delivered, failed
+    # pending, sending (claimed by a dispatcher), delivered, failed
+    status = Column(String(20), default="pending", index=True)
     attempts = Column(Integer, default=0)
     next_retry_at = Column(DateTime, nullable=True)
     response_code = Column(Integer, nullable=True)
@@ -238,28 +303,64 @@ class WebhookDelivery(Base):
     webhook = relationship("Webhook", back_populates="deliveries")
 
 
+# Outbox dispatcher scans pending deliveries in due order
+Index(
+    "ix_webhook_deliveries_status_next_retry",
+    WebhookDelivery.status,
+    WebhookDelivery.next_retry_at,
+)
+
+
 class AuditJob(Base):
-    """Async audit job queue."""
+    """
+    Async audit job queue.
+
+    Written and claimed with SQL (apps/worker/executor.py); the mapping
+    mirrors the migrations so create_all() builds the same table.
+    """
 
     __tablename__ = "audit_jobs"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('queued', 'running', 'done', 'failed', 'canceled')",
+            name="ck_audit_jobs_status",
+        ),
+    )
 
     job_id = Column(String(36), primary_key=True)
-    tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=True, index=True)
-    audit_id = Column(String(36), ForeignKey("audits.id"), nullable=False, index=True)
-    status = Column(
-        String(50), default="queued", index=True
-    )  # queued, processing, completed, failed
-    idempotency_key = Column(String(64), unique=True, nullable=True, index=True)
-    payload_json = Column(JSON, nullable=False)
-    queued_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=False)
+    audit_id = Column(String(36), ForeignKey("audits.id"), nullable=False)
+    status = Column(String(20), nullable=False, default="queued", server_default="queued")
+    attempt = Column(Integer, nullable=False, default=0, server_default="0")
+    max_attempts = Column(Integer, nullable=False, default=3, server_default="3")
+    queued_at = Column(DateTime, nullable=False, server_default=func.now())
     started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
-    error_message = Column(Text, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    # Lease held by the claiming worker
+    locked_until = Column(DateTime, nullable=True)
+    locked_by = Column(String(255), nullable=True)
+    idempotency_key = Column(String(64), unique=True, nullable=False)
+    payload_json = Column(Text, nullable=False)
+    last_error = Column(Text, nullable=True)
+    # Claim priority (packages/core/scheduling.py): interactive > bulk, high tier first
+    priority = Column(Integer, nullable=False, default=0, server_default="0")
+    # Jobs computing the same result share a key; one runs, the rest take its result
+    coalesce_key = Column(String(64), nullable=True)
+    leader_job_id = Column(String(36), nullable=True)  # Job whose result this one took
 
     tenant = relationship("Tenant")
     audit = relationship("Audit")
 
 
+Index("idx_jobs_tenant", AuditJob.tenant_id, AuditJob.queued_at)
+# Claiming: queued jobs, oldest first
+Index("idx_jobs_status_queued", AuditJob.status, AuditJob.queued_at)
+# Per-tenant running counts for the concurrency caps
+Index("idx_jobs_tenant_status", AuditJob.tenant_id, AuditJob.status)
+# Finding the job running (or the jobs waiting) for a coalesce key
+Index("idx_jobs_coalesce_status", AuditJob.coalesce_key, AuditJob.status)
+
+
 class CostEvent(Base):
     """
     Append-only cost ledger entry for any billable API call during an audit.
@@ -314,6 +415,50 @@ Index(
 )
 
 
+class CostRollup(Base):
+    """
+    Per-tenant daily cost totals, maintained incrementally as cost events
+    are flushed so admin views don't aggregate the raw ledger.
+    """
+
+    __tablename__ = "cost_rollups"
+
+    id = Column(String(36), primary_key=True)
+    tenant_id = Column(String(36), nullable=False, default="")  # "" for untenanted audits
+    day = Column(Date, nullable=False)
+
+    event_count = Column(Integer, nullable=False, default=0)
+    total_tokens = Column(Integer, nullable=False, default=0)
+    cost_usd = Column(Float, nullable=False, default=0.0)
+
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+# One rollup row per tenant per day; flushes upsert against it
+Index("ux_cost_rollups_tenant_day", CostRollup.tenant_id, CostRollup.day, unique=True)
+
+
+class Observation(Base):
+    """
+    Tenant-neutral fact about a site (robots.txt, PSI result, page HTML, ...)
+    shared by every audit while fresh. See packages/core/observations.py.
+    """
+
+    __tablename__ = "observations"
+
+    key = Column(String(64), primary_key=True)  # sha256 of kind, version, subject
+    kind = Column(String(50), nullable=False, index=True)
+    subject = Column(String(2048), nullable=False)
+    analyzer_version = Column(String(20), nullable=False)
+    payload = Column(LargeBinary, nullable=False)  # zlib-compressed JSON
+    observed_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+
 def init_db():
     """Create all tables."""
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,157 @@
+"""
+Keyset pagination, indexed search and cached counts for audit listings.
+
+Listings walk the ``(created_at, id)`` index with an opaque cursor instead of
+``OFFSET``, so every page costs the same regardless of depth. Search uses the
+FTS5 trigram table on SQLite and ``ILIKE`` on PostgreSQL, where the pg_trgm
+GIN indexes from migration 011 serve ``%term%`` patterns.
+
+Usage:
+    query = apply_search(db.query(Audit), db, "example")
+    page = keyset_page(query, cursor=request_cursor, per_page=20)
+    total = count_audits(query, cache_key="audits:example")
+"""
+
+import base64
+import json
+import os
+import weakref
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import inspect, or_, text, tuple_
+from sqlalchemy.orm import Query, Session
+
+from packages.database import Audit
+
+AUDIT_COUNT_CACHE_TTL = int(os.getenv("AUDIT_COUNT_CACHE_TTL", "30"))
+# Above this many rows an unfiltered PostgreSQL count uses the planner estimate
+AUDIT_COUNT_ESTIMATE_THRESHOLD = int(os.getenv("AUDIT_COUNT_ESTIMATE_THRESHOLD", "100000"))
+# FTS5 trigram tokens are three characters; shorter terms can't use the index
+FTS_MIN_TERM_LENGTH = 3
+
+_fts_available: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class AuditPage:
+    """One page of audits plus cursors for the neighbouring pages."""
+
+    items: list = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+def encode_cursor(audit: Audit) -> str:
+    """Encode an audit's sort key as an opaque URL-safe cursor."""
+    created_at = audit.created_at.isoformat() if audit.created_at else ""
+    raw = json.dumps([created_at, audit.id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor into ``(created_at, id)``. Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, audit_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(audit_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def keyset_page(
+    query: Query,
+    cursor: Optional[str] = None,
+    before: Optional[str] = None,
+    per_page: int = 20,
+) -> AuditPage:
+    """
+    Fetch one page of audits, newest first.
+
+    ``cursor`` continues after the row it encodes; ``before`` returns the page
+    preceding that row. With neither, the first page is returned.
+    """
+    key = tuple_(Audit.created_at, Audit.id)
+
+    if before:
+        query = query.filter(key > tuple_(*decode_cursor(before)))
+        rows = query.order_by(Audit.created_at.asc(), Audit.id.asc()).limit(per_page + 1).all()
+        has_prev = len(rows) > per_page
+        items = list(reversed(rows[:per_page]))
+        return AuditPage(
+            items=items,
+            next_cursor=encode_cursor(items[-1]) if items else None,
+            prev_cursor=encode_cursor(items[0]) if items and has_prev else None,
+        )
+
+    if cursor:
+        query = query.filter(key < tuple_(*decode_cursor(cursor)))
+    rows = query.order_by(Audit.created_at.desc(), Audit.id.desc()).limit(per_page + 1).all()
+    items = rows[:per_page]
+    return AuditPage(
+        items=items,
+        next_cursor=encode_cursor(items[-1]) if len(rows) > per_page else None,
+        prev_cursor=encode_cursor(items[0]) if items and cursor else None,
+    )
+
+
+def _has_fts_table(bind: Any) -> bool:
+    engine = getattr(bind, "engine", bind)
+    available = _fts_available.get(engine)
+    if available is None:
+        available = inspect(engine).has_table("audits_fts")
+        _fts_available[engine] = available
+    return available
+
+
+def _fts_phrase(term: str) -> str:
+    """Quote a user search term as a literal FTS5 phrase."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def apply_search(query: Query, db: Session, term: str) -> Query:
+    """Filter audits whose URL or company name contains ``term``."""
+    bind = db.get_bind()
+    if (
+        bind.dialect.name == "sqlite"
+        and len(term) >= FTS_MIN_TERM_LENGTH
+        and _has_fts_table(bind)
+    ):
+        matches = text("SELECT audit_id FROM audits_fts WHERE audits_fts MATCH :phrase")
+        return query.filter(
+            Audit.id.in_(matches.bindparams(phrase=_fts_phrase(term)).columns(Audit.id))
+        )
+
+    pattern = f"%{term}%"
+    return query.filter(or_(Audit.url.ilike(pattern), Audit.company_name.ilike(pattern)))
+
+
+def _estimated_row_count(db: Session) -> Optional[int]:
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    row = db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'audits'")
+    ).fetchone()
+    return int(row[0]) if row and row[0] >= AUDIT_COUNT_ESTIMATE_THRESHOLD else None
+
+
+def count_audits(query: Query, cache_key: str, filtered: bool = True) -> int:
+    """
+    Count the rows a listing query matches, cached for AUDIT_COUNT_CACHE_TTL.
+
+    Unfiltered counts over large PostgreSQL tables use the planner's estimate.
+    """
+    # Imported lazily: the report package is slow to import for database-only callers
+    from packages.seo_health_report.scripts import memory_cache
+
+    cached = memory_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    total = None if filtered else _estimated_row_count(query.session)
+    if total is None:
+        total = query.count()
+
+    memory_cache.set(cache_key, total, AUDIT_COUNT_CACHE_TTL)
+    return total
@@ -12,7 +12,13 @@ from typing import Any, Optional
 
 import requests
 
-from .scripts.analyze_content import analyze_page_content, assess_content_quality
+from packages.core.robots import get_robots_policy
+
+from .scripts.analyze_content import (
+    analyze_page_content,
+    analyze_pages,
+    assess_content_quality,
+)
 from .scripts.analyze_links import analyze_internal_links
 from .scripts.check_eeat import analyze_eeat_signals
 from .scripts.map_topics import analyze_topical_coverage
@@ -115,7 +121,8 @@ def run_audit(
             return False
         return True
 
-    # Crawl to find pages
+    # Crawl to find pages, skipping anything robots.txt disallows for us
+    robots = get_robots_policy(target_url)
     html = fetch_page(target_url)
     pages_to_analyze = [target_url]
 
@@ -129,14 +136,15 @@ def run_audit(
             full_url = urljoin(target_url, link)
             parsed = urlparse(full_url)
             if parsed.netloc == parsed_base.netloc:
-                if full_url not in pages_to_analyze and is_content_url(full_url):
+                if (
+                    full_url not in pages_to_analyze
+                    and is_content_url(full_url)
+                    and robots.is_allowed(full_url)
+                ):
                     pages_to_analyze.append(full_url)
 
     # Analyze pages
-    page_analyses = []
-    for page_url in pages_to_analyze[:20]:  # Limit for performance
-        page_analysis = analyze_page_content(page_url)
-        page_analyses.append(page_analysis)
+    page_analyses = analyze_pages(pages_to_analyze[:20])  # Limit for performance
 
     content_result = assess_content_quality(page_analyses)
     results["components"]["content_quality"] = {
@@ -604,6 +612,7 @@ __all__ = [
     "generate_recommendations",
     "format_report",
     "analyze_page_content",
+    "analyze_pages",
     "assess_content_quality",
     "analyze_eeat_signals",
     "analyze_topical_coverage",
@@ -4,7 +4,13 @@ SEO Content & Authority Audit Scripts
 Core functionality for content quality and authority analysis.
 """
 
-from .analyze_content import analyze_page_content, assess_content_quality, check_content_freshness
+from .analyze_content import (
+    analyze_page_content,
+    analyze_page_html,
+    analyze_pages,
+    assess_content_quality,
+    check_content_freshness,
+)
 from .analyze_links import analyze_anchor_text, analyze_internal_links, find_orphan_pages
 from .check_eeat import analyze_eeat_signals, check_author_pages, check_trust_signals
 from .map_topics import analyze_topical_coverage, find_content_gaps, identify_topic_clusters
@@ -12,6 +18,8 @@ from .score_backlinks import analyze_backlink_profile, check_toxic_links
 
 __all__ = [
     "analyze_page_content",
+    "analyze_page_html",
+    "analyze_pages",
     "assess_content_quality",
     "check_content_freshness",
     "analyze_eeat_signals",
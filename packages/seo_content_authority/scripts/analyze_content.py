@@ -4,11 +4,22 @@ Analyze Content Quality
 Evaluate content quality metrics: word count, readability, media, freshness.
 """
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
 
+from packages.core.analysis_pool import get_analysis_pool
+from packages.core.observations import ObservationKind, observed
+from packages.core.parsed_page import parse_page
+from packages.core.text_stats import text_stats
+from packages.core.tracing import Stage, in_current_context, traced
+
+# Pages fetched at once by analyze_pages()
+CONTENT_FETCH_CONCURRENCY = int(os.getenv("CONTENT_FETCH_CONCURRENCY", "8"))
+
 
 @dataclass
 class ContentIssue:
@@ -21,6 +32,8 @@ class ContentIssue:
     recommendation: str = ""
 
 
+@observed(ObservationKind.PAGE)
+@traced(Stage.FETCH)
 def fetch_page(url: str, timeout: int = 30) -> Optional[str]:
     """Fetch HTML content from URL."""
     try:
@@ -35,24 +48,13 @@ def fetch_page(url: str, timeout: int = 30) -> Optional[str]:
 
 
 def extract_text_content(html: str) -> str:
-    """Extract text content from HTML, removing scripts and styles."""
-    # Remove scripts and styles
-    clean = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    clean = re.sub(r"<style[^>]*>.*?</style>", "", clean, flags=re.DOTALL | re.IGNORECASE)
-
-    # Remove HTML tags
-    text = re.sub(r"<[^>]+>", " ", clean)
-
-    # Clean up whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-
-    return text
+    """Extract the visible text of an HTML page (scripts and styles excluded)."""
+    return parse_page(html).text
 
 
 def count_words(text: str) -> int:
     """Count words in text."""
-    words = text.split()
-    return len(words)
+    return text_stats(text).word_count
 
 
 def calculate_readability(text: str) -> dict[str, Any]:
@@ -65,58 +67,7 @@ def calculate_readability(text: str) -> dict[str, Any]:
     Returns:
         Dict with readability metrics
     """
-    words = text.split()
-    word_count = len(words)
-
-    if word_count == 0:
-        return {
-            "flesch_reading_ease": 0,
-            "flesch_kincaid_grade": 0,
-            "avg_sentence_length": 0,
-            "avg_syllables_per_word": 0,
-        }
-
-    # Count sentences (rough approximation)
-    sentences = re.split(r"[.!?]+", text)
-    sentences = [s for s in sentences if s.strip()]
-    sentence_count = max(len(sentences), 1)
-
-    # Count syllables (rough approximation)
-    def count_syllables(word: str) -> int:
-        word = word.lower()
-        vowels = "aeiouy"
-        count = 0
-        prev_vowel = False
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not prev_vowel:
-                count += 1
-            prev_vowel = is_vowel
-        # Handle silent e
-        if word.endswith("e") and count > 1:
-            count -= 1
-        return max(count, 1)
-
-    total_syllables = sum(count_syllables(word) for word in words)
-
-    # Calculate metrics
-    avg_sentence_length = word_count / sentence_count
-    avg_syllables_per_word = total_syllables / word_count
-
-    # Flesch Reading Ease
-    flesch_reading_ease = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
-    flesch_reading_ease = max(0, min(100, flesch_reading_ease))
-
-    # Flesch-Kincaid Grade Level
-    flesch_kincaid_grade = (0.39 * avg_sentence_length) + (11.8 * avg_syllables_per_word) - 15.59
-    flesch_kincaid_grade = max(0, flesch_kincaid_grade)
-
-    return {
-        "flesch_reading_ease": round(flesch_reading_ease, 1),
-        "flesch_kincaid_grade": round(flesch_kincaid_grade, 1),
-        "avg_sentence_length": round(avg_sentence_length, 1),
-        "avg_syllables_per_word": round(avg_syllables_per_word, 2),
-    }
+    return text_stats(text).readability()
 
 
 def analyze_media_richness(html: str) -> dict[str, Any]:
@@ -129,19 +80,20 @@ def analyze_media_richness(html: str) -> dict[str, Any]:
     Returns:
         Dict with media analysis
     """
+    page = parse_page(html)
+
     # Count images
-    images = re.findall(r"<img[^>]+>", html, re.IGNORECASE)
-    images_with_alt = len([img for img in images if "alt=" in img.lower()])
+    images = page.images
+    images_with_alt = len([img for img in images if img.alt is not None])
 
     # Count videos
-    videos = len(
-        re.findall(r"<video[^>]*>|<iframe[^>]*(?:youtube|vimeo)[^>]*>", html, re.IGNORECASE)
-    )
+    embedded_videos = [src for src in page.iframes if re.search(r"youtube|vimeo", src, re.I)]
+    videos = page.count("video") + len(embedded_videos)
 
     # Count other rich content
-    infographics = len(re.findall(r"<(?:svg|canvas)[^>]*>", html, re.IGNORECASE))
-    tables = len(re.findall(r"<table[^>]*>", html, re.IGNORECASE))
-    lists = len(re.findall(r"<(?:ul|ol)[^>]*>", html, re.IGNORECASE))
+    infographics = page.count("svg", "canvas")
+    tables = page.count("table")
+    lists = page.count("ul", "ol")
 
     return {
         "image_count": len(images),
@@ -173,19 +125,15 @@ def check_content_freshness(html: str, url: str) -> dict[str, Any]:
         "freshness_status": "unknown",
     }
 
-    # Look for dates in structured data
-    date_patterns = [
-        r'"datePublished"\s*:\s*"([^"]+)"',
-        r'"dateModified"\s*:\s*"([^"]+)"',
-        r'<meta[^>]*property=["\']article:published_time["\'][^>]*content=["\']([^"\']+)',
-        r'<meta[^>]*property=["\']article:modified_time["\'][^>]*content=["\']([^"\']+)',
-        r'<time[^>]*datetime=["\']([^"\']+)["\']',
-    ]
+    page = parse_page(html)
 
-    dates_found = []
-    for pattern in date_patterns:
-        matches = re.findall(pattern, html, re.IGNORECASE)
-        dates_found.extend(matches)
+    # Look for dates in structured data, article meta tags and <time> elements
+    json_ld = "\n".join(page.json_ld)
+    dates_found = re.findall(r'"datePublished"\s*:\s*"([^"]+)"', json_ld, re.IGNORECASE)
+    dates_found.extend(re.findall(r'"dateModified"\s*:\s*"([^"]+)"', json_ld, re.IGNORECASE))
+    dates_found.extend(page.meta_all("article:published_time", "property"))
+    dates_found.extend(page.meta_all("article:modified_time", "property"))
+    dates_found.extend(page.datetimes)
 
     if dates_found:
         result["has_date"] = True
@@ -227,8 +175,9 @@ def is_technical_content(html: str, text: str) -> bool:
         True if content appears to be technical/developer documentation
     """
     # Check for code blocks
-    code_count = len(re.findall(r"<code[^>]*>", html, re.IGNORECASE))
-    pre_count = len(re.findall(r"<pre[^>]*>", html, re.IGNORECASE))
+    page = parse_page(html)
+    code_count = page.count("code")
+    pre_count = page.count("pre")
 
     # Check for keywords
     tech_keywords = [
@@ -246,7 +195,8 @@ def is_technical_content(html: str, text: str) -> bool:
         "config",
         "install",
     ]
-    keyword_count = sum(1 for k in tech_keywords if k in text.lower())
+    text_lower = text_stats(text).text_lower
+    keyword_count = sum(1 for k in tech_keywords if k in text_lower)
 
     return code_count > 2 or pre_count > 1 or keyword_count > 5
 
@@ -258,6 +208,57 @@ def analyze_page_content(url: str) -> dict[str, Any]:
     Args:
         url: Page URL to analyze
 
+    Returns:
+        Dict with complete content analysis
+    """
+    return analyze_page_html(url, fetch_page(url))
+
+
+@traced(Stage.ANALYZE)
+def analyze_pages(urls: list[str]) -> list[dict[str, Any]]:
+    """
+    Fetch and analyze several pages.
+
+    Pages are fetched concurrently and each batch of fetched pages is handed
+    to the analysis process pool as soon as it is complete, so analysis runs
+    alongside the remaining fetches.
+
+    Args:
+        urls: Page URLs to analyze
+
+    Returns:
+        Content analysis per page, in the order of `urls`
+    """
+    order: list[int] = []
+
+    def fetched_pages():
+        with ThreadPoolExecutor(max_workers=CONTENT_FETCH_CONCURRENCY) as fetchers:
+            fetches = {
+                fetchers.submit(in_current_context(fetch_page), url): i
+                for i, url in enumerate(urls)
+            }
+            for fetched in as_completed(fetches):
+                index = fetches[fetched]
+                order.append(index)
+                yield urls[index], fetched.result()
+
+    analyses = get_analysis_pool().map(analyze_page_html, fetched_pages())
+    results: list[dict[str, Any]] = [{}] * len(urls)
+    for index, analysis in zip(order, analyses):
+        results[index] = analysis
+    return results
+
+
+def analyze_page_html(url: str, html: Optional[str]) -> dict[str, Any]:
+    """
+    Content analysis of an already fetched page.
+
+    Pure CPU work on picklable inputs, so it can run in the analysis pool.
+
+    Args:
+        url: Page URL
+        html: HTML content, or None if the page could not be fetched
+
     Returns:
         Dict with complete content analysis
     """
@@ -272,8 +273,6 @@ def analyze_page_content(url: str) -> dict[str, Any]:
         "findings": [],
     }
 
-    html = fetch_page(url)
-
     if not html:
         result["issues"].append(
             {"severity": "high", "category": "fetch", "description": f"Could not fetch {url}"}
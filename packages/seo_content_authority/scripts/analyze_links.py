@@ -5,11 +5,20 @@ Evaluate internal linking structure, orphan pages, and link equity flow.
 """
 
 import re
+import time
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Optional
 from urllib.parse import urljoin, urlparse
 
+from packages.core.observations import ObservationKind, observed
+from packages.core.parsed_page import parse_page
+from packages.core.robots import get_robots_policy
+from packages.core.tracing import Stage, traced
+
+# Upper bound on a site's Crawl-delay we honour, so one audit can't stall
+MAX_CRAWL_DELAY = 2.0
+
 
 @dataclass
 class InternalLink:
@@ -21,6 +30,8 @@ class InternalLink:
     is_navigation: bool
 
 
+@observed(ObservationKind.PAGE)
+@traced(Stage.FETCH)
 def fetch_page(url: str, timeout: int = 30) -> Optional[str]:
     """Fetch HTML content from URL."""
     try:
@@ -50,32 +61,16 @@ def extract_internal_links(html: str, page_url: str, base_url: str) -> list[Inte
     parsed_base = urlparse(base_url)
     base_domain = parsed_base.netloc
 
-    # Find all anchor tags
-    link_pattern = r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>'
-    matches = re.findall(link_pattern, html, re.IGNORECASE | re.DOTALL)
-
-    # Check if link is in navigation
-    nav_section = ""
-    nav_match = re.search(
-        r"<(?:nav|header)[^>]*>.*?</(?:nav|header)>", html, re.IGNORECASE | re.DOTALL
-    )
-    if nav_match:
-        nav_section = nav_match.group(0).lower()
+    for anchor in parse_page(html).anchors:
+        if not anchor.href:
+            continue
 
-    for href, anchor in matches:
         # Resolve relative URLs
-        full_url = urljoin(page_url, href)
+        full_url = urljoin(page_url, anchor.href)
         parsed = urlparse(full_url)
 
         # Check if internal
         if parsed.netloc == base_domain:
-            # Clean anchor text
-            anchor_clean = re.sub(r"<[^>]+>", "", anchor)
-            anchor_clean = re.sub(r"\s+", " ", anchor_clean).strip()
-
-            # Check if in navigation
-            is_nav = href.lower() in nav_section
-
             # Normalize URL (remove fragments, trailing slashes)
             normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
             normalized = normalized.rstrip("/")
@@ -84,8 +79,8 @@ def extract_internal_links(html: str, page_url: str, base_url: str) -> list[Inte
                 InternalLink(
                     source_url=page_url,
                     target_url=normalized,
-                    anchor_text=anchor_clean[:100],  # Limit length
-                    is_navigation=is_nav,
+                    anchor_text=anchor.text[:100],  # Limit length
+                    is_navigation=anchor.in_navigation,
                 )
             )
 
@@ -340,6 +335,7 @@ def calculate_click_depth(
     return result
 
 
+@traced(Stage.ANALYZE)
 def analyze_internal_links(url: str, crawl_depth: int = 30) -> dict[str, Any]:
     """
     Complete internal linking analysis.
@@ -370,14 +366,17 @@ def analyze_internal_links(url: str, crawl_depth: int = 30) -> dict[str, Any]:
     pages_to_crawl = [url]
     all_discovered_pages = set()
 
-    urlparse(url)
+    robots = get_robots_policy(url)
+    crawl_delay = min(robots.crawl_delay() or 0, MAX_CRAWL_DELAY)
 
     while pages_to_crawl and len(crawled_pages) < crawl_depth:
         current_url = pages_to_crawl.pop(0)
 
-        if current_url in crawled_pages:
+        if current_url in crawled_pages or not robots.is_allowed(current_url):
             continue
 
+        if crawl_delay and crawled_pages:
+            time.sleep(crawl_delay)
         html = fetch_page(current_url)
         if not html:
             continue
@@ -9,6 +9,10 @@ from dataclasses import dataclass
 from typing import Any, Optional
 from urllib.parse import urljoin
 
+from packages.core.observations import ObservationKind, observed
+from packages.core.parsed_page import parse_page
+from packages.core.tracing import Stage, traced
+
 
 @dataclass
 class EEATIssue:
@@ -20,6 +24,8 @@ class EEATIssue:
     recommendation: str = ""
 
 
+@observed(ObservationKind.PAGE)
+@traced(Stage.FETCH)
 def fetch_page(url: str, timeout: int = 30) -> Optional[str]:
     """Fetch HTML content from URL."""
     try:
@@ -54,26 +60,22 @@ def check_author_pages(html: str, base_url: str) -> dict[str, Any]:
         "findings": [],
     }
 
-    # Look for author indicators
-    author_patterns = [
-        # Schema.org author
-        (r'"author"\s*:\s*\{[^}]*"name"\s*:\s*"([^"]+)"', "schema"),
-        # Meta tag author
-        (r'<meta[^>]*name=["\']author["\'][^>]*content=["\']([^"\']+)', "meta"),
-        # Common author class patterns
-        (r'class=["\'][^"\']*author[^"\']*["\'][^>]*>([^<]+)</(?:a|span|div)', "class"),
-        # "By [Author]" patterns
-        (r"[Bb]y\s+<a[^>]+>([^<]+)</a>", "byline"),
-        (r"[Bb]y\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)", "byline_text"),
-    ]
+    page = parse_page(html)
+
+    # Look for author indicators: Schema.org author, meta tag, elements marked
+    # up as the author, and "By Firstname Lastname" bylines in the text
+    candidates = re.findall(
+        r'"author"\s*:\s*\{[^}]*"name"\s*:\s*"([^"]+)"', "\n".join(page.json_ld), re.IGNORECASE
+    )
+    candidates.extend(page.meta_all("author"))
+    candidates.extend(page.author_texts)
+    candidates.extend(re.findall(r"\b[Bb]y\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)", page.text))
 
     authors_found = set()
-    for pattern, _source in author_patterns:
-        matches = re.findall(pattern, html, re.IGNORECASE)
-        for match in matches:
-            author_name = match.strip()
-            if len(author_name) > 2 and len(author_name) < 100:
-                authors_found.add(author_name)
+    for match in candidates:
+        author_name = match.strip()
+        if len(author_name) > 2 and len(author_name) < 100:
+            authors_found.add(author_name)
 
     result["author_count"] = len(authors_found)
     result["has_authors"] = len(authors_found) > 0
@@ -91,15 +93,9 @@ def check_author_pages(html: str, base_url: str) -> dict[str, Any]:
         )
 
     # Look for author bio links
-    author_link_patterns = [
-        r'href=["\']([^"\']*(?:author|team|about)[^"\']*)["\']',
-        r'href=["\']([^"\']*(?:\/about\/|\/team\/|\/author\/)[^"\']*)["\']',
-    ]
-
-    for pattern in author_link_patterns:
-        matches = re.findall(pattern, html, re.IGNORECASE)
-        for match in matches:
-            full_url = urljoin(base_url, match)
+    for anchor in page.anchors:
+        if re.search(r"author|team|about", anchor.href, re.IGNORECASE):
+            full_url = urljoin(base_url, anchor.href)
             if full_url not in result["author_links"]:
                 result["author_links"].append(full_url)
 
@@ -112,7 +108,7 @@ def check_author_pages(html: str, base_url: str) -> dict[str, Any]:
     ]
 
     for pattern in credential_patterns:
-        if re.search(pattern, html, re.IGNORECASE):
+        if re.search(pattern, page.text, re.IGNORECASE):
             result["authors_with_credentials"] += 1
             break
 
@@ -181,7 +177,8 @@ def check_about_page(base_url: str) -> dict[str, Any]:
         return result
 
     # Analyze about page content
-    html_lower = html.lower()
+    page = parse_page(html)
+    html_lower = page.text_lower
 
     # Check for company information
     company_indicators = [
@@ -212,9 +209,7 @@ def check_about_page(base_url: str) -> dict[str, Any]:
         result["findings"].append("About page includes company history")
 
     # Check word count
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    result["word_count"] = len(text.split())
+    result["word_count"] = page.word_count
 
     if result["word_count"] < 200:
         result["issues"].append(
@@ -263,33 +258,44 @@ def check_contact_page(base_url: str) -> dict[str, Any]:
     # Also check homepage and footer
     homepage_html = fetch_page(base_url)
 
-    # Check for contact info in either page
-    check_html = (html or "") + (homepage_html or "")
+    # Check for contact info in either page: visible text plus mailto:/tel: links
+    pages = [parse_page(page_html) for page_html in (html, homepage_html) if page_html]
+    contact_text = "\n".join(
+        [page.text for page in pages]
+        + [
+            anchor.href
+            for page in pages
+            for anchor in page.anchors
+            if anchor.href.lower().startswith(("mailto:", "tel:"))
+        ]
+    )
 
     # Check for address
     address_patterns = [
-        r"<address[^>]*>.*?</address>",
         r"(?:street|avenue|road|blvd|drive|suite|floor)\s*(?:#?\d+)?",
         r"\d{5}(?:-\d{4})?",  # ZIP code
     ]
-    if any(re.search(p, check_html, re.IGNORECASE) for p in address_patterns):
+    has_address = any(page.count("address") for page in pages) or any(
+        re.search(p, contact_text, re.IGNORECASE) for p in address_patterns
+    )
+    if has_address:
         result["has_address"] = True
         result["findings"].append("Physical address found")
 
     # Check for phone
     phone_pattern = r"(?:\+1|1)?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}"
-    if re.search(phone_pattern, check_html):
+    if re.search(phone_pattern, contact_text):
         result["has_phone"] = True
         result["findings"].append("Phone number found")
 
     # Check for email
     email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    if re.search(email_pattern, check_html):
+    if re.search(email_pattern, contact_text):
         result["has_email"] = True
         result["findings"].append("Email address found")
 
     # Check for contact form
-    if "<form" in check_html.lower():
+    if any(page.count("form") for page in pages):
         result["has_form"] = True
         result["findings"].append("Contact form available")
 
@@ -347,10 +353,14 @@ def check_trust_signals(html: str, base_url: str) -> dict[str, Any]:
         "findings": [],
     }
 
-    html_lower = html.lower()
+    page = parse_page(html)
+    # Links (targets and anchor text) for policy pages and profiles; visible
+    # text and image alt text for testimonials and badges
+    links_lower = "\n".join(f"{anchor.href} {anchor.text}" for anchor in page.anchors).lower()
+    html_lower = "\n".join([page.text] + [image.alt for image in page.images if image.alt]).lower()
 
     # Check for privacy policy
-    if re.search(r"privacy[\s-]?policy|privacy", html_lower):
+    if re.search(r"privacy[\s-]?policy|privacy", links_lower):
         result["has_privacy_policy"] = True
         result["findings"].append("Privacy policy linked")
     else:
@@ -365,7 +375,7 @@ def check_trust_signals(html: str, base_url: str) -> dict[str, Any]:
 
     # Check for terms
     if re.search(
-        r"terms[\s-]?(?:of[\s-]?(?:service|use))?|terms[\s-]?(?:and[\s-]?)?conditions", html_lower
+        r"terms[\s-]?(?:of[\s-]?(?:service|use))?|terms[\s-]?(?:and[\s-]?)?conditions", links_lower
     ):
         result["has_terms"] = True
         result["findings"].append("Terms of service linked")
@@ -397,7 +407,7 @@ def check_trust_signals(html: str, base_url: str) -> dict[str, Any]:
     ]
 
     for pattern, name in social_patterns:
-        if re.search(pattern, html_lower):
+        if re.search(pattern, links_lower):
             result["social_profiles"].append(name)
 
     if result["social_profiles"]:
@@ -406,6 +416,7 @@ def check_trust_signals(html: str, base_url: str) -> dict[str, Any]:
     return result
 
 
+@traced(Stage.ANALYZE)
 def analyze_eeat_signals(url: str) -> dict[str, Any]:
     """
     Complete E-E-A-T analysis for a website.
@@ -9,6 +9,13 @@ from dataclasses import dataclass
 from typing import Any, Optional
 from urllib.parse import urljoin, urlparse
 
+from packages.core.analysis_pool import get_analysis_pool
+from packages.core.observations import ObservationKind, observed
+from packages.core.parsed_page import parse_page
+from packages.core.robots import get_robots_policy
+from packages.core.text_stats import text_stats
+from packages.core.tracing import Stage, traced
+
 
 @dataclass
 class TopicCluster:
@@ -21,6 +28,8 @@ class TopicCluster:
     depth_score: int  # 1-5
 
 
+@observed(ObservationKind.PAGE)
+@traced(Stage.FETCH)
 def fetch_page(url: str, timeout: int = 30) -> Optional[str]:
     """Fetch HTML content from URL."""
     try:
@@ -45,11 +54,11 @@ def extract_keywords_from_content(html: str) -> list[str]:
         List of potential keywords/phrases
     """
     keywords = set()
+    page = parse_page(html)
 
     # Extract from title
-    title_match = re.search(r"<title>([^<]+)</title>", html, re.IGNORECASE)
-    if title_match:
-        title = title_match.group(1)
+    if page.title:
+        title = page.title
         # Split title by common separators
         parts = re.split(r"[|\-–—:]", title)
         for part in parts:
@@ -57,32 +66,40 @@ def extract_keywords_from_content(html: str) -> list[str]:
             if len(part) > 3 and len(part) < 60:
                 keywords.add(part.lower())
 
-    # Extract from h1, h2, h3
-    heading_patterns = [r"<h1[^>]*>([^<]+)</h1>", r"<h2[^>]*>([^<]+)</h2>"]
-    for pattern in heading_patterns:
-        matches = re.findall(pattern, html, re.IGNORECASE)
-        for match in matches:
-            match = re.sub(r"<[^>]+>", "", match).strip()
-            if len(match) > 3 and len(match) < 100:
-                keywords.add(match.lower())
+    # Extract from h1, h2
+    for heading in page.headings:
+        if heading.level <= 2 and len(heading.text) > 3 and len(heading.text) < 100:
+            keywords.add(heading.text.lower())
 
     # Extract from meta description
-    meta_desc = re.search(
-        r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)', html, re.IGNORECASE
-    )
-    if meta_desc:
-        # Extract key phrases from description
-        desc = meta_desc.group(1)
-        # Simple n-gram extraction for 2-3 word phrases
-        words = desc.lower().split()
-        for i in range(len(words) - 1):
-            phrase = " ".join(words[i : i + 2])
-            if len(phrase) > 5:
-                keywords.add(phrase)
+    desc = page.meta("description")
+    if desc:
+        # Two-word phrases from the description
+        keywords.update(phrase for phrase in text_stats(desc).ngram_counts(2) if len(phrase) > 5)
 
     return list(keywords)[:20]  # Limit to top 20
 
 
+def summarize_page(url: str, html: str) -> dict[str, Any]:
+    """
+    Title, word count and keywords of a fetched page, for topic clustering.
+
+    Args:
+        url: Page URL
+        html: HTML content
+
+    Returns:
+        Dict with url, title, word_count and keywords
+    """
+    page = parse_page(html)
+    return {
+        "url": url,
+        "title": page.title or "",
+        "word_count": page.word_count,
+        "keywords": extract_keywords_from_content(html),
+    }
+
+
 def identify_topic_clusters(
     pages: list[dict[str, Any]], primary_keywords: list[str]
 ) -> list[TopicCluster]:
@@ -282,7 +299,11 @@ def analyze_keyword_optimization(html: str, target_keywords: list[str]) -> dict[
     """
     result = {"keywords_analyzed": [], "optimization_score": 0, "issues": [], "findings": []}
 
-    html.lower()
+    page = parse_page(html)
+    h1_texts = page.headings_at(1)
+    h2_texts = page.headings_at(2)
+    meta_description = page.meta("description") or ""
+    word_count = page.word_count
 
     for keyword in target_keywords:
         kw_lower = keyword.lower()
@@ -300,36 +321,27 @@ def analyze_keyword_optimization(html: str, target_keywords: list[str]) -> dict[
         }
 
         # Check title
-        title_match = re.search(r"<title>([^<]+)</title>", html, re.IGNORECASE)
-        if title_match and kw_lower in title_match.group(1).lower():
+        if page.title and kw_lower in page.title.lower():
             kw_analysis["in_title"] = True
             kw_analysis["score"] += 2
 
         # Check H1
-        h1_match = re.search(r"<h1[^>]*>([^<]+)</h1>", html, re.IGNORECASE)
-        if h1_match and kw_lower in h1_match.group(1).lower():
+        if h1_texts and kw_lower in h1_texts[0].lower():
             kw_analysis["in_h1"] = True
             kw_analysis["score"] += 2
 
         # Check H2s
-        h2_matches = re.findall(r"<h2[^>]*>([^<]+)</h2>", html, re.IGNORECASE)
-        if any(kw_lower in h2.lower() for h2 in h2_matches):
+        if any(kw_lower in h2.lower() for h2 in h2_texts):
             kw_analysis["in_h2"] = True
             kw_analysis["score"] += 1
 
         # Check meta description
-        meta_match = re.search(
-            r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)', html, re.IGNORECASE
-        )
-        if meta_match and kw_lower in meta_match.group(1).lower():
+        if kw_lower in meta_description.lower():
             kw_analysis["in_meta_description"] = True
             kw_analysis["score"] += 1
 
         # Calculate keyword density
-        text = re.sub(r"<[^>]+>", " ", html)
-        text_lower = text.lower()
-        word_count = len(text.split())
-        keyword_count = text_lower.count(kw_lower)
+        keyword_count = page.text_lower.count(kw_lower)
 
         if word_count > 0:
             kw_analysis["density"] = round((keyword_count / word_count) * 100, 2)
@@ -355,6 +367,7 @@ def analyze_keyword_optimization(html: str, target_keywords: list[str]) -> dict[
     return result
 
 
+@traced(Stage.ANALYZE)
 def analyze_topical_coverage(
     url: str, primary_keywords: list[str], crawl_depth: int = 20
 ) -> dict[str, Any]:
@@ -387,11 +400,11 @@ def analyze_topical_coverage(
         return result
 
     # Extract internal links to crawl
-    link_pattern = r'href=["\']([^"\']+)["\']'
-    links = re.findall(link_pattern, html, re.IGNORECASE)
+    links = [anchor.href for anchor in parse_page(html).anchors if anchor.href]
 
     parsed_base = urlparse(url)
     internal_urls = [url]  # Start with homepage
+    robots = get_robots_policy(url)
 
     for link in links:
         full_url = urljoin(url, link)
@@ -411,32 +424,20 @@ def analyze_topical_coverage(
                 r"\.(?:jpg|png|gif|css|js|pdf)$",
             ]
             if not any(re.search(p, full_url, re.IGNORECASE) for p in skip_patterns):
-                if full_url not in internal_urls:
+                if full_url not in internal_urls and robots.is_allowed(full_url):
                     internal_urls.append(full_url)
 
         if len(internal_urls) >= crawl_depth:
             break
 
-    # Analyze each page
-    pages = []
-    for page_url in internal_urls[:crawl_depth]:
-        page_html = fetch_page(page_url)
-        if page_html:
-            # Extract title
-            title_match = re.search(r"<title>([^<]+)</title>", page_html, re.IGNORECASE)
-            title = title_match.group(1) if title_match else ""
-
-            # Extract text and count words
-            text = re.sub(r"<[^>]+>", " ", page_html)
-            text = re.sub(r"\s+", " ", text)
-            word_count = len(text.split())
-
-            # Extract keywords
-            keywords = extract_keywords_from_content(page_html)
-
-            pages.append(
-                {"url": page_url, "title": title, "word_count": word_count, "keywords": keywords}
-            )
+    # Analyze each page in the analysis pool while the next ones are fetched
+    def fetched_pages():
+        for page_url in internal_urls[:crawl_depth]:
+            page_html = fetch_page(page_url)
+            if page_html:
+                yield page_url, page_html
+
+    pages = get_analysis_pool().map(summarize_page, fetched_pages())
 
     result["findings"].append(f"Analyzed {len(pages)} pages")
 
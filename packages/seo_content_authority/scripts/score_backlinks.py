@@ -15,6 +15,8 @@ from urllib.parse import urlparse
 
 import requests
 
+from packages.core.tracing import Stage, traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +32,7 @@ class Backlink:
     is_relevant: bool
 
 
+@traced(Stage.ANALYZE)
 def analyze_backlink_profile(
     url: str, api_key: Optional[str] = None, api_provider: str = "moz"
 ) -> dict[str, Any]:
@@ -5,34 +5,45 @@ Generate comprehensive, branded SEO health reports by orchestrating
 technical, content, and AI visibility audits.
 """
 
+import importlib
 import os
 from datetime import datetime
 from typing import Any, Optional
 from urllib.parse import urlparse
 
-from .scripts.apply_branding import apply_branding
-from .scripts.build_report import build_report_document
-from .scripts.calculate_scores import (
-    calculate_composite_score,
-    determine_grade,
-    get_grade_description,
-)
-from .scripts.generate_summary import generate_executive_summary
 from .scripts.logger import get_logger
-from .scripts.orchestrate import (
-    collect_all_issues,
-    collect_all_recommendations,
-    identify_critical_issues,
-    identify_quick_wins,
-    run_full_audit,
-    run_full_audit_sync,
-)
 
 logger = get_logger(__name__)
 
 
 __version__ = "1.0.0"
 
+# Re-exported pipeline functions, imported on first use: the audit and report
+# modules pull in heavy dependencies (reportlab, docx, the AI clients) that
+# code importing a light subpackage such as .quotas or .metrics doesn't need
+_LAZY_EXPORTS = {
+    "apply_branding": ".scripts.apply_branding",
+    "build_report_document": ".scripts.build_report",
+    "calculate_composite_score": ".scripts.calculate_scores",
+    "determine_grade": ".scripts.calculate_scores",
+    "get_grade_description": ".scripts.calculate_scores",
+    "generate_executive_summary": ".scripts.generate_summary",
+    "collect_all_issues": ".scripts.orchestrate",
+    "collect_all_recommendations": ".scripts.orchestrate",
+    "identify_critical_issues": ".scripts.orchestrate",
+    "identify_quick_wins": ".scripts.orchestrate",
+    "run_full_audit": ".scripts.orchestrate",
+    "run_full_audit_sync": ".scripts.orchestrate",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 def clear_all_caches():
     """Clear all cached data."""
@@ -107,6 +118,19 @@ def generate_report(
     if not company_name or not company_name.strip():
         raise ValueError("company_name must be a non-empty string")
 
+    # Resolved through the package so they load lazily (and can be patched there)
+    from . import (
+        apply_branding,
+        build_report_document,
+        calculate_composite_score,
+        collect_all_issues,
+        collect_all_recommendations,
+        generate_executive_summary,
+        identify_critical_issues,
+        identify_quick_wins,
+        run_full_audit_sync,
+    )
+
     result = {
         "overall_score": 0,
         "grade": "F",
@@ -241,6 +265,8 @@ def format_text_report(result: dict[str, Any]) -> str:
     lines.append("=" * 60)
 
     lines.append(f"\nOVERALL SCORE: {result['overall_score']}/100 (Grade: {result['grade']})")
+    from . import get_grade_description
+
     lines.append(f"\n{get_grade_description(result['grade'])}")
 
     lines.append("\n" + "-" * 60)
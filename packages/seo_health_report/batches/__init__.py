@@ -0,0 +1,23 @@
+"""Bulk audit submission and batch progress."""
+
+from .service import (
+    AUDIT_BATCH_MAX_URLS,
+    BatchItem,
+    BatchService,
+    BatchSubmission,
+    BatchTarget,
+    BatchTooLargeError,
+    normalize_target_url,
+    parse_csv_targets,
+)
+
+__all__ = [
+    "AUDIT_BATCH_MAX_URLS",
+    "BatchService",
+    "BatchSubmission",
+    "BatchItem",
+    "BatchTarget",
+    "BatchTooLargeError",
+    "normalize_target_url",
+    "parse_csv_targets",
+]
@@ -0,0 +1,342 @@
+"""
+Bulk audit submission.
+
+A batch is admitted in one transaction: URLs are canonicalized and deduped
+(within the batch, against existing jobs by idempotency key and against the
+tenant's recent audits), the quota is reserved for what's left in a single
+UPDATE, and the audits and audit_jobs rows are bulk-inserted. Submitting
+N URLs costs a handful of statements instead of N request round trips.
+"""
+
+import csv
+import io
+import json
+import os
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from sqlalchemy import bindparam, func, insert, text
+from sqlalchemy.orm import Session
+
+from database import Audit, AuditBatch
+from packages.core.scheduling import job_priority
+from packages.seo_health_report.quotas.service import QuotaService, invalidate_quota_cache
+from packages.seo_health_report.scripts.idempotency import (
+    canonicalize_url,
+    compute_coalesce_key,
+    compute_idempotency_key,
+)
+
+# Most URLs one batch may carry
+AUDIT_BATCH_MAX_URLS = int(os.getenv("AUDIT_BATCH_MAX_URLS", "5000"))
+# URLs audited for the tenant this recently are answered with that audit
+AUDIT_BATCH_DEDUPE_HOURS = int(os.getenv("AUDIT_BATCH_DEDUPE_HOURS", "24"))
+
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+_LOOKUP_CHUNK = 500
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+INSERT_JOBS_SQL = text("""
+    INSERT INTO audit_jobs
+    (job_id, tenant_id, audit_id, status, idempotency_key, payload_json, priority, coalesce_key,
+     queued_at)
+    VALUES (:job_id, :tenant_id, :audit_id, 'queued', :idempotency_key, :payload, :priority,
+            :coalesce_key, CURRENT_TIMESTAMP)
+""")
+
+EXISTING_JOBS_SQL = text(
+    "SELECT idempotency_key, audit_id FROM audit_jobs WHERE idempotency_key IN :keys"
+).bindparams(bindparam("keys", expanding=True))
+
+
+class BatchTooLargeError(ValueError):
+    """Raised when a batch carries more than AUDIT_BATCH_MAX_URLS URLs."""
+
+
+@dataclass
+class BatchTarget:
+    """One URL to audit, with the company name for its report."""
+
+    url: str
+    company_name: Optional[str] = None
+
+
+@dataclass
+class BatchItem:
+    """What happened to one submitted URL."""
+
+    url: str  # As submitted
+    status: str  # queued, duplicate or invalid
+    audit_id: Optional[str] = None
+    canonical_url: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "audit_id": self.audit_id,
+            "canonical_url": self.canonical_url,
+            "error": self.error,
+        }
+
+
+@dataclass
+class BatchSubmission:
+    """Result of submitting a batch."""
+
+    batch_id: str
+    items: list[BatchItem] = field(default_factory=list)
+
+    def count(self, status: str) -> int:
+        return sum(1 for item in self.items if item.status == status)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "batch_id": self.batch_id,
+            "submitted": len(self.items),
+            "queued": self.count("queued"),
+            "duplicates": self.count("duplicate"),
+            "invalid": self.count("invalid"),
+            "items": [item.to_dict() for item in self.items],
+        }
+
+
+def normalize_target_url(url: str) -> str:
+    """
+    Canonical form of a submitted URL.
+
+    Raises:
+        ValueError: If the URL can't be audited.
+    """
+    url = url.strip()
+    if not url.startswith(("http://", "https://")):
+        url = f"https://{url}"
+    canonical = canonicalize_url(url)
+    if "." not in urlparse(canonical).netloc:
+        raise ValueError("Invalid URL format")
+    return canonical
+
+
+def parse_csv_targets(content: str) -> list[BatchTarget]:
+    """
+    Read targets from CSV text.
+
+    A header row naming a `url` column (and optionally `company_name`) is
+    used when present; otherwise the first column is the URL and the second,
+    if any, the company name.
+    """
+    rows = [row for row in csv.reader(io.StringIO(content)) if any(cell.strip() for cell in row)]
+    if not rows:
+        return []
+    header = [cell.strip().lower() for cell in rows[0]]
+    url_col, name_col = 0, 1
+    if "url" in header:
+        url_col = header.index("url")
+        name_col = header.index("company_name") if "company_name" in header else None
+        rows = rows[1:]
+    targets = []
+    for row in rows:
+        if url_col >= len(row) or not row[url_col].strip():
+            continue
+        name = row[name_col].strip() if name_col is not None and name_col < len(row) else ""
+        targets.append(BatchTarget(row[url_col].strip(), name or None))
+    return targets
+
+
+class BatchService:
+    """Admits and tracks audit batches."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def submit(
+        self,
+        targets: list[BatchTarget],
+        user_id: Optional[str],
+        tenant_id: Optional[str],
+        tier: str = "low",
+        keywords: Optional[list[str]] = None,
+        competitors: Optional[list[str]] = None,
+    ) -> BatchSubmission:
+        """
+        Queue an audit for every new URL in `targets`.
+
+        Raises:
+            BatchTooLargeError: If there are more than AUDIT_BATCH_MAX_URLS targets.
+            QuotaExceededError: If the tenant's monthly allowance can't cover
+                the new audits; nothing is queued.
+        """
+        if len(targets) > AUDIT_BATCH_MAX_URLS:
+            raise BatchTooLargeError(
+                f"A batch may carry at most {AUDIT_BATCH_MAX_URLS} URLs, got {len(targets)}"
+            )
+
+        submission = BatchSubmission(batch_id=f"batch_{uuid.uuid4().hex[:12]}")
+        job_tenant = tenant_id or "default"
+        options = {"tier": tier, "keywords": keywords or [], "competitors": competitors or []}
+        # Batches run in the bulk lane behind interactive audits
+        priority = job_priority(tier, interactive=False)
+
+        # Canonicalize and dedupe within the batch; first occurrence wins
+        first: dict[str, BatchItem] = {}
+        pending: list[tuple[BatchItem, str, str]] = []
+        for target in targets:
+            item = BatchItem(url=target.url, status="queued")
+            submission.items.append(item)
+            try:
+                item.canonical_url = normalize_target_url(target.url)
+            except ValueError as e:
+                item.status, item.error = "invalid", str(e)
+                continue
+            if item.canonical_url in first:
+                item.status = "duplicate"
+                continue
+            first[item.canonical_url] = item
+            company_name = target.company_name or urlparse(item.canonical_url).netloc
+            key = compute_idempotency_key(
+                job_tenant, item.canonical_url, {"company_name": company_name, **options}
+            )
+            pending.append((item, company_name, key))
+
+        existing_jobs = self._existing_jobs([key for *_, key in pending])
+        recent = self._recent_audits(user_id, tenant_id)
+
+        new: list[tuple[BatchItem, str, str]] = []
+        for item, company_name, key in pending:
+            audit_id = existing_jobs.get(key) or recent.get(item.canonical_url)
+            if audit_id:
+                item.status, item.audit_id = "duplicate", audit_id
+                continue
+            item.audit_id = f"audit_{uuid.uuid4().hex[:12]}"
+            new.append((item, company_name, key))
+
+        # Later copies of a URL share the audit its first occurrence resolved to
+        for item in submission.items:
+            if item.status == "duplicate" and item.audit_id is None:
+                item.audit_id = first[item.canonical_url].audit_id
+
+        if tenant_id and new:
+            QuotaService(self.db).reserve_audits(tenant_id, len(new))
+
+        self.db.add(
+            AuditBatch(
+                id=submission.batch_id,
+                tenant_id=tenant_id,
+                user_id=user_id,
+                tier=tier,
+                submitted_count=len(submission.items),
+                queued_count=len(new),
+                duplicate_count=submission.count("duplicate"),
+                invalid_count=submission.count("invalid"),
+            )
+        )
+        if new:
+            now = datetime.now(timezone.utc)
+            self.db.execute(
+                insert(Audit),
+                [
+                    {
+                        "id": item.audit_id,
+                        "url": item.canonical_url,
+                        "company_name": company_name,
+                        "tier": tier,
+                        "status": "queued",
+                        "user_id": user_id,
+                        "tenant_id": tenant_id,
+                        "batch_id": submission.batch_id,
+                        "created_at": now,
+                    }
+                    for item, company_name, _ in new
+                ],
+            )
+            jobs = []
+            for item, company_name, key in new:
+                payload = {
+                    "type": "audit",
+                    "url": item.canonical_url,
+                    "company_name": company_name,
+                    "tenant_id": job_tenant,
+                    "batch_id": submission.batch_id,
+                    **options,
+                }
+                jobs.append(
+                    {
+                        "job_id": str(uuid.uuid4()),
+                        "tenant_id": job_tenant,
+                        "audit_id": item.audit_id,
+                        "idempotency_key": key,
+                        "payload": json.dumps(payload),
+                        "priority": priority,
+                        "coalesce_key": compute_coalesce_key(payload),
+                    }
+                )
+            self.db.execute(INSERT_JOBS_SQL, jobs)
+        self.db.commit()
+        if tenant_id and new:
+            invalidate_quota_cache(tenant_id)
+        return submission
+
+    def _existing_jobs(self, keys: list[str]) -> dict[str, str]:
+        """Idempotency key -> audit id of jobs already queued for these keys."""
+        found = {}
+        for start in range(0, len(keys), _LOOKUP_CHUNK):
+            rows = self.db.execute(EXISTING_JOBS_SQL, {"keys": keys[start : start + _LOOKUP_CHUNK]})
+            found.update({row[0]: row[1] for row in rows})
+        return found
+
+    def _recent_audits(self, user_id: Optional[str], tenant_id: Optional[str]) -> dict[str, str]:
+        """Canonical URL -> id of the owner's latest audit inside the dedupe window."""
+        if not (user_id or tenant_id):
+            return {}
+        since = datetime.now(timezone.utc) - timedelta(hours=AUDIT_BATCH_DEDUPE_HOURS)
+        owner = Audit.tenant_id == tenant_id if tenant_id else Audit.user_id == user_id
+        rows = (
+            self.db.query(Audit.id, Audit.url)
+            .filter(owner, Audit.created_at >= since, Audit.status != "failed")
+            .order_by(Audit.created_at)
+            .all()
+        )
+        recent = {}
+        for audit_id, url in rows:
+            try:
+                recent[normalize_target_url(url)] = audit_id
+            except ValueError:
+                continue
+        return recent
+
+    def get_batch(self, batch_id: str) -> Optional[AuditBatch]:
+        return self.db.query(AuditBatch).filter(AuditBatch.id == batch_id).first()
+
+    def progress(self, batch: AuditBatch) -> dict[str, Any]:
+        """Aggregate status of the audits a batch queued."""
+        counts = dict(
+            self.db.query(Audit.status, func.count(Audit.id))
+            .filter(Audit.batch_id == batch.id)
+            .group_by(Audit.status)
+            .all()
+        )
+        total = sum(counts.values())
+        finished = sum(counts.get(status, 0) for status in TERMINAL_STATUSES)
+        if finished == total:
+            status = "completed"
+        elif counts.get("queued", 0) == total:
+            status = "queued"
+        else:
+            status = "running"
+        return {
+            "batch_id": batch.id,
+            "status": status,
+            "tier": batch.tier,
+            "submitted": batch.submitted_count,
+            "queued": batch.queued_count,
+            "duplicates": batch.duplicate_count,
+            "invalid": batch.invalid_count,
+            "audits": {"total": total, **counts},
+            "progress": round(finished / total, 4) if total else 1.0,
+            "created_at": batch.created_at.isoformat() if batch.created_at else None,
+        }
@@ -5,12 +5,7 @@ Provides consistent matplotlib styling and chart functions.
 NO emojis - B2B professional output only.
 """
 
-import matplotlib
-
-matplotlib.use("Agg")  # Non-interactive backend
-
-import matplotlib.pyplot as plt
-import numpy as np
+import functools
 
 # Chart color palette (from color-systems.md)
 CHART_PALETTE = [
@@ -34,8 +29,21 @@ GRADE_COLORS = {
 }
 
 
+@functools.cache
+def _pyplot():
+    """Import pyplot on first use (it takes seconds), on the non-interactive backend."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
 def setup_chart_style():
     """Apply consistent chart styling for all charts."""
+    plt = _pyplot()
+
     plt.rcParams.update(
         {
             "font.family": "sans-serif",
@@ -61,6 +69,8 @@ def save_chart(fig, path: str, dpi: int = 200):
         path: Output path
         dpi: Resolution (default 200 for print quality)
     """
+    plt = _pyplot()
+
     fig.tight_layout()
     fig.savefig(path, dpi=dpi, bbox_inches="tight", facecolor="white", edgecolor="none")
     plt.close(fig)
@@ -91,6 +101,10 @@ def create_score_gauge(score: int, grade: str, company_name: str, output_path: s
     Returns:
         Path to saved chart
     """
+    import numpy as np
+
+    plt = _pyplot()
+
     setup_chart_style()
 
     fig, ax = plt.subplots(figsize=(5, 3.5))
@@ -169,6 +183,10 @@ def create_component_bars(
     Returns:
         Path to saved chart
     """
+    import numpy as np
+
+    plt = _pyplot()
+
     setup_chart_style()
 
     fig, ax = plt.subplots(figsize=(6.5, 2.2))
@@ -238,6 +256,10 @@ def create_ranked_bar_chart(
     Returns:
         Path to saved chart
     """
+    import numpy as np
+
+    plt = _pyplot()
+
     setup_chart_style()
 
     color = primary_color or CHART_PALETTE[0]
@@ -297,6 +319,10 @@ def create_competitor_comparison(
     Returns:
         Path to saved chart
     """
+    import numpy as np
+
+    plt = _pyplot()
+
     setup_chart_style()
 
     labels = [company_name[:15]]
@@ -17,6 +17,8 @@ class HistogramBuckets:
 
     HTTP_LATENCY = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
     AUDIT_DURATION = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+    STAGE_DURATION = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+    QUEUE_WAIT = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0, 7200.0)
 
 
 class MetricsRegistry:
@@ -328,3 +330,26 @@ metrics.register_histogram(
     buckets=HistogramBuckets.AUDIT_DURATION,
 )
 metrics.register_counter("webhook_deliveries_total", "Total webhook delivery attempts by status")
+metrics.register_histogram(
+    "audit_stage_duration_seconds",
+    "Time spent in each audit pipeline stage (fetch, analyze, llm, ...) in seconds",
+    buckets=HistogramBuckets.STAGE_DURATION,
+)
+metrics.register_counter(
+    "observation_store_lookups_total",
+    "Shared observation store lookups by kind and result (hit, miss)",
+)
+metrics.register_histogram(
+    "job_queue_wait_seconds",
+    "Time audit jobs waited in the queue before a worker claimed them, by tenant and lane",
+    buckets=HistogramBuckets.QUEUE_WAIT,
+)
+metrics.register_gauge("job_queue_depth", "Queued audit jobs by tenant")
+metrics.register_counter(
+    "audit_jobs_coalesced_total",
+    "Queued audit jobs completed with the result of an identical in-flight audit",
+)
+metrics.register_counter(
+    "log_records_dropped_total",
+    "Log records dropped by sampling or because the log queue was full, by reason",
+)
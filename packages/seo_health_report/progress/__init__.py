@@ -1,15 +1,29 @@
 """Progress tracking service for SEO Health Report audits."""
 
+from .broker import (
+    ProgressBroker,
+    ProgressSubscription,
+    get_progress_broker,
+    publish_progress_event,
+)
 from .service import (
     AuditProgress,
+    LiveProgress,
     ModuleProgress,
     estimate_completion_time,
     get_audit_progress,
+    progress_event_dict,
 )
 
 __all__ = [
     "ModuleProgress",
     "AuditProgress",
+    "LiveProgress",
     "get_audit_progress",
     "estimate_completion_time",
+    "progress_event_dict",
+    "ProgressBroker",
+    "ProgressSubscription",
+    "get_progress_broker",
+    "publish_progress_event",
 ]
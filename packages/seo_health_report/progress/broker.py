@@ -0,0 +1,242 @@
+"""
+Pub/sub fan-out of audit progress events to live subscribers.
+
+Workers publish each progress event as they write it; subscribers (the SSE
+progress stream) receive pushes instead of re-reading the event table.
+
+On PostgreSQL events travel over LISTEN/NOTIFY, so workers and API servers
+can run in separate processes: the publish rides the worker's transaction
+and one listener thread per API process fans notifications out to local
+subscribers. NOTIFYs sent while that thread is not listening (before its
+first LISTEN, or while it reconnects) are lost, so subscribers should not
+rely on pushes alone to learn that an audit finished. On other databases
+(SQLite in development) delivery is in-process only.
+
+Usage:
+    # Worker, inside the transaction that inserts the event
+    publish_progress_event(db, audit_id, event)
+
+    # API
+    with await get_progress_broker().subscribe(audit_id) as subscription:
+        event = await subscription.get(timeout=15)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import select
+import threading
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_CHANNEL = os.getenv("PROGRESS_NOTIFY_CHANNEL", "audit_progress")
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("PROGRESS_SUBSCRIBER_QUEUE_SIZE", "100"))
+LISTEN_POLL_SECONDS = 5.0
+# Longest subscribe() waits for the listener to be LISTENing
+LISTEN_READY_SECONDS = float(os.getenv("PROGRESS_LISTEN_READY_SECONDS", "5"))
+
+
+def _is_postgres(bind: Any) -> bool:
+    dialect = getattr(bind, "dialect", None)
+    return getattr(dialect, "name", None) == "postgresql"
+
+
+class ProgressSubscription:
+    """A subscriber's queue of progress events for one audit."""
+
+    def __init__(self, broker: "ProgressBroker", audit_id: str, maxsize: int):
+        self.audit_id = audit_id
+        self._broker = broker
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def _push(self, event: dict) -> None:
+        """Enqueue an event on the subscriber's loop, dropping the oldest if full."""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    def deliver(self, event: dict) -> None:
+        """Hand an event to this subscriber from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._push, event)
+        except RuntimeError:
+            # Subscriber's loop has already closed
+            self.close()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Wait for the next event; returns None if ``timeout`` elapses first."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._broker._unsubscribe(self)
+
+    def __enter__(self) -> "ProgressSubscription":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class ProgressBroker:
+    """Routes published progress events to subscribers of the same audit."""
+
+    def __init__(self, channel: str = PROGRESS_CHANNEL, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.channel = channel
+        self.queue_size = queue_size
+        self._subscribers: dict[str, set[ProgressSubscription]] = {}
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._listening = threading.Event()
+
+    async def subscribe(self, audit_id: str) -> ProgressSubscription:
+        """
+        Subscribe to an audit's events.
+
+        On PostgreSQL this returns once the listener thread is LISTENing (or
+        after LISTEN_READY_SECONDS), so events published after it returns
+        reach the subscription.
+        """
+        subscription = ProgressSubscription(self, audit_id, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(audit_id, set()).add(subscription)
+        try:
+            if self._ensure_listener() and not self._listening.is_set():
+                if not await asyncio.to_thread(self._listening.wait, LISTEN_READY_SECONDS):
+                    logger.warning("Progress listener is not listening yet; events may be missed")
+        except BaseException:
+            subscription.close()
+            raise
+        return subscription
+
+    def _unsubscribe(self, subscription: ProgressSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.audit_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.audit_id]
+
+    def subscriber_count(self, audit_id: Optional[str] = None) -> int:
+        with self._lock:
+            if audit_id is not None:
+                return len(self._subscribers.get(audit_id, ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+    def dispatch(self, audit_id: str, event: dict) -> int:
+        """Deliver an event to local subscribers. Returns the number reached."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(audit_id, ()))
+        for subscription in subscribers:
+            subscription.deliver(event)
+        return len(subscribers)
+
+    def publish(self, db: Session, audit_id: str, event: dict) -> None:
+        """
+        Publish an event for an audit.
+
+        On PostgreSQL the NOTIFY is part of ``db``'s transaction and is sent
+        when it commits; otherwise the event is dispatched in-process now.
+        """
+        if _is_postgres(db.get_bind()):
+            payload = json.dumps({"audit_id": audit_id, "event": event}, default=str)
+            db.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.channel, "payload": payload},
+            )
+        else:
+            self.dispatch(audit_id, event)
+
+    def _ensure_listener(self) -> bool:
+        """
+        Start the LISTEN thread on first subscribe when running on PostgreSQL.
+
+        Returns:
+            True if events arrive through the listener thread
+        """
+        if self._listener is not None and self._listener.is_alive():
+            return True
+        from database import engine
+
+        if not _is_postgres(engine):
+            return False
+        self._stop.clear()
+        self._listener = threading.Thread(
+            target=self._listen_loop, args=(engine,), name="progress-listener", daemon=True
+        )
+        self._listener.start()
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the LISTEN thread, if running."""
+        self._stop.set()
+        if self._listener is not None:
+            self._listener.join(timeout)
+            self._listener = None
+
+    def _handle_notification(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            self.dispatch(message["audit_id"], message["event"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed progress notification: {payload[:200]}")
+
+    def _listen_loop(self, engine: Any) -> None:
+        """Hold one LISTEN connection and fan notifications out (psycopg2)."""
+        while not self._stop.is_set():
+            raw = None
+            try:
+                raw = engine.raw_connection()
+                conn = raw.driver_connection
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+                self._listening.set()
+                logger.info(f"Listening for progress events on {self.channel}")
+
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], LISTEN_POLL_SECONDS) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self._handle_notification(conn.notifies.pop(0).payload)
+            except Exception as e:
+                logger.warning(f"Progress listener error, reconnecting: {e}")
+                self._stop.wait(LISTEN_POLL_SECONDS)
+            finally:
+                self._listening.clear()
+                if raw is not None:
+                    # Connection state was altered for LISTEN; don't return it to the pool
+                    raw.invalidate()
+
+
+_broker: Optional[ProgressBroker] = None
+_broker_lock = threading.Lock()
+
+
+def get_progress_broker() -> ProgressBroker:
+    """Get the process-wide progress broker."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = ProgressBroker()
+    return _broker
+
+
+def publish_progress_event(db: Session, audit_id: str, event: dict) -> None:
+    """Publish a progress event; failures are logged, never raised to the caller."""
+    try:
+        get_progress_broker().publish(db, audit_id, event)
+    except Exception as e:
+        logger.warning(f"Failed to publish progress event for audit {audit_id}: {e}")
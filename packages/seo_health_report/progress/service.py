@@ -2,7 +2,7 @@
 
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -111,32 +111,17 @@ def _parse_module_events(events: list) -> dict[str, ModuleProgress]:
     return modules
 
 
-def get_audit_progress(db: Session, audit_id: str) -> Optional[AuditProgress]:
-    """Get comprehensive progress for an audit."""
-    audit_row = db.execute(
-        text("""
-            SELECT status, tier, created_at, completed_at
-            FROM audits
-            WHERE id = :audit_id
-        """),
-        {"audit_id": audit_id},
-    ).fetchone()
-
-    if not audit_row:
-        return None
-
-    status, tier, started_at, completed_at = audit_row
+TERMINAL_EVENT_TYPES = ("completed", "failed")
 
-    events = db.execute(
-        text("""
-            SELECT event_type, message, progress_pct, created_at, data_json
-            FROM audit_progress_events
-            WHERE audit_id = :audit_id
-            ORDER BY created_at
-        """),
-        {"audit_id": audit_id},
-    ).fetchall()
 
+def build_audit_progress(
+    audit_id: str,
+    status: str,
+    tier: Optional[str],
+    started_at: Optional[datetime],
+    events: list,
+) -> AuditProgress:
+    """Compute progress from an audit's status and its progress event rows."""
     modules_dict = _parse_module_events(events)
     modules = list(modules_dict.values())
 
@@ -182,3 +167,123 @@ def get_audit_progress(db: Session, audit_id: str) -> Optional[AuditProgress]:
         estimated_completion=estimated_completion,
         elapsed_seconds=elapsed,
     )
+
+
+def _fetch_progress_rows(db: Session, audit_id: str) -> Optional[tuple]:
+    """Read the audit row and its progress events; None if the audit is unknown."""
+    audit_row = db.execute(
+        text("""
+            SELECT status, tier, created_at, completed_at
+            FROM audits
+            WHERE id = :audit_id
+        """),
+        {"audit_id": audit_id},
+    ).fetchone()
+
+    if not audit_row:
+        return None
+
+    events = db.execute(
+        text("""
+            SELECT event_type, message, progress_pct, created_at, data_json
+            FROM audit_progress_events
+            WHERE audit_id = :audit_id
+            ORDER BY created_at
+        """),
+        {"audit_id": audit_id},
+    ).fetchall()
+
+    return audit_row, events
+
+
+def get_audit_progress(db: Session, audit_id: str) -> Optional[AuditProgress]:
+    """Get comprehensive progress for an audit."""
+    rows = _fetch_progress_rows(db, audit_id)
+    if rows is None:
+        return None
+
+    (status, tier, started_at, _completed_at), events = rows
+    return build_audit_progress(audit_id, status, tier, started_at, events)
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def progress_event_dict(
+    event_type: str, message: str, progress_pct: Optional[int], created_at: Any
+) -> dict:
+    """Serialize one progress event in the shape used by the events endpoint."""
+    created_at = _as_datetime(created_at)
+    return {
+        "event_type": event_type,
+        "message": message,
+        "progress_pct": progress_pct,
+        "timestamp": created_at.isoformat() if created_at else None,
+    }
+
+
+class LiveProgress:
+    """
+    Progress for one audit kept in memory and advanced by pushed events.
+
+    Loaded with a single database read; afterwards each event published by
+    the worker is applied locally instead of re-reading the event table.
+    """
+
+    def __init__(
+        self,
+        audit_id: str,
+        status: str,
+        tier: Optional[str],
+        started_at: Optional[datetime],
+        events: list,
+    ):
+        self.audit_id = audit_id
+        self.status = status
+        self.tier = tier
+        self.started_at = started_at
+        self.events = [tuple(e) for e in events]
+
+    @classmethod
+    def load(cls, db: Session, audit_id: str) -> Optional["LiveProgress"]:
+        rows = _fetch_progress_rows(db, audit_id)
+        if rows is None:
+            return None
+        (status, tier, started_at, _completed_at), events = rows
+        return cls(audit_id, status, tier, started_at, events)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in TERMINAL_EVENT_TYPES
+
+    def apply(self, event: dict) -> AuditProgress:
+        """Apply a pushed progress event and return the updated progress."""
+        event_type = event.get("event_type")
+        self.events.append(
+            (
+                event_type,
+                event.get("message"),
+                event.get("progress_pct"),
+                _as_datetime(event.get("timestamp")),
+                None,
+            )
+        )
+        if event_type in TERMINAL_EVENT_TYPES:
+            self.status = event_type
+        elif self.status in ("pending", "queued"):
+            self.status = "running"
+        return self.progress()
+
+    def progress(self) -> AuditProgress:
+        return build_audit_progress(
+            self.audit_id, self.status, self.tier, self.started_at, self.events
+        )
+
+    def event_dicts(self) -> list[dict]:
+        return [progress_event_dict(e[0], e[1], e[2], e[3]) for e in self.events]
@@ -1,13 +1,43 @@
 """
 Browser-based SEO crawler using Playwright.
 Extracts SEO elements from fully-rendered pages (JavaScript support).
+
+BrowserCrawler launches a browser for one-off use. BrowserPool keeps a
+browser running with a set of warm contexts, recycles pages and contexts
+after a number of uses, blocks resource types the SEO extraction never looks
+at, and renders several URLs concurrently. apps/renderer serves a pool over
+HTTP so workers share one warm browser instead of launching their own.
 """
 
 import asyncio
+import importlib.util
+import os
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page, Route
+
+# Probed without importing: playwright loads when a crawler or pool starts
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+
+# Number of warm contexts, i.e. pages rendered concurrently
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+# Navigations on one page before it is closed and replaced
+BROWSER_PAGE_MAX_USES = int(os.getenv("BROWSER_PAGE_MAX_USES", "20"))
+# Pages opened in one context before the context (cookies, cache) is replaced
+BROWSER_CONTEXT_MAX_PAGES = int(os.getenv("BROWSER_CONTEXT_MAX_PAGES", "10"))
+# Blocked resources leave nothing for networkidle to wait on, so "load" suffices
+BROWSER_WAIT_UNTIL = os.getenv("BROWSER_WAIT_UNTIL", "load")
+
+# Resource types the SEO extraction never reads. <img> elements stay in the
+# DOM when their bytes are blocked, so image and alt counts are unaffected.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
 
-from playwright.async_api import Browser, Page, async_playwright
+
+def _require_playwright() -> None:
+    if not PLAYWRIGHT_AVAILABLE:
+        raise ImportError("playwright is not installed (pip install playwright)")
 
 
 @dataclass
@@ -39,10 +69,13 @@ class BrowserCrawler:
 
     def __init__(self, headless: bool = True):
         self.headless = headless
-        self._browser: Optional[Browser] = None
+        self._browser: Optional["Browser"] = None
         self._playwright = None
 
     async def __aenter__(self):
+        _require_playwright()
+        from playwright.async_api import async_playwright
+
         self._playwright = await async_playwright().start()
         self._browser = await self._playwright.chromium.launch(headless=self.headless)
         return self
@@ -58,12 +91,18 @@ class BrowserCrawler:
         if not self._browser:
             raise RuntimeError("Browser not initialized. Use 'async with BrowserCrawler():'")
 
-        data = SEOData(url=url)
         page = await self._browser.new_page()
+        try:
+            return await self._render(page, url, timeout_ms, wait_until="networkidle")
+        finally:
+            await page.close()
+
+    async def _render(self, page: "Page", url: str, timeout_ms: int, wait_until: str) -> SEOData:
+        data = SEOData(url=url)
 
         try:
             start_time = asyncio.get_event_loop().time()
-            response = await page.goto(url, wait_until="networkidle", timeout=timeout_ms)
+            response = await page.goto(url, wait_until=wait_until, timeout=timeout_ms)
             data.page_load_time_ms = (asyncio.get_event_loop().time() - start_time) * 1000
 
             if response:
@@ -90,19 +129,17 @@ class BrowserCrawler:
 
         except Exception as e:
             data.error = str(e)
-        finally:
-            await page.close()
 
         return data
 
-    async def _get_text(self, page: Page, selector: str) -> str:
+    async def _get_text(self, page: "Page", selector: str) -> str:
         try:
             el = await page.query_selector(selector)
             return await el.inner_text() if el else ""
         except Exception:
             return ""
 
-    async def _get_meta(self, page: Page, name: str, is_property: bool = False) -> str:
+    async def _get_meta(self, page: "Page", name: str, is_property: bool = False) -> str:
         try:
             attr = "property" if is_property else "name"
             el = await page.query_selector(f'meta[{attr}="{name}"]')
@@ -110,21 +147,21 @@ class BrowserCrawler:
         except Exception:
             return ""
 
-    async def _get_link_href(self, page: Page, selector: str) -> str:
+    async def _get_link_href(self, page: "Page", selector: str) -> str:
         try:
             el = await page.query_selector(selector)
             return await el.get_attribute("href") if el else ""
         except Exception:
             return ""
 
-    async def _get_all_text(self, page: Page, selector: str) -> list[str]:
+    async def _get_all_text(self, page: "Page", selector: str) -> list[str]:
         try:
             elements = await page.query_selector_all(selector)
             return [await el.inner_text() for el in elements]
         except Exception:
             return []
 
-    async def _extract_schema(self, page: Page) -> list[dict]:
+    async def _extract_schema(self, page: "Page") -> list[dict]:
         try:
             return await page.evaluate("""
                 () => {
@@ -138,7 +175,7 @@ class BrowserCrawler:
         except Exception:
             return []
 
-    async def _extract_links(self, page: Page, base_url: str) -> dict:
+    async def _extract_links(self, page: "Page", base_url: str) -> dict:
         try:
             from urllib.parse import urlparse
 
@@ -157,7 +194,7 @@ class BrowserCrawler:
         except Exception:
             return {"internal": [], "external": []}
 
-    async def _analyze_images(self, page: Page) -> dict:
+    async def _analyze_images(self, page: "Page") -> dict:
         try:
             return await page.evaluate("""
                 () => {
@@ -170,6 +207,155 @@ class BrowserCrawler:
             return {"total": 0, "without_alt": 0}
 
 
+@dataclass
+class _Slot:
+    """One warm context and its reusable page."""
+
+    context: Optional["BrowserContext"] = None
+    page: Optional["Page"] = None
+    page_uses: int = 0
+    context_pages: int = 0
+
+
+async def _block_heavy_resources(route: "Route") -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool(BrowserCrawler):
+    """
+    Long-lived browser with warm contexts shared by many renders.
+
+    Each slot holds one context and one page; a render borrows a slot, so
+    at most `size` pages render at once and callers beyond that wait.
+
+        async with BrowserPool() as pool:
+            pages = await pool.crawl_many(urls)
+    """
+
+    def __init__(
+        self,
+        size: int = BROWSER_POOL_SIZE,
+        headless: bool = True,
+        page_max_uses: int = BROWSER_PAGE_MAX_USES,
+        context_max_pages: int = BROWSER_CONTEXT_MAX_PAGES,
+        wait_until: str = BROWSER_WAIT_UNTIL,
+    ):
+        super().__init__(headless=headless)
+        self.size = size
+        self.page_max_uses = page_max_uses
+        self.context_max_pages = context_max_pages
+        self.wait_until = wait_until
+        self._slots: Optional[asyncio.Queue] = None
+        self._launch_lock = asyncio.Lock()
+        self.renders = 0
+        self.recycled_pages = 0
+        self.recycled_contexts = 0
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def start(self) -> None:
+        """Launch the browser and warm every slot's context and page."""
+        _require_playwright()
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        self._slots = asyncio.Queue()
+        for _ in range(self.size):
+            slot = _Slot()
+            await self._open_page(slot)
+            self._slots.put_nowait(slot)
+
+    async def stop(self) -> None:
+        """Close every context and shut the browser down."""
+        if self._slots is not None:
+            while not self._slots.empty():
+                await self._close_context(self._slots.get_nowait())
+            self._slots = None
+        await super().__aexit__(None, None, None)
+        self._browser = None
+        self._playwright = None
+
+    async def crawl_page(self, url: str, timeout_ms: int = 30000) -> SEOData:
+        """Render one URL on a warm page and extract SEO data."""
+        if self._slots is None:
+            raise RuntimeError("Browser pool not started. Use 'async with BrowserPool():'")
+
+        slot = await self._slots.get()
+        try:
+            await self._ensure_page(slot)
+            data = await self._render(slot.page, url, timeout_ms, wait_until=self.wait_until)
+            slot.page_uses += 1
+            self.renders += 1
+            if data.error:
+                # Don't carry a page in an unknown state into the next render
+                slot.page_uses = self.page_max_uses
+            return data
+        finally:
+            self._slots.put_nowait(slot)
+
+    async def crawl_many(self, urls: list[str], timeout_ms: int = 30000) -> list[SEOData]:
+        """Render several URLs concurrently, bounded by the pool size."""
+        return list(await asyncio.gather(*(self.crawl_page(url, timeout_ms) for url in urls)))
+
+    def stats(self) -> dict[str, int]:
+        """Counters for health checks and metrics."""
+        return {
+            "size": self.size,
+            "idle": self._slots.qsize() if self._slots is not None else 0,
+            "renders": self.renders,
+            "recycled_pages": self.recycled_pages,
+            "recycled_contexts": self.recycled_contexts,
+        }
+
+    async def _ensure_page(self, slot: _Slot) -> None:
+        async with self._launch_lock:
+            if not self._browser.is_connected():
+                # Chromium crashed: every slot's context died with it
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        if slot.context is not None and slot.context.browser is not self._browser:
+            slot.context = slot.page = None
+            slot.context_pages = 0
+        if slot.page is None or slot.page.is_closed() or slot.page_uses >= self.page_max_uses:
+            await self._open_page(slot)
+
+    async def _open_page(self, slot: _Slot) -> None:
+        if slot.page is not None:
+            self.recycled_pages += 1
+            await self._close_quietly(slot.page)
+        if slot.context is None or slot.context_pages >= self.context_max_pages:
+            if slot.context is not None:
+                self.recycled_contexts += 1
+                await self._close_context(slot)
+            slot.context = await self._browser.new_context()
+            await slot.context.route("**/*", _block_heavy_resources)
+            slot.context_pages = 0
+        slot.page = await slot.context.new_page()
+        slot.page_uses = 0
+        slot.context_pages += 1
+
+    async def _close_context(self, slot: _Slot) -> None:
+        if slot.context is not None:
+            await self._close_quietly(slot.context)
+        slot.context = slot.page = None
+        slot.context_pages = 0
+
+    @staticmethod
+    async def _close_quietly(target: Any) -> None:
+        try:
+            await target.close()
+        except Exception:
+            pass
+
+
 async def test_crawler(url: str = "https://www.sheetmetalwerks.com"):
     """Test the crawler on a given URL."""
     print(f"🔍 Crawling: {url}")
@@ -0,0 +1,45 @@
+"""
+Client for the rendering service (apps/renderer).
+
+Workers send URLs to a shared, already-warm browser pool instead of
+launching Chromium per audit. Set RENDER_SERVICE_URL to enable it.
+"""
+
+import os
+from typing import Optional
+
+import httpx
+
+from packages.seo_health_report.providers.browser_crawler import SEOData
+
+RENDER_SERVICE_URL = os.getenv("RENDER_SERVICE_URL", "")
+# Covers queueing behind other workers' renders as well as the render itself
+RENDER_SERVICE_TIMEOUT = float(os.getenv("RENDER_SERVICE_TIMEOUT", "90"))
+
+
+async def render_pages(
+    urls: list[str],
+    timeout_ms: int = 30000,
+    service_url: Optional[str] = None,
+) -> list[SEOData]:
+    """
+    Render pages on the rendering service.
+
+    Args:
+        urls: Pages to render
+        timeout_ms: Per-page navigation timeout
+        service_url: Service base URL (defaults to RENDER_SERVICE_URL)
+
+    Returns:
+        SEOData for each URL, in request order
+
+    Raises:
+        httpx.HTTPError: If the service is unreachable or rejects the request
+    """
+    base_url = (service_url or RENDER_SERVICE_URL).rstrip("/")
+    async with httpx.AsyncClient(timeout=RENDER_SERVICE_TIMEOUT) as client:
+        response = await client.post(
+            f"{base_url}/render", json={"urls": urls, "timeout_ms": timeout_ms}
+        )
+        response.raise_for_status()
+    return [SEOData(**page) for page in response.json()["pages"]]
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import func
+from sqlalchemy import case, func, or_, update
 from sqlalchemy.orm import Session
 
 sys.path.insert(
@@ -20,6 +20,10 @@ sys.path.insert(
 )
 
 from database import Audit, TenantQuota
+from packages.seo_health_report.scripts import memory_cache
+
+# Dashboard quota displays may lag admissions made by other processes by this long
+QUOTA_STATUS_CACHE_TTL = int(os.getenv("QUOTA_STATUS_CACHE_TTL", "5"))
 
 TIER_DEFAULTS = {
     "basic": {"monthly_audits": 10, "concurrent": 2, "pages": 50, "prompts": 10},
@@ -52,6 +56,16 @@ class QuotaStatus:
     reset_date: Optional[datetime] = None
 
 
+def quota_cache_key(tenant_id: str) -> str:
+    """Cache key for a tenant's quota display."""
+    return f"quota_status:{tenant_id}"
+
+
+def invalidate_quota_cache(tenant_id: str) -> None:
+    """Drop this process's cached quota display for a tenant."""
+    memory_cache.delete(quota_cache_key(tenant_id))
+
+
 class QuotaService:
     """Service for managing and enforcing per-tenant quotas."""
 
@@ -85,13 +99,45 @@ class QuotaService:
         return quota
 
     def _get_concurrent_audit_count(self, tenant_id: str) -> int:
-        """Get count of currently running audits for tenant."""
+        """Get the tenant's in-flight audit count from its admission counter."""
         return (
+            self.db.query(TenantQuota.concurrent_audits)
+            .filter(TenantQuota.tenant_id == tenant_id)
+            .scalar()
+            or 0
+        )
+
+    def reconcile_concurrent(self, tenant_id: str) -> int:
+        """Reset the concurrent counter from the audits actually in flight."""
+        count = (
             self.db.query(func.count(Audit.id))
-            .filter(Audit.tenant_id == tenant_id, Audit.status.in_(["pending", "running"]))
+            .filter(
+                Audit.tenant_id == tenant_id,
+                Audit.status.in_(["pending", "queued", "running"]),
+            )
             .scalar()
             or 0
         )
+        self.db.execute(
+            update(TenantQuota)
+            .where(TenantQuota.tenant_id == tenant_id)
+            .values(concurrent_audits=count, updated_at=datetime.now(timezone.utc))
+        )
+        self.db.commit()
+        invalidate_quota_cache(tenant_id)
+        return count
+
+    def _reclaim_leaked_slots(self, tenant_id: str) -> bool:
+        """Reconcile a counter at its concurrent limit; True if slots were freed."""
+        self.db.rollback()
+        row = (
+            self.db.query(TenantQuota.concurrent_audits, TenantQuota.max_concurrent_audits)
+            .filter(TenantQuota.tenant_id == tenant_id)
+            .first()
+        )
+        if row is None or row.concurrent_audits < row.max_concurrent_audits:
+            return False
+        return self.reconcile_concurrent(tenant_id) < row.concurrent_audits
 
     def _calculate_reset_date(self, billing_cycle_start: Optional[datetime]) -> datetime:
         """Calculate the next billing cycle reset date."""
@@ -153,24 +199,188 @@ class QuotaService:
             reset_date=reset_date,
         )
 
-    def increment_usage(self, tenant_id: str) -> None:
-        """Increment monthly audit usage."""
-        quota = self.db.query(TenantQuota).filter(TenantQuota.tenant_id == tenant_id).first()
+    def admit_audit(self, tenant_id: str) -> QuotaStatus:
+        """
+        Atomically reserve a monthly audit and a concurrent slot for a tenant.
 
-        if not quota:
-            quota = self.get_or_create_quota(tenant_id)
+        Admission is a single conditional UPDATE, so concurrent submissions
+        can't both take the last unit of quota. The concurrent slot is given
+        back by release_audit(), which the worker does when the job finishes.
+        A tenant turned away at the concurrent limit has its counter
+        reconciled first, so a slot leaked by a crash doesn't block it for good.
+
+        Raises:
+            QuotaExceededError: If the monthly or concurrent limit is reached.
+        """
+        row = self._try_admit(tenant_id)
+        if row is None and not self._quota_exists(tenant_id):
+            self.get_or_create_quota(tenant_id)
+            row = self._try_admit(tenant_id)
+
+        if row is None and self._reclaim_leaked_slots(tenant_id):
+            row = self._try_admit(tenant_id)
+
+        if row is None:
+            self.db.rollback()
+            status = self.check_quota(tenant_id)
+            self._raise_exceeded(status)
 
-        quota.monthly_audits_used += 1
-        quota.updated_at = datetime.now(timezone.utc)
         self.db.commit()
+        invalidate_quota_cache(tenant_id)
 
-    def decrement_concurrent(self, tenant_id: str) -> None:
-        """Decrement concurrent count when audit completes.
+        used, limit, concurrent, max_concurrent, billing_cycle_start = row
+        is_unlimited = limit == -1
+        return QuotaStatus(
+            monthly_audits_used=used,
+            monthly_audits_limit=limit,
+            monthly_audits_remaining=-1 if is_unlimited else max(0, limit - used),
+            concurrent_audits=concurrent,
+            max_concurrent=max_concurrent,
+            can_start_audit=(is_unlimited or used < limit) and concurrent < max_concurrent,
+            reset_date=self._calculate_reset_date(billing_cycle_start),
+        )
+
+    def _try_admit(self, tenant_id: str) -> Optional[tuple]:
+        stmt = (
+            update(TenantQuota)
+            .where(
+                TenantQuota.tenant_id == tenant_id,
+                or_(
+                    TenantQuota.monthly_audits_limit == -1,
+                    TenantQuota.monthly_audits_used < TenantQuota.monthly_audits_limit,
+                ),
+                TenantQuota.concurrent_audits < TenantQuota.max_concurrent_audits,
+            )
+            .values(
+                monthly_audits_used=TenantQuota.monthly_audits_used + 1,
+                concurrent_audits=TenantQuota.concurrent_audits + 1,
+                updated_at=datetime.now(timezone.utc),
+            )
+            .returning(
+                TenantQuota.monthly_audits_used,
+                TenantQuota.monthly_audits_limit,
+                TenantQuota.concurrent_audits,
+                TenantQuota.max_concurrent_audits,
+                TenantQuota.billing_cycle_start,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        row = self.db.execute(stmt).first()
+        return tuple(row) if row is not None else None
 
-        Note: This is a no-op since concurrent count is calculated dynamically
-        from actual running audits. Keeping for API compatibility.
+    def reserve_audits(self, tenant_id: str, count: int) -> QuotaStatus:
         """
-        pass
+        Reserve `count` monthly audits for a batch in one conditional UPDATE.
+
+        Unlike admit_audit() this does not commit: the caller commits together
+        with the audits it queues, so a failed insert gives the quota back.
+        Only the monthly allowance limits a batch. Its audits still count as
+        in flight, so single submissions wait for the batch to drain.
+
+        Raises:
+            QuotaExceededError: If fewer than `count` monthly audits remain.
+        """
+        if not self._quota_exists(tenant_id):
+            self.get_or_create_quota(tenant_id)
+
+        stmt = (
+            update(TenantQuota)
+            .where(
+                TenantQuota.tenant_id == tenant_id,
+                or_(
+                    TenantQuota.monthly_audits_limit == -1,
+                    TenantQuota.monthly_audits_used + count <= TenantQuota.monthly_audits_limit,
+                ),
+            )
+            .values(
+                monthly_audits_used=TenantQuota.monthly_audits_used + count,
+                concurrent_audits=TenantQuota.concurrent_audits + count,
+                updated_at=datetime.now(timezone.utc),
+            )
+            .returning(
+                TenantQuota.monthly_audits_used,
+                TenantQuota.monthly_audits_limit,
+                TenantQuota.concurrent_audits,
+                TenantQuota.max_concurrent_audits,
+                TenantQuota.billing_cycle_start,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        row = self.db.execute(stmt).first()
+        if row is None:
+            self.db.rollback()
+            status = self.check_quota(tenant_id)
+            raise QuotaExceededError(
+                f"Batch of {count} audits exceeds the {status.monthly_audits_remaining} "
+                f"remaining this month",
+                "monthly_audits",
+                status.monthly_audits_limit,
+                status.monthly_audits_used,
+            )
+
+        used, limit, concurrent, max_concurrent, billing_cycle_start = row
+        is_unlimited = limit == -1
+        return QuotaStatus(
+            monthly_audits_used=used,
+            monthly_audits_limit=limit,
+            monthly_audits_remaining=-1 if is_unlimited else max(0, limit - used),
+            concurrent_audits=concurrent,
+            max_concurrent=max_concurrent,
+            can_start_audit=(is_unlimited or used < limit) and concurrent < max_concurrent,
+            reset_date=self._calculate_reset_date(billing_cycle_start),
+        )
+
+    def _quota_exists(self, tenant_id: str) -> bool:
+        return (
+            self.db.query(TenantQuota.id).filter(TenantQuota.tenant_id == tenant_id).first()
+            is not None
+        )
+
+    def release_audit(self, tenant_id: str, refund: bool = False) -> None:
+        """
+        Give back a concurrent slot taken by admit_audit().
+
+        With ``refund`` the monthly unit is returned too, for admissions that
+        never produced an audit (duplicate submission, enqueue failure).
+        """
+        values = {
+            "concurrent_audits": TenantQuota.concurrent_audits - 1,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        if refund:
+            values["monthly_audits_used"] = case(
+                (TenantQuota.monthly_audits_used > 0, TenantQuota.monthly_audits_used - 1),
+                else_=0,
+            )
+        self.db.execute(
+            update(TenantQuota)
+            .where(TenantQuota.tenant_id == tenant_id, TenantQuota.concurrent_audits > 0)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        invalidate_quota_cache(tenant_id)
+
+    def increment_usage(self, tenant_id: str) -> None:
+        """Increment monthly audit usage."""
+        stmt = (
+            update(TenantQuota)
+            .where(TenantQuota.tenant_id == tenant_id)
+            .values(
+                monthly_audits_used=TenantQuota.monthly_audits_used + 1,
+                updated_at=datetime.now(timezone.utc),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if not self.db.execute(stmt).rowcount:
+            self.get_or_create_quota(tenant_id)
+            self.db.execute(stmt)
+        self.db.commit()
+        invalidate_quota_cache(tenant_id)
+
+    def decrement_concurrent(self, tenant_id: str) -> None:
+        """Decrement concurrent count when audit completes."""
+        self.release_audit(tenant_id)
 
     def check_page_limit(self, tenant_id: str, page_count: int) -> bool:
         """Check if page count is within limit."""
@@ -219,6 +429,7 @@ class QuotaService:
         quota.billing_cycle_start = datetime.now(timezone.utc)
         quota.updated_at = datetime.now(timezone.utc)
         self.db.commit()
+        invalidate_quota_cache(tenant_id)
 
     def update_tier(self, tenant_id: str, tier: str) -> TenantQuota:
         """Update quota limits based on new tier."""
@@ -237,6 +448,7 @@ class QuotaService:
 
         self.db.commit()
         self.db.refresh(quota)
+        invalidate_quota_cache(tenant_id)
 
         return quota
 
@@ -245,23 +457,26 @@ class QuotaService:
         status = self.check_quota(tenant_id)
 
         if not status.can_start_audit:
-            if status.quota_exceeded_reason and "Monthly" in status.quota_exceeded_reason:
-                raise QuotaExceededError(
-                    status.quota_exceeded_reason,
-                    "monthly_audits",
-                    status.monthly_audits_limit,
-                    status.monthly_audits_used,
-                )
-            else:
-                raise QuotaExceededError(
-                    status.quota_exceeded_reason or "Quota exceeded",
-                    "concurrent_audits",
-                    status.max_concurrent,
-                    status.concurrent_audits,
-                )
+            self._raise_exceeded(status)
 
         return status
 
+    @staticmethod
+    def _raise_exceeded(status: QuotaStatus) -> None:
+        if status.quota_exceeded_reason and "Monthly" in status.quota_exceeded_reason:
+            raise QuotaExceededError(
+                status.quota_exceeded_reason,
+                "monthly_audits",
+                status.monthly_audits_limit,
+                status.monthly_audits_used,
+            )
+        raise QuotaExceededError(
+            status.quota_exceeded_reason or "Quota exceeded",
+            "concurrent_audits",
+            status.max_concurrent,
+            status.concurrent_audits,
+        )
+
 
 def check_quota(db: Session, tenant_id: str) -> QuotaStatus:
     """Convenience function to check quota."""
@@ -2,49 +2,65 @@
 SEO Health Report Scripts
 
 Master orchestrator functionality for generating comprehensive SEO reports.
+
+The re-exports below are imported on first access, so importing one script
+(e.g. .logger or .cache) doesn't load the report builders and reportlab.
 """
 
-from .apply_branding import apply_branding
-from .build_report import build_report_document, generate_pdf
-from .calculate_scores import calculate_composite_score, determine_grade
-from .generate_summary import generate_executive_summary
-from .idempotency import canonicalize_url, compute_idempotency_key
-from .orchestrate import run_full_audit
-from .rate_limiter import (
-    TIER_LIMITS,
-    RateLimitedSession,
-    RateLimiter,
-    RateLimiterConfig,
-    rate_limited_fetch,
-)
-from .redaction import redact_dict, redact_sensitive
-from .webhook import (
-    WebhookResult,
-    build_audit_webhook_payload,
-    deliver_webhook,
-    sign_webhook_payload,
-    validate_callback_url,
-    verify_webhook_signature,
+import importlib
+
+# Exported name -> submodule defining it
+_LAZY_EXPORTS = {
+    "apply_branding": ".apply_branding",
+    "build_report_document": ".build_report",
+    "generate_pdf": ".build_report",
+    "calculate_composite_score": ".calculate_scores",
+    "determine_grade": ".calculate_scores",
+    "generate_executive_summary": ".generate_summary",
+    "canonicalize_url": ".idempotency",
+    "compute_coalesce_key": ".idempotency",
+    "compute_idempotency_key": ".idempotency",
+    "run_full_audit": ".orchestrate",
+    "TIER_LIMITS": ".rate_limiter",
+    "RateLimitedSession": ".rate_limiter",
+    "RateLimiter": ".rate_limiter",
+    "RateLimiterConfig": ".rate_limiter",
+    "rate_limited_fetch": ".rate_limiter",
+    "redact_dict": ".redaction",
+    "redact_sensitive": ".redaction",
+    "WebhookResult": ".webhook",
+    "build_audit_webhook_payload": ".webhook",
+    "deliver_webhook": ".webhook",
+    "sign_webhook_payload": ".webhook",
+    "validate_callback_url": ".webhook",
+    "verify_webhook_signature": ".webhook",
+}
+
+# Optional PDF components (requires reportlab); None when unavailable
+_PDF_COMPONENTS = (
+    "create_cover_page",
+    "create_findings_table",
+    "create_recommendations_list",
+    "create_score_gauge",
+    "create_section_header",
 )
 
-# Optional PDF components (requires reportlab)
-try:
-    from .pdf_components import (
-        create_cover_page,
-        create_findings_table,
-        create_recommendations_list,
-        create_score_gauge,
-        create_section_header,
-    )
 
-    _HAS_PDF_COMPONENTS = True
-except ImportError:
-    create_cover_page = None
-    create_score_gauge = None
-    create_section_header = None
-    create_findings_table = None
-    create_recommendations_list = None
-    _HAS_PDF_COMPONENTS = False
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    elif name in _PDF_COMPONENTS:
+        try:
+            value = getattr(importlib.import_module(".pdf_components", __name__), name)
+        except ImportError:
+            value = None
+    elif name == "_HAS_PDF_COMPONENTS":
+        value = __getattr__("create_cover_page") is not None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "run_full_audit",
@@ -57,6 +73,7 @@ __all__ = [
     "redact_sensitive",
     "redact_dict",
     "canonicalize_url",
+    "compute_coalesce_key",
     "compute_idempotency_key",
     "create_cover_page",
     "create_score_gauge",
@@ -9,7 +9,7 @@ import inspect
 import os
 import sys
 from functools import wraps
-from typing import Callable
+from typing import Any, Callable, Optional
 
 # Add parent directory to path for config import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -44,8 +44,16 @@ def cache_key(*args, **kwargs) -> str:
     return hashlib.md5(key_data.encode(), usedforsecurity=False).hexdigest()
 
 
-def cached(namespace: str, ttl: int):
-    """Decorator for caching function results (supports sync and async)."""
+def cached(namespace: str, ttl: int, vary: Optional[Callable[[], Any]] = None):
+    """
+    Decorator for caching function results (supports sync and async).
+
+    `vary` is called on each lookup and its result joins the key, for
+    inputs taken from context rather than arguments (a tier's model).
+    """
+
+    def varies() -> tuple:
+        return (vary(),) if vary else ()
 
     def decorator(func: Callable):
         is_async = inspect.iscoroutinefunction(func)
@@ -61,7 +69,7 @@ def cached(namespace: str, ttl: int):
                 if cache is None:
                     return await func(*args, **kwargs)
 
-                key = cache_key(func.__name__, *args, **kwargs)
+                key = cache_key(func.__name__, *varies(), *args, **kwargs)
 
                 result = cache.get(key)
                 if result is not None:
@@ -84,7 +92,7 @@ def cached(namespace: str, ttl: int):
                 if cache is None:
                     return func(*args, **kwargs)
 
-                key = cache_key(func.__name__, *args, **kwargs)
+                key = cache_key(func.__name__, *varies(), *args, **kwargs)
 
                 result = cache.get(key)
                 if result is not None:
@@ -11,6 +11,7 @@ from typing import Any
 # Add parent directory to path for config import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from packages.core.tracing import Stage, traced
 from config import get_config
 
 # Get configuration
@@ -24,6 +25,7 @@ WEIGHTS = {
 }
 
 
+@traced(Stage.SCORING)
 def calculate_composite_score(
     audit_results: dict[str, Any], weights: dict[str, float] = None
 ) -> dict[str, Any]:
@@ -4,6 +4,7 @@ Report Generation Module
 Provides HTML and PDF report generation with graceful fallback.
 """
 
+import importlib.util
 import logging
 from pathlib import Path
 from typing import Optional
@@ -12,14 +13,9 @@ from packages.schemas.models import AuditResult
 
 logger = logging.getLogger(__name__)
 
-# Check weasyprint availability at module load
-WEASYPRINT_AVAILABLE = False
-try:
-    from weasyprint import HTML as WeasyprintHTML
-
-    WEASYPRINT_AVAILABLE = True
-except ImportError:
-    WeasyprintHTML = None
+# Probe for weasyprint without importing it (seconds of startup, loaded on first PDF)
+WEASYPRINT_AVAILABLE = importlib.util.find_spec("weasyprint") is not None
+if not WEASYPRINT_AVAILABLE:
     logger.info("weasyprint not available - PDF generation disabled")
 
 
@@ -46,7 +42,7 @@ async def generate_pdf_report(
         return None
 
     try:
-        # Import here to avoid issues when weasyprint isn't available
+        # Imported on first use; a broken install falls back below
         from weasyprint import HTML
 
         # If no html_path provided, we need to generate HTML first
@@ -7,6 +7,7 @@ enabling deduplication and caching of identical audit operations.
 
 import hashlib
 import json
+from typing import Any, Optional
 from urllib.parse import parse_qs, urlencode, urlparse
 
 
@@ -85,4 +86,36 @@ def compute_idempotency_key(
     return hashlib.sha256(payload.encode()).hexdigest()
 
 
-__all__ = ["canonicalize_url", "compute_idempotency_key"]
+def compute_coalesce_key(payload: dict[str, Any], recipe_version: str = "v1") -> Optional[str]:
+    """
+    Compute the key shared by queued audit jobs that would produce the same result.
+
+    Unlike the idempotency key this leaves out the tenant and any option the
+    audit doesn't read, so identical audits submitted through the API, the
+    dashboard, batches or retries (by one tenant or several) share a key.
+    Only one job per key runs at a time; the others wait and take its result.
+
+    Args:
+        payload: Job payload (url, company_name, tier, keywords, competitors).
+        recipe_version: Version of the audit recipe (default: "v1").
+
+    Returns:
+        A 64-character hex string, or None for jobs that aren't full audits.
+    """
+    from packages.seo_health_report.tier_config import normalize_tier
+
+    if payload.get("type", "audit") != "audit" or not payload.get("url"):
+        return None
+
+    inputs = {
+        "url": canonicalize_url(payload["url"]),
+        "company_name": (payload.get("company_name") or "").strip().lower(),
+        "tier": normalize_tier(payload.get("tier") or "low"),
+        "keywords": sorted(payload.get("keywords") or []),
+        "competitors": sorted(canonicalize_url(u) for u in payload.get("competitors") or []),
+    }
+    canonical = json.dumps(inputs, sort_keys=True)
+    return hashlib.sha256(f"{canonical}|{recipe_version}".encode()).hexdigest()
+
+
+__all__ = ["canonicalize_url", "compute_coalesce_key", "compute_idempotency_key"]
@@ -1,85 +1,276 @@
 """
 In-memory caching for fast repeated access to audit results and API responses.
 
-This provides a simple TTL-based cache that's faster than disk for frequently
-accessed data like audit status and results.
+This provides a bounded LRU cache with per-entry TTLs that's faster than disk
+for frequently accessed data like audit status and results.
+
+The cache is capped both by entry count and by an approximate byte budget, so
+API memory stays flat under heavy polling. Expired entries are tracked in a
+min-heap keyed on expiry time; an optional background sweeper thread reclaims
+them without scanning the whole cache.
 """
 
+import builtins
+import hashlib
+import heapq
+import json
+import os
+import sys
+import threading
 import time
+from collections import OrderedDict
 from functools import wraps
 from threading import Lock
-from typing import Any, Callable, Optional
-
-# Global in-memory cache
-_cache: dict[str, tuple[Any, float]] = {}
-_cache_lock = Lock()
+from typing import Any, Callable, NamedTuple, Optional
 
 # Default TTL in seconds
 DEFAULT_TTL = 300  # 5 minutes
 AUDIT_RESULT_TTL = 3600  # 1 hour for completed audits
 AUDIT_STATUS_TTL = 10  # 10 seconds for status polling
 
+# Capacity limits (overridable via environment)
+MAX_ENTRIES = int(os.environ.get("SEO_HEALTH_MEMORY_CACHE_MAX_ENTRIES", "10000"))
+MAX_BYTES = int(os.environ.get("SEO_HEALTH_MEMORY_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+SWEEP_INTERVAL = float(os.environ.get("SEO_HEALTH_MEMORY_CACHE_SWEEP_INTERVAL", "30"))
+
+DEFAULT_NAMESPACE = "default"
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expiry: float
+    size: int
+    namespace: str
+
+
+# Global in-memory cache (insertion/access ordered for LRU eviction)
+_cache: "OrderedDict[str, _Entry]" = OrderedDict()
+_cache_lock = Lock()
+
+# Min-heap of (expiry, key); stale rows are skipped by comparing against _cache
+_expiry_heap: list[tuple[float, str]] = []
+
+_total_bytes = 0
+_namespace_stats: dict[str, dict[str, int]] = {}
+
+_sweeper_thread: Optional[threading.Thread] = None
+_sweeper_stop = threading.Event()
+
+
+def _namespace_of(key: str) -> str:
+    """Namespace is the key prefix before the first ':'."""
+    head, sep, _ = key.partition(":")
+    return head if sep else DEFAULT_NAMESPACE
+
+
+def _ns(namespace: str) -> dict[str, int]:
+    stats = _namespace_stats.get(namespace)
+    if stats is None:
+        stats = {"entries": 0, "bytes": 0, "hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        _namespace_stats[namespace] = stats
+    return stats
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate the in-memory footprint of a value in bytes.
+
+    Walks containers iteratively (no recursion limit) and counts each object
+    once. This is an estimate for budgeting, not an exact accounting.
+    """
+    seen: builtins.set[int] = builtins.set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+        total += sys.getsizeof(obj, 64)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, builtins.set, frozenset)):
+            stack.extend(obj)
+    return total
+
+
+def _remove(key: str, entry: _Entry) -> None:
+    """Drop an entry and update accounting. Caller holds the lock."""
+    global _total_bytes
+    del _cache[key]
+    _total_bytes -= entry.size
+    stats = _ns(entry.namespace)
+    stats["entries"] -= 1
+    stats["bytes"] -= entry.size
+
+
+def _evict_lru() -> None:
+    """Evict least-recently-used entries until within limits. Caller holds the lock."""
+    while _cache and (len(_cache) > MAX_ENTRIES or _total_bytes > MAX_BYTES):
+        key, entry = next(iter(_cache.items()))
+        _remove(key, entry)
+        _ns(entry.namespace)["evictions"] += 1
+
+
+def _purge_expired(now: float) -> int:
+    """Pop expired entries off the expiry heap. Caller holds the lock."""
+    cleared = 0
+    while _expiry_heap and _expiry_heap[0][0] <= now:
+        expiry, key = heapq.heappop(_expiry_heap)
+        entry = _cache.get(key)
+        if entry is not None and entry.expiry == expiry:
+            _remove(key, entry)
+            _ns(entry.namespace)["expirations"] += 1
+            cleared += 1
+    # Rebuild if overwritten/deleted keys have left the heap mostly stale
+    if len(_expiry_heap) > 2 * len(_cache) + 64:
+        _expiry_heap[:] = [(e.expiry, k) for k, e in _cache.items()]
+        heapq.heapify(_expiry_heap)
+    return cleared
+
+
+def _count_expired(now: float) -> int:
+    """Count live expired entries by visiting only the heap prefix <= now."""
+    count = 0
+    stack = [0] if _expiry_heap else []
+    while stack:
+        i = stack.pop()
+        expiry, key = _expiry_heap[i]
+        if expiry > now:
+            continue
+        entry = _cache.get(key)
+        if entry is not None and entry.expiry == expiry:
+            count += 1
+        for child in (2 * i + 1, 2 * i + 2):
+            if child < len(_expiry_heap):
+                stack.append(child)
+    return count
+
 
 def get(key: str) -> Optional[Any]:
     """Get value from cache if not expired."""
     with _cache_lock:
-        if key in _cache:
-            value, expiry = _cache[key]
-            if time.time() < expiry:
-                return value
-            else:
-                del _cache[key]
+        entry = _cache.get(key)
+        if entry is not None:
+            if time.time() < entry.expiry:
+                _cache.move_to_end(key)
+                _ns(entry.namespace)["hits"] += 1
+                return entry.value
+            _remove(key, entry)
+            _ns(entry.namespace)["expirations"] += 1
+        _ns(_namespace_of(key))["misses"] += 1
     return None
 
 
 def set(key: str, value: Any, ttl: int = DEFAULT_TTL) -> None:
-    """Set value in cache with TTL."""
+    """Set value in cache with TTL, evicting LRU entries if over capacity."""
+    global _total_bytes
+    size = estimate_size(value)
+    namespace = _namespace_of(key)
+    expiry = time.time() + ttl
     with _cache_lock:
-        _cache[key] = (value, time.time() + ttl)
+        existing = _cache.get(key)
+        if existing is not None:
+            _remove(key, existing)
+        if size > MAX_BYTES:
+            # Never let a single oversized value flush the whole cache
+            _ns(namespace)["evictions"] += 1
+            return
+        _cache[key] = _Entry(value, expiry, size, namespace)
+        _total_bytes += size
+        stats = _ns(namespace)
+        stats["entries"] += 1
+        stats["bytes"] += size
+        heapq.heappush(_expiry_heap, (expiry, key))
+        _evict_lru()
 
 
 def delete(key: str) -> bool:
     """Delete key from cache. Returns True if key existed."""
     with _cache_lock:
-        if key in _cache:
-            del _cache[key]
+        entry = _cache.get(key)
+        if entry is not None:
+            _remove(key, entry)
             return True
     return False
 
 
 def clear() -> int:
     """Clear all cache entries. Returns count of cleared items."""
+    global _total_bytes
     with _cache_lock:
         count = len(_cache)
         _cache.clear()
+        _expiry_heap.clear()
+        _namespace_stats.clear()
+        _total_bytes = 0
         return count
 
 
 def clear_expired() -> int:
     """Clear only expired entries. Returns count of cleared items."""
-    now = time.time()
-    cleared = 0
     with _cache_lock:
-        keys_to_delete = [k for k, (_, expiry) in _cache.items() if now >= expiry]
-        for key in keys_to_delete:
-            del _cache[key]
-            cleared += 1
-    return cleared
+        return _purge_expired(time.time())
 
 
 def stats() -> dict:
-    """Get cache statistics."""
+    """Get cache statistics, including per-namespace hit/eviction counters."""
     now = time.time()
     with _cache_lock:
         total = len(_cache)
-        expired = sum(1 for _, (_, expiry) in _cache.items() if now >= expiry)
+        expired = _count_expired(now)
         return {
             "total_entries": total,
             "active_entries": total - expired,
             "expired_entries": expired,
+            "total_bytes": _total_bytes,
+            "max_entries": MAX_ENTRIES,
+            "max_bytes": MAX_BYTES,
+            "namespaces": {name: dict(values) for name, values in _namespace_stats.items()},
         }
 
 
+def _sweep_loop(interval: float) -> None:
+    while not _sweeper_stop.wait(interval):
+        clear_expired()
+
+
+def start_sweeper(interval: float = SWEEP_INTERVAL) -> None:
+    """Start the background expiry sweeper (idempotent)."""
+    global _sweeper_thread
+    if _sweeper_thread is not None and _sweeper_thread.is_alive():
+        return
+    _sweeper_stop.clear()
+    _sweeper_thread = threading.Thread(
+        target=_sweep_loop, args=(interval,), name="memory-cache-sweeper", daemon=True
+    )
+    _sweeper_thread.start()
+
+
+def stop_sweeper(timeout: float = 5.0) -> None:
+    """Stop the background expiry sweeper if running."""
+    global _sweeper_thread
+    _sweeper_stop.set()
+    if _sweeper_thread is not None:
+        _sweeper_thread.join(timeout)
+        _sweeper_thread = None
+
+
+def make_key(prefix: str, args: tuple, kwargs: dict) -> str:
+    """
+    Build a stable cache key from call arguments.
+
+    Unlike ``hash()``, this works for dict/list arguments and is stable
+    across processes.
+    """
+    payload = json.dumps([args, kwargs], sort_keys=True, default=repr, separators=(",", ":"))
+    # Non-cryptographic hash used only to derive a cache key
+    digest = hashlib.md5(payload.encode(), usedforsecurity=False).hexdigest()
+    return f"{prefix}:{digest}"
+
+
 def cached_memory(prefix: str = "", ttl: int = DEFAULT_TTL):
     """
     Decorator for caching function results in memory.
@@ -98,8 +289,7 @@ def cached_memory(prefix: str = "", ttl: int = DEFAULT_TTL):
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Build cache key
-            key_prefix = prefix or func.__name__
-            key = f"{key_prefix}:{hash((args, tuple(sorted(kwargs.items()))))}"
+            key = make_key(prefix or func.__name__, args, kwargs)
 
             # Check cache
             result = get(key)
@@ -131,8 +321,7 @@ def cached_memory_async(prefix: str = "", ttl: int = DEFAULT_TTL):
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Build cache key
-            key_prefix = prefix or func.__name__
-            key = f"{key_prefix}:{hash((args, tuple(sorted(kwargs.items()))))}"
+            key = make_key(prefix or func.__name__, args, kwargs)
 
             # Check cache
             result = get(key)
@@ -15,7 +15,9 @@ _project_root = Path(__file__).resolve().parents[3]  # packages/seo_health_repor
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
+from packages.core.tracing import Stage, span
 from packages.seo_health_report.scripts.logger import get_logger
+from packages.seo_health_report.tier_config import use_tier
 
 logger = get_logger(__name__)
 
@@ -24,15 +26,21 @@ async def run_browser_crawl(target_url: str) -> Optional[dict[str, Any]]:
     """
     Run browser-based crawl to get rendered DOM data.
 
-    Returns SEO data extracted from fully-rendered JavaScript pages.
+    Returns SEO data extracted from fully-rendered JavaScript pages. Uses the
+    shared rendering service when RENDER_SERVICE_URL is set, otherwise
+    launches a browser for this audit.
     """
     try:
+        from packages.seo_health_report.providers import render_client
         from packages.seo_health_report.providers.browser_crawler import BrowserCrawler
 
         logger.info(f"[0/3] Running Browser Crawl for {target_url}...")
 
-        async with BrowserCrawler(headless=True) as crawler:
-            data = await crawler.crawl_page(target_url)
+        if render_client.RENDER_SERVICE_URL:
+            data = (await render_client.render_pages([target_url]))[0]
+        else:
+            async with BrowserCrawler(headless=True) as crawler:
+                data = await crawler.crawl_page(target_url)
 
         if data.error:
             logger.warning(f"Browser crawl error: {data.error}")
@@ -88,6 +96,29 @@ async def run_full_audit(
     Returns:
         Dict with all audit results
     """
+    # The three audits run as tasks that inherit this tier binding, so
+    # concurrent audits on other tiers keep their own models and settings
+    with use_tier(tier):
+        return await _run_audits(
+            target_url,
+            company_name,
+            primary_keywords,
+            competitor_urls,
+            ground_truth,
+            rate_limiter,
+            tier,
+        )
+
+
+async def _run_audits(
+    target_url: str,
+    company_name: str,
+    primary_keywords: list[str],
+    competitor_urls: Optional[list[str]],
+    ground_truth: Optional[dict[str, Any]],
+    rate_limiter: Optional[Any],
+    tier: str,
+) -> dict[str, Any]:
     results = {
         "url": target_url,
         "company_name": company_name,
@@ -97,12 +128,20 @@ async def run_full_audit(
         "browser_data": None,
         "warnings": [],
         "errors": [],
+        # Wall-clock seconds spent in each stage
+        "stage_timings": {},
     }
 
     _rate_limiter = rate_limiter
 
+    async def timed(stage: str, coro):
+        with span(stage, Stage.AUDIT) as record:
+            result = await coro
+        results["stage_timings"][stage] = round(record.duration, 3)
+        return result
+
     # Run browser crawl first to get rendered DOM data
-    browser_data = await run_browser_crawl(target_url)
+    browser_data = await timed("browser_crawl", run_browser_crawl(target_url))
     if browser_data:
         results["browser_data"] = browser_data
         logger.info(
@@ -129,7 +168,9 @@ async def run_full_audit(
         try:
             import packages.seo_content_authority as seo_content_authority
 
-            return seo_content_authority.run_audit(
+            # Synchronous crawl; a thread keeps it off the loop the other audits share
+            return await asyncio.to_thread(
+                seo_content_authority.run_audit,
                 target_url=target_url,
                 primary_keywords=primary_keywords,
                 competitor_urls=competitor_urls,
@@ -162,7 +203,10 @@ async def run_full_audit(
 
     # Run all three audits in parallel
     audit_results = await asyncio.gather(
-        run_technical(), run_content(), run_ai(), return_exceptions=True
+        timed("technical", run_technical()),
+        timed("content", run_content()),
+        timed("ai_visibility", run_ai()),
+        return_exceptions=True,
     )
 
     results["audits"]["technical"] = audit_results[0]
@@ -2,9 +2,17 @@
 Sensitive Data Redaction Utility
 
 Provides utilities to strip secrets from strings before logging/storage.
+
+Redaction runs on every progress message, job error, webhook payload and
+structured log line, so it is built to be cheap when there is nothing to
+redact: all patterns are compiled into one alternation that scans the text
+once, and text containing none of the words the patterns need is returned
+without running the regex at all.
 """
 
 import re
+from functools import lru_cache
+from typing import Any
 
 REDACTION_PATTERNS: list[tuple[str, str]] = [
     (r"(?i)(api[_-]?key|token|secret|password|auth)['\"]?\s*[:=]\s*['\"]?[\w\-\.]+", "[REDACTED]"),
@@ -15,6 +23,39 @@ REDACTION_PATTERNS: list[tuple[str, str]] = [
 
 SENSITIVE_KEYS = {"api_key", "token", "secret", "password", "authorization", "cookie", "api-key"}
 
+# Every pattern matches one of these (lowercase) words
+PREFILTER_WORDS = ("api", "token", "secret", "password", "auth", "cookie")
+
+REDACTED = "[REDACTED]"
+
+
+def _compile(patterns: list[tuple[str, str]]) -> tuple[re.Pattern, dict[str, str]]:
+    # Each pattern becomes a named alternative; the name picks its replacement
+    alternatives = []
+    replacements = {}
+    for index, (pattern, replacement) in enumerate(patterns):
+        name = f"p{index}"
+        alternatives.append(f"(?P<{name}>{pattern.removeprefix('(?i)')})")
+        replacements[name] = replacement
+    return re.compile("|".join(alternatives), re.IGNORECASE), replacements
+
+
+_REDACTION_RE, _REPLACEMENTS = _compile(REDACTION_PATTERNS)
+
+
+def _replacement(match: re.Match) -> str:
+    return _REPLACEMENTS[match.lastgroup]
+
+
+def _may_contain_secret(text: str) -> bool:
+    # Case-insensitive matching folds a few non-ASCII letters onto ASCII ones
+    # (the Kelvin sign onto "k"), which str.lower() doesn't, so only ASCII
+    # text can be ruled out by the word check.
+    if not text.isascii():
+        return True
+    lowered = text.lower()
+    return any(word in lowered for word in PREFILTER_WORDS)
+
 
 def redact_sensitive(text: str) -> str:
     """Remove secrets from text before logging/storing.
@@ -25,18 +66,24 @@ def redact_sensitive(text: str) -> str:
     Returns:
         String with sensitive patterns replaced by [REDACTED].
     """
-    if not isinstance(text, str):
+    if not isinstance(text, str) or not _may_contain_secret(text):
         return text
 
-    result = text
-    for pattern, replacement in REDACTION_PATTERNS:
-        result = re.sub(pattern, replacement, result)
+    return _REDACTION_RE.sub(_replacement, text)
 
-    return result
+
+@lru_cache(maxsize=4096, typed=True)
+def _is_sensitive_key(key: Any) -> bool:
+    normalized_key = str(key).lower().replace("-", "_")
+    return any(sk in normalized_key for sk in SENSITIVE_KEYS)
 
 
 def redact_dict(data: dict) -> dict:
-    """Recursively redact sensitive values in nested dict.
+    """Redact sensitive values in a nested dict.
+
+    Values under sensitive keys are replaced, strings are passed through
+    redact_sensitive, and dicts (including dicts inside lists) are walked
+    without recursion. Other values are shared with the input.
 
     Args:
         data: Dictionary that may contain sensitive values.
@@ -47,26 +94,37 @@ def redact_dict(data: dict) -> dict:
     if not isinstance(data, dict):
         return data
 
-    result = {}
-    for key, value in data.items():
-        normalized_key = str(key).lower().replace("-", "_")
-
-        if normalized_key in SENSITIVE_KEYS or any(sk in normalized_key for sk in SENSITIVE_KEYS):
-            result[key] = "[REDACTED]"
-        elif isinstance(value, dict):
-            result[key] = redact_dict(value)
-        elif isinstance(value, list):
-            result[key] = [
-                redact_dict(item)
-                if isinstance(item, dict)
-                else redact_sensitive(item)
-                if isinstance(item, str)
-                else item
-                for item in value
-            ]
-        elif isinstance(value, str):
-            result[key] = redact_sensitive(value)
-        else:
-            result[key] = value
+    result: dict = {}
+    # Source dict id -> its copy, so shared and cyclic dicts are copied once
+    copies = {id(data): result}
+    pending = [(data, result)]
+
+    def copy_of(source: dict) -> dict:
+        target = copies.get(id(source))
+        if target is None:
+            target = copies[id(source)] = {}
+            pending.append((source, target))
+        return target
+
+    while pending:
+        source, target = pending.pop()
+        for key, value in source.items():
+            if _is_sensitive_key(key):
+                target[key] = REDACTED
+            elif isinstance(value, str):
+                target[key] = redact_sensitive(value)
+            elif isinstance(value, dict):
+                target[key] = copy_of(value)
+            elif isinstance(value, list):
+                target[key] = [
+                    redact_sensitive(item)
+                    if isinstance(item, str)
+                    else copy_of(item)
+                    if isinstance(item, dict)
+                    else item
+                    for item in value
+                ]
+            else:
+                target[key] = value
 
     return result
@@ -14,8 +14,19 @@ Middleware:
 
     app = FastAPI()
     app.add_middleware(RequestLoggingMiddleware)
+
+Queued output (formatting and writes happen on a listener thread):
+    from packages.seo_health_report.seo_logging import start_queue_logging
+
+    start_queue_logging()
 """
 
+from .log_queue import (
+    SamplingFilter,
+    get_queue_handler,
+    start_queue_logging,
+    stop_queue_logging,
+)
 from .middleware import (
     RequestLoggingMiddleware,
     UserContextMiddleware,
@@ -39,15 +50,19 @@ __all__ = [
     "JSONFormatter",
     "StructuredLogger",
     "RequestLoggingMiddleware",
+    "SamplingFilter",
     "UserContextMiddleware",
     "clear_request_context",
     "configure_uvicorn_logging",
     "get_log_level",
     "get_logger",
+    "get_queue_handler",
     "is_json_logging_enabled",
     "log_with_context",
     "request_id_var",
     "set_request_context",
+    "start_queue_logging",
+    "stop_queue_logging",
     "tenant_id_var",
     "user_id_var",
 ]
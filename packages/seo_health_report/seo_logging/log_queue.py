@@ -0,0 +1,200 @@
+"""
+Queue-backed log output.
+
+Handlers normally format and write each record on the thread that logs it,
+which for the API and worker is the event loop. Once start_queue_logging()
+runs, loggers only put records on a bounded in-memory queue. A single
+listener thread formats them and writes them to stdout.
+
+- Request context (request ID, user, tenant) is captured when the record is
+  queued, because the listener thread doesn't see the caller's context vars.
+- LOG_SAMPLE_RATES keeps only a fraction of the DEBUG/INFO records from busy
+  loggers, e.g. "seo_health_report.http=0.1,packages.core.observations=0.01".
+  A rate applies to the named logger and its children. WARNING and above are
+  never sampled.
+- When the queue is full, records below ERROR are dropped rather than making
+  the caller wait. ERROR and above wait up to LOG_QUEUE_BLOCK_SECONDS for room.
+  Dropped records are counted in log_records_dropped_total.
+"""
+
+import atexit
+import copy
+import logging
+import os
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from .structured_logger import (
+    _loggers,
+    console_handler,
+    request_id_var,
+    tenant_id_var,
+    user_id_var,
+)
+
+LOG_QUEUE_ENABLED = os.getenv("LOG_QUEUE_ENABLED", "true").lower() == "true"
+# Records held for the listener before callers start dropping them
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# Longest an ERROR+ record waits for room in a full queue (seconds)
+LOG_QUEUE_BLOCK_SECONDS = float(os.getenv("LOG_QUEUE_BLOCK_SECONDS", "0.05"))
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "")
+
+DROPPED_COUNTER = "log_records_dropped_total"
+
+_queue_handler: Optional["ContextQueueHandler"] = None
+_listener: Optional[QueueListener] = None
+
+
+def parse_sample_rates(spec: str) -> dict[str, float]:
+    """Parse "logger=rate,..." into a mapping; malformed entries are ignored."""
+    rates = {}
+    for entry in spec.split(","):
+        name, sep, rate = entry.partition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            rates[name.strip()] = min(max(float(rate), 0.0), 1.0)
+        except ValueError:
+            continue
+    return rates
+
+
+def _record_drop(reason: str) -> None:
+    from packages.seo_health_report.metrics import metrics
+
+    metrics.inc_counter(DROPPED_COUNTER, labels={"reason": reason})
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a configured fraction of the DEBUG/INFO records of each logger."""
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._resolved: dict[str, float] = {}
+
+    def rate_for(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            # The most specific configured ancestor wins
+            rate = 1.0
+            prefix = name
+            while prefix:
+                if prefix in self.rates:
+                    rate = self.rates[prefix]
+                    break
+                prefix = prefix.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rate_for(record.name)
+        if rate >= 1.0 or random.random() < rate:
+            return True
+        _record_drop("sampled")
+        return False
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    Queues records for the listener without formatting them.
+
+    The message is resolved and the request context captured up front; the
+    listener's formatter does the rest.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.request_id = request_id_var.get()
+        record.user_id = user_id_var.get()
+        record.tenant_id = tenant_id_var.get()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if record.levelno >= logging.ERROR:
+            try:
+                self.queue.put(record, timeout=LOG_QUEUE_BLOCK_SECONDS)
+                return
+            except queue.Full:
+                pass
+        _record_drop("backpressure")
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Wait for room rather than fail when stopping with a full queue
+        self.queue.put(self._sentinel)
+
+
+def _reroute(logger: logging.Logger, handler: logging.Handler) -> None:
+    # Only plain console handlers; test capture and file handlers stay put
+    for existing in list(logger.handlers):
+        if type(existing) is logging.StreamHandler:
+            logger.removeHandler(existing)
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
+
+
+def start_queue_logging(
+    output: Optional[logging.Handler] = None,
+) -> Optional[ContextQueueHandler]:
+    """
+    Route the root logger and get_logger() loggers through the log queue.
+
+    Console handlers already attached to them are replaced by the queue
+    handler, and `output` (stdout by default) is written from the listener
+    thread. Does nothing when LOG_QUEUE_ENABLED is false; calling it again
+    returns the running handler.
+    """
+    global _queue_handler, _listener
+
+    if not LOG_QUEUE_ENABLED:
+        return None
+    if _queue_handler is not None:
+        return _queue_handler
+
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    handler = ContextQueueHandler(log_queue)
+    rates = parse_sample_rates(LOG_SAMPLE_RATES)
+    if rates:
+        handler.addFilter(SamplingFilter(rates))
+
+    _listener = _Listener(log_queue, output or console_handler(), respect_handler_level=True)
+    _listener.start()
+    _queue_handler = handler
+
+    _reroute(logging.getLogger(), handler)
+    for logger in _loggers.values():
+        _reroute(logger, handler)
+
+    atexit.register(stop_queue_logging)
+    return handler
+
+
+def stop_queue_logging() -> None:
+    """Write out everything queued and stop the listener thread."""
+    global _queue_handler, _listener
+
+    if _listener is None:
+        return
+    for logger in [logging.getLogger(), *_loggers.values()]:
+        logger.removeHandler(_queue_handler)
+    _listener.stop()
+    _listener = None
+    _queue_handler = None
+
+
+def get_queue_handler() -> Optional[ContextQueueHandler]:
+    """The handler loggers should use while the log queue is running."""
+    return _queue_handler
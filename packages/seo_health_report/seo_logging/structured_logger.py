@@ -8,10 +8,20 @@ import json
 import logging
 import os
 import sys
+import time
 from contextvars import ContextVar
-from datetime import datetime, timezone
 from typing import Any, Optional
 
+from packages.seo_health_report.scripts.redaction import redact_dict, redact_sensitive
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
 user_id_var: ContextVar[str] = ContextVar("user_id", default="")
 tenant_id_var: ContextVar[str] = ContextVar("tenant_id", default="")
@@ -32,27 +42,33 @@ class JSONFormatter(logging.Formatter):
         "tenant_id": "tenant-789",
         "extra": {...}
     }
+
+    Secrets in the message, exception and extra data are redacted unless
+    `redact` is False.
     """
 
-    def __init__(self, include_extra: bool = True):
+    def __init__(self, include_extra: bool = True, redact: bool = True):
         super().__init__()
         self.include_extra = include_extra
+        self.redact = redact
 
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        if request_id := request_id_var.get():
+        # Records from the log queue carry the context of the thread that logged them
+        if request_id := getattr(record, "request_id", None) or request_id_var.get():
             log_data["request_id"] = request_id
 
-        if user_id := user_id_var.get():
+        if user_id := getattr(record, "user_id", None) or user_id_var.get():
             log_data["user_id"] = user_id
 
-        if tenant_id := tenant_id_var.get():
+        if tenant_id := getattr(record, "tenant_id", None) or tenant_id_var.get():
             log_data["tenant_id"] = tenant_id
 
         if record.exc_info:
@@ -62,10 +78,25 @@ class JSONFormatter(logging.Formatter):
         if self.include_extra and hasattr(record, "extra_data"):
             log_data["extra"] = record.extra_data
 
+        if self.redact:
+            log_data["message"] = redact_sensitive(log_data["message"])
+            if "exception" in log_data:
+                log_data["exception"] = redact_sensitive(log_data["exception"])
+            if "extra" in log_data:
+                log_data["extra"] = redact_dict(log_data["extra"])
+
         if record.levelno >= logging.WARNING:
             log_data["location"] = f"{record.pathname}:{record.lineno}"
             log_data["function"] = record.funcName
 
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(
+                    log_data, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except TypeError:
+                # Integers beyond 64 bits and the like
+                pass
         return json.dumps(log_data, default=str)
 
 
@@ -120,6 +151,22 @@ def get_log_level() -> int:
     return getattr(logging, level_str, logging.INFO)
 
 
+def console_handler() -> logging.Handler:
+    """A stdout handler, JSON-formatted when JSON logging is enabled."""
+    handler = logging.StreamHandler(sys.stdout)
+
+    if is_json_logging_enabled():
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
+        )
+    return handler
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a configured logger instance.
@@ -139,18 +186,10 @@ def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
 
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-
-        if is_json_logging_enabled():
-            handler.setFormatter(JSONFormatter())
-        else:
-            handler.setFormatter(
-                logging.Formatter(
-                    "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-                    datefmt="%Y-%m-%d %H:%M:%S",
-                )
-            )
+        from .log_queue import get_queue_handler
 
+        # While the log queue runs, its listener does the formatting
+        handler = get_queue_handler() or console_handler()
         logger.addHandler(handler)
         logger.setLevel(get_log_level())
         logger.propagate = False
@@ -3,11 +3,23 @@ Tier Configuration Loader
 
 Loads tier-specific environment variables from config/tier_*.env files.
 This allows dynamic model selection based on the audit tier.
+
+Each tier file is parsed once into a cached TierContext. Audits bind their
+tier with use_tier(), which sets a contextvar rather than os.environ, so
+jobs on different tiers can run side by side in one event loop. Lookups
+fall back to the process environment when no tier is bound (CLI runs and
+callers of the legacy load_tier_config()).
 """
 
 import logging
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +69,42 @@ TIER_VARIABLES = [
     "REPORT_EXECUTIVE_SUMMARY_PROVIDER",
 ]
 
+# Legacy tier names accepted from older clients
+TIER_ALIASES = {
+    "basic": "low",
+    "pro": "medium",
+    "enterprise": "high",
+    "budget": "low",
+    "balanced": "medium",
+    "premium": "high",
+}
+
+# Default models when neither the tier nor the environment configures one
+DEFAULT_MODELS = {
+    "OPENAI": "gpt-5-nano",
+    "ANTHROPIC": "claude-4-haiku-20251120",
+    "GOOGLE": "gemini-3.0-flash",
+    "PERPLEXITY": "sonar",
+    "XAI": "grok-4-1-fast-reasoning",
+}
+
+
+@dataclass(frozen=True)
+class TierContext:
+    """Settings for one tier, parsed from its tier_*.env file."""
+
+    tier: str
+    values: dict[str, str] = field(default_factory=dict)
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Return a tier setting, falling back to the process environment."""
+        if name in self.values:
+            return self.values[name]
+        return os.environ.get(name, default)
+
+
+_current_tier: ContextVar[Optional[TierContext]] = ContextVar("current_tier", default=None)
+
 
 def parse_env_file(file_path: Path) -> dict[str, str]:
     """
@@ -99,69 +147,131 @@ def parse_env_file(file_path: Path) -> dict[str, str]:
     return env_vars
 
 
+def normalize_tier(tier: str) -> str:
+    """Map a tier name (including legacy aliases) to low, medium or high."""
+    tier = tier.lower().strip()
+    tier = TIER_ALIASES.get(tier, tier)
+    if tier not in TIER_CONFIG_FILES:
+        logger.warning(f"Unknown tier '{tier}', defaulting to 'low'")
+        tier = "low"
+    return tier
+
+
+@lru_cache(maxsize=None)
+def _build_tier_context(tier: str) -> TierContext:
+    config_path = CONFIG_DIR / TIER_CONFIG_FILES[tier]
+    logger.info(f"Loading tier config: {config_path}")
+
+    tier_config = parse_env_file(config_path)
+    values = {name: tier_config[name] for name in TIER_VARIABLES if name in tier_config}
+    values["REPORT_TIER"] = tier
+    return TierContext(tier=tier, values=values)
+
+
+def get_tier_context(tier: str) -> TierContext:
+    """
+    Get the parsed configuration for a tier.
+
+    The tier file is read on first use and cached for the life of the process.
+
+    Args:
+        tier: Tier name ('low', 'medium', 'high' or a legacy alias)
+
+    Returns:
+        TierContext for the normalized tier
+    """
+    return _build_tier_context(normalize_tier(tier))
+
+
+def current_tier_context() -> Optional[TierContext]:
+    """Get the tier bound to the current context, if any."""
+    return _current_tier.get()
+
+
+def activate_tier(tier: str) -> Token:
+    """
+    Bind a tier to the current context.
+
+    Prefer use_tier(); pass the returned token to reset_tier() when the
+    binding has to span code that a with-block can't wrap.
+    """
+    return _current_tier.set(get_tier_context(tier))
+
+
+def reset_tier(token: Token) -> None:
+    """Restore the tier binding that was active before activate_tier()."""
+    _current_tier.reset(token)
+
+
+@contextmanager
+def use_tier(tier: str) -> Iterator[TierContext]:
+    """
+    Run a block with a tier bound to the current context.
+
+    Tasks created inside the block (asyncio.gather, create_task, to_thread)
+    inherit the binding, while other tasks keep their own.
+
+    Args:
+        tier: Tier name ('low', 'medium', 'high' or a legacy alias)
+
+    Yields:
+        The bound TierContext
+    """
+    token = activate_tier(tier)
+    try:
+        yield _current_tier.get()
+    finally:
+        reset_tier(token)
+
+
+def tier_setting(name: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Look up a tier setting for the current context.
+
+    Uses the bound tier when there is one, otherwise the process environment.
+    """
+    context = _current_tier.get()
+    if context is not None:
+        return context.get(name, default)
+    return os.environ.get(name, default)
+
+
 def load_tier_config(tier: str) -> dict[str, str]:
     """
     Load tier-specific configuration into the environment.
 
     This function:
-    1. Reads the appropriate tier_*.env file
+    1. Reads the appropriate tier_*.env file (cached after the first call)
     2. Sets the environment variables
     3. Returns the loaded config for reference
 
+    Setting os.environ affects every audit in the process; concurrent
+    audits should bind their tier with use_tier() instead.
+
     Args:
         tier: Tier name ('low', 'medium', 'high')
 
     Returns:
         Dictionary of loaded configuration values
     """
-    # Normalize tier name
-    tier = tier.lower().strip()
-
-    # Map legacy tier names
-    tier_mapping = {
-        "basic": "low",
-        "pro": "medium",
-        "enterprise": "high",
-        "budget": "low",
-        "balanced": "medium",
-        "premium": "high",
-    }
-    tier = tier_mapping.get(tier, tier)
-
-    # Get config file name
-    config_file = TIER_CONFIG_FILES.get(tier)
-    if not config_file:
-        logger.warning(f"Unknown tier '{tier}', defaulting to 'low'")
-        config_file = TIER_CONFIG_FILES["low"]
-        tier = "low"
-
-    config_path = CONFIG_DIR / config_file
-
-    logger.info(f"Loading tier config: {config_path}")
-
-    # Parse the config file
-    tier_config = parse_env_file(config_path)
+    tier_context = get_tier_context(tier)
 
     # Set environment variables
-    loaded_vars = {}
-    for var_name in TIER_VARIABLES:
-        if var_name in tier_config:
-            os.environ[var_name] = tier_config[var_name]
-            loaded_vars[var_name] = tier_config[var_name]
-            logger.debug(f"Set {var_name}={tier_config[var_name]}")
-
-    # Always set REPORT_TIER
-    os.environ["REPORT_TIER"] = tier
-    loaded_vars["REPORT_TIER"] = tier
+    for var_name, value in tier_context.values.items():
+        os.environ[var_name] = value
+        logger.debug(f"Set {var_name}={value}")
 
-    logger.info(f"Loaded {len(loaded_vars)} tier configuration variables for '{tier}' tier")
+    logger.info(
+        f"Loaded {len(tier_context.values)} tier configuration variables "
+        f"for '{tier_context.tier}' tier"
+    )
 
-    return loaded_vars
+    return dict(tier_context.values)
 
 
 def get_current_tier() -> str:
     """Get the currently configured tier."""
-    return os.environ.get("REPORT_TIER", "low")
+    return tier_setting("REPORT_TIER", "low")
 
 
 def get_tier_model(provider: str, quality: str = "fast") -> str:
@@ -181,18 +291,10 @@ def get_tier_model(provider: str, quality: str = "fast") -> str:
     var_name = f"{provider}_MODEL_{quality}"
     fallback_var = f"{provider}_MODEL"
 
-    model = os.environ.get(var_name) or os.environ.get(fallback_var)
+    model = tier_setting(var_name) or tier_setting(fallback_var)
 
     if not model:
-        # Default fallbacks
-        defaults = {
-            "OPENAI": "gpt-5-nano",
-            "ANTHROPIC": "claude-4-haiku-20251120",
-            "GOOGLE": "gemini-3.0-flash",
-            "PERPLEXITY": "sonar",
-            "XAI": "grok-4-1-fast-reasoning",
-        }
-        model = defaults.get(provider, "unknown")
+        model = DEFAULT_MODELS.get(provider, "unknown")
         logger.warning(f"No model configured for {provider}, using default: {model}")
 
     return model
@@ -207,10 +309,10 @@ def get_tier_info() -> dict[str, str]:
     """
     return {
         "tier": get_current_tier(),
-        "display_name": os.environ.get("REPORT_TIER_NAME", "Unknown"),
-        "ai_queries_per_provider": os.environ.get("REPORT_AI_QUERIES_PER_PROVIDER", "3"),
-        "include_social_sentiment": os.environ.get("REPORT_INCLUDE_SOCIAL_SENTIMENT", "true"),
-        "include_competitive_analysis": os.environ.get(
+        "display_name": tier_setting("REPORT_TIER_NAME", "Unknown"),
+        "ai_queries_per_provider": tier_setting("REPORT_AI_QUERIES_PER_PROVIDER", "3"),
+        "include_social_sentiment": tier_setting("REPORT_INCLUDE_SOCIAL_SENTIMENT", "true"),
+        "include_competitive_analysis": tier_setting(
             "REPORT_INCLUDE_COMPETITIVE_ANALYSIS", "false"
         ),
     }
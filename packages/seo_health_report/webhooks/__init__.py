@@ -9,20 +9,28 @@ Usage:
 
     service = WebhookService(db_session)
 
-    # Fire an event
+    # Queue an event in the delivery outbox
     await service.fire_event(
         tenant_id="tenant_123",
         event=WebhookEvent.AUDIT_COMPLETED,
         payload={"audit_id": "audit_456", "score": 85}
     )
+
+    # Drain the delivery outbox (runs inside the worker process)
+    await WebhookDispatcher().run_forever(stop_event)
 """
 
+from .dispatcher import CircuitBreaker, WebhookDispatcher
+from .outbox import enqueue_audit_webhooks
 from .security import sign_payload, validate_webhook_url, verify_signature
 from .service import WebhookEvent, WebhookService
 
 __all__ = [
     "WebhookService",
     "WebhookEvent",
+    "WebhookDispatcher",
+    "CircuitBreaker",
+    "enqueue_audit_webhooks",
     "validate_webhook_url",
     "sign_payload",
     "verify_signature",
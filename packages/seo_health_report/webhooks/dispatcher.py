@@ -0,0 +1,413 @@
+"""
+Outbox dispatcher for webhook deliveries.
+
+Drains pending rows from ``webhook_deliveries`` in batches, ordered by when
+they became due (``next_retry_at``). Deliveries share one pooled HTTP client,
+are limited per endpoint host, and are short-circuited while an endpoint's
+circuit breaker is open so one slow customer cannot stall everyone else.
+
+A batch is claimed by marking its rows ``sending`` and committing, so no
+transaction or row lock is held while requests are in flight. Each result
+is then written in its own short transaction. A claimed row that never gets
+a result (the dispatcher died mid-batch) becomes due again once its claim
+expires after WEBHOOK_CLAIM_SECONDS.
+
+Usage:
+    dispatcher = WebhookDispatcher()
+    await dispatcher.run_forever(stop_event)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+from urllib.parse import urlparse
+
+import httpx
+from sqlalchemy import func, or_, text
+from sqlalchemy.orm import Session
+
+from packages.seo_health_report.scripts.safe_fetch import SSRFError
+from packages.seo_health_report.scripts.webhook import (
+    sign_webhook_payload,
+    validate_callback_url,
+)
+
+from .outbox import get_callback_secret
+from .service import DELIVERY_TIMEOUT, build_delivery_request, record_delivery_outcome
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = int(os.getenv("WEBHOOK_DISPATCH_BATCH_SIZE", "100"))
+POLL_INTERVAL = float(os.getenv("WEBHOOK_DISPATCH_POLL_INTERVAL", "2"))
+PER_ENDPOINT_CONCURRENCY = int(os.getenv("WEBHOOK_PER_ENDPOINT_CONCURRENCY", "4"))
+MAX_CONNECTIONS = int(os.getenv("WEBHOOK_MAX_CONNECTIONS", "100"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("WEBHOOK_BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("WEBHOOK_BREAKER_RESET_SECONDS", "60"))
+# How long a claimed batch is held before another dispatcher may retry it
+CLAIM_SECONDS = int(os.getenv("WEBHOOK_CLAIM_SECONDS", "300"))
+
+IN_FLIGHT = "sending"
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    Opens after ``failure_threshold`` consecutive failures. Once
+    ``reset_timeout`` has elapsed a single trial request is let through
+    (half-open); success closes the breaker, failure re-opens it.
+    """
+
+    failure_threshold: int = BREAKER_FAILURE_THRESHOLD
+    reset_timeout: float = BREAKER_RESET_SECONDS
+    failures: int = 0
+    opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self, now: float) -> bool:
+        """Return True if a request may be attempted."""
+        if self.opened_at is None:
+            return True
+        if now - self.opened_at >= self.reset_timeout:
+            # Half-open: admit one trial and block the rest until it resolves
+            self.opened_at = now
+            return True
+        return False
+
+    def retry_after(self, now: float) -> float:
+        """Seconds until the breaker will admit a trial request."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (now - self.opened_at))
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self, now: float) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = now
+
+
+class WebhookDispatcher:
+    """Drains the webhook outbox with a pooled client and per-endpoint limits."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: int = BATCH_SIZE,
+        per_endpoint_concurrency: int = PER_ENDPOINT_CONCURRENCY,
+        max_connections: int = MAX_CONNECTIONS,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_SECONDS,
+        timeout: float = DELIVERY_TIMEOUT,
+    ):
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.per_endpoint_concurrency = per_endpoint_concurrency
+        self.max_connections = max_connections
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.timeout = timeout
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                follow_redirects=False,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections // 2,
+                ),
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._http_client and not self._http_client.is_closed:
+            await self._http_client.aclose()
+
+    def breaker_for(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self._breakers[host] = breaker
+        return breaker
+
+    def _semaphore_for(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_endpoint_concurrency)
+            self._semaphores[host] = semaphore
+        return semaphore
+
+    def _open_session(self) -> Session:
+        if self._session_factory is not None:
+            return self._session_factory()
+        from database import SessionLocal
+
+        return SessionLocal()
+
+    def _claim_due(self, db: Session, delivery_ids: Optional[list[str]] = None) -> list[Any]:
+        """Select a batch of due deliveries, skipping rows locked by other dispatchers."""
+        from database import WebhookDelivery
+
+        now = datetime.now(timezone.utc)
+        query = db.query(WebhookDelivery).filter(
+            # In-flight rows come back once their claim has expired
+            WebhookDelivery.status.in_(("pending", IN_FLIGHT)),
+            or_(
+                WebhookDelivery.next_retry_at.is_(None),
+                WebhookDelivery.next_retry_at <= now,
+            ),
+        )
+        if delivery_ids is not None:
+            query = query.filter(WebhookDelivery.id.in_(delivery_ids))
+        return (
+            # Fresh rows have no next_retry_at; they've been due since they were created
+            query.order_by(
+                func.coalesce(WebhookDelivery.next_retry_at, WebhookDelivery.created_at)
+            )
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+    async def dispatch_due(
+        self,
+        db: Optional[Session] = None,
+        delivery_ids: Optional[list[str]] = None,
+    ) -> int:
+        """
+        Deliver one batch of due webhooks concurrently.
+
+        Args:
+            db: Optional session to claim the batch with; a new one is opened
+                (and closed) if omitted. It is committed once the batch is claimed.
+            delivery_ids: Only consider these deliveries
+
+        Returns:
+            Number of deliveries attempted
+        """
+        # Database work runs in threads so the loop keeps serving other deliveries
+        claims, bind = await asyncio.to_thread(self._claim_batch, db, delivery_ids)
+        if not claims:
+            return 0
+
+        async def deliver(delivery: Any, url: str, secret: str, is_callback: bool) -> bool:
+            success = await self._dispatch_one(delivery, url, secret, is_callback)
+            await asyncio.to_thread(self._record_result, bind, delivery)
+            return success
+
+        results = await asyncio.gather(
+            *(deliver(*claim) for claim in claims), return_exceptions=True
+        )
+        for (delivery, *_), result in zip(claims, results):
+            if isinstance(result, Exception):
+                logger.error(f"Webhook delivery {delivery.id} left in flight: {result}")
+
+        delivered = sum(1 for result in results if result is True)
+        logger.info(f"Webhook dispatch batch: {len(claims)} attempted, {delivered} delivered")
+        return len(claims)
+
+    def _claim_batch(
+        self, db: Optional[Session], delivery_ids: Optional[list[str]]
+    ) -> tuple[list[tuple[Any, str, str, bool]], Any]:
+        """
+        Claim due deliveries and commit them as in flight.
+
+        Returns:
+            (delivery, url, secret, is_callback) for each claimed delivery,
+            detached from the session, and the engine to record results with
+        """
+        from database import Webhook
+
+        own_session = db is None
+        if own_session:
+            db = self._open_session()
+
+        try:
+            due = self._claim_due(db, delivery_ids)
+            bind = db.get_bind()
+            if not due:
+                db.commit()
+                return [], bind
+
+            webhook_ids = {d.webhook_id for d in due if d.webhook_id}
+            webhooks = {}
+            if webhook_ids:
+                webhooks = {
+                    w.id: w for w in db.query(Webhook).filter(Webhook.id.in_(webhook_ids)).all()
+                }
+
+            claimed_until = datetime.now(timezone.utc) + timedelta(seconds=CLAIM_SECONDS)
+            claims = []
+            for delivery in due:
+                if delivery.webhook_id:
+                    webhook = webhooks.get(delivery.webhook_id)
+                    if webhook is None or not webhook.is_active:
+                        delivery.status = "failed"
+                        delivery.error_message = "Webhook inactive or deleted"
+                        continue
+                    claims.append((delivery, webhook.url, webhook.secret, False))
+                elif delivery.target_url:
+                    claims.append(
+                        (
+                            delivery,
+                            delivery.target_url,
+                            get_callback_secret(delivery.tenant_id),
+                            True,
+                        )
+                    )
+                else:
+                    delivery.status = "failed"
+                    delivery.error_message = "Delivery has no target"
+                    continue
+                delivery.status = IN_FLIGHT
+                delivery.next_retry_at = claimed_until
+
+            # Detach the claimed rows so they keep their loaded state past the commit
+            db.flush()
+            for delivery, *_ in claims:
+                db.expunge(delivery)
+            db.commit()
+            return claims, bind
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            if own_session:
+                db.close()
+
+    def _record_result(self, bind: Any, delivery: Any) -> None:
+        """Write one delivery's outcome in its own transaction."""
+        with Session(bind=bind) as db:
+            db.merge(delivery)
+            if delivery.target_url and delivery.audit_id and delivery.status == "delivered":
+                db.execute(
+                    text(
+                        "UPDATE audits SET callback_delivered_at = CURRENT_TIMESTAMP WHERE id = :id"
+                    ),
+                    {"id": delivery.audit_id},
+                )
+            db.commit()
+
+    async def _dispatch_one(
+        self,
+        delivery: Any,
+        url: str,
+        secret: str,
+        is_callback: bool = False,
+    ) -> bool:
+        """Attempt a single delivery, honouring the endpoint's breaker and limit."""
+        from packages.seo_health_report.metrics import metrics
+
+        host = urlparse(url).hostname or url
+        breaker = self.breaker_for(host)
+
+        if not breaker.allow(time.monotonic()):
+            # Defer without consuming an attempt
+            delay = breaker.retry_after(time.monotonic())
+            delivery.status = "pending"
+            delivery.next_retry_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+            metrics.inc_counter("webhook_deliveries_total", labels={"status": "circuit_open"})
+            return False
+
+        if is_callback:
+            try:
+                await validate_callback_url(url)
+            except (SSRFError, ValueError) as e:
+                delivery.status = "failed"
+                delivery.error_message = f"Invalid callback URL: {e}"
+                metrics.inc_counter("webhook_deliveries_total", labels={"status": "failed"})
+                return False
+            body, headers = build_callback_request(delivery.payload, secret)
+        else:
+            body, headers = build_delivery_request(delivery, secret)
+
+        status_code = None
+        response_body = None
+        error = None
+        async with self._semaphore_for(host):
+            delivery.attempts = (delivery.attempts or 0) + 1
+            try:
+                client = await self._get_client()
+                response = await client.post(url, content=body, headers=headers)
+                status_code = response.status_code
+                response_body = response.text
+            except httpx.TimeoutException:
+                error = "Request timeout"
+            except httpx.RequestError as e:
+                error = str(e)[:500]
+            except Exception as e:
+                error = f"Unexpected error: {str(e)[:500]}"
+                logger.exception(f"Webhook delivery failed: {delivery.id}")
+
+        success = record_delivery_outcome(delivery, status_code, response_body, error)
+
+        if success:
+            breaker.record_success()
+            metrics.inc_counter("webhook_deliveries_total", labels={"status": "success"})
+        elif status_code is None or status_code >= 500 or status_code == 429:
+            # Only endpoint-health failures trip the breaker, not rejected payloads
+            breaker.record_failure(time.monotonic())
+            if breaker.is_open:
+                logger.warning(f"Circuit opened for webhook host {host}")
+
+        return success
+
+    async def run_forever(
+        self,
+        stop_event: Optional[asyncio.Event] = None,
+        poll_interval: float = POLL_INTERVAL,
+    ) -> None:
+        """Drain the outbox until ``stop_event`` is set."""
+        stop_event = stop_event or asyncio.Event()
+        logger.info("Webhook dispatcher started")
+        try:
+            while not stop_event.is_set():
+                try:
+                    attempted = await self.dispatch_due()
+                except Exception as e:
+                    logger.exception(f"Webhook dispatch error: {e}")
+                    attempted = 0
+
+                # Keep draining while full batches are coming back
+                if attempted < self.batch_size:
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), timeout=poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            await self.close()
+            logger.info("Webhook dispatcher stopped")
+
+
+def build_callback_request(payload: dict[str, Any], secret: str) -> tuple[str, dict[str, str]]:
+    """
+    Build the body and headers for a per-audit callback delivery.
+
+    Callbacks keep the original wire format: the (already redacted) payload
+    posted as-is, signed over its sorted-key JSON serialization.
+    """
+    body = json.dumps(payload, sort_keys=True, default=str)
+    headers = {
+        "Content-Type": "application/json",
+        "X-Webhook-Signature": sign_webhook_payload(payload, secret),
+        "User-Agent": "SEOHealthReport-Webhook/1.0",
+    }
+    return body, headers
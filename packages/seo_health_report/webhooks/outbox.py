@@ -0,0 +1,107 @@
+"""
+Transactional webhook outbox.
+
+Audit completion writes delivery rows into ``webhook_deliveries`` on the same
+session (and therefore the same transaction) as the audit result. Nothing is
+sent from the audit path; the WebhookDispatcher drains pending rows.
+
+Two kinds of rows share the table:
+- Subscription deliveries (``webhook_id`` set) for tenants' registered webhooks
+- Callback deliveries (``target_url`` set) for a per-audit ``callback_url``
+"""
+
+import logging
+import os
+import uuid
+from typing import Any, Optional
+
+from sqlalchemy.orm import Session
+
+from packages.seo_health_report.scripts.redaction import redact_dict
+
+logger = logging.getLogger(__name__)
+
+
+def get_callback_secret(tenant_id: Optional[str]) -> str:
+    """Get signing secret for per-audit callback deliveries."""
+    return os.getenv("WEBHOOK_SECRET", f"webhook-secret-{tenant_id or 'default'}")
+
+
+def enqueue_audit_webhooks(
+    db: Session,
+    audit_id: str,
+    tenant_id: Optional[str],
+    event_type: str,
+    payload: dict[str, Any],
+    callback_url: Optional[str] = None,
+) -> list[str]:
+    """
+    Stage webhook deliveries for an audit event without committing.
+
+    The caller commits together with the audit status/result update, so a
+    delivery exists if and only if the result was persisted.
+
+    Args:
+        db: Database session holding the audit result transaction
+        audit_id: Audit ID the event belongs to
+        tenant_id: Tenant whose active subscriptions should receive the event
+        event_type: Event type (e.g. "audit.completed")
+        payload: Event payload (redacted before storage)
+        callback_url: Optional per-audit callback URL
+
+    Returns:
+        List of staged delivery IDs
+    """
+    from database import Webhook, WebhookDelivery
+
+    safe_payload = redact_dict(payload)
+    delivery_ids = []
+
+    if tenant_id:
+        webhooks = (
+            db.query(Webhook)
+            .filter(
+                Webhook.tenant_id == tenant_id,
+                Webhook.is_active,
+            )
+            .all()
+        )
+        for webhook in webhooks:
+            if event_type not in (webhook.events or []):
+                continue
+            delivery_id = str(uuid.uuid4())
+            db.add(
+                WebhookDelivery(
+                    id=delivery_id,
+                    webhook_id=webhook.id,
+                    audit_id=audit_id,
+                    tenant_id=tenant_id,
+                    event_type=event_type,
+                    payload=safe_payload,
+                    status="pending",
+                    attempts=0,
+                )
+            )
+            delivery_ids.append(delivery_id)
+
+    if callback_url:
+        delivery_id = str(uuid.uuid4())
+        db.add(
+            WebhookDelivery(
+                id=delivery_id,
+                webhook_id=None,
+                target_url=callback_url,
+                audit_id=audit_id,
+                tenant_id=tenant_id,
+                event_type=event_type,
+                payload=safe_payload,
+                status="pending",
+                attempts=0,
+            )
+        )
+        delivery_ids.append(delivery_id)
+
+    if delivery_ids:
+        logger.debug(f"Staged {len(delivery_ids)} {event_type} deliveries for audit {audit_id}")
+
+    return delivery_ids
@@ -15,7 +15,6 @@ from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any, Optional
 
-import httpx
 from sqlalchemy.orm import Session
 
 from .security import SSRFError, generate_secret, sign_payload, validate_webhook_url
@@ -36,6 +35,82 @@ MAX_RETRIES = len(RETRY_DELAYS)
 DELIVERY_TIMEOUT = 10.0
 
 
+def build_delivery_request(delivery: Any, secret: str) -> tuple[str, dict[str, str]]:
+    """
+    Build the signed request body and headers for a subscription delivery.
+
+    Args:
+        delivery: WebhookDelivery record
+        secret: Webhook signing secret
+
+    Returns:
+        Tuple of (JSON body, headers)
+    """
+    full_payload = {
+        "event": delivery.event_type,
+        "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+        "delivery_id": delivery.id,
+        "data": delivery.payload,
+    }
+
+    payload_json = json.dumps(full_payload)
+    signature = sign_payload(payload_json, secret)
+
+    headers = {
+        "Content-Type": "application/json",
+        "X-Webhook-Signature": f"sha256={signature}",
+        "X-Webhook-Event": delivery.event_type,
+        "X-Webhook-Delivery": delivery.id,
+        "User-Agent": "SEO-Health-Report-Webhook/1.0",
+    }
+    return payload_json, headers
+
+
+def record_delivery_outcome(
+    delivery: Any,
+    status_code: Optional[int],
+    response_body: Optional[str],
+    error: Optional[str],
+) -> bool:
+    """
+    Apply the result of a delivery attempt to the delivery record.
+
+    Schedules the next retry off RETRY_DELAYS or marks the delivery failed
+    once MAX_RETRIES is reached. Does not commit.
+
+    Returns:
+        True if the delivery succeeded
+    """
+    from packages.seo_health_report.metrics import metrics
+
+    if status_code is not None:
+        delivery.response_code = status_code
+        delivery.response_body = response_body[:1000] if response_body else None
+
+        if status_code < 400:
+            delivery.status = "delivered"
+            delivery.delivered_at = datetime.now(timezone.utc)
+            delivery.next_retry_at = None
+            delivery.error_message = None
+            return True
+
+        error = f"HTTP {status_code}"
+
+    delivery.error_message = error
+
+    if delivery.attempts < MAX_RETRIES:
+        delay = RETRY_DELAYS[delivery.attempts - 1]
+        delivery.next_retry_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        delivery.status = "pending"
+        logger.info(f"Webhook {delivery.id} scheduled for retry in {delay}s")
+    else:
+        delivery.status = "failed"
+        metrics.inc_counter("webhook_deliveries_total", labels={"status": "failed"})
+        logger.warning(f"Webhook {delivery.id} failed after {MAX_RETRIES} attempts")
+
+    return False
+
+
 class WebhookService:
     """
     Service for managing webhooks and delivering events.
@@ -50,7 +125,7 @@ class WebhookService:
             events=["audit.completed", "audit.failed"]
         )
 
-        # Fire an event
+        # Queue an event for delivery
         await service.fire_event(
             tenant_id="tenant_123",
             event=WebhookEvent.AUDIT_COMPLETED,
@@ -60,21 +135,6 @@ class WebhookService:
 
     def __init__(self, db: Session):
         self.db = db
-        self._http_client: Optional[httpx.AsyncClient] = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(DELIVERY_TIMEOUT),
-                follow_redirects=False,
-            )
-        return self._http_client
-
-    async def close(self) -> None:
-        """Close HTTP client."""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
 
     def create_webhook(
         self,
@@ -262,7 +322,10 @@ class WebhookService:
         payload: dict[str, Any],
     ) -> list[str]:
         """
-        Fire an event to all subscribed webhooks.
+        Queue an event for all subscribed webhooks.
+
+        Deliveries are written to the outbox and committed; the
+        WebhookDispatcher sends them.
 
         Args:
             tenant_id: Tenant ID
@@ -272,175 +335,47 @@ class WebhookService:
         Returns:
             List of delivery IDs created
         """
-        from database import Webhook
+        from .outbox import enqueue_audit_webhooks
 
-        webhooks = (
-            self.db.query(Webhook)
-            .filter(
-                Webhook.tenant_id == tenant_id,
-                Webhook.is_active,
-            )
-            .all()
-        )
-
-        delivery_ids = []
-
-        for webhook in webhooks:
-            if event.value in webhook.events:
-                delivery_id = await self._create_and_deliver(webhook, event.value, payload)
-                if delivery_id:
-                    delivery_ids.append(delivery_id)
-
-        return delivery_ids
-
-    async def _create_and_deliver(
-        self,
-        webhook: Any,
-        event_type: str,
-        payload: dict[str, Any],
-    ) -> Optional[str]:
-        """Create delivery record and attempt delivery."""
-        from database import WebhookDelivery
-        from packages.seo_health_report.metrics import metrics
-
-        delivery = WebhookDelivery(
-            id=str(uuid.uuid4()),
-            webhook_id=webhook.id,
-            event_type=event_type,
+        delivery_ids = enqueue_audit_webhooks(
+            self.db,
+            audit_id=payload.get("audit_id"),
+            tenant_id=tenant_id,
+            event_type=event.value,
             payload=payload,
-            status="pending",
-            attempts=0,
         )
+        if delivery_ids:
+            self.db.commit()
+        return delivery_ids
 
-        self.db.add(delivery)
-        self.db.commit()
-
-        # Attempt delivery
-        success = await self._deliver(delivery, webhook)
-
-        if success:
-            metrics.inc_counter("webhook_deliveries_total", labels={"status": "success"})
-        else:
-            metrics.inc_counter("webhook_deliveries_total", labels={"status": "pending_retry"})
-
-        return delivery.id
-
-    async def _deliver(self, delivery: Any, webhook: Any) -> bool:
+    async def process_pending_retries(self) -> int:
         """
-        Attempt to deliver a webhook.
+        Process webhooks that are due for retry.
 
-        Args:
-            delivery: WebhookDelivery record
-            webhook: Webhook record
+        Delegates to the outbox dispatcher so retries share its pooled client,
+        per-endpoint limits and circuit breakers.
 
         Returns:
-            True if delivered successfully
+            Number of deliveries processed
         """
-        from packages.seo_health_report.metrics import metrics
-
-        delivery.attempts += 1
-
-        # Build payload with event envelope
-        full_payload = {
-            "event": delivery.event_type,
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
-            "delivery_id": delivery.id,
-            "data": delivery.payload,
-        }
-
-        payload_json = json.dumps(full_payload)
-        signature = sign_payload(payload_json, webhook.secret)
-
-        headers = {
-            "Content-Type": "application/json",
-            "X-Webhook-Signature": f"sha256={signature}",
-            "X-Webhook-Event": delivery.event_type,
-            "X-Webhook-Delivery": delivery.id,
-            "User-Agent": "SEO-Health-Report-Webhook/1.0",
-        }
+        from .dispatcher import WebhookDispatcher
 
+        dispatcher = WebhookDispatcher()
         try:
-            client = await self._get_client()
-            response = await client.post(
-                webhook.url,
-                content=payload_json,
-                headers=headers,
-            )
-
-            delivery.response_code = response.status_code
-            delivery.response_body = response.text[:1000] if response.text else None
-
-            if response.status_code < 400:
-                delivery.status = "delivered"
-                delivery.delivered_at = datetime.now(timezone.utc)
-                delivery.error_message = None
-                self.db.commit()
-
-                logger.info(f"Webhook delivered: {delivery.id} to {webhook.url}")
-                return True
-            else:
-                delivery.error_message = f"HTTP {response.status_code}"
-
-        except httpx.TimeoutException:
-            delivery.error_message = "Request timeout"
-        except httpx.RequestError as e:
-            delivery.error_message = str(e)[:500]
-        except Exception as e:
-            delivery.error_message = f"Unexpected error: {str(e)[:500]}"
-            logger.exception(f"Webhook delivery failed: {delivery.id}")
-
-        # Schedule retry if under max attempts
-        if delivery.attempts < MAX_RETRIES:
-            delay = RETRY_DELAYS[delivery.attempts - 1]
-            delivery.next_retry_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
-            delivery.status = "pending"
-            logger.info(f"Webhook {delivery.id} scheduled for retry in {delay}s")
-        else:
-            delivery.status = "failed"
-            metrics.inc_counter("webhook_deliveries_total", labels={"status": "failed"})
-            logger.warning(f"Webhook {delivery.id} failed after {MAX_RETRIES} attempts")
+            return await dispatcher.dispatch_due(db=self.db)
+        finally:
+            await dispatcher.close()
 
-        self.db.commit()
-        return False
-
-    async def process_pending_retries(self) -> int:
+    async def send_test_event(self, webhook_id: str, tenant_id: str) -> dict[str, Any]:
         """
-        Process webhooks that are due for retry.
+        Send a test event to verify webhook configuration.
 
-        Returns:
-            Number of deliveries processed
+        The test delivery goes through the outbox like any other, but is
+        dispatched straight away so the result can be reported back.
         """
         from database import Webhook, WebhookDelivery
 
-        pending = (
-            self.db.query(WebhookDelivery)
-            .filter(
-                WebhookDelivery.status == "pending",
-                WebhookDelivery.next_retry_at <= datetime.now(timezone.utc),
-            )
-            .limit(100)
-            .all()
-        )
-
-        count = 0
-        for delivery in pending:
-            webhook = (
-                self.db.query(Webhook)
-                .filter(
-                    Webhook.id == delivery.webhook_id,
-                )
-                .first()
-            )
-
-            if webhook and webhook.is_active:
-                await self._deliver(delivery, webhook)
-                count += 1
-
-        return count
-
-    async def send_test_event(self, webhook_id: str, tenant_id: str) -> dict[str, Any]:
-        """Send a test event to verify webhook configuration."""
-        from database import Webhook
+        from .dispatcher import WebhookDispatcher
 
         webhook = (
             self.db.query(Webhook)
@@ -454,19 +389,30 @@ class WebhookService:
         if not webhook:
             raise ValueError("Webhook not found")
 
-        test_payload = {
-            "message": "This is a test webhook event",
-            "webhook_id": webhook_id,
-        }
-
-        delivery_id = await self._create_and_deliver(
-            webhook,
-            "test",
-            test_payload,
+        delivery_id = str(uuid.uuid4())
+        self.db.add(
+            WebhookDelivery(
+                id=delivery_id,
+                webhook_id=webhook.id,
+                tenant_id=tenant_id,
+                event_type="test",
+                payload={
+                    "message": "This is a test webhook event",
+                    "webhook_id": webhook_id,
+                },
+                status="pending",
+                attempts=0,
+            )
         )
+        self.db.commit()
 
-        from database import WebhookDelivery
+        dispatcher = WebhookDispatcher()
+        try:
+            await dispatcher.dispatch_due(db=self.db, delivery_ids=[delivery_id])
+        finally:
+            await dispatcher.close()
 
+        self.db.expire_all()
         delivery = (
             self.db.query(WebhookDelivery)
             .filter(
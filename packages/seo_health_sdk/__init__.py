@@ -25,6 +25,9 @@ from .exceptions import (
     ValidationError,
 )
 from .models import (
+    AuditBatchItem,
+    AuditBatchProgress,
+    AuditBatchResponse,
     AuditRequest,
     AuditResponse,
     AuditResult,
@@ -56,6 +59,9 @@ __all__ = [
     "AuditRequest",
     "AuditResponse",
     "AuditResult",
+    "AuditBatchItem",
+    "AuditBatchResponse",
+    "AuditBatchProgress",
     "ScoreBreakdown",
     "WebhookEvent",
     "Webhook",
@@ -1,12 +1,14 @@
 """Main client classes for the SEO Health SDK."""
 
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import httpx
 
 from .auth import RefreshableTokenAuth
 from .exceptions import raise_for_status
 from .models import (
+    AuditBatchProgress,
+    AuditBatchResponse,
     AuditResponse,
     AuditResult,
     AuditTier,
@@ -18,6 +20,45 @@ from .models import (
     WebhookEvent,
 )
 
+# Max GET responses remembered for conditional (If-None-Match) requests
+ETAG_CACHE_SIZE = 128
+
+
+def _etag_cache_key(method: str, path: str, kwargs: dict[str, Any]) -> Optional[str]:
+    if method != "GET":
+        return None
+    params = kwargs.get("params")
+    return f"{path}?{sorted(params.items())}" if params else path
+
+
+def _remember_etag(
+    cache: dict[str, tuple[str, Any]], key: Optional[str], response: httpx.Response, data: Any
+) -> None:
+    etag = response.headers.get("etag")
+    if key is None or not etag:
+        return
+    cache.pop(key, None)
+    if len(cache) >= ETAG_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = (etag, data)
+
+
+def _batch_payload(
+    urls: Optional[list[Union[str, dict[str, str]]]],
+    csv: Optional[str],
+    tier: str,
+    keywords: Optional[list[str]],
+    competitors: Optional[list[str]],
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {"audits": list(urls or []), "tier": tier}
+    if csv:
+        payload["csv"] = csv
+    if keywords:
+        payload["keywords"] = keywords
+    if competitors:
+        payload["competitors"] = competitors
+    return payload
+
 
 class SEOHealthClient:
     """Synchronous client for the SEO Health Report API."""
@@ -50,6 +91,7 @@ class SEOHealthClient:
             timeout=timeout,
             headers={"Content-Type": "application/json"},
         )
+        self._etags: dict[str, tuple[str, Any]] = {}
 
     def __enter__(self):
         return self
@@ -67,9 +109,22 @@ class SEOHealthClient:
         path: str,
         **kwargs,
     ) -> dict[str, Any]:
-        """Make an HTTP request and handle errors."""
+        """
+        Make an HTTP request and handle errors.
+
+        GET responses carrying an ETag are remembered so repeat polls can be
+        answered with 304 Not Modified and served from the local copy.
+        """
+        cache_key = _etag_cache_key(method, path, kwargs)
+        cached = self._etags.get(cache_key) if cache_key else None
+        if cached:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
+
         response = self._client.request(method, path, **kwargs)
 
+        if response.status_code == 304 and cached:
+            return cached[1]
+
         if response.status_code >= 400:
             try:
                 data = response.json()
@@ -84,7 +139,9 @@ class SEOHealthClient:
         if response.status_code == 204:
             return {}
 
-        return response.json()
+        data = response.json()
+        _remember_etag(self._etags, cache_key, response, data)
+        return data
 
     # Auth Methods
 
@@ -188,6 +245,45 @@ class SEOHealthClient:
         data = self._request("POST", "/api/v1/audits", json=payload)
         return AuditResponse(**data)
 
+    def create_audit_batch(
+        self,
+        urls: Optional[list[Union[str, dict[str, str]]]] = None,
+        csv: Optional[str] = None,
+        tier: str = "low",
+        keywords: Optional[list[str]] = None,
+        competitors: Optional[list[str]] = None,
+    ) -> AuditBatchResponse:
+        """
+        Submit many audits in one request.
+
+        Args:
+            urls: URLs, or {"url": ..., "company_name": ...} dicts
+            csv: CSV text with url[,company_name] rows (header optional),
+                e.g. Path("prospects.csv").read_text()
+            tier: Audit tier for the whole batch (low, medium, high)
+            keywords: Optional keywords applied to every audit
+            competitors: Optional competitor URLs applied to every audit
+
+        Returns:
+            AuditBatchResponse with the batch ID and the outcome per URL
+        """
+        payload = _batch_payload(urls, csv, tier, keywords, competitors)
+        data = self._request("POST", "/api/v1/audits/batch", json=payload)
+        return AuditBatchResponse(**data)
+
+    def get_audit_batch(self, batch_id: str) -> AuditBatchProgress:
+        """
+        Get the aggregate progress of a batch.
+
+        Args:
+            batch_id: The batch ID returned by create_audit_batch
+
+        Returns:
+            AuditBatchProgress with audit counts per status
+        """
+        data = self._request("GET", f"/api/v1/audits/batch/{batch_id}")
+        return AuditBatchProgress(**data)
+
     def get_audit(self, audit_id: str) -> AuditResult:
         """
         Get an audit by ID.
@@ -469,6 +565,7 @@ class AsyncSEOHealthClient:
             timeout=timeout,
             headers={"Content-Type": "application/json"},
         )
+        self._etags: dict[str, tuple[str, Any]] = {}
 
     async def __aenter__(self):
         return self
@@ -486,9 +583,22 @@ class AsyncSEOHealthClient:
         path: str,
         **kwargs,
     ) -> dict[str, Any]:
-        """Make an HTTP request and handle errors."""
+        """
+        Make an HTTP request and handle errors.
+
+        GET responses carrying an ETag are remembered so repeat polls can be
+        answered with 304 Not Modified and served from the local copy.
+        """
+        cache_key = _etag_cache_key(method, path, kwargs)
+        cached = self._etags.get(cache_key) if cache_key else None
+        if cached:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
+
         response = await self._client.request(method, path, **kwargs)
 
+        if response.status_code == 304 and cached:
+            return cached[1]
+
         if response.status_code >= 400:
             try:
                 data = response.json()
@@ -503,7 +613,9 @@ class AsyncSEOHealthClient:
         if response.status_code == 204:
             return {}
 
-        return response.json()
+        data = response.json()
+        _remember_etag(self._etags, cache_key, response, data)
+        return data
 
     # Auth Methods
 
@@ -609,6 +721,45 @@ class AsyncSEOHealthClient:
         data = await self._request("POST", "/api/v1/audits", json=payload)
         return AuditResponse(**data)
 
+    async def create_audit_batch(
+        self,
+        urls: Optional[list[Union[str, dict[str, str]]]] = None,
+        csv: Optional[str] = None,
+        tier: str = "low",
+        keywords: Optional[list[str]] = None,
+        competitors: Optional[list[str]] = None,
+    ) -> AuditBatchResponse:
+        """
+        Submit many audits in one request.
+
+        Args:
+            urls: URLs, or {"url": ..., "company_name": ...} dicts
+            csv: CSV text with url[,company_name] rows (header optional),
+                e.g. Path("prospects.csv").read_text()
+            tier: Audit tier for the whole batch (low, medium, high)
+            keywords: Optional keywords applied to every audit
+            competitors: Optional competitor URLs applied to every audit
+
+        Returns:
+            AuditBatchResponse with the batch ID and the outcome per URL
+        """
+        payload = _batch_payload(urls, csv, tier, keywords, competitors)
+        data = await self._request("POST", "/api/v1/audits/batch", json=payload)
+        return AuditBatchResponse(**data)
+
+    async def get_audit_batch(self, batch_id: str) -> AuditBatchProgress:
+        """
+        Get the aggregate progress of a batch.
+
+        Args:
+            batch_id: The batch ID returned by create_audit_batch
+
+        Returns:
+            AuditBatchProgress with audit counts per status
+        """
+        data = await self._request("GET", f"/api/v1/audits/batch/{batch_id}")
+        return AuditBatchProgress(**data)
+
     async def get_audit(self, audit_id: str) -> AuditResult:
         """
         Get an audit by ID.
@@ -83,6 +83,43 @@ class AuditResult(BaseModel):
     pdf_url: Optional[str] = None
 
 
+class AuditBatchItem(BaseModel):
+    """What happened to one URL of a batch."""
+
+    url: str
+    status: str  # queued, duplicate or invalid
+    audit_id: Optional[str] = None
+    canonical_url: Optional[str] = None
+    error: Optional[str] = None
+
+
+class AuditBatchResponse(BaseModel):
+    """Response when submitting a batch of audits."""
+
+    batch_id: str
+    submitted: int
+    queued: int
+    duplicates: int
+    invalid: int
+    items: list[AuditBatchItem] = []
+    progress_url: Optional[str] = None
+
+
+class AuditBatchProgress(BaseModel):
+    """Aggregate progress of a batch."""
+
+    batch_id: str
+    status: str  # queued, running or completed
+    tier: Optional[str] = None
+    submitted: int
+    queued: int
+    duplicates: int
+    invalid: int
+    audits: dict[str, int] = {}  # Audit status -> count, plus "total"
+    progress: float = Field(ge=0, le=1)
+    created_at: Optional[datetime] = None
+
+
 class WebhookEvent(str, Enum):
     """Webhook event types."""
 
@@ -156,6 +193,9 @@ __all__ = [
     "ScoreBreakdown",
     "AuditResponse",
     "AuditResult",
+    "AuditBatchItem",
+    "AuditBatchResponse",
+    "AuditBatchProgress",
     "WebhookEvent",
     "Webhook",
     "WebhookDelivery",
@@ -5,14 +5,23 @@ Comprehensive technical SEO analysis covering crawlability, page speed,
 mobile optimization, security, and structured data.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any, Optional
 
+from packages.core.analysis_pool import get_analysis_pool
+from packages.core.observations import ObservationKind, get_observation, put_observation
+from packages.core.tracing import Stage, span
+
 from .scripts.analyze_speed import analyze_speed, get_pagespeed_insights
 from .scripts.check_mobile import analyze_mobile_config
 from .scripts.check_security import analyze_security
 from .scripts.crawl_site import analyze_crawlability, check_robots, check_sitemaps
-from .scripts.validate_schema import validate_structured_data
+from .scripts.validate_schema import (
+    fetch_page,
+    validate_structured_data,
+    validate_structured_html,
+)
 
 __version__ = "1.0.0"
 
@@ -130,7 +139,21 @@ async def run_audit(
     }
 
     # Component 6: Structured Data (15 points)
-    schema_result = validate_structured_data(target_url)
+    # Fetched off the event loop, validated in the analysis pool; another
+    # audit's fresh result for the same page is reused as is
+    schema_result = await asyncio.to_thread(
+        get_observation, ObservationKind.STRUCTURED_DATA, target_url
+    )
+    if schema_result is None:
+        schema_html = await asyncio.to_thread(fetch_page, target_url)
+        with span("validate_schema.validate_structured_html", Stage.ANALYZE):
+            schema_result = await get_analysis_pool().run_async(
+                validate_structured_html, target_url, schema_html
+            )
+        if schema_html:
+            await asyncio.to_thread(
+                put_observation, ObservationKind.STRUCTURED_DATA, target_url, schema_result
+            )
     results["components"]["structured_data"] = {
         "score": schema_result["score"],
         "max": schema_result["max"],
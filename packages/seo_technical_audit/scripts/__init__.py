@@ -22,16 +22,21 @@ from .crawl_site import (
     check_robots,
     check_sitemaps,
 )
+from .sitemap_reader import DiskUrlSet, ReservoirSample, SitemapReader
 from .validate_schema import (
     check_rich_results_eligibility,
     extract_structured_data,
     validate_schema,
     validate_structured_data,
+    validate_structured_html,
 )
 
 __all__ = [
     "check_robots",
     "check_sitemaps",
+    "SitemapReader",
+    "ReservoirSample",
+    "DiskUrlSet",
     "analyze_crawlability",
     "check_redirects",
     "analyze_internal_links",
@@ -46,4 +51,5 @@ __all__ = [
     "validate_schema",
     "check_rich_results_eligibility",
     "validate_structured_data",
+    "validate_structured_html",
 ]
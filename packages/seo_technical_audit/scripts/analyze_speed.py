@@ -13,6 +13,8 @@ from typing import Any, Optional
 # Add parent directory to path for config import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from packages.core.observations import ObservationKind, observed
+from packages.core.tracing import Stage, traced
 from seo_health_report.config import get_config
 
 # Get config
@@ -87,6 +89,8 @@ CWV_THRESHOLDS = {
 
 
 @cached("pagespeed", TTL_PAGESPEED)
+@observed(ObservationKind.PAGESPEED, params=("strategy",), keep=lambda r: r.get("success"))
+@traced(Stage.FETCH)
 async def get_pagespeed_insights(
     url: str, strategy: str = "mobile", api_key: Optional[str] = None
 ) -> dict[str, Any]:
@@ -519,6 +523,7 @@ def format_bytes(bytes_val: Optional[int]) -> str:
         return f"{bytes_val / (1024 * 1024):.1f} MB"
 
 
+@traced(Stage.ANALYZE)
 async def analyze_speed(url: str, strategy: str = "mobile") -> dict[str, Any]:
     """
     Complete speed analysis for a URL.
@@ -4,10 +4,12 @@ Check Mobile Optimization Configuration
 Analyze viewport settings and mobile-specific meta tags.
 """
 
-import re
 from dataclasses import dataclass
 from typing import Any
 
+from packages.core.parsed_page import parse_page
+from packages.core.tracing import Stage, traced
+
 from .crawl_site import fetch_url
 
 
@@ -23,15 +25,9 @@ def check_viewport_tag(html: str) -> dict[str, Any]:
     Check if the viewport meta tag is present and correctly configured.
     """
     issues = []
-    viewport_pattern = r'<meta[^>]*name=["\']viewport["\'][^>]*content=["\']([^"\']+)["\']'
-    match = re.search(viewport_pattern, html, re.IGNORECASE)
-
-    if not match:
-        # Check reverse order of attributes
-        viewport_pattern_alt = r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']viewport["\']'
-        match = re.search(viewport_pattern_alt, html, re.IGNORECASE)
+    viewport = parse_page(html).meta("viewport")
 
-    if not match:
+    if not viewport:
         # Critical for mobile
         issues.append(
             MobileIssue(
@@ -42,7 +38,7 @@ def check_viewport_tag(html: str) -> dict[str, Any]:
         )
         return {"valid": False, "content": None, "issues": issues}
 
-    content = match.group(1).lower()
+    content = viewport.lower()
 
     # Check for width=device-width
     if "width=device-width" not in content:
@@ -77,6 +73,7 @@ def check_viewport_tag(html: str) -> dict[str, Any]:
     return {"valid": len(issues) == 0, "content": content, "issues": issues}
 
 
+@traced(Stage.ANALYZE)
 def analyze_mobile_config(url: str) -> dict[str, Any]:
     """
     Analyze mobile configuration (viewport, tap targets, etc.)
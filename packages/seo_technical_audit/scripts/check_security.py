@@ -11,6 +11,9 @@ from datetime import datetime
 from typing import Any
 from urllib.parse import urlparse
 
+from packages.core.parsed_page import parse_page
+from packages.core.tracing import Stage, traced
+
 
 @dataclass
 class SecurityIssue:
@@ -330,8 +333,6 @@ def check_mixed_content(url: str) -> dict[str, Any]:
         return result
 
     try:
-        import re
-
         import requests
 
         headers = {"User-Agent": "SEO-Health-Report-Bot/1.0 (Security Audit)"}
@@ -339,21 +340,13 @@ def check_mixed_content(url: str) -> dict[str, Any]:
         response = requests.get(url, headers=headers, timeout=30)
         html = response.text
 
-        # Find all HTTP resources
-        http_patterns = [
-            (r'src=["\']http://[^"\']+["\']', "src"),
-            (r'href=["\']http://[^"\']+\.(?:css|js)["\']', "href"),
-            (r'url\(["\']?http://[^"\')\s]+["\']?\)', "url()"),
-        ]
-
-        for pattern, resource_type in http_patterns:
-            matches = re.findall(pattern, html, re.IGNORECASE)
-            for match in matches:
-                # Extract URL from match
-                url_match = re.search(r'http://[^\s"\')\]]+', match)
-                if url_match:
-                    resource_url = url_match.group()
-                    result["mixed_resources"].append({"url": resource_url, "type": resource_type})
+        # Find all HTTP resources (stylesheets and scripts only, for <link href>)
+        for resource_type, resource_url in parse_page(html).resources:
+            if not resource_url.lower().startswith("http://"):
+                continue
+            if resource_type == "href" and not resource_url.lower().endswith((".css", ".js")):
+                continue
+            result["mixed_resources"].append({"url": resource_url, "type": resource_type})
 
         if result["mixed_resources"]:
             result["has_mixed_content"] = True
@@ -391,6 +384,7 @@ def check_mixed_content(url: str) -> dict[str, Any]:
     return result
 
 
+@traced(Stage.ANALYZE)
 def analyze_security(url: str) -> dict[str, Any]:
     """
     Complete security analysis for a URL.
@@ -5,9 +5,7 @@ Analyze robots.txt, sitemaps, and crawlability of a website.
 """
 
 import os
-import re
 import sys
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from typing import Any, Optional
 from urllib.parse import urljoin, urlparse
@@ -15,9 +13,26 @@ from urllib.parse import urljoin, urlparse
 # Add parent directory to path for logger import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from packages.core.observations import ObservationKind, observed
+from packages.core.parsed_page import parse_page
+from packages.core.robots import (
+    ALLOW_ALL,
+    ROBOTS_UNREACHABLE_TTL,
+    RobotsPolicy,
+    fetch_robots_txt,
+    store_robots_policy,
+)
+from packages.core.tracing import Stage, traced
 from seo_health_report.config import get_config
 from seo_health_report.scripts.logger import get_logger
 
+from .sitemap_reader import (
+    SITEMAP_PROTOCOL_URL_LIMIT,
+    SitemapReader,
+    UrlSink,
+    stream_url,
+)
+
 logger = get_logger(__name__)
 _config = get_config()
 
@@ -50,6 +65,7 @@ class CrawlIssue:
 
 
 @cached("http_fetch", TTL_HTTP_FETCH)
+@traced(Stage.FETCH)
 def fetch_url(url: str, timeout: int = None) -> Optional[str]:
     """
     Fetch content from a URL.
@@ -112,9 +128,15 @@ def check_robots(url: str) -> dict[str, Any]:
         "score": 0,
     }
 
-    content = fetch_url(robots_url)
+    content = fetch_robots_txt(robots_url)
 
     if not content:
+        # Share the "allow everything" policy with the other crawlers; an
+        # unreachable robots.txt is only trusted briefly
+        if content is None:
+            store_robots_policy(url, ALLOW_ALL, ROBOTS_UNREACHABLE_TTL)
+        else:
+            store_robots_policy(url, ALLOW_ALL)
         result["issues"].append(
             CrawlIssue(
                 severity="medium",
@@ -129,52 +151,21 @@ def check_robots(url: str) -> dict[str, Any]:
     result["exists"] = True
     result["content"] = content
 
-    # Parse robots.txt
-    current_user_agent = None
-    rules = []
+    # Compile once; every crawler in the audit reuses this policy
+    policy = RobotsPolicy.parse(content)
+    store_robots_policy(url, policy)
+    rules = policy.rules
+    result["sitemaps"] = list(policy.sitemaps)
 
-    for line in content.split("\n"):
-        line = line.strip()
-
-        # Skip comments and empty lines
-        if not line or line.startswith("#"):
-            continue
-
-        # Parse directive
-        if ":" in line:
-            directive, value = line.split(":", 1)
-            directive = directive.strip().lower()
-            value = value.strip()
-
-            if directive == "user-agent":
-                current_user_agent = value
-            elif directive == "disallow":
-                rules.append(
-                    {
-                        "user_agent": current_user_agent or "*",
-                        "type": "disallow",
-                        "path": value,
-                    }
-                )
-            elif directive == "allow":
-                rules.append(
-                    {
-                        "user_agent": current_user_agent or "*",
-                        "type": "allow",
-                        "path": value,
-                    }
-                )
-            elif directive == "sitemap":
-                result["sitemaps"].append(value)
-            elif directive == "crawl-delay":
-                result["issues"].append(
-                    CrawlIssue(
-                        severity="low",
-                        category="robots",
-                        description=f"Crawl-delay directive found ({value}s)",
-                        recommendation="Crawl-delay may slow down indexing; consider removing if not needed",
-                    )
-                )
+    for value in dict.fromkeys(policy.crawl_delays.values()):
+        result["issues"].append(
+            CrawlIssue(
+                severity="low",
+                category="robots",
+                description=f"Crawl-delay directive found ({value:g}s)",
+                recommendation="Crawl-delay may slow down indexing; consider removing if not needed",
+            )
+        )
 
     result["rules"] = rules
 
@@ -247,13 +238,23 @@ def check_robots(url: str) -> dict[str, Any]:
     return result
 
 
-def check_sitemaps(url: str, sitemap_urls: Optional[list[str]] = None) -> dict[str, Any]:
+def check_sitemaps(
+    url: str,
+    sitemap_urls: Optional[list[str]] = None,
+    sink: Optional[UrlSink] = None,
+) -> dict[str, Any]:
     """
     Analyze XML sitemaps.
 
+    Sitemaps are streamed (gzip included) rather than loaded whole, child
+    sitemaps of an index are fetched concurrently and at most once, and the
+    SITEMAP_MAX_* budgets bound the work for very large sites.
+
     Args:
         url: Base URL of the site
         sitemap_urls: Optional list of known sitemap URLs
+        sink: Optional UrlSink (e.g. ReservoirSample, DiskUrlSet) that receives
+            each unique page URL, for seeding a crawl
 
     Returns:
         Dict with sitemap analysis
@@ -279,64 +280,36 @@ def check_sitemaps(url: str, sitemap_urls: Optional[list[str]] = None) -> dict[s
         for loc in default_locations:
             sitemaps_to_check.append(urljoin(base_url, loc))
 
-    found_urls: set[str] = set()
-
-    for sitemap_url in sitemaps_to_check:
-        content = fetch_url(sitemap_url)
-
-        if not content:
+    reader = SitemapReader(
+        sink=sink,
+        fetch=lambda sitemap_url: stream_url(
+            sitemap_url, _config.crawl_timeout, _config.crawl_user_agent
+        ),
+    )
+    report = reader.read(list(dict.fromkeys(sitemaps_to_check)))
+
+    for document in report.documents:
+        if document.error and document.error.startswith("fetch error"):
+            # Missing sitemaps at default locations are normal
+            logger.debug(f"Sitemap not fetched: {document.url} ({document.error})")
             continue
 
-        sitemap_data = {
-            "url": sitemap_url,
-            "type": "unknown",
-            "urls": [],
-            "child_sitemaps": [],
-        }
-
-        try:
-            # Parse XML
-            root = ET.fromstring(content)
-
-            # Remove namespace for easier parsing
-            namespace = ""
-            if root.tag.startswith("{"):
-                namespace = root.tag.split("}")[0] + "}"
-
-            # Check if it's a sitemap index
-            if "sitemapindex" in root.tag.lower():
-                sitemap_data["type"] = "index"
-
-                for sitemap in root.findall(f".//{namespace}sitemap"):
-                    loc = sitemap.find(f"{namespace}loc")
-                    if loc is not None and loc.text:
-                        sitemap_data["child_sitemaps"].append(loc.text)
-                        # Recursively check child sitemaps
-                        sitemaps_to_check.append(loc.text)
-
-            elif "urlset" in root.tag.lower():
-                sitemap_data["type"] = "urlset"
-
-                for url_elem in root.findall(f".//{namespace}url"):
-                    loc = url_elem.find(f"{namespace}loc")
-                    if loc is not None and loc.text:
-                        sitemap_data["urls"].append(loc.text)
-                        found_urls.add(loc.text)
-
-            result["sitemaps_found"].append(sitemap_data)
-
-        except ET.ParseError:
+        if document.error:
             result["issues"].append(
                 {
                     "severity": "high",
                     "category": "sitemap",
-                    "description": f"Sitemap XML parse error: {sitemap_url}",
-                    "url": sitemap_url,
+                    "description": f"Sitemap XML parse error: {document.url}",
+                    "url": document.url,
                     "recommendation": "Fix XML syntax errors in sitemap",
                 }
             )
+            continue
 
-    result["total_urls"] = len(found_urls)
+        result["sitemaps_found"].append(document.to_dict())
+
+    result["total_urls"] = report.total_urls
+    result["truncated"] = report.url_budget_reached or report.sitemap_budget_reached
 
     # Check for issues
     if not result["sitemaps_found"]:
@@ -351,7 +324,7 @@ def check_sitemaps(url: str, sitemap_urls: Optional[list[str]] = None) -> dict[s
 
     # Check for large sitemaps
     for sitemap in result["sitemaps_found"]:
-        if len(sitemap.get("urls", [])) > 50000:
+        if sitemap["url_count"] > SITEMAP_PROTOCOL_URL_LIMIT:
             result["issues"].append(
                 {
                     "severity": "medium",
@@ -362,6 +335,16 @@ def check_sitemaps(url: str, sitemap_urls: Optional[list[str]] = None) -> dict[s
                 }
             )
 
+    if report.duplicate_sitemaps:
+        result["issues"].append(
+            {
+                "severity": "low",
+                "category": "sitemap",
+                "description": "Sitemap index references the same sitemap more than once",
+                "recommendation": "Remove duplicate and self-referencing sitemap index entries",
+            }
+        )
+
     # Calculate score (contributes to indexing score)
     score = 15
     for issue in result["issues"]:
@@ -379,6 +362,21 @@ def check_sitemaps(url: str, sitemap_urls: Optional[list[str]] = None) -> dict[s
     return result
 
 
+@observed(
+    ObservationKind.SITEMAP,
+    params=("sitemap_urls",),
+    keep=lambda result: bool(result["sitemaps_found"]),
+)
+def check_shared_sitemaps(url: str, sitemap_urls: list[str]) -> dict[str, Any]:
+    """
+    check_sitemaps(), shared with other audits of the site while fresh.
+
+    Only stored when a sitemap was actually read, so a failed or timed-out
+    fetch is retried by the next audit rather than served as "no sitemap".
+    """
+    return check_sitemaps(url, sitemap_urls)
+
+
 def check_redirects(url: str, max_chain: int = 5) -> dict[str, Any]:
     """
     Check for redirect chains and issues.
@@ -497,15 +495,7 @@ def analyze_meta_robots(html: str, url: str) -> dict[str, Any]:
     """
     result = {"directives": [], "indexable": True, "followable": True, "issues": []}
 
-    # Find meta robots tags
-    robots_pattern = r'<meta[^>]*name=["\']robots["\'][^>]*content=["\']([^"\']+)["\']'
-    matches = re.findall(robots_pattern, html, re.IGNORECASE)
-
-    # Also check for reverse order
-    robots_pattern_alt = r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']robots["\']'
-    matches.extend(re.findall(robots_pattern_alt, html, re.IGNORECASE))
-
-    for match in matches:
+    for match in parse_page(html).meta_all("robots"):
         directives = [d.strip().lower() for d in match.split(",")]
         result["directives"].extend(directives)
 
@@ -549,17 +539,10 @@ def analyze_canonical(html: str, page_url: str) -> dict[str, Any]:
     """
     result = {"canonical_url": None, "is_self_referencing": False, "issues": []}
 
-    # Find canonical tag
-    canonical_pattern = r'<link[^>]*rel=["\']canonical["\'][^>]*href=["\']([^"\']+)["\']'
-    match = re.search(canonical_pattern, html, re.IGNORECASE)
+    canonical_url = parse_page(html).canonical
 
-    if not match:
-        # Try reverse order
-        canonical_pattern_alt = r'<link[^>]*href=["\']([^"\']+)["\'][^>]*rel=["\']canonical["\']'
-        match = re.search(canonical_pattern_alt, html, re.IGNORECASE)
-
-    if match:
-        result["canonical_url"] = match.group(1)
+    if canonical_url:
+        result["canonical_url"] = canonical_url
 
         # Check if self-referencing
         canonical = result["canonical_url"].rstrip("/")
@@ -613,15 +596,16 @@ def analyze_internal_links(html: str, page_url: str, base_url: str) -> dict[str,
         "issues": [],
     }
 
-    # Find all links
-    link_pattern = r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>'
-    matches = re.findall(link_pattern, html, re.IGNORECASE | re.DOTALL)
-
     parsed_base = urlparse(base_url)
     base_domain = parsed_base.netloc
 
-    for href, _anchor_text in matches:
+    for anchor in parse_page(html).anchors:
+        href = anchor.href
+        if not href:
+            continue
         result["total_links"] += 1
+        if "nofollow" in anchor.rel.split():
+            result["nofollow_links"] += 1
 
         # Skip javascript, mailto, tel links
         if href.startswith(("javascript:", "mailto:", "tel:", "#")):
@@ -662,6 +646,7 @@ def analyze_internal_links(html: str, page_url: str, base_url: str) -> dict[str,
     return result
 
 
+@traced(Stage.ANALYZE)
 def analyze_crawlability(url: str, depth: int = 50, check_pages: bool = True) -> dict[str, Any]:
     """
     Comprehensive crawlability analysis.
@@ -691,8 +676,7 @@ def analyze_crawlability(url: str, depth: int = 50, check_pages: bool = True) ->
     result["issues"].extend(robots_result.get("issues", []))
 
     # Check sitemaps
-    sitemap_urls = robots_result.get("sitemaps", [])
-    sitemaps_result = check_sitemaps(url, sitemap_urls)
+    sitemaps_result = check_shared_sitemaps(url, robots_result.get("sitemaps", []))
     result["sitemaps"] = sitemaps_result
     result["issues"].extend(sitemaps_result.get("issues", []))
 
@@ -0,0 +1,311 @@
+"""
+Streaming Sitemap Reader
+
+Reads XML sitemaps and sitemap indexes incrementally. Responses are streamed
+through gzip decompression (for .xml.gz sitemaps) into an XML pull parser,
+so a sitemap is never held in memory as a whole and parsed elements are
+discarded as soon as their <loc> has been read. Child sitemaps are fetched
+concurrently, each at most once, and URL, byte and sitemap-count budgets
+cap the work done for very large sites.
+"""
+
+import os
+import random
+import sqlite3
+import threading
+import xml.etree.ElementTree as ET
+import zlib
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Protocol
+
+# Unique page URLs read before stopping (also bounds the in-memory dedupe set)
+SITEMAP_MAX_URLS = int(os.getenv("SITEMAP_MAX_URLS", "200000"))
+# Decompressed bytes read per sitemap; the protocol limit is 50MB
+SITEMAP_MAX_BYTES = int(os.getenv("SITEMAP_MAX_BYTES", str(50 * 1024 * 1024)))
+# Sitemap documents fetched per site, index files included
+SITEMAP_MAX_SITEMAPS = int(os.getenv("SITEMAP_MAX_SITEMAPS", "500"))
+SITEMAP_FETCH_CONCURRENCY = int(os.getenv("SITEMAP_FETCH_CONCURRENCY", "8"))
+SITEMAP_CHUNK_SIZE = 64 * 1024
+
+# Per the sitemaps.org protocol a single sitemap may list at most this many URLs
+SITEMAP_PROTOCOL_URL_LIMIT = 50000
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class UrlSink(Protocol):
+    """Receives each unique page URL found in the sitemaps."""
+
+    def add(self, url: str) -> None: ...
+
+
+class ReservoirSample:
+    """Keeps a uniform random sample of `size` URLs out of any number seen."""
+
+    def __init__(self, size: int, seed: Optional[int] = None):
+        self.size = size
+        self.seen = 0
+        self.urls: list[str] = []
+        self._random = random.Random(seed)
+
+    def add(self, url: str) -> None:
+        self.seen += 1
+        if len(self.urls) < self.size:
+            self.urls.append(url)
+            return
+        slot = self._random.randrange(self.seen)
+        if slot < self.size:
+            self.urls[slot] = url
+
+
+class DiskUrlSet:
+    """On-disk set of URLs (SQLite), for crawl seeding beyond what fits in memory."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY)")
+        self._lock = threading.Lock()
+
+    def add(self, url: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR IGNORE INTO urls (url) VALUES (?)", (url,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            self._conn.commit()
+        for (url,) in self._conn.execute("SELECT url FROM urls ORDER BY url"):
+            yield url
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+@dataclass
+class SitemapDocument:
+    """What was read from one sitemap file."""
+
+    url: str
+    type: str = "unknown"
+    url_count: int = 0
+    child_sitemaps: list[str] = field(default_factory=list)
+    bytes_read: int = 0
+    truncated: bool = False
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "type": self.type,
+            "url_count": self.url_count,
+            "child_sitemaps": self.child_sitemaps,
+            "bytes_read": self.bytes_read,
+            "truncated": self.truncated,
+        }
+
+
+@dataclass
+class SitemapReport:
+    """Result of reading a site's sitemaps."""
+
+    documents: list[SitemapDocument] = field(default_factory=list)
+    total_urls: int = 0
+    url_budget_reached: bool = False
+    sitemap_budget_reached: bool = False
+    duplicate_sitemaps: int = 0
+
+
+def stream_url(
+    url: str, timeout: int = 30, user_agent: str = "SEO-Health-Report-Bot/1.0"
+) -> Iterator[bytes]:
+    """Yield the raw response body of `url` in chunks."""
+    import requests
+
+    headers = {"User-Agent": user_agent}
+    with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        yield from response.iter_content(SITEMAP_CHUNK_SIZE)
+
+
+def _decoded(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Pass chunks through, gunzipping on the fly when the body is gzip."""
+    decompressor = None
+    first = True
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if first:
+            first = False
+            if chunk[:2] == GZIP_MAGIC:
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            else:
+                # Tolerate whitespace before the XML declaration
+                chunk = chunk.lstrip()
+        if decompressor is not None:
+            # Bound each step so a compression bomb can't expand past the budget
+            data = decompressor.decompress(chunk, SITEMAP_CHUNK_SIZE)
+            while data:
+                yield data
+                data = decompressor.decompress(decompressor.unconsumed_tail, SITEMAP_CHUNK_SIZE)
+        else:
+            yield chunk
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+class SitemapReader:
+    """
+    Reads a site's sitemaps with bounded memory.
+
+    Unique page URLs are counted (and optionally passed to `sink`) as they
+    are parsed; nothing but the dedupe set, capped at `max_urls`, grows
+    with the size of the sitemaps.
+    """
+
+    def __init__(
+        self,
+        max_urls: int = SITEMAP_MAX_URLS,
+        max_bytes: int = SITEMAP_MAX_BYTES,
+        max_sitemaps: int = SITEMAP_MAX_SITEMAPS,
+        concurrency: int = SITEMAP_FETCH_CONCURRENCY,
+        sink: Optional[UrlSink] = None,
+        fetch: Callable[[str], Iterable[bytes]] = stream_url,
+    ):
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.max_sitemaps = max_sitemaps
+        self.concurrency = concurrency
+        self.sink = sink
+        self.fetch = fetch
+        self._seen_urls: set[str] = set()
+        self._lock = threading.Lock()
+
+    def read(self, sitemap_urls: list[str]) -> SitemapReport:
+        """Read `sitemap_urls` and every sitemap they reference, once each."""
+        report = SitemapReport()
+        visited: set[str] = set()
+        pending: list[str] = []
+
+        def enqueue(urls: Iterable[str]) -> None:
+            for url in urls:
+                if url in visited:
+                    report.duplicate_sitemaps += 1
+                elif len(visited) >= self.max_sitemaps:
+                    report.sitemap_budget_reached = True
+                else:
+                    visited.add(url)
+                    pending.append(url)
+
+        enqueue(sitemap_urls)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            running = set()
+            while pending or running:
+                while pending and not self._budget_reached():
+                    running.add(pool.submit(self._read_document, pending.pop(0)))
+                if not running:
+                    break
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    document = future.result()
+                    report.documents.append(document)
+                    enqueue(document.child_sitemaps)
+
+        report.total_urls = len(self._seen_urls)
+        report.url_budget_reached = self._budget_reached()
+        return report
+
+    def _budget_reached(self) -> bool:
+        return len(self._seen_urls) >= self.max_urls
+
+    def _add_url(self, url: str) -> bool:
+        with self._lock:
+            if url in self._seen_urls:
+                return True
+            if len(self._seen_urls) >= self.max_urls:
+                return False
+            self._seen_urls.add(url)
+        if self.sink is not None:
+            self.sink.add(url)
+        return True
+
+    def _read_document(self, url: str) -> SitemapDocument:
+        document = SitemapDocument(url=url)
+        parser = ET.XMLPullParser(events=("start", "end"))
+        root = None
+        chunks = None
+        try:
+            chunks = self.fetch(url)
+            for data in _decoded(chunks):
+                if document.bytes_read + len(data) > self.max_bytes:
+                    data = data[: self.max_bytes - document.bytes_read]
+                    document.truncated = True
+                document.bytes_read += len(data)
+                parser.feed(data)
+                for event, elem in parser.read_events():
+                    if event == "start":
+                        if root is None:
+                            root = elem
+                            document.type = self._document_type(elem.tag)
+                        continue
+                    if not self._handle_end(document, root, elem):
+                        document.truncated = True
+                        break
+                if document.truncated:
+                    break
+            if not document.truncated:
+                parser.close()
+        except ET.ParseError as e:
+            document.error = f"parse error: {e}"
+        except Exception as e:
+            document.error = f"fetch error: {e}"
+        finally:
+            # Stop downloading when a budget ends the read early
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        return document
+
+    @staticmethod
+    def _document_type(tag: str) -> str:
+        name = _local_name(tag)
+        if name == "sitemapindex":
+            return "index"
+        if name == "urlset":
+            return "urlset"
+        return "unknown"
+
+    def _handle_end(self, document: SitemapDocument, root: Any, elem: Any) -> bool:
+        """Handle a closed element; False once the URL budget stops the read."""
+        name = _local_name(elem.tag)
+        if name not in ("url", "sitemap"):
+            return True
+
+        loc = next((child.text for child in elem if _local_name(child.tag) == "loc"), None)
+        # Drop the parsed entry so memory stays flat however long the file is
+        if elem in root:
+            root.remove(elem)
+        else:
+            elem.clear()
+        if not loc or not loc.strip():
+            return True
+        loc = loc.strip()
+
+        if name == "sitemap" and document.type == "index":
+            if len(document.child_sitemaps) < self.max_sitemaps:
+                document.child_sitemaps.append(loc)
+            return True
+        if name == "url" and document.type == "urlset":
+            if not self._add_url(loc):
+                return False
+            document.url_count += 1
+        return True
@@ -5,10 +5,13 @@ Extract and validate JSON-LD, Microdata, and RDFa structured data.
 """
 
 import json
-import re
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from packages.core.observations import ObservationKind, observed
+from packages.core.parsed_page import parse_page
+from packages.core.tracing import Stage, traced
+
 
 @dataclass
 class SchemaIssue:
@@ -53,6 +56,8 @@ RECOMMENDED_PROPERTIES = {
 }
 
 
+@observed(ObservationKind.PAGE)
+@traced(Stage.FETCH)
 def fetch_page(url: str, timeout: int = 30) -> Optional[str]:
     """Fetch HTML content from URL."""
     try:
@@ -78,13 +83,9 @@ def extract_json_ld(html: str) -> list[dict[str, Any]]:
     """
     results = []
 
-    # Find all JSON-LD script tags
-    pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-    matches = re.findall(pattern, html, re.DOTALL | re.IGNORECASE)
-
-    for match in matches:
+    for match in parse_page(html).json_ld:
         try:
-            data = json.loads(match.strip())
+            data = json.loads(match)
 
             # Handle single object or array
             if isinstance(data, list):
@@ -111,11 +112,7 @@ def extract_microdata(html: str) -> list[dict[str, Any]]:
     """
     results = []
 
-    # Find itemscope elements
-    itemscope_pattern = r'<[^>]+itemscope[^>]*itemtype=["\']([^"\']+)["\'][^>]*>'
-    matches = re.findall(itemscope_pattern, html, re.IGNORECASE)
-
-    for itemtype in matches:
+    for itemtype in parse_page(html).microdata_types:
         # Extract schema type from URL
         schema_type = itemtype.split("/")[-1]
         results.append({"@type": schema_type, "_format": "microdata", "_itemtype": itemtype})
@@ -135,11 +132,7 @@ def extract_rdfa(html: str) -> list[dict[str, Any]]:
     """
     results = []
 
-    # Find typeof attributes
-    typeof_pattern = r'typeof=["\']([^"\']+)["\']'
-    matches = re.findall(typeof_pattern, html, re.IGNORECASE)
-
-    for typeof in matches:
+    for typeof in parse_page(html).rdfa_types:
         results.append({"@type": typeof, "_format": "rdfa"})
 
     return results
@@ -329,6 +322,22 @@ def validate_structured_data(url: str) -> dict[str, Any]:
     Args:
         url: URL to validate
 
+    Returns:
+        Dict with complete validation results (0-15 score)
+    """
+    return validate_structured_html(url, fetch_page(url))
+
+
+def validate_structured_html(url: str, html: Optional[str]) -> dict[str, Any]:
+    """
+    Structured data validation of an already fetched page.
+
+    Pure CPU work on picklable inputs, so it can run in the analysis pool.
+
+    Args:
+        url: Page URL
+        html: HTML content, or None if the page could not be fetched
+
     Returns:
         Dict with complete validation results (0-15 score)
     """
@@ -342,9 +351,6 @@ def validate_structured_data(url: str) -> dict[str, Any]:
         "findings": [],
     }
 
-    # Fetch page
-    html = fetch_page(url)
-
     if not html:
         result["issues"].append(
             {
@@ -454,4 +460,5 @@ __all__ = [
     "validate_schema",
     "check_rich_results_eligibility",
     "validate_structured_data",
+    "validate_structured_html",
 ]
@@ -6,10 +6,18 @@ from packages.storage.client import (
     StorageBackend,
     get_storage_backend,
 )
+from packages.storage.results import (
+    fetch_audit_result,
+    load_audit_result,
+    store_audit_result,
+)
 
 __all__ = [
     "StorageBackend",
     "LocalStorageBackend",
     "S3StorageBackend",
     "get_storage_backend",
+    "store_audit_result",
+    "fetch_audit_result",
+    "load_audit_result",
 ]
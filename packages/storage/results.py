@@ -0,0 +1,194 @@
+"""Compressed offload of audit result documents to the storage backend.
+
+Full audit results (raw crawl data, robots.txt content, issue lists) can run
+to megabytes. Keeping them in ``audits.result`` means every ORM load of an
+audit row drags the whole document across the wire. Results larger than
+``AUDIT_RESULT_INLINE_MAX_BYTES`` are instead compressed and written to the
+storage backend, and the row keeps only a ``result_key`` pointer.
+
+zstd is used when the ``zstandard`` package is installed; gzip otherwise.
+Blobs are decoded by their magic bytes, so either codec can be read back
+regardless of which one wrote it.
+"""
+
+import gzip
+import io
+import json
+import logging
+import os
+from collections.abc import Iterator
+from typing import Any, Optional
+
+from packages.storage.client import StorageBackend, get_storage_backend
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+AUDIT_RESULT_INLINE_MAX_BYTES = int(os.getenv("AUDIT_RESULT_INLINE_MAX_BYTES", "8192"))
+AUDIT_RESULT_ZSTD_LEVEL = int(os.getenv("AUDIT_RESULT_ZSTD_LEVEL", "6"))
+AUDIT_RESULT_PREFIX = "audit-results"
+AUDIT_RESULT_STREAM_CHUNK = int(os.getenv("AUDIT_RESULT_STREAM_CHUNK", str(64 * 1024)))
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_backend: Optional[StorageBackend] = None
+
+
+def _get_backend() -> StorageBackend:
+    """Get the process-wide storage backend, creating it on first use."""
+    global _backend
+    if _backend is None:
+        _backend = get_storage_backend()
+    return _backend
+
+
+def compress_result(result: Any) -> tuple[bytes, str]:
+    """Serialize and compress a result document.
+
+    Args:
+        result: JSON-serializable result document.
+
+    Returns:
+        Tuple of (compressed bytes, file extension for the codec used).
+    """
+    data = json.dumps(result, default=str, separators=(",", ":")).encode("utf-8")
+    if ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=AUDIT_RESULT_ZSTD_LEVEL).compress(data), "zst"
+    return gzip.compress(data, compresslevel=6), "gz"
+
+
+def decompress_result(blob: bytes) -> Any:
+    """Decode a blob written by ``compress_result``.
+
+    Raises:
+        ValueError: If the blob uses an unknown or unavailable codec.
+    """
+    if blob.startswith(_ZSTD_MAGIC):
+        if not ZSTD_AVAILABLE:
+            raise ValueError(
+                "zstandard is required to read this result. Install it with: pip install zstandard"
+            )
+        data = zstandard.ZstdDecompressor().decompress(blob)
+    elif blob.startswith(_GZIP_MAGIC):
+        data = gzip.decompress(blob)
+    else:
+        raise ValueError("Unrecognized result blob encoding")
+    return json.loads(data)
+
+
+def iter_decompressed(blob: bytes, chunk_size: int = AUDIT_RESULT_STREAM_CHUNK) -> Iterator[bytes]:
+    """Yield the serialized JSON of a result blob in chunks without decoding it.
+
+    Raises:
+        ValueError: If the blob uses an unknown or unavailable codec.
+    """
+    if blob.startswith(_ZSTD_MAGIC):
+        if not ZSTD_AVAILABLE:
+            raise ValueError(
+                "zstandard is required to read this result. Install it with: pip install zstandard"
+            )
+        reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(blob))
+    elif blob.startswith(_GZIP_MAGIC):
+        reader = gzip.GzipFile(fileobj=io.BytesIO(blob))
+    else:
+        raise ValueError("Unrecognized result blob encoding")
+
+    with reader:
+        while True:
+            chunk = reader.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def result_key_for(audit_id: str, tenant_id: Optional[str], extension: str) -> str:
+    """Build the storage key for an audit result blob."""
+    return f"{AUDIT_RESULT_PREFIX}/{tenant_id or 'default'}/{audit_id}.json.{extension}"
+
+
+def store_audit_result(
+    audit_id: str,
+    result: Any,
+    tenant_id: Optional[str] = None,
+    backend: Optional[StorageBackend] = None,
+    inline_max_bytes: Optional[int] = None,
+) -> tuple[Optional[Any], Optional[str]]:
+    """Decide where an audit result lives and offload it if it is large.
+
+    Args:
+        audit_id: Audit the result belongs to.
+        result: JSON-serializable result document.
+        tenant_id: Owning tenant, used to namespace the storage key.
+        backend: Storage backend (defaults to the configured backend).
+        inline_max_bytes: Override for ``AUDIT_RESULT_INLINE_MAX_BYTES``.
+
+    Returns:
+        Tuple of (value for ``audits.result``, value for ``audits.result_key``).
+        Exactly one of the two is set for a non-empty result.
+    """
+    if result is None:
+        return None, None
+
+    limit = AUDIT_RESULT_INLINE_MAX_BYTES if inline_max_bytes is None else inline_max_bytes
+    serialized_size = len(json.dumps(result, default=str, separators=(",", ":")))
+    if serialized_size <= limit:
+        return result, None
+
+    blob, extension = compress_result(result)
+    key = result_key_for(audit_id, tenant_id, extension)
+    content_type = "application/zstd" if extension == "zst" else "application/gzip"
+    (backend or _get_backend()).upload(key, blob, content_type=content_type)
+    logger.info(
+        f"Offloaded result for audit {audit_id}: {serialized_size} bytes -> {len(blob)} ({key})"
+    )
+    return None, key
+
+
+def download_result_blob(result_key: str, backend: Optional[StorageBackend] = None) -> bytes:
+    """Download the compressed blob for an offloaded result.
+
+    Raises:
+        FileNotFoundError: If the blob is missing from storage.
+    """
+    return (backend or _get_backend()).download(result_key)
+
+
+def fetch_audit_result(result_key: str, backend: Optional[StorageBackend] = None) -> Any:
+    """Download and decode an offloaded result.
+
+    Raises:
+        FileNotFoundError: If the blob is missing from storage.
+    """
+    return decompress_result(download_result_blob(result_key, backend))
+
+
+def load_audit_result(audit: Any, backend: Optional[StorageBackend] = None) -> Optional[Any]:
+    """Return the full result for an audit row, wherever it is stored.
+
+    Offloaded results are fetched from storage; legacy rows fall back to the
+    inline ``audits.result`` column. A missing blob is logged and treated as
+    no result rather than failing the request.
+    """
+    result_key = getattr(audit, "result_key", None)
+    if isinstance(result_key, str) and result_key:
+        try:
+            return fetch_audit_result(result_key, backend)
+        except FileNotFoundError:
+            logger.warning(f"Result blob missing for audit {audit.id}: {result_key}")
+            return None
+    return audit.result
+
+
+def delete_audit_result(result_key: Optional[str], backend: Optional[StorageBackend] = None) -> bool:
+    """Delete an offloaded result blob. Returns False if there was none."""
+    if not result_key:
+        return False
+    return (backend or _get_backend()).delete(result_key)
@@ -0,0 +1 @@
+"""Offline performance benchmarks against a local fixture web farm."""
@@ -0,0 +1,9 @@
+"""Entry point: python -m tests.benchmark run ..."""
+
+import sys
+
+from tests.benchmark.harness import main
+
+# Guarded: analysis pool processes re-import the main module when spawned
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,462 @@
+"""
+Local fixture web farm for offline benchmarks.
+
+One asyncio HTTP server stands in for every site an audit touches. Audit
+processes send their traffic to it as an HTTP proxy (HTTP_PROXY), so the
+request line carries the absolute URL and the farm routes on its host:
+
+- fixture sites from tests/fixtures/sites.py, served over http
+- synthetic sites with thousands of pages and giant (optionally gzipped,
+  sitemap-index) sitemaps, with per-host latency and request-rate throttling
+- stub PageSpeed Insights and LLM APIs with configurable latency
+
+Unknown hosts get a 404 and HTTPS tunnels (CONNECT) are refused, so nothing
+leaves the machine. Every request is counted per host.
+"""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from tests.fixtures.mock_responses import (
+    build_html_page,
+    build_robots_txt,
+    build_sitemap_xml,
+    get_mock_responses,
+)
+from tests.fixtures.sites import FIXTURE_SITES
+
+# Hosts of the stub APIs (reached through the proxy like any other site)
+PSI_HOST = "psi.bench.test"
+LLM_HOST = "llm.bench.test"
+
+# URLs per child sitemap (the sitemaps.org limit)
+SITEMAP_URLS_PER_FILE = 50_000
+
+REASONS = {
+    200: "OK",
+    301: "Moved Permanently",
+    302: "Found",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+}
+
+
+@dataclass
+class FarmResponse:
+    """A canned HTTP response."""
+
+    status: int = 200
+    body: bytes = b""
+    content_type: str = "text/html; charset=utf-8"
+    headers: dict[str, str] = field(default_factory=dict)
+    # Seconds to wait before answering
+    delay: float = 0.0
+
+
+NOT_FOUND = FarmResponse(status=404, body=b"Not Found", content_type="text/plain")
+
+
+class Site:
+    """A host served by the farm."""
+
+    def __init__(
+        self,
+        host: str,
+        latency: float = 0.0,
+        max_rps: Optional[int] = None,
+        company_name: Optional[str] = None,
+        keywords: Optional[list[str]] = None,
+    ):
+        self.host = host
+        # What the audit of this site is told about the business
+        self.company_name = company_name or host
+        self.keywords = keywords or ["synthetic", "benchmark"]
+        # Seconds added to every response
+        self.latency = latency
+        # Requests per second before the host answers 429 (None: unlimited)
+        self.max_rps = max_rps
+        self._recent: deque[float] = deque()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}"
+
+    def throttled(self) -> bool:
+        if self.max_rps is None:
+            return False
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] >= 1.0:
+            self._recent.popleft()
+        if len(self._recent) >= self.max_rps:
+            return True
+        self._recent.append(now)
+        return False
+
+    def respond(self, method: str, path: str, body: bytes) -> FarmResponse:
+        raise NotImplementedError
+
+
+class StaticSite(Site):
+    """A site answering from a fixed path -> response table."""
+
+    def __init__(self, host: str, responses: dict[str, FarmResponse], **kwargs):
+        super().__init__(host, **kwargs)
+        self.responses = responses
+
+    def respond(self, method: str, path: str, body: bytes) -> FarmResponse:
+        return self.responses.get(path) or self.responses.get(path.split("?")[0]) or NOT_FOUND
+
+
+def fixture_site(name: str, **kwargs) -> StaticSite:
+    """
+    Serve a FIXTURE_SITES entry.
+
+    The fixture's https URLs are rewritten to http, since the farm does not
+    terminate TLS; each response keeps the fixture's response time.
+    """
+    fixture = FIXTURE_SITES[name]
+    origin = fixture.url.rstrip("/")
+    host = urlsplit(origin).hostname
+    responses = {}
+    for url, mock in get_mock_responses(name).items():
+        path = urlsplit(url).path or "/"
+        headers = {}
+        if mock.redirect_to:
+            headers["Location"] = mock.redirect_to.replace("https://", "http://")
+        responses[path] = FarmResponse(
+            status=mock.status_code,
+            body=mock.content.replace("https://", "http://").encode(),
+            content_type=mock.content_type,
+            headers={**mock.headers, **headers},
+            delay=mock.response_time_ms / 1000,
+        )
+    kwargs.setdefault("company_name", fixture.company_name)
+    kwargs.setdefault("keywords", fixture.keywords)
+    return StaticSite(host, responses, **kwargs)
+
+
+class SyntheticSite(Site):
+    """
+    A generated site of `pages` pages.
+
+    Every page links to the next few, and the sitemap lists all of them: one
+    urlset up to SITEMAP_URLS_PER_FILE URLs, a sitemap index over gzipped or
+    plain children above that. Responses are built on demand.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        pages: int,
+        gzip_sitemaps: bool = False,
+        words_per_page: int = 400,
+        **kwargs,
+    ):
+        super().__init__(host, **kwargs)
+        self.pages = pages
+        self.gzip_sitemaps = gzip_sitemaps
+        self.words_per_page = words_per_page
+
+    def page_url(self, number: int) -> str:
+        return f"{self.url}/" if number == 0 else f"{self.url}/page-{number}"
+
+    @property
+    def sitemap_files(self) -> int:
+        return -(-self.pages // SITEMAP_URLS_PER_FILE)
+
+    def respond(self, method: str, path: str, body: bytes) -> FarmResponse:
+        path = path.split("?")[0]
+        if path == "/robots.txt":
+            robots = build_robots_txt(sitemap_urls=[f"{self.url}/sitemap.xml"])
+            return FarmResponse(body=robots.encode(), content_type="text/plain")
+        if path == "/sitemap.xml":
+            return self._sitemap_root()
+        if path.startswith("/sitemap-"):
+            return self._sitemap_child(path)
+        if path == "/":
+            return FarmResponse(body=self._page(0))
+        if path.startswith("/page-"):
+            number = path[len("/page-") :]
+            if number.isdigit() and 0 < int(number) < self.pages:
+                return FarmResponse(body=self._page(int(number)))
+        return NOT_FOUND
+
+    def _sitemap_root(self) -> FarmResponse:
+        if self.sitemap_files == 1:
+            return FarmResponse(body=self._urlset(0), content_type="application/xml")
+        suffix = ".xml.gz" if self.gzip_sitemaps else ".xml"
+        entries = "".join(
+            f"<sitemap><loc>{self.url}/sitemap-{n}{suffix}</loc></sitemap>"
+            for n in range(self.sitemap_files)
+        )
+        index = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}'
+            "</sitemapindex>"
+        )
+        return FarmResponse(body=index.encode(), content_type="application/xml")
+
+    def _sitemap_child(self, path: str) -> FarmResponse:
+        name = path[len("/sitemap-") :]
+        compressed = name.endswith(".gz")
+        number = name.removesuffix(".gz").removesuffix(".xml")
+        if not number.isdigit() or int(number) >= self.sitemap_files:
+            return NOT_FOUND
+        if compressed:
+            return FarmResponse(
+                body=self._urlset_gzip(int(number)), content_type="application/x-gzip"
+            )
+        return FarmResponse(body=self._urlset(int(number)), content_type="application/xml")
+
+    @lru_cache(maxsize=4)
+    def _urlset(self, file_number: int) -> bytes:
+        start = file_number * SITEMAP_URLS_PER_FILE
+        stop = min(start + SITEMAP_URLS_PER_FILE, self.pages)
+        urls = [self.page_url(n) for n in range(start, stop)]
+        return build_sitemap_xml(urls, include_lastmod=False).encode()
+
+    @lru_cache(maxsize=4)
+    def _urlset_gzip(self, file_number: int) -> bytes:
+        return gzip.compress(self._urlset(file_number), mtime=0)
+
+    def _page(self, number: int) -> bytes:
+        links = [self.page_url(n) for n in range(number + 1, min(number + 6, self.pages))]
+        sentence = f"Synthetic page {number} covers topic {number % 37} in plain words. "
+        paragraphs = "".join(
+            f"<h2>Section {section}</h2><p>{sentence * (self.words_per_page // 100)}</p>"
+            for section in range(10)
+        )
+        return build_html_page(
+            title=f"Page {number} | {self.host}",
+            description=f"Synthetic benchmark page {number}",
+            canonical=self.page_url(number),
+            internal_links=links,
+            body_content=paragraphs,
+        ).encode()
+
+
+class StubApiSite(Site):
+    """PageSpeed Insights and LLM chat APIs answering canned results."""
+
+    def __init__(self, host: str, latency: float = 0.0, **kwargs):
+        super().__init__(host, latency=latency, **kwargs)
+
+    def respond(self, method: str, path: str, body: bytes) -> FarmResponse:
+        route = path.split("?")[0]
+        if route.endswith("/runPagespeed"):
+            url = parse_qs(urlsplit(path).query).get("url", [""])[0]
+            return _json(_pagespeed_result(url))
+        if method != "POST":
+            return NOT_FOUND
+        prompt = _prompt(body)
+        answer = f"Here is an overview for: {prompt} Several local providers are well reviewed."
+        if route.endswith("/messages"):
+            return _json(
+                {
+                    "id": "msg_bench",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": "bench",
+                    "content": [{"type": "text", "text": answer}],
+                    "stop_reason": "end_turn",
+                    "usage": {"input_tokens": len(prompt) // 4, "output_tokens": 32},
+                }
+            )
+        if route.endswith("/chat/completions"):
+            return _json(
+                {
+                    "choices": [{"message": {"role": "assistant", "content": answer}}],
+                    "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": 32},
+                }
+            )
+        if route.endswith(":generateContent"):
+            return _json({"candidates": [{"content": {"parts": [{"text": answer}]}}]})
+        return NOT_FOUND
+
+
+def _json(data: dict) -> FarmResponse:
+    return FarmResponse(body=json.dumps(data).encode(), content_type="application/json")
+
+
+def _prompt(body: bytes) -> str:
+    try:
+        request = json.loads(body or b"{}")
+    except ValueError:
+        return ""
+    messages = request.get("messages") or []
+    if messages:
+        content = messages[-1].get("content", "")
+        return content if isinstance(content, str) else json.dumps(content)
+    contents = request.get("contents") or [{}]
+    return " ".join(part.get("text", "") for part in contents[-1].get("parts", []))
+
+
+def _pagespeed_result(url: str) -> dict:
+    def metric(value: float, display: str, score: float) -> dict:
+        return {"numericValue": value, "displayValue": display, "score": score}
+
+    return {
+        "id": url,
+        "lighthouseResult": {
+            "categories": {"performance": {"score": 0.82}},
+            "audits": {
+                "largest-contentful-paint": metric(2100, "2.1 s", 0.85),
+                "max-potential-fid": metric(90, "90 ms", 0.9),
+                "cumulative-layout-shift": metric(0.05, "0.05", 0.95),
+                "first-contentful-paint": metric(1200, "1.2 s", 0.9),
+                "server-response-time": metric(180, "180 ms", 1.0),
+                "speed-index": metric(2600, "2.6 s", 0.8),
+                "total-blocking-time": metric(150, "150 ms", 0.85),
+            },
+        },
+    }
+
+
+class WebFarm:
+    """
+    The farm's HTTP server.
+
+    Audits block their event loop on synchronous fetches, so the farm runs
+    its own loop on a background thread:
+
+        with WebFarm([fixture_site("healthy_plumber")]) as farm:
+            os.environ["HTTP_PROXY"] = farm.proxy_url
+    """
+
+    def __init__(self, sites: list[Site], api_latency: float = 0.0):
+        self.sites = {site.host: site for site in sites}
+        for host in (PSI_HOST, LLM_HOST):
+            self.sites.setdefault(host, StubApiSite(host, latency=api_latency))
+        self.requests: Counter = Counter()
+        self._server: Optional[asyncio.base_events.Server] = None
+        self.port = 0
+
+    @property
+    def proxy_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def add_site(self, site: Site) -> None:
+        self.sites[site.host] = site
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def __enter__(self) -> "WebFarm":
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def serve() -> None:
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+            loop.run_until_complete(self.stop())
+            loop.close()
+
+        self._thread = threading.Thread(target=serve, name="web-farm", daemon=True)
+        self._loop = loop
+        self._thread.start()
+        started.wait()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", "0") or 0)
+                body = await reader.readexactly(length) if length else b""
+
+                if method == "CONNECT":
+                    self.requests[target.split(":")[0]] += 1
+                    await self._write(writer, method, FarmResponse(status=405), close=True)
+                    break
+
+                response = await self._respond(method, target, headers, body)
+                close = headers.get("connection", "").lower() == "close"
+                await self._write(writer, method, response, close)
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> FarmResponse:
+        if target.startswith(("http://", "https://")):
+            parts = urlsplit(target)
+            host = parts.hostname or ""
+            path = parts.path or "/"
+            if parts.query:
+                path = f"{path}?{parts.query}"
+        else:
+            host = headers.get("host", "").split(":")[0]
+            path = target
+        host = host.lower()
+        self.requests[host] += 1
+
+        site = self.sites.get(host)
+        if site is None:
+            return NOT_FOUND
+        if site.throttled():
+            return FarmResponse(
+                status=429,
+                body=b"Slow down",
+                content_type="text/plain",
+                headers={"Retry-After": "1"},
+            )
+        response = site.respond(method, path, body)
+        delay = site.latency + response.delay
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+    @staticmethod
+    async def _write(
+        writer: asyncio.StreamWriter, method: str, response: FarmResponse, close: bool
+    ) -> None:
+        reason = REASONS.get(response.status, "Unknown")
+        head = [
+            f"HTTP/1.1 {response.status} {reason}",
+            f"Content-Type: {response.content_type}",
+            f"Content-Length: {len(response.body)}",
+            f"Connection: {'close' if close else 'keep-alive'}",
+        ]
+        head.extend(f"{name}: {value}" for name, value in response.headers.items())
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+        if method != "HEAD":
+            writer.write(response.body)
+        await writer.drain()
@@ -0,0 +1,343 @@
+"""
+Offline end-to-end audit benchmark.
+
+Runs full audits (run_full_audit plus scoring) against the local web farm
+and reports, per scenario:
+
+- throughput in audits per minute
+- p50/p95 wall-clock seconds per stage (browser crawl, technical, content,
+  AI visibility, scoring) and per audit
+- peak RSS of the process
+- HTTP requests per audit, as seen by the farm
+
+plus the cold-start import time of the API, worker and report entrypoints
+(see importtime.py).
+
+Results are written as sorted, indented JSON so a committed baseline diffs
+cleanly in review; --compare fails when a metric regresses past the
+tolerance.
+
+Usage:
+    python -m tests.benchmark run --scenario fixtures
+    python -m tests.benchmark run --scenario all --output tests/benchmark/baseline.json
+    python -m tests.benchmark run --compare
+    python -m tests.benchmark importtime --entrypoint api
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from tests.benchmark.farm import (
+    LLM_HOST,
+    PSI_HOST,
+    Site,
+    SyntheticSite,
+    WebFarm,
+    fixture_site,
+)
+from tests.benchmark.importtime import ENTRYPOINTS, measure_imports, startup_report
+from tests.fixtures.sites import FIXTURE_SITES
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+STAGES = ("browser_crawl", "technical", "content", "ai_visibility", "scoring", "total")
+
+# Relative change in a metric that counts as a regression
+DEFAULT_TOLERANCE = 0.25
+# Latency changes smaller than this many seconds are noise, whatever the ratio
+MIN_LATENCY_CHANGE = 0.05
+
+
+def _synthetic_sites() -> list[Site]:
+    return [
+        SyntheticSite("synthetic-1k.test", pages=1_000),
+        SyntheticSite("synthetic-100k.test", pages=100_000, gzip_sitemaps=True),
+        SyntheticSite("slow-host.test", pages=1_000, latency=0.2),
+        SyntheticSite("throttled-host.test", pages=1_000, max_rps=5),
+    ]
+
+
+def _fixture_sites() -> list[Site]:
+    return [fixture_site(name) for name in FIXTURE_SITES]
+
+
+# Scenario name -> sites audited (one audit per site per repeat)
+SCENARIOS: dict[str, Callable[[], list[Site]]] = {
+    "fixtures": _fixture_sites,
+    "synthetic": _synthetic_sites,
+}
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def configure_environment(farm: WebFarm, cache_dir: str) -> None:
+    """
+    Route every HTTP client through the farm and point APIs at its stubs.
+
+    Must run before the audit packages are imported: several read their
+    endpoints from the environment at import time.
+    """
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy"):
+        os.environ[name] = farm.proxy_url
+    for name in ("NO_PROXY", "no_proxy"):
+        os.environ.pop(name, None)
+    os.environ.update(
+        {
+            "SEO_HEALTH_CACHE_DIR": cache_dir,
+            # Every run measures cold fetches, like the fresh cache directory
+            "OBSERVATION_STORE_ENABLED": "false",
+            "SEO_HEALTH_PAGESPEED_ENDPOINT": f"http://{PSI_HOST}/runPagespeed",
+            "ANTHROPIC_BASE_URL": f"http://{LLM_HOST}",
+            "OPENAI_BASE_URL": f"http://{LLM_HOST}/v1",
+            "GEMINI_BASE_URL": f"http://{LLM_HOST}/v1beta",
+            "PERPLEXITY_BASE_URL": f"http://{LLM_HOST}",
+            "XAI_BASE_URL": f"http://{LLM_HOST}/v1",
+            "ANTHROPIC_API_KEY": "benchmark",
+            "OPENAI_API_KEY": "benchmark",
+        }
+    )
+    os.environ.pop("RENDER_SERVICE_URL", None)
+
+
+async def run_audit(url: str, company_name: str, keywords: list[str]) -> dict[str, float]:
+    """Run one full audit and return its stage timings in seconds."""
+    from packages.seo_health_report.scripts.calculate_scores import calculate_composite_score
+    from packages.seo_health_report.scripts.orchestrate import run_full_audit
+
+    started = time.perf_counter()
+    result = await run_full_audit(
+        target_url=url, company_name=company_name, primary_keywords=keywords
+    )
+    scoring_started = time.perf_counter()
+    calculate_composite_score(result)
+    finished = time.perf_counter()
+
+    timings = dict(result.get("stage_timings", {}))
+    timings["scoring"] = finished - scoring_started
+    timings["total"] = finished - started
+    return timings
+
+
+async def run_scenario(
+    farm: WebFarm, sites: list[Site], repeats: int, concurrency: int
+) -> dict[str, Any]:
+    """Audit every site `repeats` times, `concurrency` audits at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    before = sum(farm.requests.values())
+
+    async def audit(site: Site) -> dict[str, float]:
+        async with semaphore:
+            return await run_audit(f"{site.url}/", site.company_name, site.keywords)
+
+    started = time.perf_counter()
+    timings = await asyncio.gather(*(audit(site) for _ in range(repeats) for site in sites))
+    elapsed = time.perf_counter() - started
+    requests = sum(farm.requests.values()) - before
+
+    stages = {}
+    for stage in STAGES:
+        values = [t[stage] for t in timings if stage in t]
+        stages[stage] = {
+            "p50": round(percentile(values, 50), 3),
+            "p95": round(percentile(values, 95), 3),
+        }
+    return {
+        "audits": len(timings),
+        "throughput_audits_per_min": round(len(timings) / elapsed * 60, 2),
+        "stages": stages,
+        "http_requests_per_audit": round(requests / len(timings), 1),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_benchmark(
+    scenarios: list[str], repeats: int = 1, concurrency: int = 1, api_latency: float = 0.0
+) -> dict[str, Any]:
+    """Serve the farm, run the scenarios and return the report."""
+    sites = {name: SCENARIOS[name]() for name in scenarios}
+    all_sites = [site for scenario_sites in sites.values() for site in scenario_sites]
+
+    with tempfile.TemporaryDirectory() as cache_dir, WebFarm(
+        all_sites, api_latency=api_latency
+    ) as farm:
+        configure_environment(farm, cache_dir)
+        from packages.core.analysis_pool import get_analysis_pool
+
+        try:
+            results = {
+                name: asyncio.run(run_scenario(farm, scenario_sites, repeats, concurrency))
+                for name, scenario_sites in sites.items()
+            }
+        finally:
+            get_analysis_pool().shutdown()
+
+    return {
+        "settings": {
+            "repeats": repeats,
+            "concurrency": concurrency,
+            "api_latency": api_latency,
+            "python": sys.version.split()[0],
+        },
+        "scenarios": results,
+        "startup": startup_report(),
+    }
+
+
+def compare(
+    report: dict[str, Any], baseline: dict[str, Any], tolerance: float = DEFAULT_TOLERANCE
+) -> list[str]:
+    """
+    Metrics that got worse than the baseline by more than `tolerance`.
+
+    Returns:
+        One line per regression (empty when there is none)
+    """
+    regressions = []
+
+    def check(
+        label: str,
+        current: float,
+        previous: float,
+        higher_is_better: bool = False,
+        min_change: float = 0.0,
+    ):
+        if not previous or abs(current - previous) < min_change:
+            return
+        change = (current - previous) / previous
+        if (-change if higher_is_better else change) > tolerance:
+            regressions.append(f"{label}: {previous} -> {current} ({change:+.0%})")
+
+    for name, current in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        check(
+            f"{name} throughput_audits_per_min",
+            current["throughput_audits_per_min"],
+            previous["throughput_audits_per_min"],
+            higher_is_better=True,
+        )
+        check(
+            f"{name} http_requests_per_audit",
+            current["http_requests_per_audit"],
+            previous["http_requests_per_audit"],
+        )
+        check(f"{name} peak_rss_mb", current["peak_rss_mb"], previous["peak_rss_mb"])
+        for stage, latency in current["stages"].items():
+            previous_latency = previous["stages"].get(stage, {})
+            for pct in ("p50", "p95"):
+                check(
+                    f"{name} {stage} {pct}",
+                    latency[pct],
+                    previous_latency.get(pct, 0),
+                    min_change=MIN_LATENCY_CHANGE,
+                )
+    for name, current in report.get("startup", {}).items():
+        previous = baseline.get("startup", {}).get(name)
+        if previous:
+            check(
+                f"startup {name} import_ms",
+                current["import_ms"],
+                previous["import_ms"],
+                min_change=MIN_LATENCY_CHANGE * 1000,
+            )
+    return regressions
+
+
+def write_report(report: dict[str, Any], path: Path) -> None:
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline audit benchmark against a local farm")
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="Run benchmark scenarios")
+    run_parser.add_argument(
+        "--scenario",
+        choices=[*SCENARIOS, "all"],
+        default="all",
+        help="Scenario to run (default: all)",
+    )
+    run_parser.add_argument("--repeats", type=int, default=1, help="Audits per site")
+    run_parser.add_argument("--concurrency", type=int, default=1, help="Audits run at once")
+    run_parser.add_argument(
+        "--api-latency", type=float, default=0.0, help="Seconds added by the LLM/PSI stubs"
+    )
+    run_parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    run_parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs="?",
+        const=BASELINE_PATH,
+        help="Baseline JSON to check against (default: the committed baseline)",
+    )
+    run_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Relative change counted as a regression (default: 0.25)",
+    )
+
+    importtime_parser = subparsers.add_parser(
+        "importtime", help="Profile entrypoint imports with python -X importtime"
+    )
+    importtime_parser.add_argument(
+        "--entrypoint",
+        choices=[*ENTRYPOINTS, "all"],
+        default="all",
+        help="Entrypoint to import (default: all)",
+    )
+    importtime_parser.add_argument("--top", type=int, default=15, help="Slowest modules shown")
+
+    args = parser.parse_args(argv)
+    if args.command == "importtime":
+        names = list(ENTRYPOINTS) if args.entrypoint == "all" else [args.entrypoint]
+        for name in names:
+            print(measure_imports(ENTRYPOINTS[name]).summary(args.top))
+        return 0
+    if args.command != "run":
+        parser.print_help()
+        return 0
+
+    scenarios = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    report = run_benchmark(
+        scenarios,
+        repeats=args.repeats,
+        concurrency=args.concurrency,
+        api_latency=args.api_latency,
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+    if args.output:
+        write_report(report, args.output)
+
+    if args.compare:
+        regressions = compare(report, json.loads(args.compare.read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
@@ -0,0 +1,151 @@
+"""
+Cold-start import profile of the entrypoints.
+
+Each entrypoint is imported in a fresh interpreter under
+`python -X importtime`; the per-module timings and the set of modules left
+in sys.modules show what startup costs and whether a heavy dependency
+(reportlab, matplotlib, playwright, the AI SDKs, ...) was loaded before it
+was needed.
+
+Usage:
+    python -m tests.benchmark importtime
+    python -m tests.benchmark importtime --entrypoint api --top 25
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Name -> module imported at startup
+ENTRYPOINTS = {
+    "api": "apps.api.main",
+    "worker": "apps.worker.main",
+    "report": "packages.seo_health_report",
+}
+
+# Loaded on first use by the features that need them, never at startup
+HEAVY_MODULES = (
+    "anthropic",
+    "docx",
+    "google.generativeai",
+    "matplotlib",
+    "numpy",
+    "openai",
+    "PIL",
+    "playwright",
+    "reportlab",
+    "weasyprint",
+)
+
+# Cumulative import milliseconds each entrypoint may take; roughly twice
+# what it measures on a developer laptop. IMPORT_TIME_BUDGET_SCALE
+# stretches them for slow CI machines.
+IMPORT_BUDGET_MS = {"api": 3000, "worker": 1500, "report": 300}
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+_MODULES_MARKER = "IMPORTED_MODULES "
+
+
+@dataclass
+class ImportRecord:
+    """One line of -X importtime output."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    """How importing one module went in a fresh interpreter."""
+
+    module: str
+    records: list[ImportRecord]
+    modules: list[str]  # sys.modules after the import
+
+    @property
+    def total_ms(self) -> float:
+        top = [r for r in self.records if r.name == self.module and r.depth == 0]
+        return top[-1].cumulative_us / 1000 if top else 0.0
+
+    def heavy_modules(self) -> list[str]:
+        """HEAVY_MODULES that ended up imported."""
+        loaded = set(self.modules)
+        return [name for name in HEAVY_MODULES if name in loaded]
+
+    def slowest(self, count: int = 15) -> list[ImportRecord]:
+        """Modules with the most import time of their own."""
+        return sorted(self.records, key=lambda r: r.self_us, reverse=True)[:count]
+
+    def summary(self, count: int = 15) -> str:
+        lines = [
+            f"{self.module}: {self.total_ms:.0f} ms, {len(self.modules)} modules",
+            f"  heavy modules loaded: {', '.join(self.heavy_modules()) or 'none'}",
+            "  slowest (self ms / cumulative ms):",
+        ]
+        for record in self.slowest(count):
+            self_ms, cumulative_ms = record.self_us / 1000, record.cumulative_us / 1000
+            lines.append(f"    {self_ms:8.1f} {cumulative_ms:8.1f}  {record.name}")
+        return "\n".join(lines)
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse the -X importtime lines of `output` (stderr)."""
+    records = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            records.append(
+                ImportRecord(
+                    name=match.group(4),
+                    self_us=int(match.group(1)),
+                    cumulative_us=int(match.group(2)),
+                    depth=len(match.group(3)) // 2,
+                )
+            )
+    return records
+
+
+def measure_imports(module: str) -> ImportProfile:
+    """Import `module` in a fresh interpreter and profile it."""
+    # A plain import statement: importlib.import_module() bypasses the timing
+    code = (
+        f"import {module}\n"
+        "import json, sys\n"
+        f"print({_MODULES_MARKER!r} + json.dumps(sorted(sys.modules)))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{completed.stderr[-2000:]}")
+    modules = []
+    for line in completed.stdout.splitlines():
+        if line.startswith(_MODULES_MARKER):
+            modules = json.loads(line[len(_MODULES_MARKER) :])
+    return ImportProfile(module, parse_importtime(completed.stderr), modules)
+
+
+def import_budget_ms(entrypoint: str) -> float:
+    return IMPORT_BUDGET_MS[entrypoint] * float(os.getenv("IMPORT_TIME_BUDGET_SCALE", "1"))
+
+
+def startup_report(repeats: int = 3) -> dict[str, dict[str, float]]:
+    """Best-of-`repeats` import time and module count per entrypoint."""
+    report = {}
+    for name, module in ENTRYPOINTS.items():
+        profiles = [measure_imports(module) for _ in range(repeats)]
+        best = min(profiles, key=lambda profile: profile.total_ms)
+        report[name] = {"import_ms": round(best.total_ms, 1), "modules": len(best.modules)}
+    return report
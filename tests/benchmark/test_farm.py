@@ -0,0 +1,104 @@
+"""Tests for the benchmark web farm and the baseline comparison."""
+
+import gzip
+
+import httpx
+import pytest
+import requests
+
+from tests.benchmark.farm import LLM_HOST, PSI_HOST, SyntheticSite, WebFarm, fixture_site
+from tests.benchmark.harness import compare, percentile
+
+
+@pytest.fixture(scope="module")
+def farm():
+    sites = [
+        fixture_site("redirect_chains"),
+        SyntheticSite("giant.test", pages=120_000, gzip_sitemaps=True),
+        SyntheticSite("throttled.test", pages=10, max_rps=2),
+    ]
+    with WebFarm(sites) as farm:
+        yield farm
+
+
+def _get(farm, url, **kwargs):
+    proxies = {"http": farm.proxy_url, "https": farm.proxy_url}
+    return requests.get(url, proxies=proxies, timeout=10, **kwargs)
+
+
+class TestWebFarm:
+    """Tests for serving sites through the farm proxy."""
+
+    def test_fixture_site_served_over_http(self, farm):
+        response = _get(farm, "http://redirect-chains.test/", allow_redirects=True)
+
+        assert response.status_code == 200
+        assert [r.status_code for r in response.history] == [301, 301, 302]
+        assert response.url == "http://redirect-chains.test/en/home/"
+        assert farm.requests["redirect-chains.test"] >= 4
+
+    def test_giant_sitemap_index_with_gzipped_children(self, farm):
+        index = _get(farm, "http://giant.test/sitemap.xml").text
+        assert index.count("<sitemap>") == 3
+
+        child = _get(farm, "http://giant.test/sitemap-2.xml.gz", stream=True).raw.read()
+        assert gzip.decompress(child).count(b"<url>") == 20_000
+
+    def test_throttled_host_answers_429(self, farm):
+        statuses = [_get(farm, "http://throttled.test/").status_code for _ in range(4)]
+
+        assert statuses[:2] == [200, 200]
+        assert 429 in statuses[2:]
+
+    def test_unknown_hosts_and_tunnels_stay_local(self, farm):
+        assert _get(farm, "http://example.com/").status_code == 404
+        with pytest.raises(requests.exceptions.ProxyError):
+            _get(farm, "https://example.com/")
+
+    def test_stub_apis(self, farm):
+        with httpx.Client(proxy=farm.proxy_url) as client:
+            psi = client.get(f"http://{PSI_HOST}/runPagespeed", params={"url": "http://a.test/"})
+            chat = client.post(
+                f"http://{LLM_HOST}/v1/chat/completions",
+                json={"messages": [{"role": "user", "content": "best plumber?"}]},
+            )
+
+        assert psi.json()["lighthouseResult"]["categories"]["performance"]["score"] == 0.82
+        assert "best plumber?" in chat.json()["choices"][0]["message"]["content"]
+
+
+class TestBaselineComparison:
+    """Tests for flagging regressions against a baseline."""
+
+    def _report(self, throughput=10.0, requests_per_audit=40.0, p95=2.0):
+        return {
+            "scenarios": {
+                "fixtures": {
+                    "throughput_audits_per_min": throughput,
+                    "http_requests_per_audit": requests_per_audit,
+                    "peak_rss_mb": 80.0,
+                    "stages": {"technical": {"p50": 1.0, "p95": p95}},
+                }
+            }
+        }
+
+    def test_no_regression_within_tolerance(self):
+        assert compare(self._report(throughput=9.0, p95=2.3), self._report()) == []
+
+    def test_regressions_reported(self):
+        regressions = compare(
+            self._report(throughput=5.0, requests_per_audit=80.0, p95=4.0), self._report()
+        )
+
+        assert len(regressions) == 3
+        assert regressions[0].startswith("fixtures throughput_audits_per_min: 10.0 -> 5.0")
+
+    def test_small_latency_changes_ignored(self):
+        baseline = self._report(p95=0.01)
+
+        assert compare(self._report(p95=0.04), baseline) == []
+
+    def test_percentile(self):
+        assert percentile([], 95) == 0.0
+        assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+        assert percentile(list(range(1, 101)), 95) == 95
@@ -0,0 +1,53 @@
+"""Tests for the entrypoint import-time budget."""
+
+import pytest
+
+from tests.benchmark.importtime import (
+    ENTRYPOINTS,
+    ImportProfile,
+    import_budget_ms,
+    measure_imports,
+    parse_importtime,
+)
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2100 |       2400 |     packages.core
+import time:       300 |       2700 |   packages
+import time:      1500 |       4200 | packages.seo_health_report
+"""
+
+
+class TestParseImporttime:
+    """Tests for reading -X importtime output."""
+
+    def test_records_and_depth(self):
+        records = parse_importtime(SAMPLE)
+
+        assert [(r.name, r.depth) for r in records] == [
+            ("_io", 1),
+            ("packages.core", 2),
+            ("packages", 1),
+            ("packages.seo_health_report", 0),
+        ]
+        assert records[1].self_us == 2100
+
+    def test_profile_total_and_slowest(self):
+        profile = ImportProfile(
+            "packages.seo_health_report",
+            parse_importtime(SAMPLE),
+            ["packages", "reportlab", "reportlab.lib"],
+        )
+
+        assert profile.total_ms == 4.2
+        assert profile.slowest(1)[0].name == "packages.core"
+        assert profile.heavy_modules() == ["reportlab"]
+
+
+@pytest.mark.parametrize("entrypoint", sorted(ENTRYPOINTS))
+def test_entrypoint_import_budget(entrypoint):
+    profile = measure_imports(ENTRYPOINTS[entrypoint])
+
+    assert profile.heavy_modules() == [], profile.summary()
+    assert 0 < profile.total_ms <= import_budget_ms(entrypoint), profile.summary()
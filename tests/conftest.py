@@ -12,6 +12,17 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# Tests importing the report scripts as top-level `scripts.*` (the layout the
+# scripts use among themselves)
+report_root = os.path.join(project_root, "packages", "seo_health_report")
+if report_root not in sys.path:
+    sys.path.append(report_root)
+
+# Audits under test must not share observations through the default database
+os.environ.setdefault("OBSERVATION_STORE_ENABLED", "false")
+# Log output stays synchronous so tests can capture it
+os.environ.setdefault("LOG_QUEUE_ENABLED", "false")
+
 # Import seo-health-report package dynamically (has hyphen in name)
 spec = importlib.util.spec_from_file_location(
     "seo_health_report", os.path.join(project_root, "packages", "seo_health_report", "__init__.py")
@@ -21,6 +32,31 @@ sys.modules["seo_health_report"] = seo_health_report_module
 spec.loader.exec_module(seo_health_report_module)
 
 
+@pytest.fixture(autouse=True)
+def fresh_cost_ledger(monkeypatch):
+    """Give each test its own cost ledger so buffered events don't leak between tests."""
+    from packages.core import cost_tracker
+
+    monkeypatch.setattr(cost_tracker, "_ledger", None)
+
+
+@pytest.fixture
+def sqlite_session_factory():
+    """Session factory for a fresh in-memory database with every mapped table."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from database import Base
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
 @pytest.fixture
 def mock_config():
     """Mock configuration for testing."""
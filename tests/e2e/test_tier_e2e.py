@@ -184,7 +184,7 @@ class TestTierCostTracking:
         db_session.commit()
 
         # Simulate cost events that would be created during audit
-        from packages.core.cost_tracker import record_cost_event
+        from packages.core.cost_tracker import flush_cost_events, record_cost_event
 
         # AI Visibility calls (simulated)
         record_cost_event(
@@ -220,6 +220,9 @@ class TestTierCostTracking:
             phase="technical_analysis",
         )
 
+        # Phase boundary: buffered events are written to the ledger
+        flush_cost_events(db_session)
+
         # Verify cost events
         events = db_session.query(CostEvent).filter(CostEvent.audit_id == audit_id).all()
 
@@ -253,7 +256,11 @@ class TestTierCostTracking:
         Expected models: gpt-5, claude-sonnet-4-5, gemini-3.0-pro
         """
         from database import Audit, CostEvent
-        from packages.core.cost_tracker import get_audit_cost_summary, record_cost_event
+        from packages.core.cost_tracker import (
+            flush_cost_events,
+            get_audit_cost_summary,
+            record_cost_event,
+        )
         from packages.seo_health_report.tier_config import load_tier_config
 
         load_tier_config("high")
@@ -325,6 +332,8 @@ class TestTierCostTracking:
             phase="social_sentiment",
         )
 
+        flush_cost_events(db_session)
+
         # Verify HIGH tier models
         events = db_session.query(CostEvent).filter(CostEvent.audit_id == audit_id).all()
 
@@ -355,7 +364,7 @@ class TestTierCostTracking:
         This catches environment caching bugs.
         """
         from database import Audit, CostEvent
-        from packages.core.cost_tracker import record_cost_event
+        from packages.core.cost_tracker import flush_cost_events, record_cost_event
         from packages.seo_health_report.tier_config import load_tier_config
 
         # Create LOW tier audit
@@ -408,6 +417,8 @@ class TestTierCostTracking:
             phase="test",
         )
 
+        flush_cost_events(db_session)
+
         # Verify different tiers recorded
         low_event = db_session.query(CostEvent).filter(CostEvent.audit_id == low_audit_id).first()
         high_event = db_session.query(CostEvent).filter(CostEvent.audit_id == high_audit_id).first()
@@ -428,7 +439,11 @@ class TestTierCostTracking:
         Should have events for working providers, none for skipped ones.
         """
         from database import Audit, CostEvent
-        from packages.core.cost_tracker import get_audit_cost_summary, record_cost_event
+        from packages.core.cost_tracker import (
+            flush_cost_events,
+            get_audit_cost_summary,
+            record_cost_event,
+        )
 
         audit_id = f"audit_degrade_{uuid.uuid4().hex[:8]}"
 
@@ -480,6 +495,7 @@ class TestTierCostTracking:
         assert summary["total_cost_usd"] > 0, "Should have non-zero cost from working providers"
 
         # Cleanup
+        flush_cost_events(db_session)
         db_session.query(CostEvent).filter(CostEvent.audit_id == audit_id).delete()
         db_session.query(Audit).filter(Audit.id == audit_id).delete()
         db_session.commit()
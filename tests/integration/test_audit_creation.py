@@ -192,8 +192,7 @@ class TestAuditCreationSuccess:
             return kwargs.get("audit_id", "audit_123")
 
         mock_quota_service = MagicMock()
-        mock_quota_service.enforce_quota.return_value = None
-        mock_quota_service.increment_usage.return_value = None
+        mock_quota_service.admit_audit.return_value = None
 
         routes_module.enqueue_audit_job = mock_enqueue
         routes_module.QuotaService = lambda db: mock_quota_service
@@ -271,7 +270,7 @@ class TestAuditCreationQuotas:
         original_quota_service = routes_module.QuotaService
 
         mock_service = MagicMock()
-        mock_service.enforce_quota.side_effect = QuotaExceededError(
+        mock_service.admit_audit.side_effect = QuotaExceededError(
             "Monthly audit limit reached (10)", "monthly_audits", 10, 10
         )
 
@@ -300,7 +299,7 @@ class TestAuditCreationQuotas:
         original_quota_service = routes_module.QuotaService
 
         mock_service = MagicMock()
-        mock_service.enforce_quota.side_effect = QuotaExceededError(
+        mock_service.admit_audit.side_effect = QuotaExceededError(
             "Concurrent audit limit reached (2)", "concurrent_audits", 2, 2
         )
 
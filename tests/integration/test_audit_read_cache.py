@@ -0,0 +1,143 @@
+"""Tests for cached, ETag-aware audit read endpoints."""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from packages.seo_health_report.scripts import memory_cache
+from packages.storage import results
+from packages.storage.client import LocalStorageBackend
+
+
+def _make_audit(status="completed", result=None, result_key=None):
+    from database import Audit
+
+    audit = MagicMock(spec=Audit)
+    audit.id = f"audit_{uuid.uuid4().hex[:12]}"
+    audit.status = status
+    audit.url = "https://example.com"
+    audit.company_name = "Example Co"
+    audit.tier = "basic"
+    audit.overall_score = 81
+    audit.grade = "B"
+    audit.result = result
+    audit.result_key = result_key
+    audit.created_at = datetime.now(timezone.utc)
+    audit.completed_at = datetime.now(timezone.utc)
+    audit.report_html_path = None
+    audit.report_pdf_path = None
+    return audit
+
+
+@pytest.fixture
+def session():
+    return MagicMock()
+
+
+@pytest.fixture
+def client(session):
+    from apps.api.main import app
+    from database import get_db
+
+    def override():
+        yield session
+
+    app.dependency_overrides[get_db] = override
+    memory_cache.clear()
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+        memory_cache.clear()
+
+
+class TestAuditStatusEndpoint:
+    """Tests for GET /audit/{id}."""
+
+    def test_returns_etag_and_304_on_match(self, client, session):
+        audit = _make_audit()
+        session.query.return_value.filter.return_value.first.return_value = audit
+
+        first = client.get(f"/audit/{audit.id}")
+        assert first.status_code == 200
+        assert first.json()["overall_score"] == 81
+        etag = first.headers["etag"]
+
+        second = client.get(f"/audit/{audit.id}", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_completed_audit_served_from_cache(self, client, session):
+        audit = _make_audit()
+        session.query.return_value.filter.return_value.first.return_value = audit
+
+        client.get(f"/audit/{audit.id}")
+        client.get(f"/audit/{audit.id}")
+
+        assert session.query.call_count == 1
+
+    def test_running_audit_not_cached(self, client, session):
+        audit = _make_audit(status="running")
+        session.query.return_value.filter.return_value.first.return_value = audit
+
+        client.get(f"/audit/{audit.id}")
+        audit.status = "completed"
+        response = client.get(f"/audit/{audit.id}")
+
+        assert response.json()["status"] == "completed"
+        assert session.query.call_count == 2
+
+
+class TestFullAuditEndpoint:
+    """Tests for GET /audit/{id}/full."""
+
+    def test_inline_result_included(self, client, session):
+        audit = _make_audit(result={"overall_score": 81, "issues": ["a"]})
+        session.query.return_value.filter.return_value.first.return_value = audit
+
+        response = client.get(f"/audit/{audit.id}/full")
+
+        assert response.status_code == 200
+        assert response.json()["result"]["issues"] == ["a"]
+
+    def test_offloaded_result_streamed_from_storage(self, client, session, tmp_path):
+        backend = LocalStorageBackend(base_path=str(tmp_path / "storage"))
+        large = {"raw": {"robots_txt": "Disallow: /private\n" * 2000}}
+        audit = _make_audit()
+        _, key = results.store_audit_result(audit.id, large, backend=backend)
+        audit.result_key = key
+        session.query.return_value.filter.return_value.first.return_value = audit
+
+        with patch.object(results, "_backend", backend):
+            response = client.get(f"/audit/{audit.id}/full")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["audit_id"] == audit.id
+        assert data["result"] == large
+
+        cached = client.get(
+            f"/audit/{audit.id}/full", headers={"If-None-Match": response.headers["etag"]}
+        )
+        assert cached.status_code == 304
+
+
+class TestAuditEventsEndpoint:
+    """Tests for GET /audits/{id}/events."""
+
+    def test_events_cached_once_completed(self, client, session):
+        now = datetime.now(timezone.utc)
+        session.execute.return_value.fetchall.return_value = [
+            ("initializing", "Starting", 0, now),
+            ("completed", "Done", 100, now),
+        ]
+
+        first = client.get("/audits/audit_x/events")
+        second = client.get("/audits/audit_x/events")
+
+        assert first.json()["events"][-1]["event_type"] == "completed"
+        assert first.headers["etag"] == second.headers["etag"]
+        assert session.execute.call_count == 1
@@ -52,7 +52,7 @@ class TestQuotaExceededReturns429:
         original_quota_service = routes_module.QuotaService
 
         mock_service = MagicMock()
-        mock_service.enforce_quota.side_effect = QuotaExceededError(
+        mock_service.admit_audit.side_effect = QuotaExceededError(
             "Monthly audit limit reached (10)", "monthly_audits", 10, 10
         )
 
@@ -96,7 +96,7 @@ class TestConcurrentLimitBlocksNewAudits:
         original_quota_service = routes_module.QuotaService
 
         mock_service = MagicMock()
-        mock_service.enforce_quota.side_effect = QuotaExceededError(
+        mock_service.admit_audit.side_effect = QuotaExceededError(
             "Concurrent audit limit reached (2)", "concurrent_audits", 2, 2
         )
 
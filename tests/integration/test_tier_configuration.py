@@ -1,6 +1,7 @@
 import asyncio
 import os
 import sys
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -8,7 +9,13 @@ from unittest.mock import MagicMock, patch
 sys.path.insert(0, os.getcwd())
 
 import packages.ai_visibility_audit.scripts.query_ai_systems as query_ai
-from packages.seo_health_report.tier_config import load_tier_config
+from packages.seo_health_report.tier_config import (
+    get_tier_context,
+    get_tier_info,
+    load_tier_config,
+    tier_setting,
+    use_tier,
+)
 
 
 class TestTierConfiguration(unittest.TestCase):
@@ -98,5 +105,59 @@ class TestTierConfiguration(unittest.TestCase):
             loop.close()
 
 
+class TestTierContext(unittest.TestCase):
+    """Tests for per-audit tier binding without touching os.environ."""
+
+    def setUp(self):
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_tier_file_parsed_once(self):
+        self.assertIs(get_tier_context("low"), get_tier_context("basic"))
+        self.assertEqual(get_tier_context("premium").tier, "high")
+
+    def test_use_tier_leaves_environment_untouched(self):
+        os.environ["REPORT_TIER"] = "medium"
+
+        with use_tier("high"):
+            self.assertEqual(tier_setting("REPORT_TIER"), "high")
+            self.assertEqual(get_tier_info()["tier"], "high")
+            self.assertEqual(os.environ["REPORT_TIER"], "medium")
+
+        self.assertEqual(tier_setting("REPORT_TIER"), "medium")
+
+    def test_parallel_audits_use_their_own_tier(self):
+        """Two tiers asking the same question concurrently each get their own model."""
+        models = []
+
+        def create(model, messages, **kwargs):
+            models.append(model)
+            return MagicMock(content=[MagicMock(text="Response")])
+
+        async def audit(tier):
+            with use_tier(tier):
+                await asyncio.sleep(0)
+                await query_ai.query_claude("best plumber", "brand", api_key="test")
+
+        async def run_test():
+            anthropic = MagicMock()
+            anthropic.Anthropic.return_value.messages.create.side_effect = create
+            with patch.dict(sys.modules, {"anthropic": anthropic}):
+                await audit("low")
+                # The low answer is cached; the high tier must not be served it
+                await asyncio.gather(audit("low"), audit("high"))
+
+        cache = sys.modules[query_ai.cached.__module__]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(cache, "CACHE_DIR", cache_dir):
+                asyncio.run(run_test())
+
+        low, high = (get_tier_context(t).get("ANTHROPIC_MODEL") for t in ("low", "high"))
+        self.assertNotEqual(low, high)
+        self.assertCountEqual(models, [low, high])
+
 if __name__ == "__main__":
     unittest.main()
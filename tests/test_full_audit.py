@@ -190,6 +190,7 @@ class TestAuditExecutionFlow:
                 primary_keywords=["seo", "marketing"],
                 competitor_urls=[],
                 rate_limiter=ANY,
+                tier="basic",
             )
 
             assert "raw" in result
@@ -511,7 +512,7 @@ class TestErrorHandling:
 
     @pytest.mark.asyncio
     async def test_webhook_delivered_on_failure(self, mock_db, sample_payload_with_callback):
-        """Test that webhook is delivered on failure."""
+        """Test that a failure webhook is staged in the outbox."""
         with (
             patch(
                 "apps.worker.handlers.full_audit.run_full_audit",
@@ -523,9 +524,8 @@ class TestErrorHandling:
                 return_value={"event": "audit.failed", "audit_id": "audit-123"},
             ) as mock_build_payload,
             patch(
-                "apps.worker.handlers.full_audit.deliver_webhook",
-                new_callable=AsyncMock,
-            ) as mock_deliver,
+                "apps.worker.handlers.full_audit.enqueue_audit_webhooks",
+            ) as mock_enqueue,
         ):
             with pytest.raises(Exception):
                 await handle_full_audit(
@@ -539,7 +539,10 @@ class TestErrorHandling:
         call_kwargs = mock_build_payload.call_args
         assert call_kwargs[1]["status"] == "failed"
 
-        mock_deliver.assert_called_once()
+        mock_enqueue.assert_called_once()
+        enqueue_kwargs = mock_enqueue.call_args[1]
+        assert enqueue_kwargs["event_type"] == "audit.failed"
+        assert enqueue_kwargs["callback_url"] == "https://webhook.example.com/callback"
 
     @pytest.mark.asyncio
     async def test_error_messages_are_redacted(self, mock_db, sample_payload):
@@ -612,10 +615,7 @@ class TestWebhookDelivery:
     async def test_webhook_delivered_on_success(
         self, mock_db, sample_payload_with_callback, mock_raw_audit_result, mock_composite_scores
     ):
-        """Test webhook is delivered on successful audit completion."""
-        mock_webhook_result = MagicMock()
-        mock_webhook_result.success = True
-
+        """Test webhook is staged in the outbox on successful audit completion."""
         with (
             patch(
                 "apps.worker.handlers.full_audit.run_full_audit",
@@ -636,10 +636,8 @@ class TestWebhookDelivery:
                 return_value={"event": "audit.completed", "audit_id": "audit-123"},
             ) as mock_build,
             patch(
-                "apps.worker.handlers.full_audit.deliver_webhook",
-                new_callable=AsyncMock,
-                return_value=mock_webhook_result,
-            ) as mock_deliver,
+                "apps.worker.handlers.full_audit.enqueue_audit_webhooks",
+            ) as mock_enqueue,
         ):
             await handle_full_audit(
                 audit_id="audit-123",
@@ -654,24 +652,26 @@ class TestWebhookDelivery:
         assert build_kwargs["overall_score"] == 75
         assert build_kwargs["grade"] == "C"
 
-        mock_deliver.assert_called_once()
+        mock_enqueue.assert_called_once()
+        enqueue_kwargs = mock_enqueue.call_args[1]
+        assert enqueue_kwargs["event_type"] == "audit.completed"
+        assert enqueue_kwargs["payload"] == {"event": "audit.completed", "audit_id": "audit-123"}
 
     @pytest.mark.asyncio
-    async def test_callback_delivered_at_updated_on_success(
+    async def test_webhooks_staged_in_result_transaction(
         self, mock_db, sample_payload_with_callback, mock_raw_audit_result, mock_composite_scores
     ):
-        """Test that callback_delivered_at is updated when webhook succeeds."""
-        update_sqls = []
+        """Test that outbox rows are staged before the result commit, not sent inline."""
+        calls = []
 
         def capture_execute(*args, **kwargs):
             sql_text = str(args[0]) if args else ""
-            update_sqls.append(sql_text)
+            if "UPDATE audits" in sql_text and "'completed'" in sql_text:
+                calls.append("update_result")
             return MagicMock()
 
         mock_db.execute = MagicMock(side_effect=capture_execute)
-
-        mock_webhook_result = MagicMock()
-        mock_webhook_result.success = True
+        mock_db.commit = MagicMock(side_effect=lambda: calls.append("commit"))
 
         with (
             patch(
@@ -689,9 +689,8 @@ class TestWebhookDelivery:
                 return_value="reports/test-tenant/audit-123.html",
             ),
             patch(
-                "apps.worker.handlers.full_audit.deliver_webhook",
-                new_callable=AsyncMock,
-                return_value=mock_webhook_result,
+                "apps.worker.handlers.full_audit.enqueue_audit_webhooks",
+                side_effect=lambda *a, **k: calls.append("enqueue"),
             ),
         ):
             await handle_full_audit(
@@ -701,8 +700,8 @@ class TestWebhookDelivery:
                 db=mock_db,
             )
 
-        callback_updates = [s for s in update_sqls if "callback_delivered_at" in s]
-        assert len(callback_updates) >= 1
+        start = calls.index("update_result")
+        assert calls[start : start + 3] == ["update_result", "enqueue", "commit"]
 
 
 class TestTierHandling:
@@ -236,3 +236,113 @@ class TestCacheDataTypes:
         assert result is None
         # Verify nothing was cached (decorator doesn't cache None)
         # This is intentional to avoid caching failed lookups
+
+
+class TestBoundedCache:
+    """Tests for LRU bounds, byte accounting and expiry sweeping."""
+
+    def setup_method(self):
+        """Clear cache before each test."""
+        memory_cache.clear()
+
+    def test_lru_eviction_by_entry_count(self, monkeypatch):
+        """Test that least-recently-used entries are evicted past MAX_ENTRIES."""
+        monkeypatch.setattr(memory_cache, "MAX_ENTRIES", 3)
+        for i in range(3):
+            memory_cache.set(f"k:{i}", i, ttl=60)
+
+        # Touch k:0 so k:1 becomes the LRU entry
+        assert memory_cache.get("k:0") == 0
+        memory_cache.set("k:3", 3, ttl=60)
+
+        assert memory_cache.get("k:1") is None
+        assert memory_cache.get("k:0") == 0
+        assert memory_cache.stats()["total_entries"] == 3
+
+    def test_byte_budget_eviction(self, monkeypatch):
+        """Test that the approximate byte budget caps memory use."""
+        blob = "x" * 10_000
+        monkeypatch.setattr(memory_cache, "MAX_BYTES", memory_cache.estimate_size(blob) * 2 + 10)
+
+        memory_cache.set("blob:1", blob, ttl=60)
+        memory_cache.set("blob:2", blob + "y", ttl=60)
+        memory_cache.set("blob:3", blob + "z", ttl=60)
+
+        stats = memory_cache.stats()
+        assert stats["total_entries"] == 2
+        assert stats["total_bytes"] <= memory_cache.MAX_BYTES
+        assert memory_cache.get("blob:1") is None
+        assert stats["namespaces"]["blob"]["evictions"] == 1
+
+    def test_oversized_value_not_cached(self, monkeypatch):
+        """Test that a single value larger than the budget is rejected."""
+        monkeypatch.setattr(memory_cache, "MAX_BYTES", 100)
+        memory_cache.set("small:1", 1, ttl=60)
+        memory_cache.set("big:1", "x" * 1000, ttl=60)
+
+        assert memory_cache.get("big:1") is None
+        assert memory_cache.get("small:1") == 1
+
+    def test_overwrite_updates_accounting(self):
+        """Test that overwriting a key does not double count bytes."""
+        memory_cache.set("acct:1", "a" * 1000, ttl=60)
+        memory_cache.set("acct:1", "b", ttl=60)
+
+        stats = memory_cache.stats()
+        assert stats["total_entries"] == 1
+        assert stats["total_bytes"] == memory_cache.estimate_size("b")
+
+    def test_namespace_stats(self):
+        """Test per-namespace hit and miss counters."""
+        memory_cache.cache_audit_status("a1", {"status": "running"})
+        memory_cache.get_cached_audit_status("a1")
+        memory_cache.get_cached_audit_status("missing")
+
+        ns = memory_cache.stats()["namespaces"]["audit_status"]
+        assert ns["entries"] == 1
+        assert ns["hits"] == 1
+        assert ns["misses"] == 1
+
+    def test_stable_keys_for_unhashable_args(self):
+        """Test that dict and list arguments produce stable cache keys."""
+        call_count = 0
+
+        @memory_cache.cached_memory("dict_args", ttl=60)
+        def summarize(options, tags):
+            nonlocal call_count
+            call_count += 1
+            return len(options) + len(tags)
+
+        assert summarize({"b": 2, "a": 1}, ["x"]) == 3
+        assert summarize({"a": 1, "b": 2}, ["x"]) == 3
+        assert call_count == 1
+
+        key1 = memory_cache.make_key("p", ({"a": 1},), {})
+        key2 = memory_cache.make_key("p", ({"a": 2},), {})
+        assert key1 != key2
+
+    def test_background_sweeper(self):
+        """Test that the sweeper reclaims expired entries without reads."""
+        memory_cache.set("sweep:1", "value", ttl=0.05)
+        memory_cache.set("sweep:2", "value", ttl=60)
+        memory_cache.start_sweeper(interval=0.05)
+        try:
+            deadline = time.time() + 2
+            while time.time() < deadline and memory_cache.stats()["total_entries"] > 1:
+                time.sleep(0.05)
+        finally:
+            memory_cache.stop_sweeper()
+
+        stats = memory_cache.stats()
+        assert stats["total_entries"] == 1
+        assert stats["namespaces"]["sweep"]["expirations"] == 1
+
+    def test_api_runs_sweeper_while_serving(self):
+        """Test that the API starts the sweeper on startup and stops it on shutdown."""
+        from fastapi.testclient import TestClient
+
+        from apps.api.main import app
+
+        with TestClient(app):
+            assert memory_cache._sweeper_thread.is_alive()
+        assert memory_cache._sweeper_thread is None
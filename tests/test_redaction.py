@@ -1,5 +1,9 @@
 """Tests for the redaction utility module."""
 
+import random
+import re
+import time
+
 from packages.seo_health_report.scripts.redaction import (
     REDACTION_PATTERNS,
     SENSITIVE_KEYS,
@@ -7,6 +11,82 @@ from packages.seo_health_report.scripts.redaction import (
     redact_sensitive,
 )
 
+KEYWORDS = ["api_key", "apikey", "API-KEY", "token", "Secret", "password", "auth"]
+PLAIN_WORDS = ["Analyzing", "keywords", "for", "https://example.com/a", "step", "3/7", "api"]
+SEPARATORS = [" ", ", ", "; ", "\n", " | "]
+
+
+def _reference_redact_sensitive(text):
+    """The pattern-by-pattern substitution the combined regex replaced."""
+    if not isinstance(text, str):
+        return text
+    for pattern, replacement in REDACTION_PATTERNS:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+def _reference_redact_dict(data):
+    """The recursive walk the iterative one replaced."""
+    if not isinstance(data, dict):
+        return data
+    result = {}
+    for key, value in data.items():
+        normalized_key = str(key).lower().replace("-", "_")
+        if any(sk in normalized_key for sk in SENSITIVE_KEYS):
+            result[key] = "[REDACTED]"
+        elif isinstance(value, dict):
+            result[key] = _reference_redact_dict(value)
+        elif isinstance(value, list):
+            result[key] = [
+                _reference_redact_dict(item)
+                if isinstance(item, dict)
+                else _reference_redact_sensitive(item)
+                for item in value
+            ]
+        else:
+            result[key] = _reference_redact_sensitive(value)
+    return result
+
+
+def _value(rng):
+    return "".join(rng.choice("abcXYZ019_-.") for _ in range(rng.randint(1, 12)))
+
+
+def _fragment(rng):
+    kind = rng.randrange(6)
+    if kind == 0:
+        quote = rng.choice(["", "'", '"'])
+        separator = rng.choice(["=", ": ", " = ", ":"])
+        return f"{rng.choice(KEYWORDS)}{quote}{separator}{quote}{_value(rng)}{quote}"
+    if kind == 1:
+        return f"{rng.choice(['Authorization', 'authorization'])}: Bearer {_value(rng)}"
+    if kind == 2:
+        return f"{rng.choice(['Cookie', 'set-cookie', 'Set-Cookie'])}: sid={_value(rng)}"
+    return rng.choice(PLAIN_WORDS)
+
+
+def _random_text(rng):
+    return "".join(_fragment(rng) + rng.choice(SEPARATORS) for _ in range(rng.randint(0, 8)))
+
+
+def _random_payload(rng, depth=0):
+    payload = {}
+    for _ in range(rng.randint(0, 5)):
+        key = rng.choice(["url", "score", "api_key", "Auth-Token", "items", "meta", "message"])
+        roll = rng.random()
+        if roll < 0.3 and depth < 4:
+            payload[key] = _random_payload(rng, depth + 1)
+        elif roll < 0.5 and depth < 4:
+            payload[key] = [
+                rng.choice([_random_text(rng), _random_payload(rng, depth + 1), 7, None, ["x"]])
+                for _ in range(rng.randint(0, 3))
+            ]
+        elif roll < 0.8:
+            payload[key] = _random_text(rng)
+        else:
+            payload[key] = rng.choice([1, 2.5, True, None, ("t",)])
+    return payload
+
 
 class TestRedactSensitive:
     """Tests for redact_sensitive function."""
@@ -250,3 +330,91 @@ class TestPatternConstants:
     def test_sensitive_keys_contains_expected(self):
         expected = {"api_key", "token", "secret", "password", "authorization", "cookie", "api-key"}
         assert expected.issubset(SENSITIVE_KEYS)
+
+
+class TestRedactionProperties:
+    """Property tests against the pattern-by-pattern reference."""
+
+    def test_text_matches_reference(self):
+        rng = random.Random(1)
+        for _ in range(2000):
+            text = _random_text(rng)
+            assert redact_sensitive(text) == _reference_redact_sensitive(text), text
+
+    def test_text_is_idempotent_and_hides_values(self):
+        rng = random.Random(2)
+        for _ in range(500):
+            value = f"v{_value(rng)}9"
+            text = f"{_random_text(rng)}{rng.choice(KEYWORDS)}={value} {_random_text(rng)}"
+            once = redact_sensitive(text)
+            assert redact_sensitive(once) == once
+            assert value not in once
+
+    def test_text_without_secrets_is_returned_as_is(self):
+        text = " ".join(PLAIN_WORDS) + " café ünïcode"
+        assert redact_sensitive(text) is text
+
+    def test_non_ascii_case_folding_still_redacted(self):
+        # "\u212a" (Kelvin sign) matches "k" case-insensitively
+        assert redact_sensitive("api_\u212aey=abc123") == "[REDACTED]"
+
+    def test_dict_matches_reference(self):
+        rng = random.Random(3)
+        for _ in range(500):
+            payload = _random_payload(rng)
+            assert redact_dict(payload) == _reference_redact_dict(payload), payload
+
+    def test_dict_cycles_and_shared_subtrees(self):
+        shared = {"token": "abc", "url": "https://a.com"}
+        payload = {"a": shared, "b": [shared]}
+        payload["self"] = payload
+
+        result = redact_dict(payload)
+
+        assert result["a"] == {"token": "[REDACTED]", "url": "https://a.com"}
+        assert result["b"][0] is result["a"]
+        assert result["self"] is result
+        assert shared["token"] == "abc"
+
+    def test_deep_nesting_does_not_recurse(self):
+        payload = leaf = {}
+        for _ in range(5000):
+            leaf["next"] = {}
+            leaf = leaf["next"]
+        leaf["password"] = "pw"
+
+        result = redact_dict(payload)
+        for _ in range(5000):
+            result = result["next"]
+        assert result == {"password": "[REDACTED]"}
+
+
+class TestRedactionBenchmark:
+    """Micro-benchmark against the pattern-by-pattern reference."""
+
+    def test_faster_than_reference(self):
+        # Mostly clean progress messages and result payloads, as in production
+        messages = [f"Analyzing page {n} of https://example.com/blog/{n}" for n in range(900)]
+        messages += ["Request failed: api_key=abc123 while fetching https://a.com"] * 100
+        payload = {
+            "url": "https://example.com/",
+            "scores": {f"component_{n}": n for n in range(50)},
+            "issues": [
+                {"title": "Missing meta description", "severity": "high", "url": f"/p/{n}"}
+                for n in range(50)
+            ],
+        }
+
+        def timed(redact_text, redact_payload):
+            started = time.perf_counter()
+            for _ in range(5):
+                for message in messages:
+                    redact_text(message)
+                redact_payload(payload)
+            return time.perf_counter() - started
+
+        timed(redact_sensitive, redact_dict)
+        reference = timed(_reference_redact_sensitive, _reference_redact_dict)
+        engine = timed(redact_sensitive, redact_dict)
+
+        assert engine < reference
@@ -0,0 +1,89 @@
+"""Tests for the CPU analysis process pool."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from packages.core.analysis_pool import AnalysisPool
+from packages.seo_content_authority.scripts import analyze_content
+from packages.seo_content_authority.scripts.analyze_content import analyze_page_html
+from packages.seo_content_authority.scripts.map_topics import summarize_page
+
+PAGE = "<html><head><title>Widgets | Example</title></head><body><h1>Widgets</h1>{}</body></html>"
+
+
+def _page(words: int) -> str:
+    return PAGE.format("<p>" + "word " * words + "</p>")
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = AnalysisPool(max_workers=2, batch_size=2)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+def _wait_for_idle(pool, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while pool.queue_depth and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestAnalysisPool:
+    """Tests for running analysis in pool processes."""
+
+    def test_map_keeps_input_order(self, pool):
+        items = ((f"https://example.com/{n}", _page(n)) for n in (5, 50, 500))
+
+        results = pool.map(summarize_page, items)
+
+        assert [r["url"] for r in results] == [f"https://example.com/{n}" for n in (5, 50, 500)]
+        assert [r["title"] for r in results] == ["Widgets | Example"] * 3
+        assert results[2]["word_count"] > results[1]["word_count"] > results[0]["word_count"]
+
+    def test_results_match_inline_analysis(self, pool):
+        html = _page(400)
+
+        assert pool.run(analyze_page_html, "https://example.com/", html) == analyze_page_html(
+            "https://example.com/", html
+        )
+
+    async def test_map_async(self, pool):
+        results = await pool.map_async(summarize_page, [("https://example.com/", _page(10))])
+
+        assert results[0]["keywords"]
+
+    def test_queue_depth_tracks_pending_tasks(self, pool):
+        future = pool.submit_batch(time.sleep, [(0.3,), (0.3,)])
+
+        assert pool.queue_depth == 2
+        future.result()
+        _wait_for_idle(pool)
+        assert pool.queue_depth == 0
+
+    def test_disabled_pool_runs_inline(self):
+        pool = AnalysisPool(enabled=False)
+
+        assert pool.map(summarize_page, [("https://example.com/", _page(3))])[0]["word_count"]
+        assert pool.stats()["running"] is False
+
+
+class TestAnalyzePages:
+    """Tests for fetching and analyzing content pages."""
+
+    def test_pages_fetched_then_analyzed_in_order(self):
+        pages = {f"https://example.com/{n}": _page(n * 100) for n in range(1, 6)}
+        pages["https://example.com/missing"] = None
+        pool = AnalysisPool(enabled=False, batch_size=2)
+
+        with (
+            patch.object(analyze_content, "fetch_page", side_effect=pages.get),
+            patch.object(analyze_content, "get_analysis_pool", return_value=pool),
+        ):
+            results = analyze_content.analyze_pages(list(pages))
+
+        assert [r["url"] for r in results] == list(pages)
+        assert [r["success"] for r in results] == [True] * 5 + [False]
+        assert results[4]["word_count"] > results[0]["word_count"]
@@ -0,0 +1,285 @@
+"""Tests for bulk audit submission."""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+
+from database import Audit, AuditBatch, TenantQuota
+from packages.seo_health_report.batches import (
+    BatchService,
+    BatchTarget,
+    BatchTooLargeError,
+    parse_csv_targets,
+)
+from packages.seo_health_report.quotas.service import QuotaExceededError
+from packages.seo_health_sdk import SEOHealthClient
+
+
+@pytest.fixture
+def db(sqlite_session_factory):
+    session = sqlite_session_factory()
+    yield session
+    session.close()
+
+
+def add_quota(db, tenant_id, limit=10, used=0):
+    db.add(
+        TenantQuota(
+            id=str(uuid.uuid4()),
+            tenant_id=tenant_id,
+            monthly_audits_limit=limit,
+            monthly_audits_used=used,
+            billing_cycle_start=datetime.now(timezone.utc),
+            max_concurrent_audits=2,
+        )
+    )
+    db.commit()
+
+
+def targets(*urls):
+    return [BatchTarget(url) for url in urls]
+
+
+class TestParseCsv:
+    """Tests for reading targets from CSV."""
+
+    def test_header_selects_columns(self):
+        content = "company_name,url\nAcme,acme.com\n\nBeta,https://beta.io/\n"
+
+        assert parse_csv_targets(content) == [
+            BatchTarget("acme.com", "Acme"),
+            BatchTarget("https://beta.io/", "Beta"),
+        ]
+
+    def test_headerless_url_then_name(self):
+        assert parse_csv_targets("acme.com,Acme\nbeta.io\n") == [
+            BatchTarget("acme.com", "Acme"),
+            BatchTarget("beta.io", None),
+        ]
+
+
+class TestSubmit:
+    """Tests for admitting a batch."""
+
+    def test_queues_new_urls_and_dedupes_within_batch(self, db):
+        submission = BatchService(db).submit(
+            targets("Example.com", "https://example.com:443/#top", "not-a-url", "https://b.io/x/"),
+            user_id="user-1",
+            tenant_id=None,
+        )
+
+        assert [item.status for item in submission.items] == [
+            "queued",
+            "duplicate",
+            "invalid",
+            "queued",
+        ]
+        assert submission.items[1].audit_id == submission.items[0].audit_id
+        assert submission.items[0].canonical_url == "https://example.com/"
+
+        audits = db.query(Audit).filter(Audit.batch_id == submission.batch_id).all()
+        assert sorted(a.url for a in audits) == ["https://b.io/x", "https://example.com/"]
+        assert {a.company_name for a in audits} == {"b.io", "example.com"}
+
+        jobs = db.execute(text("SELECT audit_id, payload_json FROM audit_jobs")).fetchall()
+        assert {row[0] for row in jobs} == {a.id for a in audits}
+        assert json.loads(jobs[0][1])["type"] == "audit"
+
+        batch = db.get(AuditBatch, submission.batch_id)
+        assert (batch.submitted_count, batch.queued_count) == (4, 2)
+        assert (batch.duplicate_count, batch.invalid_count) == (1, 1)
+
+    def test_resubmission_answers_with_existing_audits(self, db):
+        service = BatchService(db)
+        first = service.submit(targets("a.com", "b.com"), user_id="user-1", tenant_id=None)
+
+        second = service.submit(
+            [BatchTarget("a.com"), BatchTarget("b.com", "Other Name")],
+            user_id="user-1",
+            tenant_id=None,
+        )
+
+        assert [item.status for item in second.items] == ["duplicate", "duplicate"]
+        assert [item.audit_id for item in second.items] == [
+            item.audit_id for item in first.items
+        ]
+        assert db.query(Audit).count() == 2
+
+    def test_statement_count_does_not_grow_with_batch_size(self, db):
+        statements = []
+        event.listen(
+            db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2])
+        )
+
+        BatchService(db).submit(
+            targets(*(f"site{n}.example.com" for n in range(300))),
+            user_id="user-1",
+            tenant_id=None,
+        )
+
+        assert db.query(Audit).count() == 300
+        assert len(statements) < 10
+
+    def test_too_many_urls(self, db, monkeypatch):
+        monkeypatch.setattr("packages.seo_health_report.batches.service.AUDIT_BATCH_MAX_URLS", 2)
+
+        with pytest.raises(BatchTooLargeError):
+            BatchService(db).submit(targets("a.com", "b.com", "c.com"), "user-1", None)
+
+
+class TestBatchQuota:
+    """Tests for admitting a batch against the tenant quota."""
+
+    def test_reserves_monthly_and_in_flight_audits(self, db):
+        add_quota(db, "tenant-1", limit=10, used=3)
+
+        BatchService(db).submit(targets("a.com", "b.com", "a.com"), "user-1", "tenant-1")
+
+        quota = db.query(TenantQuota).filter_by(tenant_id="tenant-1").one()
+        assert quota.monthly_audits_used == 5
+        assert quota.concurrent_audits == 2
+
+    def test_batch_over_allowance_queues_nothing(self, db):
+        add_quota(db, "tenant-1", limit=10, used=8)
+
+        with pytest.raises(QuotaExceededError) as exc_info:
+            BatchService(db).submit(targets("a.com", "b.com", "c.com"), "user-1", "tenant-1")
+
+        assert exc_info.value.quota_type == "monthly_audits"
+        assert db.query(Audit).count() == 0
+        assert db.query(TenantQuota).filter_by(tenant_id="tenant-1").one().monthly_audits_used == 8
+
+
+class TestProgress:
+    """Tests for aggregate batch progress."""
+
+    def test_counts_by_status(self, db):
+        service = BatchService(db)
+        submission = service.submit(targets("a.com", "b.com", "c.com", "d.com"), "user-1", None)
+        ids = [item.audit_id for item in submission.items]
+        db.get(Audit, ids[0]).status = "completed"
+        db.get(Audit, ids[1]).status = "failed"
+        db.get(Audit, ids[2]).status = "running"
+        db.commit()
+
+        progress = service.progress(service.get_batch(submission.batch_id))
+
+        assert progress["status"] == "running"
+        assert progress["audits"] == {
+            "total": 4,
+            "completed": 1,
+            "failed": 1,
+            "running": 1,
+            "queued": 1,
+        }
+        assert progress["progress"] == 0.5
+
+
+class TestBatchEndpoints:
+    """Tests for POST /audits/batch and GET /audits/batch/{id}."""
+
+    @pytest.fixture
+    def client(self, db):
+        from apps.api.routers.audits import router
+        from auth import require_auth
+        from database import get_db
+
+        app = FastAPI()
+        app.include_router(router)
+
+        def override_db():
+            yield db
+
+        app.dependency_overrides[get_db] = override_db
+        app.dependency_overrides[require_auth] = lambda: SimpleNamespace(
+            id="user-1", tenant_id=None
+        )
+        return TestClient(app)
+
+    def test_submit_list_and_csv_then_poll(self, client):
+        response = client.post(
+            "/audits/batch",
+            json={
+                "audits": ["a.com", {"url": "b.com", "company_name": "Bee"}],
+                "csv": "url,company_name\nc.com,Sea\na.com,Again\n",
+                "tier": "budget",
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["submitted"], data["queued"], data["duplicates"]) == (4, 3, 1)
+
+        progress = client.get(data["progress_url"]).json()
+        assert progress["status"] == "queued"
+        assert progress["tier"] == "low"
+        assert progress["audits"] == {"total": 3, "queued": 3}
+
+    def test_empty_batch_rejected(self, client):
+        assert client.post("/audits/batch", json={"audits": []}).status_code == 400
+
+    def test_unknown_batch(self, client):
+        assert client.get("/audits/batch/batch_missing").status_code == 404
+
+
+class TestSDKBatch:
+    """Tests for the SDK batch methods."""
+
+    def test_create_and_poll(self):
+        seen = []
+
+        def handler(request):
+            seen.append((request.method, request.url.path))
+            if request.method == "POST":
+                assert json.loads(request.content) == {
+                    "audits": ["a.com"],
+                    "tier": "low",
+                    "csv": "b.com\n",
+                }
+                return httpx.Response(
+                    200,
+                    json={
+                        "batch_id": "batch_1",
+                        "submitted": 2,
+                        "queued": 2,
+                        "duplicates": 0,
+                        "invalid": 0,
+                        "items": [{"url": "a.com", "status": "queued", "audit_id": "audit_1"}],
+                    },
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "batch_id": "batch_1",
+                    "status": "running",
+                    "submitted": 2,
+                    "queued": 2,
+                    "duplicates": 0,
+                    "invalid": 0,
+                    "audits": {"total": 2, "running": 2},
+                    "progress": 0.0,
+                },
+            )
+
+        client = SEOHealthClient(base_url="https://api.test", api_key="key")
+        client._client = httpx.Client(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+
+        batch = client.create_audit_batch(["a.com"], csv="b.com\n")
+        progress = client.get_audit_batch(batch.batch_id)
+
+        assert batch.items[0].audit_id == "audit_1"
+        assert progress.audits["running"] == 2
+        assert seen == [
+            ("POST", "/api/v1/audits/batch"),
+            ("GET", "/api/v1/audits/batch/batch_1"),
+        ]
+        client.close()
@@ -0,0 +1,117 @@
+"""Tests for keyset pagination, indexed search and cached counts."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from database import Audit
+from packages.database.listing import (
+    apply_search,
+    count_audits,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+)
+from packages.seo_health_report.scripts import memory_cache
+
+
+@pytest.fixture
+def db(sqlite_session_factory):
+    session = sqlite_session_factory()
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(25):
+        session.add(
+            Audit(
+                id=f"audit_{i:03d}",
+                url=f"https://site{i}.example.com",
+                company_name="Acme Widgets" if i % 5 == 0 else f"Company {i}",
+                tier="basic",
+                status="completed",
+                # Pairs share a timestamp so the id tie-breaker is exercised
+                created_at=start + timedelta(minutes=i // 2),
+            )
+        )
+    session.commit()
+    memory_cache.clear()
+    yield session
+    session.close()
+    memory_cache.clear()
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self, db):
+        audit = db.get(Audit, "audit_007")
+        created_at, audit_id = decode_cursor(encode_cursor(audit))
+        assert audit_id == "audit_007"
+        assert created_at == audit.created_at
+
+    def test_malformed_cursor_raises_value_error(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestKeysetPage:
+    """Tests for paging along (created_at, id)."""
+
+    def test_walks_all_rows_newest_first_without_gaps(self, db):
+        seen, cursor = [], None
+        while True:
+            page = keyset_page(db.query(Audit), cursor=cursor, per_page=10)
+            seen.extend(a.id for a in page.items)
+            if not page.next_cursor:
+                break
+            cursor = page.next_cursor
+
+        assert seen == [f"audit_{i:03d}" for i in reversed(range(25))]
+
+    def test_before_returns_previous_page(self, db):
+        first = keyset_page(db.query(Audit), per_page=10)
+        second = keyset_page(db.query(Audit), cursor=first.next_cursor, per_page=10)
+
+        back = keyset_page(db.query(Audit), before=second.prev_cursor, per_page=10)
+
+        assert [a.id for a in back.items] == [a.id for a in first.items]
+        assert back.prev_cursor is None
+        assert first.prev_cursor is None
+
+
+class TestSearch:
+    """Tests for FTS5-backed search on SQLite."""
+
+    def test_fts_table_kept_in_sync(self, db):
+        audit = db.get(Audit, "audit_003")
+        audit.company_name = "Zebra Analytics"
+        db.commit()
+
+        results = apply_search(db.query(Audit), db, "zebra").all()
+
+        assert [a.id for a in results] == ["audit_003"]
+
+    def test_substring_match_on_url_and_company(self, db):
+        by_company = apply_search(db.query(Audit), db, "Widgets").all()
+        by_url = apply_search(db.query(Audit), db, "site12.").all()
+
+        assert {a.id for a in by_company} == {f"audit_{i:03d}" for i in range(0, 25, 5)}
+        assert [a.id for a in by_url] == ["audit_012"]
+
+    def test_short_terms_and_quotes_are_safe(self, db):
+        assert apply_search(db.query(Audit), db, "12").count() == 1
+        assert apply_search(db.query(Audit), db, 'a"b OR').count() == 0
+
+
+class TestCountAudits:
+    """Tests for cached listing counts."""
+
+    def test_count_is_cached(self, db):
+        query = db.query(Audit)
+        assert count_audits(query, "test_count") == 25
+
+        db.add(
+            Audit(id="audit_new", url="https://new.example.com", company_name="New", tier="basic")
+        )
+        db.commit()
+
+        assert count_audits(db.query(Audit), "test_count") == 25
+        memory_cache.clear()
+        assert count_audits(db.query(Audit), "test_count") == 26
@@ -23,7 +23,6 @@ class TestFireAuditWebhookFunction:
         MagicMock()
         mock_service = MagicMock(spec=WebhookService)
         mock_service.fire_event = AsyncMock(return_value=["del_123"])
-        mock_service.close = AsyncMock()
 
         # Simulate fire_audit_webhook logic
         audit_data = {
@@ -66,7 +65,6 @@ class TestFireAuditWebhookFunction:
 
         mock_service = MagicMock(spec=WebhookService)
         mock_service.fire_event = AsyncMock(return_value=["del_456"])
-        mock_service.close = AsyncMock()
 
         audit_data = {
             "url": "https://example.com",
@@ -97,12 +95,24 @@ class TestFireAuditWebhookFunction:
 class TestWebhookServiceIntegration:
     """Tests for WebhookService fire_event integration."""
 
+    @staticmethod
+    def _mock_db(webhooks):
+        mock_db = MagicMock()
+        mock_query = MagicMock()
+        mock_db.query.return_value = mock_query
+        mock_query.filter.return_value = mock_query
+        mock_query.all.return_value = webhooks
+        return mock_db
+
+    @staticmethod
+    def _staged(mock_db):
+        return [call.args[0] for call in mock_db.add.call_args_list]
+
     @pytest.mark.asyncio
     async def test_fire_event_with_audit_payload(self):
         """Test WebhookService.fire_event with audit completion payload."""
         from packages.seo_health_report.webhooks.service import WebhookEvent, WebhookService
 
-        mock_db = MagicMock()
         mock_webhook = MagicMock()
         mock_webhook.id = "wh_123"
         mock_webhook.tenant_id = "tenant_1"
@@ -110,40 +120,36 @@ class TestWebhookServiceIntegration:
         mock_webhook.secret = "test_secret"
         mock_webhook.events = ["audit.completed", "audit.failed"]
         mock_webhook.is_active = True
-
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [mock_webhook]
+        mock_db = self._mock_db([mock_webhook])
 
         service = WebhookService(mock_db)
 
-        with patch.object(service, "_create_and_deliver", new_callable=AsyncMock) as mock_deliver:
-            mock_deliver.return_value = "del_abc"
-
-            payload = {
-                "audit_id": "audit_123",
-                "url": "https://example.com",
-                "overall_score": 90,
-                "grade": "A",
-            }
+        payload = {
+            "audit_id": "audit_123",
+            "url": "https://example.com",
+            "overall_score": 90,
+            "grade": "A",
+        }
 
-            delivery_ids = await service.fire_event(
-                tenant_id="tenant_1",
-                event=WebhookEvent.AUDIT_COMPLETED,
-                payload=payload,
-            )
+        delivery_ids = await service.fire_event(
+            tenant_id="tenant_1",
+            event=WebhookEvent.AUDIT_COMPLETED,
+            payload=payload,
+        )
 
-        assert delivery_ids == ["del_abc"]
-        mock_deliver.assert_called_once_with(mock_webhook, "audit.completed", payload)
+        (delivery,) = self._staged(mock_db)
+        assert delivery_ids == [delivery.id]
+        assert delivery.webhook_id == "wh_123"
+        assert delivery.audit_id == "audit_123"
+        assert delivery.event_type == "audit.completed"
+        assert delivery.payload == payload
+        mock_db.commit.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_fire_event_filters_by_subscribed_events(self):
-        """Test that fire_event only delivers to webhooks subscribed to the event."""
+        """Test that fire_event only queues for webhooks subscribed to the event."""
         from packages.seo_health_report.webhooks.service import WebhookEvent, WebhookService
 
-        mock_db = MagicMock()
-
         # Webhook only subscribed to audit.completed
         mock_webhook_completed = MagicMock()
         mock_webhook_completed.id = "wh_1"
@@ -156,52 +162,36 @@ class TestWebhookServiceIntegration:
         mock_webhook_failed.events = ["audit.failed"]
         mock_webhook_failed.is_active = True
 
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [mock_webhook_completed, mock_webhook_failed]
-
+        mock_db = self._mock_db([mock_webhook_completed, mock_webhook_failed])
         service = WebhookService(mock_db)
 
-        with patch.object(service, "_create_and_deliver", new_callable=AsyncMock) as mock_deliver:
-            mock_deliver.return_value = "del_xyz"
-
-            # Fire AUDIT_COMPLETED - should only deliver to wh_1
-            await service.fire_event(
-                tenant_id="tenant_1",
-                event=WebhookEvent.AUDIT_COMPLETED,
-                payload={"audit_id": "123"},
-            )
-
-        # Only the webhook subscribed to audit.completed should receive delivery
-        assert mock_deliver.call_count == 1
-        mock_deliver.assert_called_with(
-            mock_webhook_completed, "audit.completed", {"audit_id": "123"}
+        # Fire AUDIT_COMPLETED - should only queue for wh_1
+        await service.fire_event(
+            tenant_id="tenant_1",
+            event=WebhookEvent.AUDIT_COMPLETED,
+            payload={"audit_id": "123"},
         )
 
+        assert [d.webhook_id for d in self._staged(mock_db)] == ["wh_1"]
+
     @pytest.mark.asyncio
     async def test_fire_event_skips_inactive_webhooks(self):
         """Test that fire_event skips inactive webhooks."""
         from packages.seo_health_report.webhooks.service import WebhookEvent, WebhookService
 
-        mock_db = MagicMock()
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
         # Query already filters is_active == True, so return empty
-        mock_query.all.return_value = []
-
+        mock_db = self._mock_db([])
         service = WebhookService(mock_db)
 
-        with patch.object(service, "_create_and_deliver", new_callable=AsyncMock) as mock_deliver:
-            delivery_ids = await service.fire_event(
-                tenant_id="tenant_1",
-                event=WebhookEvent.AUDIT_COMPLETED,
-                payload={"audit_id": "123"},
-            )
+        delivery_ids = await service.fire_event(
+            tenant_id="tenant_1",
+            event=WebhookEvent.AUDIT_COMPLETED,
+            payload={"audit_id": "123"},
+        )
 
         assert delivery_ids == []
-        mock_deliver.assert_not_called()
+        mock_db.add.assert_not_called()
+        mock_db.commit.assert_not_called()
 
 
 class TestAuditWebhookPayloads:
@@ -308,76 +298,26 @@ class TestWebhookDeliveryFlow:
     """Tests for the complete webhook delivery flow."""
 
     @pytest.mark.asyncio
-    async def test_delivery_creates_record_and_attempts(self):
-        """Test that delivery creates a record and attempts HTTP request."""
-        from packages.seo_health_report.webhooks.service import WebhookService
-
-        mock_db = MagicMock()
-        mock_db.add = MagicMock()
-        mock_db.commit = MagicMock()
-
-        mock_webhook = MagicMock()
-        mock_webhook.id = "wh_123"
-        mock_webhook.url = "https://example.com/webhook"
-        mock_webhook.secret = "test_secret"
-
-        service = WebhookService(mock_db)
-
-        with patch.object(service, "_deliver", new_callable=AsyncMock) as mock_deliver:
-            mock_deliver.return_value = True
-
-            with patch("packages.seo_health_report.webhooks.service.uuid") as mock_uuid:
-                mock_uuid.uuid4.return_value.hex = "abc123"
-
-                with patch("database.WebhookDelivery") as mock_delivery_class:
-                    mock_delivery = MagicMock()
-                    mock_delivery.id = "del_abc123"
-                    mock_delivery_class.return_value = mock_delivery
-
-                    await service._create_and_deliver(
-                        webhook=mock_webhook,
-                        event_type="audit.completed",
-                        payload={"audit_id": "123"},
-                    )
-
-        # Record should be created
-        mock_db.add.assert_called_once()
-        mock_db.commit.assert_called()
-
-        # Delivery should be attempted
-        mock_deliver.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_successful_delivery_increments_counter(self):
-        """Test that successful delivery increments metrics counter."""
-        from packages.seo_health_report.webhooks.service import WebhookService
-
-        mock_db = MagicMock()
-        mock_db.add = MagicMock()
-        mock_db.commit = MagicMock()
+    async def test_fire_event_queues_without_delivering(self):
+        """Test that firing an event only stages pending outbox rows."""
+        from packages.seo_health_report.webhooks.service import WebhookEvent, WebhookService
 
         mock_webhook = MagicMock()
         mock_webhook.id = "wh_123"
+        mock_webhook.events = ["audit.completed"]
+        mock_db = TestWebhookServiceIntegration._mock_db([mock_webhook])
 
         service = WebhookService(mock_db)
 
-        with patch.object(service, "_deliver", new_callable=AsyncMock) as mock_deliver:
-            mock_deliver.return_value = True
-
-            with patch("packages.seo_health_report.webhooks.service.uuid") as mock_uuid:
-                mock_uuid.uuid4.return_value.hex = "abc123"
-
-                with patch("database.WebhookDelivery") as mock_delivery_class:
-                    mock_delivery = MagicMock()
-                    mock_delivery_class.return_value = mock_delivery
-
-                    with patch("packages.seo_health_report.metrics.metrics") as mock_metrics:
-                        await service._create_and_deliver(
-                            webhook=mock_webhook,
-                            event_type="audit.completed",
-                            payload={"audit_id": "123"},
-                        )
+        with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+            await service.fire_event(
+                tenant_id="tenant_1",
+                event=WebhookEvent.AUDIT_COMPLETED,
+                payload={"audit_id": "123"},
+            )
 
-                        mock_metrics.inc_counter.assert_called_with(
-                            "webhook_deliveries_total", labels={"status": "success"}
-                        )
+        mock_post.assert_not_called()
+        (delivery,) = TestWebhookServiceIntegration._staged(mock_db)
+        assert delivery.status == "pending"
+        assert delivery.attempts == 0
+        assert delivery.next_retry_at is None
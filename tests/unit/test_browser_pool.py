@@ -0,0 +1,130 @@
+"""Tests for the pooled browser and the rendering service."""
+
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.renderer.main import create_app
+from packages.seo_health_report.providers import render_client
+from packages.seo_health_report.providers.browser_crawler import (
+    PLAYWRIGHT_AVAILABLE,
+    BrowserPool,
+    SEOData,
+)
+
+FIXTURE_PAGE = """<!doctype html>
+<html><head>
+<title>Fixture {n}</title>
+<meta name="description" content="Static fixture page {n}">
+<link rel="canonical" href="/page{n}.html">
+<link rel="stylesheet" href="https://fonts.example.invalid/font.css">
+</head><body>
+<h1>Heading {n}</h1>
+<img src="/missing.png"><img src="/missing.png" alt="ok">
+<script>document.body.insertAdjacentHTML("beforeend", "<h2>Rendered {n}</h2>")</script>
+</body></html>
+"""
+
+
+class FakePool:
+    size = 2
+
+    def __init__(self):
+        self.started = self.stopped = False
+
+    async def start(self):
+        self.started = True
+
+    async def stop(self):
+        self.stopped = True
+
+    async def crawl_many(self, urls, timeout_ms=30000):
+        return [SEOData(url=url, title=f"Title for {url}") for url in urls]
+
+    def stats(self):
+        return {"size": self.size, "idle": self.size}
+
+
+@pytest.fixture
+def fixture_site(tmp_path):
+    for n in range(4):
+        (tmp_path / f"page{n}.html").write_text(FIXTURE_PAGE.format(n=n))
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    handler.log_message = lambda *args: None
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+class TestRenderService:
+    """Tests for the HTTP service wrapped around a pool."""
+
+    def test_pool_lifecycle_follows_app(self):
+        pool = FakePool()
+        with TestClient(create_app(pool)) as client:
+            assert pool.started
+            assert client.get("/health").json()["pool"]["size"] == 2
+        assert pool.stopped
+
+    def test_render_returns_pages_in_order(self):
+        with TestClient(create_app(FakePool())) as client:
+            response = client.post("/render", json={"urls": ["https://a.test", "https://b.test"]})
+
+        assert response.status_code == 200
+        assert [p["title"] for p in response.json()["pages"]] == [
+            "Title for https://a.test",
+            "Title for https://b.test",
+        ]
+
+    def test_empty_url_list_rejected(self):
+        with TestClient(create_app(FakePool())) as client:
+            assert client.post("/render", json={"urls": []}).status_code == 422
+
+    async def test_client_rebuilds_seo_data(self):
+        transport = httpx.ASGITransport(app=create_app(FakePool()))
+        client_cls = functools.partial(httpx.AsyncClient, transport=transport)
+
+        with patch.object(render_client.httpx, "AsyncClient", client_cls):
+            pages = await render_client.render_pages(
+                ["https://a.test"], service_url="http://renderer"
+            )
+
+        assert isinstance(pages[0], SEOData)
+        assert pages[0].title == "Title for https://a.test"
+
+
+@pytest.mark.skipif(not PLAYWRIGHT_AVAILABLE, reason="playwright not installed")
+class TestBrowserPool:
+    """Tests against a real Chromium and a local static site."""
+
+    async def test_concurrent_renders_with_blocked_resources(self, fixture_site):
+        urls = [f"{fixture_site}/page{n}.html" for n in range(4)]
+
+        async with BrowserPool(size=2) as pool:
+            pages = await pool.crawl_many(urls)
+
+        assert [p.title for p in pages] == [f"Fixture {n}" for n in range(4)]
+        assert all(p.error is None for p in pages)
+        assert pages[0].h2_tags == ["Rendered 0"]
+        # Image bytes are blocked but the elements are still counted
+        assert pages[0].total_images == 2
+        assert pages[0].images_without_alt == 1
+
+    async def test_pages_and_contexts_recycled(self, fixture_site):
+        url = f"{fixture_site}/page0.html"
+
+        async with BrowserPool(size=1, page_max_uses=2, context_max_pages=2) as pool:
+            for _ in range(6):
+                await pool.crawl_page(url)
+            stats = pool.stats()
+
+        assert stats["renders"] == 6
+        assert stats["recycled_pages"] == 2
+        assert stats["recycled_contexts"] == 1
@@ -0,0 +1,182 @@
+"""Tests for the buffered cost ledger and its rollups."""
+
+import threading
+import time
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+import database
+from database import Audit, CostEvent, CostRollup
+from packages.core import cost_tracker
+from packages.core.cost_tracker import (
+    CostLedger,
+    check_cost_ceiling,
+    get_audit_cost_summary,
+    get_tenant_daily_costs,
+    record_cost_event,
+)
+
+
+@pytest.fixture
+def db(sqlite_session_factory):
+    session = sqlite_session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def ledger():
+    ledger = CostLedger(flush_size=10)
+    with patch.object(cost_tracker, "_ledger", ledger):
+        yield ledger
+
+
+def _record(db, audit_id="audit_1", model="gpt-5-mini", tenant_id="tenant_1", phase="ai"):
+    return record_cost_event(
+        db=db,
+        audit_id=audit_id,
+        provider="openai",
+        operation="chat",
+        model=model,
+        prompt_tokens=1000,
+        completion_tokens=500,
+        phase=phase,
+        tenant_id=tenant_id,
+    )
+
+
+class TestBufferedRecording:
+    """Tests for recording without per-event commits."""
+
+    def test_record_is_counted_but_not_written(self, db, ledger):
+        with patch.object(db, "commit") as commit:
+            _record(db)
+            _record(db, phase="content")
+
+        commit.assert_not_called()
+        assert db.query(CostEvent).count() == 0
+        summary = get_audit_cost_summary(db, "audit_1")
+        assert summary["event_count"] == 2
+        assert summary["by_phase"].keys() == {"ai", "content"}
+        assert ledger.pending_count() == 2
+
+    def test_ceiling_answered_from_memory(self, db, ledger):
+        _record(db)
+        _record(db, model="imagen-4.0-ultra-generate-001")
+
+        with patch.object(db, "query", side_effect=AssertionError("no query expected")):
+            exceeded, current, ceiling = check_cost_ceiling(db, "audit_1", "low")
+
+        assert exceeded
+        expected = 0.08 + cost_tracker.calculate_cost("gpt-5-mini", 1000, 500)
+        assert current == pytest.approx(expected)
+
+    def test_flush_when_buffer_fills(self, db, ledger):
+        for _ in range(10):
+            _record(db)
+
+        assert ledger.pending_count() == 0
+        assert db.query(CostEvent).count() == 10
+
+    def test_full_buffer_wakes_flusher_instead_of_writing_inline(self, db, ledger, monkeypatch):
+        monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=db.get_bind()))
+        flushed_on = []
+        flush = ledger.flush
+
+        def recording_flush(*args):
+            flushed_on.append(threading.current_thread())
+            return flush(*args)
+
+        monkeypatch.setattr(ledger, "flush", recording_flush)
+        ledger.start_flusher(interval=60)
+        try:
+            for _ in range(10):
+                _record(db)
+            deadline = time.monotonic() + 2
+            while ledger.pending_count() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert db.query(CostEvent).count() == 10
+            assert threading.main_thread() not in flushed_on
+        finally:
+            ledger.stop_flusher()
+
+
+class TestFlush:
+    """Tests for batch writes and rollups."""
+
+    def test_flush_writes_events_and_accumulates_rollups(self, db, ledger):
+        _record(db)
+        _record(db, audit_id="audit_2")
+        ledger.flush(db)
+        _record(db)
+        ledger.flush(db)
+
+        assert db.query(CostEvent).count() == 3
+        rollup = db.query(CostRollup).one()
+        assert rollup.tenant_id == "tenant_1"
+        assert rollup.event_count == 3
+        assert rollup.total_tokens == 4500
+
+        daily = get_tenant_daily_costs(db, "tenant_1", start=date.today())
+        assert daily[0]["cost_usd"] == pytest.approx(
+            3 * cost_tracker.calculate_cost("gpt-5-mini", 1000, 500)
+        )
+
+    def test_flush_leaves_caller_transaction_alone(self, db, ledger):
+        _record(db)
+        db.add(Audit(id="audit_x", url="https://a.com", company_name="A", tier="low"))
+
+        assert ledger.flush(db) == 1
+        db.rollback()
+
+        assert db.query(CostEvent).count() == 1
+        assert db.query(Audit).count() == 0
+
+    def test_phase_flush_writes_only_that_audit(self, db, ledger):
+        _record(db)
+        _record(db, audit_id="audit_2")
+
+        assert cost_tracker.flush_cost_events(db, "audit_1") == 1
+
+        assert [e.audit_id for e in db.query(CostEvent).all()] == ["audit_1"]
+        assert ledger.pending_count() == 1
+
+    def test_failed_flush_keeps_events_for_retry(self, db, ledger):
+        _record(db)
+
+        with patch.object(cost_tracker, "_upsert_rollups", side_effect=RuntimeError("db down")):
+            assert ledger.flush(db) == 0
+
+        assert ledger.pending_count() == 1
+        assert ledger.flush(db) == 1
+        assert db.query(CostEvent).count() == 1
+
+    def test_totals_seeded_from_written_events(self, db, ledger):
+        _record(db)
+        _record(db, phase="content")
+        ledger.finish_audit(db, "audit_1")
+
+        fresh = CostLedger()
+        with patch.object(cost_tracker, "_ledger", fresh):
+            summary = get_audit_cost_summary(db, "audit_1")
+
+        assert summary["event_count"] == 2
+        assert summary["by_provider"]["openai"]["total_tokens"] == 3000
+
+    def test_totals_see_events_written_by_other_processes(self, db, ledger):
+        _record(db)
+        ledger.flush(db)
+        assert get_audit_cost_summary(db, "audit_1")["event_count"] == 1
+
+        other = CostLedger()
+        with patch.object(cost_tracker, "_ledger", other):
+            _record(db)
+            other.flush(db)
+
+        assert get_audit_cost_summary(db, "audit_1")["event_count"] == 2
+        _record(db)
+        _, current, _ = check_cost_ceiling(db, "audit_1", "low")
+        assert current == pytest.approx(3 * cost_tracker.calculate_cost("gpt-5-mini", 1000, 500))
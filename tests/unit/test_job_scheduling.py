@@ -0,0 +1,291 @@
+"""Tests for fair-share job claiming and coalescing of identical jobs."""
+
+import asyncio
+import json
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from apps.worker import executor
+from apps.worker.executor import claim_job, complete_followers
+from database import TenantQuota
+from packages.core.scheduling import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    QUEUE_DEPTH_GAUGE,
+    QUEUE_WAIT_HISTOGRAM,
+    job_priority,
+)
+from packages.seo_health_report.metrics import metrics
+from packages.seo_health_report.scripts.idempotency import compute_coalesce_key
+
+@pytest.fixture
+def session_factory(monkeypatch, sqlite_session_factory):
+    monkeypatch.setattr(executor, "SessionLocal", sqlite_session_factory)
+    return sqlite_session_factory
+
+
+def add_job(
+    factory,
+    tenant_id,
+    priority=PRIORITY_INTERACTIVE,
+    age_seconds=0,
+    status="queued",
+    payload=None,
+):
+    job_id = str(uuid.uuid4())
+    payload = payload or {"type": "competitor_audit"}
+    with factory() as db:
+        db.execute(
+            text("""
+                INSERT INTO audit_jobs
+                (job_id, tenant_id, audit_id, status, idempotency_key, payload_json, priority,
+                 coalesce_key, queued_at, locked_until)
+                VALUES (:job_id, :tenant_id, :audit_id, :status, :job_id, :payload, :priority,
+                        :coalesce_key, datetime('now', :age), datetime('now', '+300 seconds'))
+            """),
+            {
+                "job_id": job_id,
+                "tenant_id": tenant_id,
+                "audit_id": f"audit_{job_id[:8]}",
+                "status": status,
+                "payload": json.dumps(payload),
+                "priority": priority,
+                "coalesce_key": compute_coalesce_key(payload),
+                "age": f"{-age_seconds} seconds",
+            },
+        )
+        db.commit()
+    return job_id
+
+
+def set_concurrency(factory, tenant_id, max_concurrent):
+    with factory() as db:
+        db.add(
+            TenantQuota(
+                id=str(uuid.uuid4()), tenant_id=tenant_id, max_concurrent_audits=max_concurrent
+            )
+        )
+        db.commit()
+
+
+class TestJobPriority:
+    """Tests for assigning queue priority."""
+
+    def test_lanes_and_tiers(self):
+        assert job_priority("low") == PRIORITY_INTERACTIVE
+        assert job_priority("enterprise") > job_priority("basic")
+        assert job_priority("high", interactive=False) == PRIORITY_BULK + 1
+        assert job_priority("high", interactive=False) < job_priority("low")
+
+
+class TestClaimJob:
+    """Tests for claim order."""
+
+    def test_interactive_before_older_bulk(self, session_factory):
+        add_job(session_factory, "agency", PRIORITY_BULK, age_seconds=60)
+        interactive = add_job(session_factory, "small")
+
+        assert claim_job("worker-1").job_id == interactive
+
+    def test_high_tier_before_older_same_lane(self, session_factory):
+        add_job(session_factory, "basic", job_priority("basic"), age_seconds=60)
+        enterprise = add_job(session_factory, "big", job_priority("enterprise"))
+
+        assert claim_job("worker-1").job_id == enterprise
+
+    def test_tenant_with_fewer_running_goes_first(self, session_factory):
+        add_job(session_factory, "agency", status="running")
+        for _ in range(3):
+            add_job(session_factory, "agency", age_seconds=120)
+        small = add_job(session_factory, "small")
+
+        assert claim_job("worker-1").job_id == small
+        assert claim_job("worker-1").tenant_id == "agency"
+
+    def test_share_is_weighted_by_concurrency_allowance(self, session_factory):
+        set_concurrency(session_factory, "enterprise", 20)
+        set_concurrency(session_factory, "basic", 2)
+        add_job(session_factory, "enterprise", status="running")
+        add_job(session_factory, "basic", status="running")
+        add_job(session_factory, "basic", age_seconds=60)
+        enterprise = add_job(session_factory, "enterprise")
+
+        assert claim_job("worker-1").job_id == enterprise
+
+    def test_tenant_at_concurrency_cap_is_skipped(self, session_factory):
+        set_concurrency(session_factory, "agency", 1)
+        add_job(session_factory, "agency", status="running")
+        add_job(session_factory, "agency", age_seconds=60)
+
+        assert claim_job("worker-1") is None
+
+        other = add_job(session_factory, "small")
+        assert claim_job("worker-1").job_id == other
+
+    def test_waiting_bulk_jobs_age_into_the_interactive_lane(self, session_factory):
+        old_bulk = add_job(session_factory, "agency", PRIORITY_BULK, age_seconds=3 * 3600)
+        add_job(session_factory, "small")
+
+        assert claim_job("worker-1").job_id == old_bulk
+
+    def test_aged_flood_does_not_outrank_another_tenants_fresh_job(self, session_factory):
+        add_job(session_factory, "agency", PRIORITY_BULK, status="running")
+        for _ in range(20):
+            add_job(session_factory, "agency", PRIORITY_BULK, age_seconds=6 * 3600)
+        fresh = add_job(session_factory, "small", PRIORITY_BULK)
+
+        assert claim_job("worker-1").job_id == fresh
+
+    def test_aging_stops_after_one_lane(self, session_factory):
+        add_job(session_factory, "agency", PRIORITY_BULK, age_seconds=6 * 3600)
+        enterprise = add_job(session_factory, "big", job_priority("enterprise"))
+
+        assert claim_job("worker-1").job_id == enterprise
+
+    def test_jobs_backing_off_are_not_claimed(self, session_factory):
+        add_job(session_factory, "small", age_seconds=-300)
+
+        assert claim_job("worker-1") is None
+
+
+class TestQueueMetrics:
+    """Tests for the queue wait and depth metrics."""
+
+    def test_wait_and_depth_exported(self, session_factory, monkeypatch):
+        monkeypatch.setattr(executor, "_queue_metrics_refreshed", 0.0)
+        labels = {"tenant_id": "small", "lane": "interactive"}
+        before = metrics.get_histogram_stats(QUEUE_WAIT_HISTOGRAM, labels)["count"]
+        add_job(session_factory, "small", age_seconds=30)
+        add_job(session_factory, "small", age_seconds=10)
+
+        claim_job("worker-1")
+
+        stats = metrics.get_histogram_stats(QUEUE_WAIT_HISTOGRAM, labels)
+        assert stats["count"] == before + 1
+        assert metrics.get_gauge(QUEUE_DEPTH_GAUGE, {"tenant_id": "small"}) == 1
+
+
+AUDIT = {"type": "audit", "url": "https://acme.com/", "company_name": "Acme", "tier": "low"}
+
+
+class TestCoalesceKey:
+    """Tests for the key shared by identical audit jobs."""
+
+    def test_same_audit_from_any_source_or_tenant(self):
+        dashboard = {
+            "url": "HTTPS://Acme.com",
+            "job_type": "dashboard_audit",
+            "company_name": "Acme ",
+            "tier": "basic",
+            "trade_type": "plumbing",
+        }
+        batch = {**AUDIT, "tenant_id": "tenant-2", "batch_id": "batch_1", "keywords": []}
+
+        assert compute_coalesce_key(dashboard) == compute_coalesce_key(batch)
+
+    def test_inputs_the_audit_reads_separate_keys(self):
+        key = compute_coalesce_key(AUDIT)
+
+        assert key != compute_coalesce_key({**AUDIT, "tier": "high"})
+        assert key != compute_coalesce_key({**AUDIT, "keywords": ["pipes"]})
+        assert key != compute_coalesce_key({**AUDIT, "company_name": "Other"})
+        assert compute_coalesce_key({**AUDIT, "type": "hello_audit"}) is None
+
+
+class TestCoalescing:
+    """Tests for identical jobs waiting on and sharing one run."""
+
+    def test_identical_job_waits_while_one_runs(self, session_factory):
+        add_job(session_factory, "tenant-1", status="running", payload=AUDIT)
+        add_job(session_factory, "tenant-2", age_seconds=60, payload=AUDIT)
+
+        assert claim_job("worker-1") is None
+
+        other = add_job(session_factory, "tenant-2", payload={**AUDIT, "tier": "high"})
+        assert claim_job("worker-1").job_id == other
+
+    async def test_followers_take_the_leader_result(self, session_factory, monkeypatch):
+        finalized = []
+
+        async def fake_finalize(db, audit_id, payload, raw_result):
+            finalized.append((audit_id, payload["tenant_id"], raw_result))
+            db.commit()
+
+        async def fake_progress(*args):
+            pass
+
+        monkeypatch.setattr(executor, "finalize_audit", fake_finalize)
+        monkeypatch.setattr(executor, "write_progress_event", fake_progress)
+        set_concurrency(session_factory, "tenant-2", 5)
+        with session_factory() as db:
+            db.execute(text("UPDATE tenant_quotas SET concurrent_audits = 1"))
+            db.commit()
+
+        leader_id = add_job(session_factory, "tenant-1", status="running", payload=AUDIT)
+        follower_id = add_job(session_factory, "tenant-2", payload=AUDIT)
+        add_job(session_factory, "tenant-2", payload={**AUDIT, "tier": "high"})
+        with session_factory() as db:
+            leader = executor.AuditJob.from_row(
+                db.execute(
+                    text("SELECT * FROM audit_jobs WHERE job_id = :id"), {"id": leader_id}
+                ).fetchone()
+            )
+
+            completed = await complete_followers(db, leader, {"score": 80})
+
+            follower = db.execute(
+                text("SELECT status, leader_job_id FROM audit_jobs WHERE job_id = :id"),
+                {"id": follower_id},
+            ).fetchone()
+            slots = db.execute(text("SELECT concurrent_audits FROM tenant_quotas")).scalar()
+
+        assert completed == 1
+        assert finalized == [(f"audit_{follower_id[:8]}", "tenant-2", {"score": 80})]
+        assert tuple(follower) == ("done", leader_id)
+        assert slots == 0
+
+    async def test_lease_outlived_by_followers_is_renewed(self, session_factory, monkeypatch):
+        claims = []
+
+        async def fake_audit(audit_id, job_id, payload, db, worker_id, lease_seconds):
+            return {"raw": {"score": 80}}
+
+        async def slow_finalize(db, audit_id, payload, raw_result):
+            db.commit()
+            # Let the leader's lease run out partway through the follower loop
+            db.execute(
+                text("UPDATE audit_jobs SET locked_until = datetime('now', '-1 seconds')")
+            )
+            db.commit()
+            await asyncio.sleep(1.5)
+            claims.append(claim_job("worker-2"))
+
+        async def fake_progress(*args):
+            pass
+
+        monkeypatch.setattr(executor, "handle_full_audit", fake_audit)
+        monkeypatch.setattr(executor, "finalize_audit", slow_finalize)
+        monkeypatch.setattr(executor, "write_progress_event", fake_progress)
+
+        leader_id = add_job(session_factory, "tenant-1", status="running", payload=AUDIT)
+        add_job(session_factory, "tenant-2", payload=AUDIT)
+        with session_factory() as db:
+            db.execute(
+                text("UPDATE audit_jobs SET locked_by = 'worker-1' WHERE job_id = :id"),
+                {"id": leader_id},
+            )
+            db.commit()
+            leader = executor.AuditJob.from_row(
+                db.execute(
+                    text("SELECT * FROM audit_jobs WHERE job_id = :id"), {"id": leader_id}
+                ).fetchone()
+            )
+
+        await executor._execute_audit(leader, worker_id="worker-1", lease_seconds=2)
+
+        assert claims == [None]
+        with session_factory() as db:
+            statuses = db.execute(text("SELECT status FROM audit_jobs")).scalars().all()
+        assert sorted(statuses) == ["done", "running"]
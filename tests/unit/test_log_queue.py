@@ -0,0 +1,141 @@
+"""Tests for queued log output."""
+
+import json
+import logging
+import queue
+import threading
+from io import StringIO
+
+import pytest
+
+from packages.seo_health_report.metrics import metrics
+from packages.seo_health_report.seo_logging import log_queue, structured_logger
+from packages.seo_health_report.seo_logging.log_queue import (
+    DROPPED_COUNTER,
+    ContextQueueHandler,
+    SamplingFilter,
+    parse_sample_rates,
+    start_queue_logging,
+    stop_queue_logging,
+)
+from packages.seo_health_report.seo_logging.structured_logger import (
+    JSONFormatter,
+    clear_request_context,
+    set_request_context,
+)
+
+
+class RecordingHandler(logging.StreamHandler):
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.threads = set()
+
+    def emit(self, record):
+        self.threads.add(threading.current_thread())
+        super().emit(record)
+
+
+def dropped(reason):
+    return metrics.get_counter(DROPPED_COUNTER, {"reason": reason})
+
+
+@pytest.fixture
+def output(monkeypatch):
+    monkeypatch.setattr(log_queue, "LOG_QUEUE_ENABLED", True)
+    monkeypatch.setattr(structured_logger, "_loggers", {})
+    monkeypatch.setattr(log_queue, "_loggers", structured_logger._loggers)
+    root = logging.getLogger()
+    root_handlers = list(root.handlers)
+
+    stream = StringIO()
+    handler = RecordingHandler(stream)
+    handler.setFormatter(JSONFormatter())
+    yield stream, handler
+
+    stop_queue_logging()
+    root.handlers = root_handlers
+
+
+class TestSampling:
+    """Tests for per-logger sampling."""
+
+    def test_parse_rates(self):
+        assert parse_sample_rates("a.b=0.1, c=2,bad,d=x,=0.5") == {"a.b": 0.1, "c": 1.0}
+
+    def test_most_specific_logger_rate_applies(self):
+        sampler = SamplingFilter({"app": 0.5, "app.http": 0.0})
+
+        assert sampler.rate_for("app.http.access") == 0.0
+        assert sampler.rate_for("app.db") == 0.5
+        assert sampler.rate_for("other") == 1.0
+
+    def test_warnings_are_never_sampled(self):
+        sampler = SamplingFilter({"app": 0.0})
+        before = dropped("sampled")
+
+        def record(level):
+            return logging.LogRecord("app", level, "x.py", 1, "m", (), None)
+
+        assert sampler.filter(record(logging.WARNING))
+        assert not sampler.filter(record(logging.DEBUG))
+        assert dropped("sampled") == before + 1
+
+
+class TestContextQueueHandler:
+    """Tests for queuing records."""
+
+    def test_context_and_message_captured_at_log_time(self):
+        handler = ContextQueueHandler(queue.Queue())
+        record = logging.LogRecord("app", logging.INFO, "x.py", 1, "user %s", ("alice",), None)
+        set_request_context(request_id="req-1", tenant_id="tenant-1")
+        try:
+            handler.handle(record)
+        finally:
+            clear_request_context()
+
+        queued = handler.queue.get_nowait()
+        data = json.loads(JSONFormatter().format(queued))
+        assert data["message"] == "user alice"
+        assert (data["request_id"], data["tenant_id"]) == ("req-1", "tenant-1")
+        assert "user_id" not in data
+
+    def test_full_queue_drops_instead_of_blocking(self, monkeypatch):
+        monkeypatch.setattr(log_queue, "LOG_QUEUE_BLOCK_SECONDS", 0.01)
+        handler = ContextQueueHandler(queue.Queue(maxsize=1))
+        before = dropped("backpressure")
+
+        for level in (logging.INFO, logging.INFO, logging.ERROR):
+            handler.handle(logging.LogRecord("app", level, "x.py", 1, "m", (), None))
+
+        assert handler.queue.qsize() == 1
+        assert dropped("backpressure") == before + 2
+
+
+class TestQueueLogging:
+    """Tests for routing loggers through the listener thread."""
+
+    def test_loggers_write_from_the_listener(self, output):
+        stream, handler = output
+        existing = structured_logger.get_logger("test.queue.existing")
+
+        start_queue_logging(handler)
+        created = structured_logger.get_logger("test.queue.created")
+        set_request_context(request_id="req-9")
+        try:
+            existing.info("first", extra_data={"n": 1})
+            created.warning("second")
+        finally:
+            clear_request_context()
+        stop_queue_logging()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line["message"] for line in lines] == ["first", "second"]
+        assert lines[0]["extra"] == {"n": 1}
+        assert lines[1]["request_id"] == "req-9"
+        assert threading.main_thread() not in handler.threads
+
+    def test_disabled(self, output, monkeypatch):
+        monkeypatch.setattr(log_queue, "LOG_QUEUE_ENABLED", False)
+
+        assert start_queue_logging(output[1]) is None
+        assert log_queue.get_queue_handler() is None
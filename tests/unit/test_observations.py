@@ -0,0 +1,189 @@
+"""Tests for the tenant-neutral observation store."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import database
+from database import Observation
+from packages.core import observations
+from packages.core.observations import (
+    ObservationKind,
+    get_observation,
+    observation_key,
+    observed,
+    purge_expired_observations,
+    put_observation,
+)
+
+
+@pytest.fixture
+def store(monkeypatch, sqlite_session_factory):
+    monkeypatch.setattr(database, "SessionLocal", sqlite_session_factory)
+    monkeypatch.setattr(observations, "OBSERVATION_STORE_ENABLED", True)
+    return sqlite_session_factory
+
+
+class TestObservationKey:
+    """Tests for observation keys."""
+
+    def test_equivalent_urls_share_a_key(self):
+        assert observation_key(ObservationKind.PAGE, "HTTPS://Example.com:443/a/#top") == (
+            observation_key(ObservationKind.PAGE, "https://example.com/a")
+        )
+
+    def test_kind_qualifiers_and_version_separate_keys(self, monkeypatch):
+        base = observation_key(ObservationKind.PAGESPEED, "https://a.com/", ("", "mobile"))
+
+        assert base != observation_key(ObservationKind.PAGESPEED, "https://a.com/", ("", "desktop"))
+        assert base != observation_key(ObservationKind.PAGE, "https://a.com/", ("", "mobile"))
+
+        monkeypatch.setitem(observations.ANALYZER_VERSIONS, ObservationKind.PAGESPEED, "2")
+        assert base != observation_key(ObservationKind.PAGESPEED, "https://a.com/", ("", "mobile"))
+
+    def test_brand_names_ignore_case_and_spacing(self):
+        assert observation_key(ObservationKind.KNOWLEDGE_GRAPH, "  Acme   Corp") == (
+            observation_key(ObservationKind.KNOWLEDGE_GRAPH, "acme corp")
+        )
+
+
+class TestStore:
+    """Tests for reading and writing observations."""
+
+    def test_round_trip(self, store):
+        put_observation(ObservationKind.SITEMAP, "https://a.com", {"total_urls": 3})
+
+        assert get_observation(ObservationKind.SITEMAP, "https://a.com/") == {"total_urls": 3}
+
+    def test_expired_observation_is_a_miss_and_purged(self, store):
+        put_observation(ObservationKind.ROBOTS, "https://a.com/robots.txt", "User-agent: *")
+        session = store()
+        row = session.query(Observation).one()
+        row.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        session.commit()
+        session.close()
+
+        assert get_observation(ObservationKind.ROBOTS, "https://a.com/robots.txt") is None
+        assert purge_expired_observations() == 1
+
+    def test_disabled_store_reads_and_writes_nothing(self, store, monkeypatch):
+        monkeypatch.setattr(observations, "OBSERVATION_STORE_ENABLED", False)
+
+        put_observation(ObservationKind.PAGE, "https://a.com/", "<html></html>")
+
+        assert store().query(Observation).count() == 0
+
+    def test_database_errors_are_misses(self, monkeypatch):
+        # No observations table
+        monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=create_engine("sqlite://")))
+        monkeypatch.setattr(observations, "OBSERVATION_STORE_ENABLED", True)
+
+        put_observation(ObservationKind.PAGE, "https://a.com/", "<html></html>")
+
+        assert get_observation(ObservationKind.PAGE, "https://a.com/") is None
+
+
+class TestObserved:
+    """Tests for the observed decorator."""
+
+    def test_fetchers_of_a_kind_share_observations(self, store):
+        calls = []
+
+        @observed(ObservationKind.PAGE)
+        def fetch_page(url, timeout=30):
+            calls.append(url)
+            return "<html>a</html>"
+
+        @observed(ObservationKind.PAGE)
+        def other_fetch_page(url, timeout=10):
+            calls.append(url)
+            return "<html>b</html>"
+
+        assert fetch_page("https://a.com/") == "<html>a</html>"
+        assert other_fetch_page("https://A.com") == "<html>a</html>"
+        assert calls == ["https://a.com/"]
+
+    def test_failed_results_are_not_kept(self, store):
+        calls = []
+
+        @observed(ObservationKind.PAGE)
+        def fetch_page(url):
+            calls.append(url)
+            return None
+
+        fetch_page("https://a.com/")
+        fetch_page("https://a.com/")
+
+        assert len(calls) == 2
+
+    async def test_async_params_select_and_other_args_ignored(self, store):
+        calls = []
+
+        @observed(ObservationKind.PAGESPEED, params=("strategy",), keep=lambda r: r["success"])
+        async def get_psi(url, strategy="mobile", api_key=None):
+            calls.append(strategy)
+            return {"success": True, "strategy": strategy}
+
+        await get_psi("https://a.com/", "mobile", api_key="tenant-1-key")
+        cached = await get_psi("https://a.com/", "mobile", api_key="tenant-2-key")
+        await get_psi("https://a.com/", "desktop")
+
+        assert cached == {"success": True, "strategy": "mobile"}
+        assert calls == ["mobile", "desktop"]
+
+    def test_unreachable_robots_is_not_kept(self, store):
+        from packages.core.robots import fetch_robots_txt
+
+        with patch("requests.get", return_value=MagicMock(status_code=503)) as get:
+            assert fetch_robots_txt("https://a.com/robots.txt") is None
+            assert fetch_robots_txt("https://a.com/robots.txt") is None
+        assert get.call_count == 2
+
+        with patch("requests.get", return_value=MagicMock(status_code=404)) as get:
+            assert fetch_robots_txt("https://a.com/robots.txt") == ""
+            assert fetch_robots_txt("https://a.com/robots.txt") == ""
+        assert get.call_count == 1
+
+    def test_sitemaps_kept_only_when_one_was_read(self, store):
+        from packages.seo_technical_audit.scripts import crawl_site
+
+        sitemap = b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        sitemap += b"<url><loc>https://a.com/</loc></url></urlset>"
+        sitemaps = ["https://a.com/sitemap.xml"]
+        responses = {"https://a.com/sitemap.xml": None}
+
+        def stream_url(url, *args):
+            if responses.get(url) is None:
+                raise ConnectionError("timed out")
+            return iter([responses[url]])
+
+        with patch.object(crawl_site, "stream_url", stream_url):
+            failed = crawl_site.check_shared_sitemaps("https://a.com", sitemaps)
+            responses["https://a.com/sitemap.xml"] = sitemap
+            found = crawl_site.check_shared_sitemaps("https://a.com", sitemaps)
+            responses["https://a.com/sitemap.xml"] = None
+            stored = crawl_site.check_shared_sitemaps("https://a.com", sitemaps)
+
+        assert failed["sitemaps_found"] == []
+        assert found["total_urls"] == 1
+        assert stored == found
+
+    def test_encode_and_decode(self, store):
+        from packages.ai_visibility_audit.scripts.check_knowledge import (
+            KnowledgeSource,
+            check_wikidata,
+        )
+
+        put_observation(
+            ObservationKind.KNOWLEDGE_GRAPH,
+            "Acme",
+            {"source": "wikidata", "found": True, "url": "https://w/Q1"},
+            ("wikidata",),
+        )
+
+        assert check_wikidata("acme") == KnowledgeSource(
+            source="wikidata", found=True, url="https://w/Q1"
+        )
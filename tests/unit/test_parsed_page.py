@@ -0,0 +1,146 @@
+"""Tests for the single-pass HTML document model and the analyzers using it."""
+
+from packages.ai_visibility_audit.scripts.check_parseability import (
+    check_content_extraction,
+    check_structured_data,
+)
+from packages.core.parsed_page import parse_page
+from packages.seo_content_authority.scripts.analyze_content import (
+    analyze_media_richness,
+    extract_text_content,
+)
+from packages.seo_content_authority.scripts.analyze_links import extract_internal_links
+from packages.seo_technical_audit.scripts.check_mobile import check_viewport_tag
+from packages.seo_technical_audit.scripts.crawl_site import (
+    analyze_canonical,
+    analyze_internal_links,
+    analyze_meta_robots,
+)
+from packages.seo_technical_audit.scripts.validate_schema import extract_structured_data
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <title>Widgets &amp; Gadgets | Example</title>
+  <meta content="noindex, follow" name="robots">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <meta name="description" content="All about widgets">
+  <meta property="article:published_time" content="2024-01-02T00:00:00Z">
+  <link rel="canonical" href="https://example.com/widgets/">
+  <link rel="stylesheet" href="http://cdn.example.com/site.css">
+  <script type="application/ld+json">{"@type": "Article", "author": {"name": "Ada Lovelace"}}</script>
+  <script type="application/ld+json">{not json</script>
+  <style>.hero { background: url("http://cdn.example.com/hero.png") }</style>
+</head>
+<body>
+  <header><nav><a href="/about">About <b>us</b></a></nav></header>
+  <main itemscope itemtype="https://schema.org/Product">
+    <h1>Widgets</h1>
+    <h2>Sizes</h2>
+    <p>The <em>best</em> widgets. <span class="author">Grace Hopper</span></p>
+    <!-- <a href="/commented-out">hidden</a> -->
+    <img src="/a.png" alt=""><img src="http://cdn.example.com/b.png">
+    <a href="https://other.com/x" rel="nofollow sponsored">Partner</a>
+    <a href="mailto:hi@example.com">Mail</a>
+    <div typeof="Person"></div>
+    <script>document.write("<p>not text</p>")</script>
+    <noscript>Please enable JavaScript</noscript>
+  </main>
+</body>
+</html>"""
+
+
+class TestParsedPage:
+    """Tests for what a single parse extracts."""
+
+    def test_head(self):
+        page = parse_page(PAGE)
+
+        assert page.title == "Widgets & Gadgets | Example"
+        assert page.lang == "en"
+        assert page.meta("robots") == "noindex, follow"
+        assert page.meta("article:published_time", "property") == "2024-01-02T00:00:00Z"
+        assert page.canonical == "https://example.com/widgets/"
+
+    def test_body_elements(self):
+        page = parse_page(PAGE)
+
+        assert [(a.href, a.text, a.in_navigation) for a in page.anchors[:2]] == [
+            ("/about", "About us", True),
+            ("https://other.com/x", "Partner", False),
+        ]
+        assert page.anchors[1].rel == "nofollow sponsored"
+        assert [(h.level, h.text) for h in page.headings] == [(1, "Widgets"), (2, "Sizes")]
+        assert [image.alt for image in page.images] == ["", None]
+        assert page.author_texts == ["Grace Hopper"]
+        assert page.noscript_texts == ["Please enable JavaScript"]
+        assert len(page.json_ld) == 2
+        assert page.microdata_types == ["https://schema.org/Product"]
+        assert page.rdfa_types == ["Person"]
+
+    def test_visible_text_and_word_offsets(self):
+        page = parse_page(PAGE)
+
+        assert "The best widgets. Grace Hopper" in page.text
+        assert "not text" not in page.text
+        assert "enable JavaScript" not in page.text
+        assert "commented-out" not in page.text
+        for word, offset in zip(page.words, page.word_offsets):
+            assert page.text[offset : offset + len(word)] == word
+
+    def test_resources(self):
+        resources = parse_page(PAGE).resources
+
+        assert ("href", "http://cdn.example.com/site.css") in resources
+        assert ("url()", "http://cdn.example.com/hero.png") in resources
+        assert ("src", "http://cdn.example.com/b.png") in resources
+
+    def test_parse_is_shared(self):
+        assert parse_page(PAGE) is parse_page(PAGE)
+
+    def test_empty_and_fragment(self):
+        assert parse_page("").text == ""
+        assert parse_page("<p>Just <b>a</b> fragment").text == "Just a fragment"
+
+
+class TestAnalyzersUseParsedPage:
+    """Tests for analyzers reading the shared parse."""
+
+    def test_technical_analyzers(self):
+        robots = analyze_meta_robots(PAGE, "https://example.com/widgets")
+        assert robots["indexable"] is False
+        assert robots["followable"] is True
+
+        canonical = analyze_canonical(PAGE, "https://example.com/widgets")
+        assert canonical["is_self_referencing"] is True
+
+        links = analyze_internal_links(PAGE, "https://example.com/widgets", "https://example.com")
+        assert links["internal_links"] == 1
+        assert links["external_links"] == 1
+        assert links["nofollow_links"] == 1
+
+        assert check_viewport_tag(PAGE)["valid"] is True
+
+    def test_structured_data(self):
+        data = extract_structured_data(PAGE)
+
+        assert data["json_ld"][0]["@type"] == "Article"
+        assert data["json_ld"][1]["_parse_error"] is True
+        assert data["microdata"][0]["@type"] == "Product"
+        assert data["rdfa"] == [{"@type": "Person", "_format": "rdfa"}]
+
+        summary = check_structured_data(PAGE)
+        assert summary["has_json_ld"] and summary["has_microdata"] and summary["has_rdfa"]
+
+    def test_content_analyzers(self):
+        assert "not text" not in extract_text_content(PAGE)
+        assert analyze_media_richness(PAGE)["images_with_alt"] == 1
+
+        details = check_content_extraction(PAGE)["details"]
+        assert details["has_meta_description"] and details["has_title"]
+        assert details["image_count"] == 2
+
+        links = extract_internal_links(PAGE, "https://example.com/widgets", "https://example.com")
+        assert [(link.target_url, link.is_navigation) for link in links] == [
+            ("https://example.com/about", True)
+        ]
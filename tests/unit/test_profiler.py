@@ -0,0 +1,159 @@
+"""Tests for the on-demand sampling profiler and loop blocking monitor."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from packages.core.profiler import ProfilerBusyError, StackSampler, profile
+
+
+def spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+async def blocking_audit_step():
+    await asyncio.sleep(0.01)
+    time.sleep(0.15)  # Sync I/O stand-in
+
+
+class TestStackSampler:
+    """Tests for sampling thread stacks."""
+
+    def test_samples_collapsed_stacks_of_other_threads(self):
+        stop = threading.Event()
+        worker = threading.Thread(target=spin, args=(stop,), name="spinner")
+        worker.start()
+        sampler = StackSampler(interval=0.002)
+        sampler.start()
+        time.sleep(0.1)
+        sampler.stop()
+        stop.set()
+        worker.join()
+
+        spinning = [stack for stack in sampler.stacks if stack.startswith("spinner;")]
+        assert sampler.samples > 0
+        assert spinning
+        assert "spin (tests/unit/test_profiler.py:" in spinning[0].split(";")[-1]
+        assert not any(stack.startswith("stack-sampler;") for stack in sampler.stacks)
+
+
+class TestProfile:
+    """Tests for profiling windows and blocking detection."""
+
+    async def test_flags_callbacks_blocking_the_loop(self):
+        task = asyncio.create_task(blocking_audit_step())
+        report = await profile(0.3, interval=0.005, block_threshold=0.05)
+        await task
+
+        assert [event.callback for event in report.blocking] == ["blocking_audit_step"]
+        event = report.blocking[0]
+        assert event.duration >= 0.15
+        assert event.stack[-1].startswith("blocking_audit_step (tests/unit/test_profiler.py:")
+
+        usage = report.callbacks["blocking_audit_step"]
+        assert usage.blocking_steps == 1
+        assert usage.steps == 2
+
+        data = report.to_dict()
+        assert data["loop_time"][0]["callback"] == "blocking_audit_step"
+        assert data["collapsed"] == report.collapsed()
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in report.collapsed().splitlines())
+
+    async def test_one_profile_at_a_time(self):
+        running = asyncio.create_task(profile(0.1))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ProfilerBusyError):
+            await profile(0.1)
+        await running
+
+    async def test_loop_restored_after_profile(self):
+        original = asyncio.events.Handle._run
+        await profile(0.01)
+
+        assert asyncio.events.Handle._run is original
+
+    async def test_write(self, tmp_path):
+        report = await profile(0.02, interval=0.005)
+
+        collapsed, summary = report.write(tmp_path, "worker-1")
+
+        assert collapsed.read_text() == report.collapsed()
+        assert summary.name == "worker-1.json"
+
+
+class TestWorkerProfileWatcher:
+    """Tests for the worker's profile trigger watcher."""
+
+    async def test_keeps_watching_after_a_failed_profile(self, tmp_path, monkeypatch):
+        from apps.worker import main as worker_main
+
+        calls = []
+
+        async def flaky_profile(seconds):
+            calls.append(seconds)
+            if len(calls) == 1:
+                raise ProfilerBusyError("A profile is already running")
+            return await profile(0.02, interval=0.005)
+
+        monkeypatch.setattr(worker_main, "profile", flaky_profile)
+        monkeypatch.setattr(worker_main, "WORKER_PROFILE_DIR", str(tmp_path))
+        monkeypatch.setattr(worker_main, "WORKER_PROFILE_TRIGGER_FILE", str(tmp_path / "x"))
+        requested = asyncio.Event()
+        watcher = asyncio.create_task(worker_main.watch_profile_triggers(requested))
+        for _ in range(2):
+            requested.set()
+            while requested.is_set() and not watcher.done():
+                await asyncio.sleep(0.01)
+        while not list(tmp_path.glob("*.json")) and not watcher.done():
+            await asyncio.sleep(0.01)
+
+        assert not watcher.done()
+        watcher.cancel()
+        assert len(calls) == 2
+
+
+class TestAdminProfileEndpoint:
+    """Tests for POST /admin/profile."""
+
+    @pytest.fixture
+    def client(self):
+        from apps.admin.routes import router
+        from auth import require_admin
+
+        app = FastAPI()
+
+        async def mock_require_admin():
+            user = MagicMock()
+            user.role = "admin"
+            return user
+
+        app.include_router(router, prefix="/admin")
+        app.dependency_overrides[require_admin] = mock_require_admin
+        return TestClient(app)
+
+    def test_json_report(self, client):
+        response = client.post("/admin/profile", params={"seconds": 0.05, "interval_ms": 5})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["samples"] > 0
+        assert "blocking" in data and "loop_time" in data
+
+    def test_collapsed_stacks(self, client):
+        response = client.post("/admin/profile", params={"seconds": 0.05, "format": "collapsed"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        lines = response.text.splitlines()
+        assert lines
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_rejects_overlong_profiles(self, client):
+        assert client.post("/admin/profile", params={"seconds": 100_000}).status_code == 422
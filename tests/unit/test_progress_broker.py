@@ -0,0 +1,191 @@
+"""Tests for progress pub/sub and the live progress stream."""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from packages.seo_health_report.progress import (
+    LiveProgress,
+    ProgressBroker,
+    progress_event_dict,
+)
+
+
+def _event(event_type: str, message: str = "", pct: int = 0) -> dict:
+    return progress_event_dict(event_type, message, pct, datetime.now(timezone.utc))
+
+
+class TestProgressBroker:
+    """Tests for in-process fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_reaches_only_same_audit(self):
+        broker = ProgressBroker()
+        with await broker.subscribe("a1") as sub_a, await broker.subscribe("a2") as sub_b:
+            assert broker.dispatch("a1", _event("technical_audit")) == 1
+            assert (await sub_a.get(timeout=1))["event_type"] == "technical_audit"
+            assert await sub_b.get(timeout=0.05) is None
+
+        assert broker.subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        broker = ProgressBroker(queue_size=2)
+        with await broker.subscribe("a1") as sub:
+            for pct in (10, 20, 30):
+                broker.dispatch("a1", _event("content_audit", pct=pct))
+            await asyncio.sleep(0)
+
+            assert (await sub.get(timeout=1))["progress_pct"] == 20
+            assert (await sub.get(timeout=1))["progress_pct"] == 30
+
+    @pytest.mark.asyncio
+    async def test_publish_without_postgres_dispatches_locally(self):
+        broker = ProgressBroker()
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "sqlite"
+        with await broker.subscribe("a1") as sub:
+            broker.publish(db, "a1", _event("completed", pct=100))
+            assert (await sub.get(timeout=1))["event_type"] == "completed"
+        db.execute.assert_not_called()
+
+    def test_publish_on_postgres_uses_notify_in_transaction(self):
+        broker = ProgressBroker(channel="audit_progress")
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+
+        broker.publish(db, "a1", _event("completed", pct=100))
+
+        sql, params = db.execute.call_args[0]
+        assert "pg_notify" in str(sql)
+        assert params["channel"] == "audit_progress"
+        assert json.loads(params["payload"])["audit_id"] == "a1"
+
+    @pytest.mark.asyncio
+    async def test_notification_payload_fans_out(self):
+        broker = ProgressBroker()
+        with await broker.subscribe("a1") as sub:
+            broker._handle_notification(json.dumps({"audit_id": "a1", "event": _event("failed")}))
+            broker._handle_notification("not json")
+            assert (await sub.get(timeout=1))["event_type"] == "failed"
+
+
+    @pytest.mark.asyncio
+    async def test_subscribe_waits_until_listening(self, monkeypatch):
+        broker = ProgressBroker()
+        monkeypatch.setattr(broker, "_ensure_listener", lambda: True)
+        listening = threading.Timer(0.1, broker._listening.set)
+        listening.start()
+
+        started = time.monotonic()
+        with await broker.subscribe("a1"):
+            assert broker._listening.is_set()
+            assert time.monotonic() - started >= 0.09
+
+
+class TestLiveProgress:
+    """Tests for applying pushed events to in-memory progress."""
+
+    def test_terminal_event_finishes(self):
+        live = LiveProgress("a1", "running", "basic", datetime.now(timezone.utc), [])
+        assert not live.finished
+
+        progress = live.apply(_event("completed", "Audit completed", 100))
+
+        assert live.finished
+        assert progress.overall_status == "completed"
+        assert progress.overall_progress_pct == 100
+        assert live.event_dicts()[-1]["event_type"] == "completed"
+
+
+class TestProgressStreamEndpoint:
+    """Tests for GET /audit/{id}/progress/stream."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_then_pushed_events(self):
+        from apps.api.main import app
+        from database import get_db
+        from packages.seo_health_report.progress import get_progress_broker
+
+        session = MagicMock()
+        session.execute.return_value.fetchone.return_value = (
+            "running",
+            "basic",
+            datetime.now(timezone.utc),
+            None,
+        )
+        session.execute.return_value.fetchall.return_value = [
+            ("initializing", "Starting audit", 0, datetime.now(timezone.utc), None)
+        ]
+
+        def override():
+            yield session
+
+        broker = get_progress_broker()
+
+        async def publish_when_subscribed():
+            while broker.subscriber_count("stream-1") == 0:
+                await asyncio.sleep(0.01)
+            broker.dispatch("stream-1", _event("technical_audit", "Running technical", 10))
+            broker.dispatch("stream-1", _event("completed", "Audit completed", 100))
+
+        app.dependency_overrides[get_db] = override
+        try:
+            publisher = asyncio.create_task(publish_when_subscribed())
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/audit/stream-1/progress/stream")
+            await publisher
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        messages = [m for m in response.text.split("\n\n") if m.startswith("event:")]
+        names = [m.split("\n")[0].removeprefix("event: ") for m in messages]
+        assert names == ["snapshot", "progress", "progress"]
+
+        final = json.loads(messages[-1].split("\n")[1].removeprefix("data: "))
+        assert final["progress"]["overall_status"] == "completed"
+        assert broker.subscriber_count("stream-1") == 0
+        # One read at connect time: the audit row and its events
+        assert session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missed_terminal_event_ends_stream_on_heartbeat(self, monkeypatch):
+        from apps.api.main import app
+        from apps.api.routers import audits
+        from database import get_db
+
+        started = datetime.now(timezone.utc)
+        session = MagicMock()
+        session.execute.return_value.fetchone.return_value = ("running", "basic", started, None)
+        session.execute.return_value.fetchall.return_value = []
+
+        def override():
+            yield session
+
+        # The completed NOTIFY never arrives; only the database knows
+        finished = LiveProgress("stream-2", "completed", "basic", started, [])
+        monkeypatch.setattr(audits, "_reload_live_progress", lambda audit_id: finished)
+        monkeypatch.setattr(audits, "PROGRESS_STREAM_HEARTBEAT_SECONDS", 0.05)
+
+        app.dependency_overrides[get_db] = override
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await asyncio.wait_for(
+                    client.get("/audit/stream-2/progress/stream"), timeout=5
+                )
+        finally:
+            app.dependency_overrides.clear()
+
+        messages = [m for m in response.text.split("\n\n") if m.startswith("event:")]
+        assert [m.split("\n")[0] for m in messages] == ["event: snapshot", "event: snapshot"]
+        final = json.loads(messages[-1].split("\n")[1].removeprefix("data: "))
+        assert final["progress"]["overall_status"] == "completed"
@@ -0,0 +1,90 @@
+"""Tests for offloading audit results to the storage backend."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import inspect
+
+from database import Audit
+from packages.storage import results
+from packages.storage.client import LocalStorageBackend
+from packages.storage.results import (
+    compress_result,
+    decompress_result,
+    load_audit_result,
+    store_audit_result,
+)
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return LocalStorageBackend(base_path=str(tmp_path / "storage"))
+
+
+@pytest.fixture
+def large_result():
+    return {
+        "raw": {"robots_txt": "User-agent: *\nDisallow: /admin\n" * 500},
+        "summary": {"overall_score": 72, "grade": "C"},
+    }
+
+
+class TestCompression:
+    """Tests for blob encoding."""
+
+    def test_round_trip(self, large_result):
+        blob, _ = compress_result(large_result)
+        assert decompress_result(blob) == large_result
+
+    def test_gzip_fallback_round_trip(self, large_result):
+        with patch.object(results, "ZSTD_AVAILABLE", False):
+            blob, extension = compress_result(large_result)
+        assert extension == "gz"
+        assert decompress_result(blob) == large_result
+
+    def test_unknown_encoding_rejected(self):
+        with pytest.raises(ValueError):
+            decompress_result(b'{"plain": "json"}')
+
+
+class TestStoreAuditResult:
+    """Tests for the inline/offload decision."""
+
+    def test_small_result_stays_inline(self, backend):
+        inline, key = store_audit_result("audit-1", {"error": "boom"}, backend=backend)
+        assert inline == {"error": "boom"}
+        assert key is None
+
+    def test_large_result_is_offloaded(self, backend, large_result):
+        inline, key = store_audit_result("audit-1", large_result, "tenant-1", backend=backend)
+        assert inline is None
+        assert key.startswith("audit-results/tenant-1/audit-1.json.")
+        assert backend.exists(key)
+        assert len(backend.download(key)) < len(large_result["raw"]["robots_txt"])
+
+    def test_load_prefers_storage_pointer(self, backend, large_result):
+        _, key = store_audit_result("audit-1", large_result, backend=backend)
+        audit = SimpleNamespace(id="audit-1", result=None, result_key=key)
+        assert load_audit_result(audit, backend=backend) == large_result
+
+    def test_load_falls_back_to_inline_column(self, backend):
+        audit = SimpleNamespace(id="audit-1", result={"score": 1}, result_key=None)
+        assert load_audit_result(audit, backend=backend) == {"score": 1}
+
+    def test_missing_blob_returns_none(self, backend):
+        audit = SimpleNamespace(id="audit-1", result=None, result_key="audit-results/x.json.zst")
+        assert load_audit_result(audit, backend=backend) is None
+
+
+def test_result_column_is_deferred(sqlite_session_factory):
+    """Status and score queries must not load the result document."""
+    db = sqlite_session_factory()
+    db.add(Audit(id="audit-1", url="https://example.com", company_name="Example", result={"a": 1}))
+    db.commit()
+    db.expunge_all()
+
+    audit = db.query(Audit).filter(Audit.id == "audit-1").first()
+    assert "result" in inspect(audit).unloaded
+    assert audit.result == {"a": 1}
+    db.close()
@@ -0,0 +1,107 @@
+"""Tests for compiled robots.txt policies."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from packages.core import robots
+from packages.core.robots import ALLOW_ALL, RobotsPolicy, get_robots_policy
+
+ROBOTS = """
+User-agent: *
+Disallow: /admin
+Allow: /admin/public
+Disallow: /*.pdf$
+Disallow: /search?
+Allow: /page$
+Disallow: /page
+Crawl-delay: 5
+Sitemap: https://example.com/sitemap.xml
+
+User-agent: Googlebot
+User-agent: SEO-Health-Report-Bot
+Disallow: /private  # trailing comment
+Disallow:
+"""
+
+
+@pytest.fixture
+def policy():
+    return RobotsPolicy.parse(ROBOTS)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    robots.clear_robots_cache()
+    yield
+    robots.clear_robots_cache()
+
+
+class TestMatching:
+    """Tests for longest-match rule precedence."""
+
+    @pytest.mark.parametrize(
+        "url,allowed",
+        [
+            ("https://example.com/", True),
+            ("https://example.com/admin/users", False),
+            ("https://example.com/admin/public/faq", True),
+            ("https://example.com/files/report.pdf", False),
+            ("https://example.com/files/report.pdf?v=2", True),
+            ("https://example.com/search?q=x", False),
+            ("https://example.com/search", True),
+            ("https://example.com/page", True),
+            ("https://example.com/pages", False),
+            ("https://example.com/robots.txt", True),
+        ],
+    )
+    def test_generic_group(self, policy, url, allowed):
+        assert policy.is_allowed(url, "SomeOtherBot/2.0") is allowed
+
+    def test_specific_group_replaces_generic(self, policy):
+        assert policy.is_allowed("https://example.com/admin", "Googlebot") is True
+        assert policy.is_allowed("https://example.com/private/x") is False
+        assert policy.crawl_delay("Googlebot") is None
+        assert policy.crawl_delay("OtherBot") == 5
+
+    def test_allow_wins_tie_and_encoding_is_normalized(self):
+        policy = RobotsPolicy.parse("User-agent: *\nDisallow: /a\nAllow: /a\nDisallow: /caf%C3%A9")
+        assert policy.is_allowed("/a/b")
+        assert not policy.is_allowed("/café/menu")
+
+    def test_reporting_fields(self, policy):
+        assert policy.sitemaps == ["https://example.com/sitemap.xml"]
+        assert {"user_agent": "googlebot", "type": "disallow", "path": "/private"} in policy.rules
+        assert policy.crawl_delays == {"*": 5.0}
+
+    def test_empty_content_allows_everything(self):
+        assert RobotsPolicy.parse("").is_allowed("/anything")
+
+
+class TestPolicyCache:
+    """Tests for the per-host policy cache."""
+
+    def test_fetched_once_per_host(self):
+        fetch = MagicMock(return_value="User-agent: *\nDisallow: /x")
+
+        first = get_robots_policy("https://example.com/a", fetch=fetch)
+        second = get_robots_policy("https://EXAMPLE.com/b/c", fetch=fetch)
+
+        assert first is second
+        fetch.assert_called_once_with("https://example.com/robots.txt")
+        assert not first.is_allowed("https://example.com/x")
+
+    def test_missing_robots_allows_all(self):
+        assert get_robots_policy("https://example.com", fetch=lambda url: None) is ALLOW_ALL
+
+    def test_unreachable_robots_is_refetched_soon(self, monkeypatch):
+        monkeypatch.setattr(robots, "ROBOTS_UNREACHABLE_TTL", 0)
+        unreachable = MagicMock(return_value=None)
+        missing = MagicMock(return_value="")
+
+        for _ in range(2):
+            assert get_robots_policy("https://down.com", fetch=unreachable) is ALLOW_ALL
+            assert get_robots_policy("https://bare.com", fetch=missing) is ALLOW_ALL
+
+        assert unreachable.call_count == 2
+        assert missing.call_count == 1
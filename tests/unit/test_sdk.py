@@ -249,3 +249,39 @@ class TestAuditStatusEnum:
         assert AuditStatus.IN_PROGRESS.value == "in_progress"
         assert AuditStatus.COMPLETED.value == "completed"
         assert AuditStatus.FAILED.value == "failed"
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation for repeated GETs."""
+
+    def test_repeat_get_uses_if_none_match(self):
+        import httpx
+
+        body = {
+            "id": "audit_1",
+            "url": "https://example.com",
+            "company_name": "Example",
+            "status": "completed",
+            "tier": "free",
+            "created_at": "2025-01-15T10:30:00Z",
+        }
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json=body, headers={"ETag": '"v1"'})
+
+        client = SEOHealthClient(base_url="https://api.test", api_key="key")
+        client._client = httpx.Client(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+
+        first = client.get_audit("audit_1")
+        second = client.get_audit("audit_1")
+
+        assert seen == [None, '"v1"']
+        assert first == second
+        assert second.status == AuditStatus.COMPLETED
+        client.close()
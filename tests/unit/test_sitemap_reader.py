@@ -0,0 +1,137 @@
+"""Tests for the streaming sitemap reader."""
+
+import gzip
+from unittest.mock import patch
+
+from packages.seo_technical_audit.scripts import crawl_site
+from packages.seo_technical_audit.scripts.sitemap_reader import (
+    DiskUrlSet,
+    ReservoirSample,
+    SitemapReader,
+)
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(*locs):
+    entries = "".join(f"<url><loc>{loc}</loc></url>" for loc in locs)
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {NS}>{entries}</urlset>'.encode()
+
+
+def index(*locs):
+    entries = "".join(f"<sitemap><loc>{loc}</loc></sitemap>" for loc in locs)
+    return f"<sitemapindex {NS}>{entries}</sitemapindex>".encode()
+
+
+def fetcher(site, chunk_size=7):
+    """Serve `site` in small chunks so parsing is exercised incrementally."""
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url)
+        if url not in site:
+            raise RuntimeError("404 Not Found")
+        body = site[url]
+        return (body[i : i + chunk_size] for i in range(0, len(body), chunk_size))
+
+    fetch.fetched = fetched
+    return fetch
+
+
+class TestSitemapReader:
+    """Tests for streaming, dedupe and budgets."""
+
+    def test_index_cycle_fetched_once(self):
+        site = {
+            "https://s.test/index.xml": index(
+                "https://s.test/a.xml", "https://s.test/index.xml", "https://s.test/a.xml"
+            ),
+            "https://s.test/a.xml": urlset("https://s.test/1", "https://s.test/2"),
+        }
+        fetch = fetcher(site)
+
+        report = SitemapReader(fetch=fetch).read(["https://s.test/index.xml"])
+
+        assert sorted(fetch.fetched) == ["https://s.test/a.xml", "https://s.test/index.xml"]
+        assert report.total_urls == 2
+        assert report.duplicate_sitemaps == 2
+
+    def test_gzip_sitemap_streamed(self):
+        locs = [f"https://s.test/p{i}" for i in range(500)]
+        site = {"https://s.test/sitemap.xml.gz": gzip.compress(urlset(*locs))}
+
+        report = SitemapReader(fetch=fetcher(site, chunk_size=100)).read(
+            ["https://s.test/sitemap.xml.gz"]
+        )
+
+        assert report.documents[0].type == "urlset"
+        assert report.total_urls == 500
+
+    def test_url_budget_stops_reading(self):
+        site = {
+            "https://s.test/a.xml": urlset(*[f"https://s.test/a{i}" for i in range(50)]),
+            "https://s.test/b.xml": urlset(*[f"https://s.test/b{i}" for i in range(50)]),
+        }
+
+        report = SitemapReader(max_urls=30, concurrency=1, fetch=fetcher(site)).read(
+            ["https://s.test/a.xml", "https://s.test/b.xml"]
+        )
+
+        assert report.total_urls == 30
+        assert report.url_budget_reached
+        assert report.documents[0].truncated
+        assert len(report.documents) == 1
+
+    def test_byte_budget_truncates_document(self):
+        site = {"https://s.test/a.xml": urlset(*[f"https://s.test/{i}" for i in range(100)])}
+
+        report = SitemapReader(max_bytes=600, fetch=fetcher(site)).read(["https://s.test/a.xml"])
+
+        document = report.documents[0]
+        assert document.truncated
+        assert document.bytes_read == 600
+        assert 0 < document.url_count < 100
+
+    def test_sinks_receive_unique_urls(self, tmp_path):
+        locs = [f"https://s.test/{i}" for i in range(40)]
+        site = {
+            "https://s.test/a.xml": urlset(*locs),
+            "https://s.test/b.xml": urlset(*locs[:10]),
+        }
+        disk = DiskUrlSet(str(tmp_path / "urls.db"))
+        sample = ReservoirSample(5, seed=1)
+
+        SitemapReader(sink=disk, fetch=fetcher(site)).read(["https://s.test/a.xml"])
+        SitemapReader(sink=sample, fetch=fetcher(site)).read(
+            ["https://s.test/a.xml", "https://s.test/b.xml"]
+        )
+
+        assert len(disk) == 40
+        assert set(disk) == set(locs)
+        disk.close()
+        assert sample.seen == 40
+        assert len(sample.urls) == 5
+        assert set(sample.urls) <= set(locs)
+
+
+class TestCheckSitemaps:
+    """Tests for the crawl_site entry point."""
+
+    def test_missing_and_broken_sitemaps(self):
+        site = {
+            "https://s.test/sitemap.xml": b"  \n" + urlset("https://s.test/"),
+            "https://s.test/broken.xml": b"<urlset><url><loc>x</url>",
+        }
+
+        with patch.object(crawl_site, "stream_url", lambda url, *args: fetcher(site)(url)):
+            result = crawl_site.check_sitemaps(
+                "https://s.test",
+                ["https://s.test/sitemap.xml", "https://s.test/broken.xml", "https://s.test/gone"],
+            )
+
+        assert [s["url"] for s in result["sitemaps_found"]] == ["https://s.test/sitemap.xml"]
+        assert result["sitemaps_found"][0]["url_count"] == 1
+        assert result["total_urls"] == 1
+        assert [i["description"] for i in result["issues"]] == [
+            "Sitemap XML parse error: https://s.test/broken.xml"
+        ]
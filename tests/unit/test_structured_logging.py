@@ -164,6 +164,26 @@ class TestJSONFormatter:
 
         assert "location" not in data
 
+    def test_secrets_redacted(self):
+        """Test that secrets in the message and extra data are redacted."""
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Calling API with api_key=%s",
+            args=("abc123",),
+            exc_info=None,
+        )
+        record.extra_data = {"headers": {"Authorization": "Bearer xyz"}, "url": "https://a.com"}
+
+        data = json.loads(JSONFormatter().format(record))
+        raw = json.loads(JSONFormatter(redact=False).format(record))
+
+        assert data["message"] == "Calling API with [REDACTED]"
+        assert data["extra"] == {"headers": {"Authorization": "[REDACTED]"}, "url": "https://a.com"}
+        assert raw["extra"]["headers"]["Authorization"] == "Bearer xyz"
+
 
 class TestRequestContext:
     """Tests for request context management."""
@@ -0,0 +1,117 @@
+"""Tests for the shared text statistics and readability scores."""
+
+import re
+import time
+
+from packages.core.parsed_page import parse_page
+from packages.core.text_stats import count_syllables, text_stats
+from packages.seo_content_authority.scripts.analyze_content import calculate_readability
+
+TEXTS = [
+    "",
+    "   ",
+    "One.",
+    "The cat sat on the mat. It was happy!",
+    "Readability scores estimate how easy text is to read... Are they useful? Yes!!",
+    "Why? Because the queue, the cache and the rhythm agree; naïve café owners rejoice.",
+    "No sentence terminator here just a long run of words without punctuation",
+    "Line one.\nLine two.\n\n   .  ! ?\tLine three",
+    "The the THE The. E e ee eye aye yyy rhythm create created recreate.",
+]
+
+
+def _reference_readability(text: str) -> dict:
+    """The per-word readability calculation that TextStats replaced."""
+    words = text.split()
+    word_count = len(words)
+    if word_count == 0:
+        return {
+            "flesch_reading_ease": 0,
+            "flesch_kincaid_grade": 0,
+            "avg_sentence_length": 0,
+            "avg_syllables_per_word": 0,
+        }
+    sentences = [s for s in re.split(r"[.!?]+", text) if s.strip()]
+    sentence_count = max(len(sentences), 1)
+
+    def syllables(word):
+        word = word.lower()
+        count = 0
+        prev_vowel = False
+        for char in word:
+            is_vowel = char in "aeiouy"
+            if is_vowel and not prev_vowel:
+                count += 1
+            prev_vowel = is_vowel
+        if word.endswith("e") and count > 1:
+            count -= 1
+        return max(count, 1)
+
+    asl = word_count / sentence_count
+    asw = sum(syllables(word) for word in words) / word_count
+    ease = max(0, min(100, 206.835 - (1.015 * asl) - (84.6 * asw)))
+    grade = max(0, (0.39 * asl) + (11.8 * asw) - 15.59)
+    return {
+        "flesch_reading_ease": round(ease, 1),
+        "flesch_kincaid_grade": round(grade, 1),
+        "avg_sentence_length": round(asl, 1),
+        "avg_syllables_per_word": round(asw, 2),
+    }
+
+
+def _long_text(words: int) -> str:
+    vocabulary = (
+        "search engines reward pages whose content answers questions clearly and "
+        "comprehensively while technical foundations such as canonical tags remain sound"
+    ).split()
+    sentence = []
+    parts = []
+    for n in range(words):
+        sentence.append(f"{vocabulary[n % len(vocabulary)]}{n % 97}")
+        if len(sentence) == 17:
+            parts.append(" ".join(sentence) + ".")
+            sentence = []
+    return " ".join(parts + sentence)
+
+
+class TestTextStats:
+    """Tests for counting over a single tokenization."""
+
+    def test_readability_matches_reference(self):
+        for text in TEXTS + [_long_text(2_500)]:
+            assert calculate_readability(text) == _reference_readability(text), text
+
+    def test_counts(self):
+        stats = text_stats("The cat sat. The cat ran!")
+
+        assert stats.word_count == 6
+        assert stats.sentence_count == 2
+        assert stats.token_counts["The"] == 2
+        assert stats.syllable_count == 6
+        assert stats.ngram_counts(2)["the cat"] == 2
+        assert stats.ngram_counts(1)["cat"] == 2
+
+    def test_syllables(self):
+        assert count_syllables("rhythm") == 1
+        assert count_syllables("created") == 2
+        assert count_syllables("the") == 1
+        assert count_syllables("Readability") == 5
+
+    def test_shared_with_parsed_page(self):
+        page = parse_page("<html><body><p>Shared words. Counted once.</p></body></html>")
+
+        assert page.text_stats is text_stats(page.text)
+        assert page.words == ["Shared", "words.", "Counted", "once."]
+
+    def test_faster_than_per_word_counting(self):
+        text = _long_text(10_000)
+        text_stats(text + " warm")
+
+        started = time.perf_counter()
+        _reference_readability(text)
+        reference = time.perf_counter() - started
+        started = time.perf_counter()
+        text_stats(text).readability()
+        shared = time.perf_counter() - started
+
+        assert shared < reference
@@ -0,0 +1,124 @@
+"""Tests for audit pipeline tracing."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from packages.core.tracing import (
+    STAGE_HISTOGRAM,
+    Stage,
+    current_trace,
+    in_current_context,
+    span,
+    start_trace,
+    traced,
+)
+from packages.seo_health_report.metrics import metrics
+
+
+@traced(Stage.FETCH)
+def fetch(url):
+    return f"<html>{url}</html>"
+
+
+@traced(Stage.LLM, name="llm.ask")
+async def ask(question):
+    await asyncio.sleep(0)
+    return question.upper()
+
+
+class TestSpans:
+    """Tests for span timing, nesting and status."""
+
+    def test_nested_spans_link_to_parent(self):
+        with start_trace(audit_id="a-1") as trace:
+            with span("audit", Stage.AUDIT) as outer:
+                with span("page", Stage.ANALYZE, url="https://example.com") as inner:
+                    pass
+
+        assert [s.name for s in trace.spans] == ["page", "audit"]
+        assert inner.parent_id == outer.span_id
+        assert inner.trace_id == outer.trace_id == trace.trace_id
+        assert inner.attributes == {"url": "https://example.com"}
+        assert trace.attributes == {"audit_id": "a-1"}
+
+    def test_duration_observed_in_stage_histogram(self):
+        before = metrics.get_histogram_stats(STAGE_HISTOGRAM, {"stage": "render"})["count"]
+
+        with span("report", Stage.RENDER):
+            pass
+
+        after = metrics.get_histogram_stats(STAGE_HISTOGRAM, {"stage": "render"})["count"]
+        assert after == before + 1
+
+    def test_spans_outside_a_trace_are_only_measured(self):
+        with span("loose", Stage.SCORING) as record:
+            assert current_trace() is None
+
+        assert record.trace_id is None
+        assert record.duration >= 0
+
+    def test_error_status(self):
+        with start_trace() as trace:
+            with pytest.raises(TimeoutError):
+                with span("slow", Stage.FETCH):
+                    raise TimeoutError
+
+        assert trace.spans[0].status == "error"
+        assert trace.spans[0].error == "TimeoutError"
+
+    def test_spans_beyond_limit_are_dropped(self, monkeypatch):
+        monkeypatch.setattr("packages.core.tracing.AUDIT_TRACE_MAX_SPANS", 2)
+        with start_trace() as trace:
+            for n in range(3):
+                with span(f"step-{n}"):
+                    pass
+
+        assert [s.name for s in trace.spans] == ["step-0", "step-1"]
+        assert trace.to_dict()["dropped_spans"] == 1
+
+
+class TestTraced:
+    """Tests for the traced decorator."""
+
+    def test_sync_function(self):
+        with start_trace() as trace:
+            assert fetch("https://example.com") == "<html>https://example.com</html>"
+
+        assert trace.spans[0].name == "test_tracing.fetch"
+        assert trace.spans[0].stage == "fetch"
+
+    async def test_async_function(self):
+        with start_trace() as trace:
+            assert await ask("why") == "WHY"
+
+        assert trace.spans[0].name == "llm.ask"
+        assert trace.stage_totals().keys() == {"llm"}
+
+
+class TestContextPropagation:
+    """Tests for carrying the trace across tasks and threads."""
+
+    async def test_gathered_tasks_and_to_thread(self):
+        with start_trace() as trace:
+            with span("audit", Stage.AUDIT) as parent:
+                await asyncio.gather(ask("a"), asyncio.to_thread(fetch, "b"))
+
+        children = [s for s in trace.spans if s.parent_id == parent.span_id]
+        assert {s.stage for s in children} == {"llm", "fetch"}
+
+    def test_executor_threads(self):
+        with start_trace() as trace:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [pool.submit(in_current_context(fetch), n) for n in range(3)]
+                [future.result() for future in futures]
+
+        assert len(trace.spans) == 3
+
+    def test_stage_totals_skip_nested_spans_of_same_stage(self):
+        with start_trace() as trace:
+            with span("outer", Stage.FETCH) as outer:
+                fetch("inner")
+
+        assert trace.stage_totals() == {"fetch": outer.duration}
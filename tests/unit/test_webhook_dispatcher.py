@@ -0,0 +1,374 @@
+"""Tests for the webhook outbox and dispatcher."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+from database import Audit, Webhook, WebhookDelivery
+from packages.seo_health_report.scripts.webhook import verify_webhook_signature
+from packages.seo_health_report.webhooks.dispatcher import CircuitBreaker, WebhookDispatcher
+from packages.seo_health_report.webhooks.outbox import (
+    enqueue_audit_webhooks,
+    get_callback_secret,
+)
+
+
+@pytest.fixture
+def session_factory(sqlite_session_factory):
+    """In-memory database with the outbox schema."""
+    factory = sqlite_session_factory
+    factory.configure(autoflush=False)
+    db = factory()
+    # Added by migration 004, not mapped on the ORM model
+    db.execute(text("ALTER TABLE audits ADD COLUMN callback_delivered_at DATETIME"))
+    db.add(Audit(id="audit-1", url="https://example.com", company_name="Example"))
+    db.add(
+        Webhook(
+            id="wh-1",
+            tenant_id="tenant-1",
+            url="https://hooks.example.com/seo",
+            secret="sub-secret",
+            events=["audit.completed"],
+            is_active=True,
+        )
+    )
+    db.commit()
+    db.close()
+    return factory
+
+
+def _response(status_code: int) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = "OK" if status_code < 400 else "Error"
+    return response
+
+
+def _dispatcher(session_factory, post, **kwargs) -> WebhookDispatcher:
+    dispatcher = WebhookDispatcher(session_factory=session_factory, **kwargs)
+    client = AsyncMock()
+    client.post = post
+    dispatcher._get_client = AsyncMock(return_value=client)
+    return dispatcher
+
+
+class TestCircuitBreaker:
+    """Tests for per-endpoint circuit breaking."""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+        breaker.record_failure(now=0)
+        assert breaker.allow(now=1)
+        breaker.record_failure(now=1)
+        assert breaker.is_open
+        assert not breaker.allow(now=2)
+        assert breaker.retry_after(now=2) == pytest.approx(29)
+
+    def test_half_open_admits_single_trial(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        breaker.record_failure(now=0)
+        assert breaker.allow(now=11)
+        assert not breaker.allow(now=11.5)
+
+        breaker.record_success()
+        assert not breaker.is_open
+        assert breaker.allow(now=12)
+
+
+class TestOutboxEnqueue:
+    """Tests for staging deliveries inside the caller's transaction."""
+
+    def test_stages_subscription_and_callback_rows(self, session_factory):
+        db = session_factory()
+        ids = enqueue_audit_webhooks(
+            db,
+            audit_id="audit-1",
+            tenant_id="tenant-1",
+            event_type="audit.completed",
+            payload={"audit_id": "audit-1", "api_key": "sk-should-not-leak"},
+            callback_url="https://client.example.com/cb",
+        )
+        db.commit()
+
+        rows = db.query(WebhookDelivery).order_by(WebhookDelivery.webhook_id).all()
+        assert {r.id for r in rows} == set(ids)
+        assert [r.webhook_id for r in rows] == [None, "wh-1"]
+        assert rows[0].target_url == "https://client.example.com/cb"
+        assert all(r.status == "pending" for r in rows)
+        assert "sk-should-not-leak" not in json.dumps(rows[0].payload)
+        db.close()
+
+    def test_rollback_discards_staged_rows(self, session_factory):
+        db = session_factory()
+        enqueue_audit_webhooks(
+            db, "audit-1", "tenant-1", "audit.completed", {"audit_id": "audit-1"}
+        )
+        db.rollback()
+        assert db.query(WebhookDelivery).count() == 0
+        db.close()
+
+    def test_skips_unsubscribed_events(self, session_factory):
+        db = session_factory()
+        ids = enqueue_audit_webhooks(db, "audit-1", "tenant-1", "audit.failed", {})
+        assert ids == []
+        db.close()
+
+
+class TestWebhookDispatcher:
+    """Tests for draining the outbox."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_callback_and_marks_audit(self, session_factory):
+        db = session_factory()
+        enqueue_audit_webhooks(
+            db,
+            "audit-1",
+            "tenant-1",
+            "audit.completed",
+            {"audit_id": "audit-1", "overall_score": 80},
+            callback_url="https://client.example.com/cb",
+        )
+        db.commit()
+        db.close()
+
+        captured = {}
+
+        async def post(url, content, headers):
+            captured[url] = (content, headers)
+            return _response(200)
+
+        dispatcher = _dispatcher(session_factory, post)
+        with patch(
+            "packages.seo_health_report.webhooks.dispatcher.validate_callback_url",
+            new_callable=AsyncMock,
+        ):
+            attempted = await dispatcher.dispatch_due()
+
+        assert attempted == 2
+        body, headers = captured["https://client.example.com/cb"]
+        assert verify_webhook_signature(
+            json.loads(body), headers["X-Webhook-Signature"], get_callback_secret("tenant-1")
+        )
+        sub_body, sub_headers = captured["https://hooks.example.com/seo"]
+        assert json.loads(sub_body)["data"]["overall_score"] == 80
+        assert sub_headers["X-Webhook-Signature"].startswith("sha256=")
+
+        db = session_factory()
+        assert {d.status for d in db.query(WebhookDelivery).all()} == {"delivered"}
+        delivered_at = db.execute(
+            text("SELECT callback_delivered_at FROM audits WHERE id = 'audit-1'")
+        ).scalar()
+        assert delivered_at is not None
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_schedules_retry_off_next_retry_at(self, session_factory):
+        db = session_factory()
+        enqueue_audit_webhooks(db, "audit-1", "tenant-1", "audit.completed", {})
+        db.commit()
+        db.close()
+
+        post = AsyncMock(return_value=_response(503))
+        dispatcher = _dispatcher(session_factory, post)
+
+        assert await dispatcher.dispatch_due() == 1
+        # Not due again until next_retry_at passes
+        assert await dispatcher.dispatch_due() == 0
+
+        db = session_factory()
+        delivery = db.query(WebhookDelivery).one()
+        assert delivery.status == "pending"
+        assert delivery.attempts == 1
+        assert delivery.next_retry_at is not None
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_defers_without_attempt(self, session_factory):
+        db = session_factory()
+        for _ in range(3):
+            enqueue_audit_webhooks(db, "audit-1", "tenant-1", "audit.completed", {})
+        db.commit()
+        db.close()
+
+        post = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        dispatcher = _dispatcher(
+            session_factory, post, failure_threshold=1, per_endpoint_concurrency=1
+        )
+
+        await dispatcher.dispatch_due()
+
+        assert post.await_count == 1
+        db = session_factory()
+        attempts = sorted(d.attempts for d in db.query(WebhookDelivery).all())
+        assert attempts == [0, 0, 1]
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_inactive_webhook_marks_delivery_failed(self, session_factory):
+        db = session_factory()
+        enqueue_audit_webhooks(db, "audit-1", "tenant-1", "audit.completed", {})
+        db.query(Webhook).update({"is_active": False})
+        db.commit()
+        db.close()
+
+        post = AsyncMock(return_value=_response(200))
+        dispatcher = _dispatcher(session_factory, post)
+        await dispatcher.dispatch_due()
+
+        post.assert_not_awaited()
+        db = session_factory()
+        assert db.query(WebhookDelivery).one().status == "failed"
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_future_retry_not_claimed(self, session_factory):
+        db = session_factory()
+        db.add(
+            WebhookDelivery(
+                id="del-future",
+                webhook_id="wh-1",
+                event_type="audit.completed",
+                payload={},
+                status="pending",
+                attempts=1,
+                next_retry_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+            )
+        )
+        db.commit()
+        db.close()
+
+        post = AsyncMock(return_value=_response(200))
+        dispatcher = _dispatcher(session_factory, post)
+        assert await dispatcher.dispatch_due() == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_committed_as_in_flight_before_sending(self, session_factory):
+        db = session_factory()
+        enqueue_audit_webhooks(db, "audit-1", "tenant-1", "audit.completed", {})
+        db.commit()
+        db.close()
+
+        seen = {}
+
+        async def post(url, content, headers):
+            # The claim is already committed, so another session can take row locks
+            other = session_factory()
+            delivery = other.query(WebhookDelivery).one()
+            seen["status"] = delivery.status
+            seen["claimed_until"] = delivery.next_retry_at
+            other.query(Audit).update({"company_name": "Renamed"})
+            other.commit()
+            other.close()
+            return _response(200)
+
+        dispatcher = _dispatcher(session_factory, post)
+        assert await dispatcher.dispatch_due() == 1
+
+        assert seen["status"] == "sending"
+        assert seen["claimed_until"] > datetime.now(timezone.utc).replace(tzinfo=None)
+        db = session_factory()
+        delivery = db.query(WebhookDelivery).one()
+        assert (delivery.status, delivery.attempts) == ("delivered", 1)
+        assert delivery.next_retry_at is None
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_claim_is_dispatched_again(self, session_factory):
+        db = session_factory()
+        db.add(
+            WebhookDelivery(
+                id="del-stuck",
+                webhook_id="wh-1",
+                event_type="audit.completed",
+                payload={},
+                status="sending",
+                attempts=0,
+                next_retry_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+            )
+        )
+        db.add(
+            WebhookDelivery(
+                id="del-claimed",
+                webhook_id="wh-1",
+                event_type="audit.completed",
+                payload={},
+                status="sending",
+                attempts=0,
+                next_retry_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+            )
+        )
+        db.commit()
+        db.close()
+
+        post = AsyncMock(return_value=_response(200))
+        dispatcher = _dispatcher(session_factory, post)
+        assert await dispatcher.dispatch_due() == 1
+
+        db = session_factory()
+        statuses = {d.id: d.status for d in db.query(WebhookDelivery).all()}
+        assert statuses == {"del-stuck": "delivered", "del-claimed": "sending"}
+        db.close()
+
+
+class TestSendTestEvent:
+    """Tests for test events going through the outbox."""
+
+    @pytest.mark.asyncio
+    async def test_test_event_is_dispatched_from_the_outbox(self, session_factory):
+        from packages.seo_health_report.webhooks.service import WebhookService
+
+        post = AsyncMock(return_value=_response(204))
+        client = AsyncMock()
+        client.post = post
+        db = session_factory()
+        with patch.object(WebhookDispatcher, "_get_client", AsyncMock(return_value=client)):
+            result = await WebhookService(db).send_test_event("wh-1", "tenant-1")
+
+        assert (result["status"], result["response_code"]) == ("delivered", 204)
+        delivery = db.query(WebhookDelivery).one()
+        assert (delivery.id, delivery.event_type) == (result["delivery_id"], "test")
+        assert post.await_args.args[0] == "https://hooks.example.com/seo"
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_claims_in_order_of_becoming_due(self, session_factory):
+        now = datetime.now(timezone.utc)
+        db = session_factory()
+        db.add(
+            WebhookDelivery(
+                id="del-fresh",
+                webhook_id="wh-1",
+                event_type="audit.completed",
+                payload={},
+                status="pending",
+                attempts=0,
+                created_at=now,
+            )
+        )
+        db.add(
+            WebhookDelivery(
+                id="del-retry",
+                webhook_id="wh-1",
+                event_type="audit.completed",
+                payload={},
+                status="pending",
+                attempts=1,
+                created_at=now - timedelta(hours=1),
+                next_retry_at=now - timedelta(minutes=10),
+            )
+        )
+        db.commit()
+        db.close()
+
+        post = AsyncMock(return_value=_response(200))
+        dispatcher = _dispatcher(session_factory, post, batch_size=1)
+        assert await dispatcher.dispatch_due() == 1
+
+        db = session_factory()
+        statuses = {d.id: d.status for d in db.query(WebhookDelivery).all()}
+        assert statuses == {"del-retry": "delivered", "del-fresh": "pending"}
+        db.close()
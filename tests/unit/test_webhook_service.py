@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
+from packages.seo_health_report.webhooks.dispatcher import WebhookDispatcher
 from packages.seo_health_report.webhooks.security import SSRFError
 from packages.seo_health_report.webhooks.service import (
     MAX_RETRIES,
@@ -245,12 +246,11 @@ class TestWebhookServiceDelete:
 
 
 class TestWebhookDelivery:
-    """Tests for webhook delivery."""
+    """Tests for webhook delivery through the outbox dispatcher."""
 
     @pytest.mark.asyncio
     async def test_deliver_success(self):
-        mock_db = MagicMock()
-        service = WebhookService(mock_db)
+        dispatcher = WebhookDispatcher()
 
         webhook = MockWebhook()
         delivery = MockDelivery()
@@ -259,12 +259,12 @@ class TestWebhookDelivery:
         mock_response.status_code = 200
         mock_response.text = "OK"
 
-        with patch.object(service, "_get_client") as mock_get_client:
+        with patch.object(dispatcher, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
             mock_get_client.return_value = mock_client
 
-            result = await service._deliver(delivery, webhook)
+            result = await dispatcher._dispatch_one(delivery, webhook.url, webhook.secret)
 
         assert result is True
         assert delivery.status == "delivered"
@@ -273,8 +273,7 @@ class TestWebhookDelivery:
 
     @pytest.mark.asyncio
     async def test_deliver_failure_schedules_retry(self):
-        mock_db = MagicMock()
-        service = WebhookService(mock_db)
+        dispatcher = WebhookDispatcher()
 
         webhook = MockWebhook()
         delivery = MockDelivery(attempts=0)
@@ -283,12 +282,12 @@ class TestWebhookDelivery:
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
 
-        with patch.object(service, "_get_client") as mock_get_client:
+        with patch.object(dispatcher, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
             mock_get_client.return_value = mock_client
 
-            result = await service._deliver(delivery, webhook)
+            result = await dispatcher._dispatch_one(delivery, webhook.url, webhook.secret)
 
         assert result is False
         assert delivery.status == "pending"
@@ -297,18 +296,17 @@ class TestWebhookDelivery:
 
     @pytest.mark.asyncio
     async def test_deliver_timeout_schedules_retry(self):
-        mock_db = MagicMock()
-        service = WebhookService(mock_db)
+        dispatcher = WebhookDispatcher()
 
         webhook = MockWebhook()
         delivery = MockDelivery(attempts=0)
 
-        with patch.object(service, "_get_client") as mock_get_client:
+        with patch.object(dispatcher, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
             mock_get_client.return_value = mock_client
 
-            result = await service._deliver(delivery, webhook)
+            result = await dispatcher._dispatch_one(delivery, webhook.url, webhook.secret)
 
         assert result is False
         assert delivery.error_message == "Request timeout"
@@ -316,8 +314,7 @@ class TestWebhookDelivery:
 
     @pytest.mark.asyncio
     async def test_deliver_max_retries_marks_failed(self):
-        mock_db = MagicMock()
-        service = WebhookService(mock_db)
+        dispatcher = WebhookDispatcher()
 
         webhook = MockWebhook()
         delivery = MockDelivery(attempts=MAX_RETRIES - 1)  # One more attempt will hit max
@@ -326,12 +323,12 @@ class TestWebhookDelivery:
         mock_response.status_code = 500
         mock_response.text = "Error"
 
-        with patch.object(service, "_get_client") as mock_get_client:
+        with patch.object(dispatcher, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
             mock_get_client.return_value = mock_client
 
-            result = await service._deliver(delivery, webhook)
+            result = await dispatcher._dispatch_one(delivery, webhook.url, webhook.secret)
 
         assert result is False
         assert delivery.status == "failed"
@@ -362,8 +359,7 @@ class TestWebhookPayloadFormat:
 
     @pytest.mark.asyncio
     async def test_payload_envelope(self):
-        mock_db = MagicMock()
-        service = WebhookService(mock_db)
+        dispatcher = WebhookDispatcher()
 
         webhook = MockWebhook()
         delivery = MockDelivery(payload={"audit_id": "abc", "score": 85})
@@ -378,12 +374,12 @@ class TestWebhookPayloadFormat:
             mock_response.text = "OK"
             return mock_response
 
-        with patch.object(service, "_get_client") as mock_get_client:
+        with patch.object(dispatcher, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post = capture_post
             mock_get_client.return_value = mock_client
 
-            await service._deliver(delivery, webhook)
+            await dispatcher._dispatch_one(delivery, webhook.url, webhook.secret)
 
         assert "event" in captured_payload
         assert "timestamp" in captured_payload
@@ -393,8 +389,7 @@ class TestWebhookPayloadFormat:
 
     @pytest.mark.asyncio
     async def test_headers_include_signature(self):
-        mock_db = MagicMock()
-        service = WebhookService(mock_db)
+        dispatcher = WebhookDispatcher()
 
         webhook = MockWebhook(secret="test_secret_123")
         delivery = MockDelivery()
@@ -409,12 +404,12 @@ class TestWebhookPayloadFormat:
             mock_response.text = "OK"
             return mock_response
 
-        with patch.object(service, "_get_client") as mock_get_client:
+        with patch.object(dispatcher, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post = capture_post
             mock_get_client.return_value = mock_client
 
-            await service._deliver(delivery, webhook)
+            await dispatcher._dispatch_one(delivery, webhook.url, webhook.secret)
 
         assert "X-Webhook-Signature" in captured_headers
         assert captured_headers["X-Webhook-Signature"].startswith("sha256=")